@@ -0,0 +1,133 @@
+"""
+Measures how long validating a large pod list blocks the event loop.
+
+A task ticking every millisecond records the longest stall of the loop while
+the list is validated at once, by chunks, by chunks in a thread, or by chunks
+as it is streamed by blocks of 64 KiB::
+
+    python benchmarks/aio.py --pods 20000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from kubedantic.aio import avalidate_list
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+
+pods, mode = int(sys.argv[1]), sys.argv[2]
+
+
+def _item(index):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/app-{index % 100}:1.0",
+                "env": [{"name": f"SETTING_{n}", "value": str(n)} for n in range(10)],
+                "ports": [{"containerPort": 8080}],
+            }],
+            "nodeName": f"node-{index % 50}",
+        },
+        "status": {"phase": "Running", "podIP": f"10.0.{index // 250 % 250}.{index % 250}"},
+    }
+
+
+raw = json.dumps({
+    "apiVersion": "v1",
+    "kind": "PodList",
+    "metadata": {"resourceVersion": "1"},
+    "items": [_item(index) for index in range(pods)],
+}).encode()
+
+
+async def _stream():
+    for start in range(0, len(raw), 65536):
+        await asyncio.sleep(0)
+        yield raw[start : start + 65536]
+
+
+async def _validate():
+    if mode == "blocking":
+        return PodList.model_validate_json(raw)
+    if mode == "chunks":
+        return await avalidate_list(PodList, raw)
+    if mode == "stream":
+        return await avalidate_list(PodList, _stream())
+    with ThreadPoolExecutor(1) as executor:
+        return await avalidate_list(PodList, raw, executor=executor)
+
+
+async def main():
+    stall = 0.0
+
+    async def tick():
+        nonlocal stall
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    # Builds the schemas beforehand
+    PodList.model_validate_json(b'{"items": [{}]}')
+    await avalidate_list(PodList, b'{"items": [{}]}')
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await _validate()
+    elapsed = time.perf_counter() - start
+    # Lets the ticker see the last stall
+    await asyncio.sleep(0.01)
+    ticker.cancel()
+    print(json.dumps({"seconds": elapsed, "stall": stall}))
+
+
+asyncio.run(main())
+"""
+
+MODES = ("blocking", "chunks", "executor", "stream")
+
+
+def _measure(pods: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(pods), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=20000)
+    options = parser.parse_args()
+
+    print(f"pods: {options.pods}")
+    for mode in MODES:
+        result = _measure(options.pods, mode)
+        print(
+            f"{mode}: {result['seconds']:.2f} s,"
+            f" longest stall {result['stall'] * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
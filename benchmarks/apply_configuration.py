@@ -0,0 +1,101 @@
+"""
+Measures the size and encode time of server-side apply bodies.
+
+Full dumps send every field of the model, unset ones as nulls (or without
+them), defaults and the fields populated by the server included;
+to_apply_configuration only sends the fields that were set, and
+dump_apply_configuration encodes them without building dicts first::
+
+    python benchmarks/apply_configuration.py --deployments 10000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import sys
+import time
+
+from kubedantic.models.io.k8s.api.apps.v1 import DeploymentList
+from kubedantic.pruning import dump_apply_configuration, to_apply_configuration
+
+deployments, mode = int(sys.argv[1]), sys.argv[2]
+
+
+def _item(index):
+    return {
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index}"},
+            "uid": f"uid-{index}",
+            "resourceVersion": str(index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "managedFields": [{"manager": "argocd", "operation": "Apply", "fieldsV1": {"f:spec": {"f:replicas": {}}}}],
+        },
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{index}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{index}"}},
+                "spec": {
+                    "containers": [{
+                        "name": "main",
+                        "image": f"registry.example.com/app-{index}:1.0",
+                        "env": [{"name": f"SETTING_{n}", "value": str(n)} for n in range(5)],
+                        "ports": [{"containerPort": 8080}],
+                        "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                    }],
+                },
+            },
+        },
+        "status": {"replicas": 3, "readyReplicas": 3, "observedGeneration": 1},
+    }
+
+
+ENCODERS = {
+    "full": lambda item: item.model_dump_json(by_alias=True),
+    "exclude_none": lambda item: item.model_dump_json(by_alias=True, exclude_none=True),
+    "apply": lambda item: json.dumps(to_apply_configuration(item)),
+    "dump_apply": dump_apply_configuration,
+}
+
+fleet = DeploymentList.model_validate({"items": [_item(index) for index in range(deployments)]})
+encode = ENCODERS[mode]
+start = time.perf_counter()
+size = sum(len(encode(item)) for item in fleet.items)
+print(json.dumps({"seconds": time.perf_counter() - start, "bytes": size}))
+"""
+
+MODES = {
+    "full": "model_dump_json",
+    "exclude_none": "model_dump_json(exclude_none=True)",
+    "apply": "to_apply_configuration",
+    "dump_apply": "dump_apply_configuration",
+}
+
+
+def _measure(deployments: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(deployments), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deployments", type=int, default=10000)
+    options = parser.parse_args()
+
+    print(f"deployments: {options.deployments}")
+    for mode, name in MODES.items():
+        result = _measure(options.deployments, mode)
+        size = result["bytes"] / options.deployments
+        print(f"{name}: {result['seconds']:.2f} s, {size:.0f} bytes per object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Measures validating a large ``kubectl get -o json`` dump in worker processes.
+
+The baseline loads the whole dump and validates the items one by one;
+validate_file splits the items into chunks validated by ``--workers``
+processes, sending back the objects or only their names. The workers only
+win with several CPUs and small results, but the first results come back
+at once in every case::
+
+    python benchmarks/bulk.py --pods 100000 --workers 8
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_MEASURE = """
+import json
+import sys
+import time
+
+from kubedantic.base import get_model
+from kubedantic.bulk import validate_file
+
+path, mode, workers = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+
+def _get_name(obj):
+    return obj.metadata.name
+
+
+start = time.perf_counter()
+if mode == "load":
+    with open(path, "rb") as file:
+        items = json.load(file)["items"]
+    results = [get_model(item["apiVersion"], item["kind"]).model_validate(item) for item in items]
+    first = time.perf_counter()
+else:
+    transform = _get_name if mode == "names" else None
+    iterator = validate_file(path, workers=workers, transform=transform)
+    results = [next(iterator)]
+    first = time.perf_counter()
+    results.extend(iterator)
+end = time.perf_counter()
+print(json.dumps({"seconds": end - start, "first": first - start, "items": len(results)}))
+"""
+
+
+def _item(index: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "resourceVersion": str(index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "main",
+                    "image": f"registry.example.com/app-{index % 100}:1.0",
+                    "env": [
+                        {"name": f"SETTING_{n}", "value": str(n)} for n in range(10)
+                    ],
+                    "ports": [{"containerPort": 8080}],
+                }
+            ],
+            "nodeName": f"node-{index % 50}",
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.0.{index // 250 % 250}.{index % 250}",
+        },
+    }
+
+
+def _measure(path: str, mode: str, workers: int) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, path, mode, str(workers)], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dump.json")
+        with open(path, "w") as file:
+            items = [_item(index) for index in range(options.pods)]
+            json.dump(
+                {"apiVersion": "v1", "items": items, "kind": "List"}, file, indent=4
+            )
+
+        print(f"pods: {options.pods}, {os.path.getsize(path) / 2**20:.0f} MiB")
+        cases = [
+            ("json.load and validate", "load", 1),
+            ("validate_file, 1 worker", "objects", 1),
+            (f"validate_file, {options.workers} workers", "objects", options.workers),
+            (
+                f"validate_file names, {options.workers} workers",
+                "names",
+                options.workers,
+            ),
+        ]
+        for name, mode, workers in cases:
+            result = _measure(path, mode, workers)
+            print(
+                f"{name}: {result['seconds']:.2f} s,"
+                f" first result after {result['first']:.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
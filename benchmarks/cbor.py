@@ -0,0 +1,128 @@
+"""
+Measures encoding lists of pods and nodes as CBOR, against the JSON path.
+
+The baseline dumps and validates the JSON of the lists with pydantic; to_cbor
+and from_cbor encode and decode them following the conventions of the API
+server, with cbor2 if installed, or in Python with ``--python``::
+
+    python benchmarks/cbor.py --pods 5000 --nodes 500
+"""
+
+import argparse
+import time
+
+from kubedantic import cbor
+from kubedantic.cbor import from_cbor, to_cbor
+from kubedantic.models.io.k8s.api.core.v1 import NodeList, PodList
+
+
+def _pod(index: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "main",
+                    "image": f"registry.example.com/app-{index % 100}:1.0",
+                    "env": [
+                        {"name": f"SETTING_{n}", "value": str(n)} for n in range(10)
+                    ],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                }
+            ],
+            "nodeName": f"node-{index % 500}",
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.0.{index // 256 % 256}.{index % 256}",
+        },
+    }
+
+
+def _node(index: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Node",
+        "metadata": {
+            "name": f"node-{index}",
+            "uid": f"uid-{index}",
+            "labels": {
+                "kubernetes.io/hostname": f"node-{index}",
+                "kubernetes.io/os": "linux",
+                "topology.kubernetes.io/zone": f"zone-{index % 3}",
+            },
+        },
+        "spec": {"podCIDR": f"10.{index // 256}.{index % 256}.0/24"},
+        "status": {
+            "capacity": {"cpu": "16", "memory": "64Gi", "pods": "110"},
+            "allocatable": {"cpu": "15800m", "memory": "62Gi", "pods": "110"},
+            "conditions": [
+                {
+                    "type": condition,
+                    "status": "False" if condition != "Ready" else "True",
+                    "lastHeartbeatTime": "2024-01-01T00:00:00Z",
+                    "lastTransitionTime": "2024-01-01T00:00:00Z",
+                    "reason": f"Kubelet{condition}",
+                }
+                for condition in ("MemoryPressure", "DiskPressure", "Ready")
+            ],
+            "images": [
+                {
+                    "names": [f"registry.example.com/app-{n}:1.0"],
+                    "sizeBytes": 10_000_000 + n,
+                }
+                for n in range(20)
+            ],
+        },
+    }
+
+
+def _dump_json(objects) -> str:
+    return objects.model_dump_json(by_alias=True, exclude_unset=True, exclude_none=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--python", action="store_true", help="ignore cbor2")
+    options = parser.parse_args()
+    if options.python:
+        cbor.cbor2 = None
+
+    lists = (
+        (PodList, [_pod(index) for index in range(options.pods)]),
+        (NodeList, [_node(index) for index in range(options.nodes)]),
+    )
+    for model, items in lists:
+        objects = model.model_validate({"items": items})
+        print(f"{model.__name__}: {len(items)} items")
+
+        codecs = (
+            ("json", _dump_json, model.model_validate_json),
+            ("cbor", to_cbor, lambda data, model=model: from_cbor(data, model)),
+        )
+        for name, dump, load in codecs:
+            start = time.perf_counter()
+            data = dump(objects)
+            dumped = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded_objects = load(data)
+            loaded = time.perf_counter() - start
+            assert loaded_objects == objects
+
+            size = len(data.encode() if isinstance(data, str) else data) / 2**20
+            print(f"  {name}: dump {dumped:.2f} s, load {loaded:.2f} s, {size:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
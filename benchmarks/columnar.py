@@ -0,0 +1,106 @@
+"""
+Measures aggregating pods per node and namespace over columns, against loops.
+
+The baseline counts the pods per node, and sums the restarts and CPU
+requests per namespace, iterating over the models; to_columns extracts the
+same fields in one pass, aggregated with NumPy, from the models and from the
+data loaded from their JSON, skipping their validation::
+
+    python benchmarks/columnar.py --pods 100000
+"""
+
+import argparse
+import collections
+import json
+import time
+
+import numpy
+
+from kubedantic.columnar import CATEGORY, INT, QUANTITY, parse_quantity, to_columns
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+
+CPU = "spec.containers[0].resources.requests.cpu"
+RESTARTS = "status.containerStatuses[0].restartCount"
+
+
+def _pod(index: int) -> dict:
+    return {
+        "metadata": {"name": f"app-{index}", "namespace": f"team-{index % 50}"},
+        "spec": {
+            "containers": [
+                {
+                    "name": "main",
+                    "resources": {"requests": {"cpu": f"{index % 4 + 1}00m"}},
+                }
+            ],
+            "nodeName": f"node-{index % 500}",
+        },
+        "status": {
+            "containerStatuses": [
+                {
+                    "name": "main",
+                    "image": "nginx",
+                    "imageID": "",
+                    "ready": True,
+                    "restartCount": index % 7,
+                }
+            ]
+        },
+    }
+
+
+def _aggregate(pods):
+    columns = to_columns(
+        pods,
+        {
+            "spec.nodeName": CATEGORY,
+            "metadata.namespace": CATEGORY,
+            RESTARTS: INT,
+            CPU: QUANTITY,
+        },
+    )
+    numpy.bincount(columns["spec.nodeName"])
+    namespaces = columns["metadata.namespace"]
+    numpy.bincount(namespaces, weights=columns[RESTARTS])
+    numpy.bincount(namespaces, weights=columns[CPU])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=100000)
+    options = parser.parse_args()
+
+    raw_json = json.dumps({"items": [_pod(index) for index in range(options.pods)]})
+
+    start = time.perf_counter()
+    pods = PodList.model_validate_json(raw_json).items
+    elapsed = time.perf_counter() - start
+    print(f"validation: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    pods_per_node: collections.Counter = collections.Counter()
+    restarts: collections.Counter = collections.Counter()
+    cpu: collections.Counter = collections.Counter()
+    for pod in pods:
+        pods_per_node[pod.spec.nodeName] += 1
+        container = pod.spec.containers[0]
+        restarts[pod.metadata.namespace] += pod.status.containerStatuses[0].restartCount
+        cpu[pod.metadata.namespace] += parse_quantity(
+            container.resources.requests["cpu"]
+        )
+    elapsed = time.perf_counter() - start
+    print(f"loop: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    _aggregate(pods)
+    elapsed = time.perf_counter() - start
+    print(f"to_columns: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    _aggregate(json.loads(raw_json)["items"])
+    elapsed = time.perf_counter() - start
+    print(f"json.loads and to_columns: {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
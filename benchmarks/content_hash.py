@@ -0,0 +1,109 @@
+"""
+Measures hashing deployments for drift detection with content_hash and sorted JSON.
+
+The baseline dumps each object to JSON with sorted keys and hashes it, as
+GitOps tools do; frozen objects are hashed twice, the second time from their
+cached digests, and once more after changing their replica count::
+
+    python benchmarks/content_hash.py --objects 2000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import hashlib
+import json
+import sys
+import time
+
+from kubedantic.frozen import freeze
+from kubedantic.hashing import content_hash
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.paths import evolve
+
+objects, mode = int(sys.argv[1]), sys.argv[2]
+
+
+def _deployment(index):
+    return Deployment.model_validate({
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index}", "team": "web"},
+            "resourceVersion": str(index),
+        },
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{index}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{index}"}},
+                "spec": {
+                    "containers": [{
+                        "name": "main",
+                        "image": f"registry.example.com/app-{index}:1.0",
+                        "env": [
+                            {"name": f"SETTING_{number}", "value": str(number)}
+                            for number in range(20)
+                        ],
+                        "ports": [{"containerPort": 8080}],
+                        "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+                    }],
+                },
+            },
+        },
+        "status": {"replicas": 3},
+    })
+
+
+def _json_hash(deployment):
+    data = deployment.model_dump(mode="json", exclude_none=True, exclude={"status"})
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+deployments = [_deployment(index) for index in range(objects)]
+if mode.startswith("frozen"):
+    deployments = [freeze(deployment) for deployment in deployments]
+    for deployment in deployments:
+        content_hash(deployment)
+if mode == "frozen-evolved":
+    deployments = [evolve(item, {"spec.replicas": 4}) for item in deployments]
+
+function = _json_hash if mode == "json" else content_hash
+start = time.perf_counter()
+for deployment in deployments:
+    function(deployment)
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+MODES = {
+    "json": "sorted JSON",
+    "mutable": "content_hash",
+    "frozen": "content_hash, frozen and cached",
+    "frozen-evolved": "content_hash, frozen after evolve",
+}
+
+
+def _measure(objects: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(objects), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--objects", type=int, default=2000)
+    options = parser.parse_args()
+
+    print(f"objects: {options.objects}")
+    for mode, name in MODES.items():
+        seconds = _measure(options.objects, mode)["seconds"]
+        print(f"{name}: {seconds * 1e6 / options.objects:.1f} µs per object")
+
+
+if __name__ == "__main__":
+    main()
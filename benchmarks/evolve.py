@@ -0,0 +1,105 @@
+"""
+Measures updating one field of a large StatefulSet with a deep copy and with evolve.
+
+The StatefulSet has many containers, each with a long environment, as a
+reconcile loop would see for a database cluster with sidecars::
+
+    python benchmarks/evolve.py --containers 20 --env 50
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import sys
+import timeit
+import tracemalloc
+
+from kubedantic.models.io.k8s.api.apps.v1 import StatefulSet
+from kubedantic.paths import evolve
+
+containers, env, mode = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+statefulset = StatefulSet.model_validate({
+    "metadata": {"name": "db", "namespace": "default", "labels": {"app": "db"}},
+    "spec": {
+        "replicas": 3,
+        "serviceName": "db",
+        "selector": {"matchLabels": {"app": "db"}},
+        "template": {
+            "metadata": {"labels": {"app": "db"}},
+            "spec": {
+                "containers": [{
+                    "name": f"container-{number}",
+                    "image": f"registry.example.com/db-{number}:1.0",
+                    "env": [
+                        {"name": f"SETTING_{index}", "value": str(index)}
+                        for index in range(env)
+                    ],
+                    "ports": [{"containerPort": 5432 + number}],
+                    "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+                    "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+                } for number in range(containers)],
+            },
+        },
+        "volumeClaimTemplates": [{
+            "metadata": {"name": "data"},
+            "spec": {
+                "accessModes": ["ReadWriteOnce"],
+                "resources": {"requests": {"storage": "10Gi"}},
+            },
+        }],
+    },
+})
+image = "spec.template.spec.containers[0].image"
+
+
+def deep_copy():
+    copy = statefulset.model_copy(deep=True)
+    copy.spec.replicas = 5
+    copy.spec.template.spec.containers[0].image = "registry.example.com/db-0:1.1"
+    return copy
+
+
+def evolved():
+    return evolve(
+        statefulset,
+        {"spec.replicas": 5, image: "registry.example.com/db-0:1.1"},
+    )
+
+
+function = deep_copy if mode == "deep" else evolved
+number, seconds = timeit.Timer(function).autorange()
+tracemalloc.start()
+copy = function()
+allocated = tracemalloc.get_traced_memory()[0]
+print(json.dumps({"seconds": seconds / number, "bytes": allocated}))
+"""
+
+
+def _measure(options: argparse.Namespace, mode: str) -> dict:
+    arguments = [str(options.containers), str(options.env), mode]
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, *arguments], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--containers", type=int, default=20)
+    parser.add_argument("--env", type=int, default=50)
+    options = parser.parse_args()
+
+    print(f"containers: {options.containers}, env: {options.env}")
+    for mode in ("deep", "evolve"):
+        result = _measure(options, mode)
+        microseconds = result["seconds"] * 1e6
+        kibibytes = result["bytes"] / 2**10
+        print(f"{mode}: {microseconds:.1f} µs, {kibibytes:.1f} KiB allocated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures the cost of importing every generated model module.
+
+Each measurement runs in a fresh interpreter so that module caches from a
+previous run do not skew the numbers::
+
+    python benchmarks/import_models.py --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_MEASURE = """
+import importlib
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+import kubedantic
+
+root = pathlib.Path(kubedantic.__file__).parent
+names = sorted(
+    ".".join(("kubedantic", *path.relative_to(root).with_suffix("").parts))
+    for path in (root / "models").rglob("*.py")
+    if path.stem != "__init__"
+)
+
+# tracemalloc slows imports down considerably, so time and memory are
+# measured in separate interpreters.
+trace = sys.argv[1] == "memory"
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+for name in names:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+current = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps({"seconds": elapsed, "bytes": current, "modules": len(names)}))
+"""
+
+
+def _measure(mode: str) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", _MEASURE, mode], text=True)
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    options = parser.parse_args()
+
+    timings = [_measure("time") for _ in range(options.runs)]
+    allocations = [_measure("memory") for _ in range(options.runs)]
+    seconds = statistics.median(result["seconds"] for result in timings)
+    megabytes = statistics.median(result["bytes"] for result in allocations) / 2**20
+
+    print(f"modules imported: {timings[0]['modules']}")
+    print(f"import time (median of {options.runs}): {seconds * 1000:.1f} ms")
+    print(f"allocated memory (median of {options.runs}): {megabytes:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures looking up a few objects in a large dump, with and without an index.
+
+The baseline loads the whole dump and validates the objects looked up;
+IndexedList scans the dump into an index saved next to it on the first open,
+and only reads that index when the dump is opened again::
+
+    python benchmarks/indexed.py --pods 100000 --lookups 100
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_MEASURE = """
+import json
+import random
+import resource
+import sys
+import time
+
+from kubedantic.indexed import IndexedList
+from kubedantic.models.io.k8s.api.core.v1 import Pod
+
+path, mode, pods, lookups = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+names = [f"app-{index}" for index in random.Random(0).sample(range(pods), lookups)]
+
+start = time.perf_counter()
+if mode == "load":
+    with open(path, "rb") as file:
+        items = json.load(file)["items"]
+    by_name = {item["metadata"]["name"]: item for item in items}
+    found = [Pod.model_validate(by_name[name]) for name in names]
+else:
+    with IndexedList(path) as snapshot:
+        opened = time.perf_counter() - start
+        found = [snapshot.get(name, "default") for name in names]
+assert all(found)
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "open": opened if mode != "load" else None,
+    "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def _item(index: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "main",
+                    "image": f"registry.example.com/app-{index % 100}:1.0",
+                    "env": [
+                        {"name": f"SETTING_{n}", "value": str(n)} for n in range(10)
+                    ],
+                }
+            ],
+            "nodeName": f"node-{index % 50}",
+        },
+    }
+
+
+def _measure(path: str, mode: str, pods: int, lookups: int) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, path, mode, str(pods), str(lookups)],
+        text=True,
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=100)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dump.json")
+        # Written item by item, the memory of this process being inherited
+        # by the measurements
+        with open(path, "w") as file:
+            file.write('{"apiVersion": "v1", "kind": "List", "items": [')
+            for index in range(options.pods):
+                file.write(("," if index else "") + json.dumps(_item(index)))
+            file.write("]}")
+
+        print(f"pods: {options.pods}, {os.path.getsize(path) / 2**20:.0f} MiB")
+        cases = [
+            ("json.load and validate", "load"),
+            ("IndexedList, first open", "indexed"),
+            ("IndexedList, reopened", "indexed"),
+        ]
+        for name, mode in cases:
+            result = _measure(path, mode, options.pods, options.lookups)
+            opened = f", open {result['open']:.3f} s" if result["open"] else ""
+            print(
+                f"{name}: {result['seconds']:.3f} s{opened},"
+                f" max RSS {result['max_rss'] / 1024:.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
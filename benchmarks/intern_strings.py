@@ -0,0 +1,109 @@
+"""
+Measures the memory saved by interning strings in a large synthetic cluster.
+
+Every pod is decoded from its own JSON document, as an informer would from
+separate watch events, once with interning and once without::
+
+    python benchmarks/intern_strings.py --pods 50000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import gc
+import json
+import sys
+import tracemalloc
+
+from kubedantic.base import validate_python
+from kubedantic.models.io.k8s.api.core.v1 import Pod
+
+pods, intern = int(sys.argv[1]), sys.argv[2] == "intern"
+context = {"intern_strings": True} if intern else None
+
+
+def _rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * 4096
+    except OSError:
+        return 0
+
+
+def _document(index):
+    namespace = f"team-{index % 50}"
+    app = f"app-{index % 400}"
+    return json.dumps({
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"{app}-{index}",
+            "namespace": namespace,
+            "uid": f"uid-{index}",
+            "labels": {
+                "app.kubernetes.io/name": app,
+                "app.kubernetes.io/part-of": namespace,
+                "pod-template-hash": f"{index % 400:08x}",
+            },
+            "annotations": {"kubernetes.io/psp": "restricted"},
+            "ownerReferences": [{
+                "apiVersion": "apps/v1",
+                "kind": "ReplicaSet",
+                "name": app,
+                "uid": f"rs-{index % 400}",
+                "controller": True,
+            }],
+        },
+        "spec": {
+            "nodeName": f"node-{index % 500}",
+            "serviceAccountName": "default",
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/{app}:1.{index % 3}",
+                "imagePullPolicy": "IfNotPresent",
+                "env": [{"name": "NAMESPACE", "value": namespace}],
+            }],
+        },
+        "status": {"phase": "Running", "hostIP": f"10.0.{index % 500 // 250}.1"},
+    })
+
+
+gc.collect()
+tracemalloc.start()
+rss = _rss()
+store = [
+    validate_python(Pod, json.loads(_document(index)), context)
+    for index in range(pods)
+]
+gc.collect()
+print(json.dumps({"bytes": tracemalloc.get_traced_memory()[0], "rss": _rss() - rss}))
+"""
+
+
+def _measure(pods: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(pods), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=20000)
+    options = parser.parse_args()
+
+    plain = _measure(options.pods, "plain")
+    interned = _measure(options.pods, "intern")
+
+    print(f"pods: {options.pods}")
+    for name, key in (("allocated", "bytes"), ("rss growth", "rss")):
+        before, after = plain[key] / 2**20, interned[key] / 2**20
+        saved = 1 - after / before if before else 0
+        print(f"{name}: {before:.1f} MiB -> {after:.1f} MiB ({saved:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Measures finding the managers of a field and their conflicts over a fleet.
+
+The baseline flattens the ``fieldsV1`` of every entry into a set of paths,
+the way a conflict report usually starts; ManagedFields follows the tries
+as they are, only along the paths it looks up::
+
+    python benchmarks/managed_fields.py --deployments 10000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import sys
+import time
+
+from kubedantic.managed_fields import ManagedFields
+from kubedantic.models.io.k8s.api.apps.v1 import DeploymentList
+
+deployments, mode = int(sys.argv[1]), sys.argv[2]
+
+
+def _containers(index):
+    return {
+        f'k:{{"name":"app-{n}"}}': {
+            ".": {},
+            "f:image": {},
+            "f:name": {},
+            "f:env": {f'k:{{"name":"SETTING_{m}"}}': {".": {}, "f:name": {}, "f:value": {}} for m in range(10)},
+            "f:ports": {'k:{"containerPort":8080,"protocol":"TCP"}': {".": {}, "f:containerPort": {}}},
+        }
+        for n in range(3)
+    }
+
+
+def _item(index):
+    gitops = {
+        "f:metadata": {"f:labels": {".": {}, "f:app": {}}},
+        "f:spec": {
+            "f:replicas": {},
+            "f:selector": {},
+            "f:template": {"f:metadata": {"f:labels": {".": {}, "f:app": {}}}, "f:spec": {"f:containers": _containers(index)}},
+        },
+    }
+    return {
+        "metadata": {
+            "name": f"app-{index}",
+            "managedFields": [
+                {"manager": "argocd", "operation": "Apply", "fieldsV1": gitops},
+                {"manager": "hpa", "operation": "Update", "fieldsV1": {"f:spec": {"f:replicas": {}}}},
+                {"manager": "kube-controller-manager", "operation": "Update", "subresource": "status",
+                 "fieldsV1": {"f:status": {"f:replicas": {}, "f:readyReplicas": {}}}},
+            ],
+        },
+        "spec": {"selector": {}, "template": {}},
+    }
+
+
+def _flatten(node, prefix=()):
+    for key, child in node.items():
+        if key == ".":
+            continue
+        if not child or "." in child:
+            yield (*prefix, key)
+        yield from _flatten(child, (*prefix, key))
+
+
+def flattened(deployment):
+    sets = {}
+    for entry in deployment.metadata.managedFields:
+        sets.setdefault(entry.manager, set()).update(_flatten(entry.fieldsV1.model_extra))
+    replicas = ("f:spec", "f:replicas")
+    owners = [manager for manager, paths in sets.items() if replicas in paths]
+    conflicts = {manager: paths & sets["argocd"] for manager, paths in sets.items() if manager != "argocd"}
+    return owners, conflicts
+
+
+def tries(deployment):
+    managed = ManagedFields.from_object(deployment)
+    return managed.owners("spec.replicas"), managed.conflicts("argocd")
+
+
+fleet = DeploymentList.model_validate({"items": [_item(index) for index in range(deployments)]})
+check = flattened if mode == "flatten" else tries
+start = time.perf_counter()
+for deployment in fleet.items:
+    check(deployment)
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+MODES = {
+    "flatten": "flattened path sets",
+    "tries": "ManagedFields",
+}
+
+
+def _measure(deployments: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(deployments), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deployments", type=int, default=10000)
+    options = parser.parse_args()
+
+    print(f"deployments: {options.deployments}")
+    for mode, name in MODES.items():
+        seconds = _measure(options.deployments, mode)["seconds"]
+        print(f"{name}: {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
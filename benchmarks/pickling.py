@@ -0,0 +1,96 @@
+"""
+Measures pickling a large pod list, as sent to the workers of a process pool.
+
+The baseline is the default pickling of pydantic models, field by field;
+kinds and lists are pickled as the JSON of their fields that are set, in
+band or as an out-of-band buffer with protocol 5::
+
+    python benchmarks/pickling.py --pods 20000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import pickle
+import sys
+import time
+
+from kubedantic.base import KubernetesObject, ObjectList
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+
+pods, mode = int(sys.argv[1]), sys.argv[2]
+
+if mode == "default":
+    del KubernetesObject.__reduce_ex__, ObjectList.__reduce_ex__
+
+
+def _item(index):
+    return {
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "resourceVersion": str(index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/app-{index % 100}:1.0",
+                "env": [{"name": f"SETTING_{n}", "value": str(n)} for n in range(10)],
+                "ports": [{"containerPort": 8080}],
+            }],
+            "nodeName": f"node-{index % 50}",
+        },
+        "status": {"phase": "Running", "podIP": f"10.0.{index // 250 % 250}.{index % 250}"},
+    }
+
+
+pod_list = PodList.model_validate({"items": [_item(index) for index in range(pods)]})
+buffers = [] if mode == "out-of-band" else None
+start = time.perf_counter()
+data = pickle.dumps(pod_list, protocol=5, buffer_callback=buffers.append if buffers is not None else None)
+dumped = time.perf_counter()
+unpickled = pickle.loads(data, buffers=buffers)
+loaded = time.perf_counter()
+assert unpickled == pod_list
+size = len(data) + sum(len(bytes(buffer)) for buffer in buffers or ())
+print(json.dumps({"dumps": dumped - start, "loads": loaded - dumped, "bytes": size}))
+"""
+
+MODES = {
+    "default": "default pickling",
+    "json": "JSON",
+    "out-of-band": "JSON, out-of-band",
+}
+
+
+def _measure(pods: int, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(pods), mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=20000)
+    options = parser.parse_args()
+
+    print(f"pods: {options.pods}")
+    for mode, name in MODES.items():
+        result = _measure(options.pods, mode)
+        size = result["bytes"] / 2**20
+        print(
+            f"{name}: dumps {result['dumps']:.2f} s, loads {result['loads']:.2f} s,"
+            f" {size:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures decoding a list of pods sent as protobuf, against the JSON path.
+
+The list repeats the pod of ``tests/data/protobuf``; the baseline
+validates the JSON of the same list with pydantic::
+
+    python benchmarks/protobuf.py --pods 5000
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+from kubedantic.protobuf import MAGIC, from_protobuf
+
+POD_PATH = Path(__file__).parent.parent / "tests" / "data" / "protobuf" / "pod.pb"
+
+
+def _varint(value: int) -> bytes:
+    data = bytearray()
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _field(number: int, data: bytes) -> bytes:
+    return _varint(number << 3 | 2) + _varint(len(data)) + data
+
+
+def _read_varint(data: bytes, position: int):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _read_pod() -> bytes:
+    # The envelope holds the type meta (field 1), then the raw pod (field 2)
+    data = POD_PATH.read_bytes()
+    position = len(MAGIC)
+    while True:
+        key, position = _read_varint(data, position)
+        size, position = _read_varint(data, position)
+        if key >> 3 == 2:
+            return data[position : position + size]
+        position += size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=5000)
+    options = parser.parse_args()
+
+    type_meta = _field(1, b"v1") + _field(2, b"PodList")
+    items = _field(2, _read_pod()) * options.pods
+    data = MAGIC + _field(1, type_meta) + _field(2, items)
+
+    start = time.perf_counter()
+    pods = from_protobuf(data)
+    elapsed = time.perf_counter() - start
+    print(f"protobuf: {elapsed:.2f} s, {len(data) / 2**20:.1f} MiB")
+
+    raw_json = pods.model_dump_json(by_alias=True, exclude_unset=True)
+    start = time.perf_counter()
+    PodList.model_validate_json(raw_json)
+    elapsed = time.perf_counter() - start
+    print(f"json: {elapsed:.2f} s, {len(raw_json) / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
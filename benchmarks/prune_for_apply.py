@@ -0,0 +1,125 @@
+"""
+Measures exporting a large pod list without the fields populated by the server.
+
+The baseline dumps every pod and walks the dump in Python to delete the
+read-only fields; prune_for_apply leaves them out while dumping, either for
+the whole list at once or streamed one pod at a time::
+
+    python benchmarks/prune_for_apply.py --pods 50000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+from kubedantic.pruning import iter_prune_for_apply, prune_for_apply
+
+pods, mode, trace = int(sys.argv[1]), sys.argv[2], sys.argv[3] == "memory"
+SERVER_FIELDS = (
+    "creationTimestamp", "deletionGracePeriodSeconds", "deletionTimestamp",
+    "generation", "managedFields", "resourceVersion", "selfLink", "uid",
+)
+
+
+def _item(index):
+    return {
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "resourceVersion": str(index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "managedFields": [{"manager": "kubelet", "operation": "Update"}],
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/app-{index % 100}:1.0",
+                "env": [{"name": f"SETTING_{n}", "value": str(n)} for n in range(10)],
+                "ports": [{"containerPort": 8080}],
+            }],
+            "nodeName": f"node-{index % 50}",
+        },
+        "status": {"phase": "Running", "podIP": f"10.0.{index // 250 % 250}.{index % 250}"},
+    }
+
+
+def _walk(value):
+    # What an export script does: dump, then delete the read-only fields
+    if isinstance(value, dict):
+        metadata = value.get("metadata")
+        if isinstance(metadata, dict):
+            for name in SERVER_FIELDS:
+                metadata.pop(name, None)
+        for item in value.values():
+            _walk(item)
+    elif isinstance(value, list):
+        for item in value:
+            _walk(item)
+    return value
+
+
+def walk(items):
+    dumps = [item.model_dump(mode="json", by_alias=True, exclude_unset=True) for item in items]
+    for dump in dumps:
+        dump.pop("status", None)
+        _walk(dump)
+    return dumps
+
+
+pod_list = PodList.model_validate({"items": [_item(index) for index in range(pods)]})
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+with open(os.devnull, "w") as out:
+    if mode == "walk":
+        exported = walk(pod_list.items)
+    elif mode == "prune":
+        exported = [prune_for_apply(item) for item in pod_list.items]
+    else:
+        exported = iter_prune_for_apply(pod_list)
+    for data in exported:
+        out.write(json.dumps(data))
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if trace else 0
+print(json.dumps({"seconds": elapsed, "peak": peak}))
+"""
+
+MODES = {
+    "walk": "dump and walk",
+    "prune": "prune_for_apply",
+    "stream": "iter_prune_for_apply",
+}
+
+
+def _measure(pods: int, mode: str, trace: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(pods), mode, trace], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=50000)
+    options = parser.parse_args()
+
+    print(f"pods: {options.pods}")
+    for mode, name in MODES.items():
+        seconds = _measure(options.pods, mode, "time")["seconds"]
+        peak = _measure(options.pods, mode, "memory")["peak"] / 2**20
+        print(f"{name}: {seconds:.2f} s, {peak:.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures reading the sizes of the data of secrets, against decoding it.
+
+Each secret holds a bundle of certificates; the fields of bytes keep their
+base64 strings, whose sizes are computed without decoding them, while the
+baseline decodes every value, as needed with plain strings::
+
+    python benchmarks/secret_data.py --secrets 200 --size 262144
+"""
+
+import argparse
+import base64
+import os
+import time
+import tracemalloc
+
+from kubedantic.models.io.k8s.api.core.v1 import SecretList
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--secrets", type=int, default=200)
+    parser.add_argument("--size", type=int, default=256 * 1024)
+    options = parser.parse_args()
+
+    bundle = base64.b64encode(os.urandom(options.size)).decode()
+    raw_json = SecretList.model_validate({
+        "items": [
+            {"metadata": {"name": f"tls-{index}"}, "data": {"ca.crt": bundle}}
+            for index in range(options.secrets)
+        ]
+    }).model_dump_json(exclude_unset=True)
+    secrets = SecretList.model_validate_json(raw_json)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = sum(value.nbytes for item in secrets.items for value in item.data.values())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"nbytes: {elapsed:.4f} s, {peak / 2**20:.1f} MiB peak, {total} bytes")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    decoded = [
+        base64.b64decode(value)
+        for item in secrets.items
+        for value in item.data.values()
+    ]
+    total = sum(len(value) for value in decoded)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"b64decode: {elapsed:.4f} s, {peak / 2**20:.1f} MiB peak, {total} bytes")
+
+
+if __name__ == "__main__":
+    main()
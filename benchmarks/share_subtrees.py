@@ -0,0 +1,95 @@
+"""
+Measures the memory saved by sharing identical pod specs across replicas.
+
+Pods are generated from a limited number of templates, as in a cluster
+running a few large deployments, and decoded from separate JSON documents
+with and without a shared subtree cache::
+
+    python benchmarks/share_subtrees.py --pods 20000 --templates 100
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from kubedantic.base import validate_json
+from kubedantic.models.io.k8s.api.core.v1 import Pod
+from kubedantic.sharing import SubtreeCache
+
+pods, templates, mode = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+cache = SubtreeCache()
+context = cache.context if mode == "shared" else None
+
+
+def _document(index):
+    template = index % templates
+    return json.dumps({
+        "metadata": {"name": f"app-{template}-{index}", "namespace": "default"},
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/app-{template}:1.0",
+                "args": ["--port=8080", "--log-level=info"],
+                "env": [
+                    {"name": f"SETTING_{number}", "value": str(number)}
+                    for number in range(10)
+                ],
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "resources": {
+                    "limits": {"cpu": "500m", "memory": "256Mi"},
+                    "requests": {"cpu": "100m", "memory": "128Mi"},
+                },
+                "volumeMounts": [{"name": "config", "mountPath": "/etc/app"}],
+                "readinessProbe": {"httpGet": {"path": "/ready", "port": 8080}},
+            }],
+            "volumes": [{"name": "config", "configMap": {"name": f"app-{template}"}}],
+            "tolerations": [{"key": "dedicated", "operator": "Exists"}],
+        },
+    })
+
+
+documents = [_document(index) for index in range(pods)]
+trace = sys.argv[4] == "memory"
+gc.collect()
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+store = [validate_json(Pod, document, context) for document in documents]
+elapsed = time.perf_counter() - start
+gc.collect()
+current = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps({"seconds": elapsed, "bytes": current}))
+"""
+
+
+def _measure(options: argparse.Namespace, mode: str, trace: str) -> dict:
+    arguments = [str(options.pods), str(options.templates), mode, trace]
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, *arguments], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=20000)
+    parser.add_argument("--templates", type=int, default=100)
+    options = parser.parse_args()
+
+    print(f"pods: {options.pods}, templates: {options.templates}")
+    for mode in ("plain", "shared"):
+        seconds = _measure(options, mode, "time")["seconds"]
+        megabytes = _measure(options, mode, "memory")["bytes"] / 2**20
+        print(f"{mode}: {seconds:.2f} s, {megabytes:.1f} MiB allocated")
+
+
+if __name__ == "__main__":
+    main()
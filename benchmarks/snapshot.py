@@ -0,0 +1,122 @@
+"""
+Measures loading a cache of pods back on start, from a snapshot or otherwise.
+
+The baselines validate the JSON of a list, as a relist would, and unpickle
+the objects; a snapshot is loaded at once, or opened to get a single pod::
+
+    python benchmarks/snapshot.py --pods 50000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+_MEASURE = """
+import json
+import pickle
+import sys
+import time
+
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+from kubedantic.snapshot import Snapshot
+
+directory, mode = sys.argv[1], sys.argv[2]
+
+start = time.perf_counter()
+if mode == "json":
+    with open(f"{directory}/pods.json", "rb") as file:
+        pods = PodList.model_validate_json(file.read()).items
+elif mode == "pickle":
+    with open(f"{directory}/pods.pickle", "rb") as file:
+        pods = pickle.load(file)
+elif mode == "snapshot":
+    with Snapshot(f"{directory}/pods.snapshot") as snapshot:
+        pods = snapshot.load(pause_gc=True)
+else:
+    with Snapshot(f"{directory}/pods.snapshot") as snapshot:
+        pods = [snapshot.get("default/app-0")]
+print(json.dumps({"seconds": time.perf_counter() - start, "pods": len(pods)}))
+"""
+
+_WRITE = """
+import json
+import pickle
+import sys
+
+from kubedantic.models.io.k8s.api.core.v1 import PodList
+from kubedantic.snapshot import write_snapshot
+
+directory = sys.argv[1]
+with open(f"{directory}/pods.json", "rb") as file:
+    pods = PodList.model_validate_json(file.read()).items
+with open(f"{directory}/pods.pickle", "wb") as file:
+    pickle.dump(pods, file, protocol=pickle.HIGHEST_PROTOCOL)
+write_snapshot(f"{directory}/pods.snapshot", pods, resource_version="1")
+"""
+
+
+def _item(index: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "main",
+                    "image": f"registry.example.com/app-{index % 100}:1.0",
+                    "env": [
+                        {"name": f"SETTING_{n}", "value": str(n)} for n in range(10)
+                    ],
+                }
+            ],
+            "nodeName": f"node-{index % 50}",
+        },
+    }
+
+
+def _measure(directory: str, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, directory, mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=50000)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "pods.json"), "w") as file:
+            items = [_item(index) for index in range(options.pods)]
+            json.dump({"apiVersion": "v1", "kind": "PodList", "items": items}, file)
+        subprocess.check_call([sys.executable, "-c", _WRITE, directory])
+
+        print(f"pods: {options.pods}")
+        for name in ("pods.json", "pods.pickle", "pods.snapshot"):
+            size = os.path.getsize(os.path.join(directory, name)) / 2**20
+            print(f"{name}: {size:.1f} MiB")
+        cases = [
+            ("validate JSON list", "json"),
+            (f"unpickle (protocol {pickle.HIGHEST_PROTOCOL})", "pickle"),
+            ("Snapshot.load", "snapshot"),
+            ("Snapshot.get, one pod", "get"),
+        ]
+        for name, mode in cases:
+            seconds = _measure(directory, mode)["seconds"]
+            print(f"{name}: {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
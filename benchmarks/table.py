@@ -0,0 +1,70 @@
+"""
+Measures reading columns out of a table of pods, against validating it.
+
+The table holds the columns printed by kubectl and the metadata of each pod;
+get_columns projects the columns out of its JSON, while the baseline
+validates the whole Table before projecting them::
+
+    python benchmarks/table.py --pods 20000
+"""
+
+import argparse
+import json
+import time
+
+from kubedantic.table import Table, get_columns
+
+COLUMNS = ["Name", "Ready", "Status", "Restarts", "Age", "IP", "Node"]
+
+
+def _row(index: int) -> dict:
+    return {
+        "cells": [
+            f"app-{index}",
+            "1/1",
+            "Running",
+            index % 3,
+            "2024-01-01T00:00:00Z",
+            f"10.0.{index // 256 % 256}.{index % 256}",
+            f"node-{index % 500}",
+        ],
+        "object": {
+            "kind": "PartialObjectMetadata",
+            "apiVersion": "meta.k8s.io/v1",
+            "metadata": {
+                "name": f"app-{index}",
+                "namespace": "default",
+                "uid": f"uid-{index}",
+                "resourceVersion": str(index),
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+                "labels": {"app": f"app-{index % 100}"},
+            },
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=20000)
+    options = parser.parse_args()
+
+    raw_json = json.dumps({
+        "kind": "Table",
+        "apiVersion": "meta.k8s.io/v1",
+        "columnDefinitions": [{"name": name, "type": "string"} for name in COLUMNS],
+        "rows": [_row(index) for index in range(options.pods)],
+    })
+
+    start = time.perf_counter()
+    get_columns(raw_json, ["Name", "Status", "Node"])
+    elapsed = time.perf_counter() - start
+    print(f"get_columns: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    Table.model_validate_json(raw_json).columns(["Name", "Status", "Node"])
+    elapsed = time.perf_counter() - start
+    print(f"Table.columns: {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures validating a batch of decoded pods on 1 to N threads.
+
+Threads only validate in parallel on free-threaded builds of Python (e.g.
+``python3.13t``), on which the time should go down with every thread added;
+with the GIL it stays about the same::
+
+    python3.13t benchmarks/threads.py --pods 100000 --threads 8
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_MEASURE = """
+import json
+import sys
+import time
+
+from kubedantic.bulk import validate_objects
+
+pods, threads = int(sys.argv[1]), int(sys.argv[2])
+
+
+def _item(index):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {"app": f"app-{index % 100}"},
+            "uid": f"uid-{index}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.example.com/app-{index % 100}:1.0",
+                "env": [{"name": f"SETTING_{n}", "value": str(n)} for n in range(10)],
+                "ports": [{"containerPort": 8080}],
+            }],
+            "nodeName": f"node-{index % 50}",
+        },
+        "status": {"phase": "Running", "podIP": f"10.0.{index // 250 % 250}.{index % 250}"},
+    }
+
+
+items = [_item(index) for index in range(pods)]
+start = time.perf_counter()
+for _ in validate_objects(items, workers=threads):
+    pass
+elapsed = time.perf_counter() - start
+free_threaded = not getattr(sys, "_is_gil_enabled", lambda: True)()
+print(json.dumps({"seconds": elapsed, "free_threaded": free_threaded}))
+"""
+
+
+def _measure(pods: int, threads: int) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, str(pods), str(threads)], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pods", type=int, default=100000)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args()
+
+    counts = sorted({1, *(2**n for n in range(options.threads.bit_length()))})
+    counts = [count for count in counts if count <= options.threads]
+    if options.threads not in counts:
+        counts.append(options.threads)
+
+    baseline = None
+    for threads in counts:
+        result = _measure(options.pods, threads)
+        if baseline is None:
+            baseline = result["seconds"]
+            gil = "disabled" if result["free_threaded"] else "enabled"
+            print(f"pods: {options.pods}, GIL {gil}")
+        speedup = baseline / result["seconds"]
+        print(f"{threads} threads: {result['seconds']:.2f} s, {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
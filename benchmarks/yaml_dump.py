@@ -0,0 +1,87 @@
+"""
+Measures writing objects back as multi-document YAML manifests.
+
+The baseline dumps the fields set of every object with ``yaml.safe_dump_all``
+and its pure Python emitter; to_yaml orders them as kubectl does and emits
+them with LibYAML::
+
+    python benchmarks/yaml_dump.py --deployments 5000
+"""
+
+import argparse
+import io
+import time
+
+import yaml
+
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.yaml import to_yaml
+
+
+def _deployment(index: int) -> Deployment:
+    labels = {"app": f"app-{index}"}
+    return Deployment.model_validate({
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": f"app-{index}", "namespace": "default", "labels": labels},
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": labels},
+            "template": {
+                "metadata": {
+                    "labels": labels,
+                    "annotations": {"config": "line 1\nline 2\nline 3\n"},
+                },
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "main",
+                            "image": f"registry.example.com/app-{index}:1.0",
+                            "ports": [{"containerPort": 8080}],
+                            "env": [
+                                {"name": f"SETTING_{n}", "value": str(n)}
+                                for n in range(10)
+                            ],
+                            "resources": {
+                                "requests": {"cpu": "100m", "memory": "128Mi"}
+                            },
+                        }
+                    ]
+                },
+            },
+        },
+    })
+
+
+def _safe_dump_all(deployments, stream):
+    yaml.safe_dump_all(
+        (
+            deployment.model_dump(
+                mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+            )
+            for deployment in deployments
+        ),
+        stream,
+        sort_keys=False,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deployments", type=int, default=5000)
+    options = parser.parse_args()
+
+    deployments = [_deployment(index) for index in range(options.deployments)]
+    print(f"deployments: {options.deployments}")
+
+    for name, dump in (("safe_dump_all", _safe_dump_all), ("to_yaml", to_yaml)):
+        stream = io.StringIO()
+        start = time.perf_counter()
+        dump(deployments, stream)
+        elapsed = time.perf_counter() - start
+        size = len(stream.getvalue().encode()) / 2**20
+        print(f"{name}: {elapsed:.2f} s, {size:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
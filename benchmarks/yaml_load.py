@@ -0,0 +1,117 @@
+"""
+Measures loading the objects of multi-document YAML manifests.
+
+The baseline loads every document with ``yaml.safe_load_all`` before
+validating them; iter_load streams them with the LibYAML parser::
+
+    python benchmarks/yaml_load.py --deployments 5000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_MEASURE = """
+import json
+import resource
+import sys
+import time
+
+import yaml
+
+from kubedantic.base import get_model
+from kubedantic.yaml import iter_load
+
+path, mode = sys.argv[1], sys.argv[2]
+
+start = time.perf_counter()
+count = 0
+if mode == "safe_load_all":
+    with open(path, "rb") as file:
+        documents = list(yaml.safe_load_all(file))
+    for data in documents:
+        get_model(data["apiVersion"], data["kind"]).model_validate(data)
+        count += 1
+else:
+    for obj in iter_load(path):
+        count += 1
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "objects": count,
+    "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+_DEPLOYMENT = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app-{index}
+  namespace: default
+  labels:
+    app: app-{index}
+spec:
+  replicas: 3
+  selector:
+    matchLabels:
+      app: app-{index}
+  template:
+    metadata:
+      labels:
+        app: app-{index}
+    spec:
+      containers:
+        - name: main
+          image: registry.example.com/app-{index}:1.0
+          ports:
+            - containerPort: 8080
+          env:
+{env}
+          resources:
+            requests:
+              cpu: 100m
+              memory: 128Mi
+"""
+
+_ENV = "".join(
+    f"            - name: SETTING_{n}\n              value: '{n}'\n" for n in range(10)
+).rstrip("\n")
+
+
+def _measure(path: str, mode: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE, path, mode], text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deployments", type=int, default=5000)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "manifests.yaml")
+        with open(path, "w") as file:
+            file.write(
+                "---\n".join(
+                    _DEPLOYMENT.format(index=index, env=_ENV)
+                    for index in range(options.deployments)
+                )
+            )
+
+        size = os.path.getsize(path) / 2**20
+        print(f"deployments: {options.deployments}, {size:.1f} MiB")
+        for mode in ("safe_load_all", "iter_load"):
+            result = _measure(path, mode)
+            print(
+                f"{mode}: {result['seconds']:.2f} s,"
+                f" max RSS {result['max_rss'] / 1024:.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from typing import Any, Dict
+
+from generator.field_trees import FieldTrees
+
+HEADER = '''"""
+Fields holding bytes, base64-encoded in JSON and YAML, by ``apiVersion`` and
+``kind``.
+
+The values are nested dicts of the fields, as ``exclude`` takes them in
+``model_dump``, with ``"__all__"`` standing for every list item or map value.
+"""
+
+from typing import Any, Dict, Tuple
+
+'''
+
+
+def _is_bytes(schema: Dict[str, Any]) -> bool:
+    return schema.get("type") == "string" and schema.get("format") == "byte"
+
+
+class ByteFields(FieldTrees):
+    """
+    Collects the fields holding bytes (``format: byte``) in every kind of the
+    specs.
+    """
+
+    header = HEADER
+    table = "BYTE_FIELDS"
+
+    def is_selected(self, name: str, field: str, schema: Dict[str, Any]) -> bool:
+        return _is_bytes(schema)
+
+    def is_selected_value(self, schema: Dict[str, Any]) -> bool:
+        return _is_bytes(schema)
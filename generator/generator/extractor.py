@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import requests  # type: ignore
 from pydantic import BaseModel
 
+from generator.protobuf import get_proto_path
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,12 +72,14 @@ class K8sOpenAPIExtractor:
         repo_owner: str = "kubernetes",
         repo_name: str = "kubernetes",
         version: str = LATEST_K8S_VERSION,
+        raw_url: str = "https://raw.githubusercontent.com/",
     ):
         self.output_path = Path(output_path)
         self.api_url = api_url if api_url.endswith("/") else f"{api_url}/"
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.version = version
+        self.raw_url = raw_url if raw_url.endswith("/") else f"{raw_url}/"
         self.client = requests.Session()
 
     @property
@@ -96,6 +100,15 @@ class K8sOpenAPIExtractor:
         response.raise_for_status()
         return response.json()
 
+    def _fetch_text(
+        self, url: str, timeout: Tuple[int, int] = (3, 30)
+    ) -> Optional[str]:
+        response = self.client.get(url, timeout=timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.text
+
     def _fetch_openapi_specs(self) -> List[OpenAPIPath]:
         response = self._fetch(
             path=f"repos/{self.repo_owner}/{self.repo_name}/contents/api/openapi-spec/v3",
@@ -156,3 +169,33 @@ class K8sOpenAPIExtractor:
             raise NoSchemaFoundError("Unable to find any schema")
 
         return self._write_schema(schema)
+
+    def extract_protos(self, spec_path: Path) -> List[Path]:
+        """
+        Downloads the ``generated.proto`` files of the packages of the
+        schemas of the spec at ``spec_path``, next to it, skipping the
+        packages that have none.
+        """
+        schemas = json.loads(spec_path.read_text())["components"]["schemas"]
+        packages = sorted({name.rpartition(".")[0] for name in schemas})
+        out_dir = spec_path.with_suffix("")
+
+        paths = []
+        for package in packages:
+            proto_path = get_proto_path(package)
+            if proto_path is None:
+                continue
+
+            url = f"{self.raw_url}{self.repo_owner}/{self.repo_name}/{self.version}/{proto_path}"
+            logger.info("Fetching protos for %s", url)
+            text = self._fetch_text(url)
+            if text is None:
+                logger.info("No protos found for %s", package)
+                continue
+
+            out_path = out_dir / f"{package}.proto"
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(text)
+            paths.append(out_path)
+
+        return paths
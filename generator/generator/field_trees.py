@@ -0,0 +1,192 @@
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+REF_PREFIX = "#/components/schemas/"
+
+Tree = Dict[str, Any]
+
+
+def get_reference(schema: Dict[str, Any]) -> Optional[str]:
+    ref = schema.get("$ref")
+    if ref is None:
+        ref = next(
+            (
+                item["$ref"]
+                for item in schema.get("allOf", []) + schema.get("anyOf", [])
+                if "$ref" in item
+            ),
+            None,
+        )
+    return ref[len(REF_PREFIX) :] if ref and ref.startswith(REF_PREFIX) else None
+
+
+def get_kind(schema: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    Returns the ``apiVersion`` and ``kind`` of a schema, if it is a kind.
+    """
+    gvks = schema.get("x-kubernetes-group-version-kind") or []
+    if len(gvks) != 1:
+        return None
+
+    group, version, kind = gvks[0]["group"], gvks[0]["version"], gvks[0]["kind"]
+    return (f"{group}/{version}" if group else version), kind
+
+
+def _to_variable(name: str) -> str:
+    return "_" + re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).upper()
+
+
+class FieldTrees:
+    """
+    Collects the fields of a sort in every kind of the specs, rendered as a
+    module with a table of them by kind.
+
+    Each schema gets a tree of the fields reachable from it, descending into
+    the schemas of its fields, lists and maps.
+    """
+
+    # Docstring and imports of the module
+    header = ""
+    # Name of the table of the trees by kind
+    table = ""
+
+    def __init__(self, schemas: Dict[str, Any]):
+        self.schemas = schemas
+        self._trees: Dict[str, Tree] = {}
+        self._pending: Set[str] = set()
+
+    def is_selected(self, name: str, field: str, schema: Dict[str, Any]) -> bool:
+        """
+        Returns whether the ``field`` of the schema ``name`` is of the sort.
+        """
+        raise NotImplementedError
+
+    def is_selected_value(self, schema: Dict[str, Any]) -> bool:
+        """
+        Returns whether the items of a list or map are of the sort.
+        """
+        return False
+
+    def _get_value_tree(self, schema: Dict[str, Any]) -> Optional[Any]:
+        reference = get_reference(schema)
+        if reference is not None:
+            return reference if self.get_tree(reference) else None
+
+        for key in ("items", "additionalProperties"):
+            if isinstance(schema.get(key), dict):
+                if self.is_selected_value(schema[key]):
+                    return {"__all__": True}
+                tree = self._get_value_tree(schema[key])
+                return {"__all__": tree} if tree else None
+
+        return None
+
+    def get_tree(self, name: str) -> Tree:
+        """
+        Returns the fields of the sort of a schema, with the fields of the
+        schemas it uses given as their names.
+        """
+        if name in self._trees:
+            return self._trees[name]
+        if name in self._pending or name not in self.schemas:
+            # Recursive schemas (e.g. JSONSchemaProps) have no such fields
+            return {}
+
+        self._pending.add(name)
+        tree: Tree = {}
+
+        properties = self.schemas[name].get("properties") or {}
+        for field, schema in sorted(properties.items()):
+            if self.is_selected(name, field, schema):
+                tree[field] = True
+            else:
+                value = self._get_value_tree(schema)
+                if value:
+                    tree[field] = value
+
+        self._pending.discard(name)
+        self._trees[name] = tree
+        return tree
+
+    def get_kinds(self) -> Dict[Tuple[str, str], str]:
+        """
+        Returns the schema names of the kinds with fields of the sort.
+        """
+        kinds = {}
+        for name, schema in sorted(self.schemas.items()):
+            kind = get_kind(schema)
+            if kind is not None and kind not in kinds and self.get_tree(name):
+                kinds[kind] = name
+        return kinds
+
+    def get_roots(self) -> List[str]:
+        """
+        Returns the schemas whose trees are rendered besides those of the
+        kinds, for the footer.
+        """
+        return []
+
+    def _get_variables(self, kinds: Dict[Tuple[str, str], str]) -> Dict[str, str]:
+        """
+        Returns the variable names of the trees used by the kinds, in
+        dependency order.
+        """
+        variables: Dict[str, str] = {}
+
+        def visit(value: Any):
+            if isinstance(value, dict):
+                for item in value.values():
+                    visit(item)
+            elif isinstance(value, str) and value not in variables:
+                visit(self._trees[value])
+                # Prefix the names taken already with the version, group...
+                parts = value.split(".")
+                for count in range(1, len(parts) + 1):
+                    variable = _to_variable("_".join(parts[-count:]))
+                    if variable not in variables.values():
+                        break
+                variables[value] = variable
+
+        for name in kinds.values():
+            visit(name)
+        for name in self.get_roots():
+            if self.get_tree(name):
+                visit(name)
+
+        return variables
+
+    def render_footer(self, variables: Dict[str, str]) -> str:
+        """
+        Returns the source following the table, given the variable names of
+        the trees.
+        """
+        return ""
+
+    def render(self) -> str:
+        """
+        Returns the source of the module with the fields of the sort by kind.
+        """
+        kinds = self.get_kinds()
+        variables = self._get_variables(kinds)
+
+        def render_tree(value: Any) -> str:
+            if value is True:
+                return "True"
+            if isinstance(value, str):
+                return variables[value]
+            items = ", ".join(
+                f"{key!r}: {render_tree(item)}" for key, item in value.items()
+            )
+            return f"{{{items}}}"
+
+        lines: List[str] = [self.header]
+        for name, variable in variables.items():
+            lines.append(f"{variable} = {render_tree(self._trees[name])}\n")
+
+        lines.append(f"\n{self.table}: Dict[Tuple[str, str], Dict[str, Any]] = {{\n")
+        for kind, name in sorted(kinds.items()):
+            lines.append(f"    {kind!r}: {variables[name]},\n")
+        lines.append("}\n")
+
+        lines.append(self.render_footer(variables))
+        return "".join(lines)
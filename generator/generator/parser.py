@@ -1,17 +1,87 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 from urllib.parse import ParseResult
 
-from datamodel_code_generator.format import PythonVersion
+from datamodel_code_generator.format import CodeFormatter, PythonVersion
+from datamodel_code_generator.imports import Import
 from datamodel_code_generator.model import DataModel, DataModelFieldBase, pydantic_v2
+from datamodel_code_generator.model.base import BaseClassDataType
+from datamodel_code_generator.parser.base import Result
 from datamodel_code_generator.parser.jsonschema import JsonSchemaObject
 from datamodel_code_generator.parser.openapi import OpenAPIParser
+from datamodel_code_generator.reference import Reference
+from datamodel_code_generator.types import Types
 from pydantic import model_validator
 
+from generator.sorter import sort_module
+from generator.splitter import split_module
+
 logger = logging.getLogger(__name__)
 
+BASE_MODEL_IMPORT = Import.from_full_path("pydantic.BaseModel")
+OBJECT_LIST_IMPORT = Import.from_full_path("kubedantic.base.ObjectList")
+NAMESPACED_OBJECT_IMPORT = Import.from_full_path("kubedantic.base.NamespacedObject")
+CLUSTER_SCOPED_OBJECT_IMPORT = Import.from_full_path(
+    "kubedantic.base.ClusterScopedObject"
+)
+# Strings of ``format: byte``, kept base64-encoded and decoded on access
+BASE64_BYTES_IMPORT = Import.from_full_path("kubedantic.types.Base64Bytes")
+
+# Fields shared by every ``*List`` kind, declared once in ``ObjectList``
+OBJECT_LIST_FIELDS = {"apiVersion", "items", "kind", "metadata"}
+
+# Fields shared by every top-level kind, declared once in ``KubernetesObject``
+OBJECT_FIELDS = {"apiVersion", "kind", "metadata"}
+
+# Fields that are already required in the base classes
+REQUIRED_BASE_FIELDS = {"items"}
+
+# The OpenAPI schemas do not carry the scope of a kind (only the API paths
+# do), so the cluster-scoped ones are listed here; any other kind is
+# considered namespaced.
+CLUSTER_SCOPED_KINDS = {
+    "APIService",
+    "CSIDriver",
+    "CSINode",
+    "CertificateSigningRequest",
+    "ClusterRole",
+    "ClusterRoleBinding",
+    "ClusterTrustBundle",
+    "ComponentStatus",
+    "CustomResourceDefinition",
+    "DeviceClass",
+    "FlowSchema",
+    "IPAddress",
+    "IngressClass",
+    "MutatingAdmissionPolicy",
+    "MutatingAdmissionPolicyBinding",
+    "MutatingWebhookConfiguration",
+    "Namespace",
+    "Node",
+    "PersistentVolume",
+    "PriorityClass",
+    "PriorityLevelConfiguration",
+    "ResourceClass",
+    "ResourceSlice",
+    "RuntimeClass",
+    "SelfSubjectAccessReview",
+    "SelfSubjectReview",
+    "SelfSubjectRulesReview",
+    "ServiceCIDR",
+    "StorageClass",
+    "StorageVersion",
+    "StorageVersionMigration",
+    "SubjectAccessReview",
+    "TokenReview",
+    "ValidatingAdmissionPolicy",
+    "ValidatingAdmissionPolicyBinding",
+    "ValidatingWebhookConfiguration",
+    "VolumeAttachment",
+    "VolumeAttributesClass",
+}
+
 
 def _get_python_version() -> PythonVersion:
     version = f"{sys.version_info.major}.{sys.version_info.minor}"
@@ -71,19 +141,35 @@ class K8sSchemaObject(JsonSchemaObject):
 
         group, version, _ = self._get_group_version_kind()
 
-        if version and group:
-            api_version_prop.default = f"{group}/{version}"
+        if version:
+            # The core group is empty and its apiVersion is just the version
+            api_version_prop.default = f"{group}/{version}" if group else version
 
     def _update_default_fields(self):
         self._update_kind()
         self._update_api_version()
 
+    def _update_free_form(self):
+        """
+        Keeps the content of objects without declared properties (e.g.
+        ``FieldsV1`` or ``RawExtension``), which would be dropped otherwise.
+        """
+        if (
+            self.type == "object"
+            and not self.properties
+            and self.additionalProperties is None
+            and not self.ref
+            and not self.allOf
+        ):
+            self.additionalProperties = True
+
     @model_validator(mode="after")
     def update_default_fields(self):
         """
         Updates some default fields based on k8s specific properties.
         """
         self._update_default_fields()
+        self._update_free_form()
         return self
 
 
@@ -98,21 +184,131 @@ class K8sDataModelField(pydantic_v2.DataModelField):
         return self
 
 
+class K8sBaseModel(pydantic_v2.BaseModel):
+    def render(self, *, class_name: Optional[str] = None) -> str:
+        """
+        Drops the ``pass`` emitted for models without fields when they have a
+        ``model_config``, which is a body already.
+        """
+        rendered = super().render(class_name=class_name)
+
+        if self.fields or not self.extra_template_data.get("config"):
+            return rendered
+
+        return rendered.replace("\n    pass\n", "\n", 1)
+
+
+class K8sGenericBaseClass(BaseClassDataType):
+    """
+    Base class parametrized with a referenced model, e.g. ``ObjectList[Pod]``.
+    """
+
+    generic: str
+
+    @property
+    def type_hint(self) -> str:
+        return f"{self.generic}[{super().type_hint}]"
+
+
+def _get_field(model: DataModel, name: str) -> Optional[DataModelFieldBase]:
+    return next((field for field in model.fields if field.name == name), None)
+
+
+def _get_reference(field: Optional[DataModelFieldBase]) -> Optional[Reference]:
+    if field is None:
+        return None
+
+    return next(
+        (
+            data_type.reference
+            for data_type in field.data_type.all_data_types
+            if data_type.reference
+        ),
+        None,
+    )
+
+
+def _get_list_item_reference(model: DataModel) -> Optional[Reference]:
+    """
+    Returns the reference of the listed kind if the model is a ``*List`` kind.
+
+    :return: Reference to the item model, or None if this is not a list kind.
+    """
+    if {field.name for field in model.fields} != OBJECT_LIST_FIELDS:
+        return None
+
+    metadata = _get_reference(_get_field(model, "metadata"))
+    if metadata is None or not metadata.path.endswith(".ListMeta"):
+        return None
+
+    items = _get_field(model, "items")
+    if not items or not items.required:
+        return None
+
+    return _get_reference(items)
+
+
+def _get_object_kind(model: DataModel) -> Optional[str]:
+    """
+    Returns the kind of the model if it is a top-level Kubernetes kind.
+
+    :return: The kind, or None if the model is not a top-level kind.
+    """
+    if not OBJECT_FIELDS <= {field.name for field in model.fields}:
+        return None
+
+    metadata = _get_reference(_get_field(model, "metadata"))
+    if metadata is None or not metadata.path.endswith(".ObjectMeta"):
+        return None
+
+    kind = _get_field(model, "kind")
+    return kind.default if kind else None
+
+
+def _set_base_class(model: DataModel, base_class: BaseClassDataType, import_: Import):
+    model.base_classes = [base_class]
+    model._additional_imports = [
+        i for i in model._additional_imports if i != BASE_MODEL_IMPORT
+    ]
+    model._additional_imports.append(import_)
+
+
+def _keep_overridden_defaults(model: DataModel, names: Set[str]):
+    """
+    Removes the fields declared by the base class, keeping only the ones whose
+    default or requiredness differs per kind (without their descriptions).
+    """
+    fields = []
+
+    for field in model.fields:
+        required = field.required and field.name not in REQUIRED_BASE_FIELDS
+
+        if field.name in names and (required or field.default is not None):
+            field.extras.pop("description", None)
+            fields.append(field)
+        elif field.name not in names:
+            fields.append(field)
+
+    model.fields = fields
+
+
 class K8sOpenAPIParser(OpenAPIParser):
     SCHEMA_OBJECT_TYPE = K8sSchemaObject
 
     def __init__(
         self,
         source: Union[str, Path, List[Path], ParseResult],
-        data_model_type: Type[DataModel] = pydantic_v2.BaseModel,
+        data_model_type: Type[DataModel] = K8sBaseModel,
         data_model_field_type: Type[DataModelFieldBase] = K8sDataModelField,
         target_python_version: PythonVersion = _get_python_version(),
         use_default_kwarg: bool = True,
         wrap_string_literal: Optional[bool] = True,
         use_double_quotes: bool = True,
         collapse_root_models: bool = True,
+        split_threshold: Optional[int] = None,
         **kwargs: Any,
     ):
+        self.split_threshold = split_threshold
         super().__init__(
             source=source,
             data_model_field_type=data_model_field_type,
@@ -124,3 +320,87 @@ class K8sOpenAPIParser(OpenAPIParser):
             use_default_kwarg=use_default_kwarg,
             **kwargs,
         )
+        self.data_type_manager.type_map[Types.byte] = self.data_type.from_import(
+            BASE64_BYTES_IMPORT
+        )
+
+    def _apply_object_list(self, model: DataModel):
+        item = _get_list_item_reference(model)
+
+        if item is None:
+            return
+
+        base_class = K8sGenericBaseClass(reference=item, generic="ObjectList")
+        _set_base_class(model, base_class, OBJECT_LIST_IMPORT)
+        _keep_overridden_defaults(model, OBJECT_LIST_FIELDS)
+
+    def _apply_object(self, model: DataModel):
+        kind = _get_object_kind(model)
+
+        if kind is None:
+            return
+
+        import_ = (
+            CLUSTER_SCOPED_OBJECT_IMPORT
+            if kind in CLUSTER_SCOPED_KINDS
+            else NAMESPACED_OBJECT_IMPORT
+        )
+        _set_base_class(model, BaseClassDataType.from_import(import_), import_)
+        _keep_overridden_defaults(model, OBJECT_FIELDS)
+
+    def parse_raw(self) -> None:
+        super().parse_raw()
+
+        for model in self.results:
+            self._apply_object_list(model)
+            self._apply_object(model)
+
+    def _split_results(
+        self, results: Dict[Tuple[str, ...], Result], settings_path: Optional[Path]
+    ) -> Dict[Tuple[str, ...], Result]:
+        formatter = CodeFormatter(
+            self.target_python_version,
+            settings_path,
+            self.wrap_string_literal,
+            skip_string_normalization=not self.use_double_quotes,
+        )
+        split_results = {}
+
+        for name, result in results.items():
+            if result.body.count("\nclass ") <= (self.split_threshold or 0):
+                split_results[name] = result
+                continue
+
+            logger.info("Splitting %s", "/".join(name))
+            for chunk_name, body in split_module(
+                name, result.body, formatter.format_code
+            ):
+                split_results[chunk_name] = Result(body=body, source=result.source)
+
+        return split_results
+
+    def parse(
+        self,
+        with_import: Optional[bool] = True,
+        format_: Optional[bool] = True,
+        settings_path: Optional[Path] = None,
+    ) -> Union[str, Dict[Tuple[str, ...], Result]]:
+        """
+        Parses the specs, emitting the classes of every module in dependency
+        order and splitting the modules with more than ``split_threshold``
+        classes into packages of per-kind chunks.
+        """
+        results = super().parse(with_import, format_, settings_path)
+
+        if isinstance(results, str):
+            return sort_module(results)
+
+        results = {
+            name: Result(body=sort_module(result.body), source=result.source)
+            for name, result in results.items()
+        }
+
+        if not self.split_threshold:
+            return results
+
+        return self._split_results(results, settings_path)
@@ -0,0 +1,350 @@
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from generator.field_trees import get_kind
+
+PROTO_FILE = "generated.proto"
+
+SCALAR_TYPES = {
+    "bool",
+    "bytes",
+    "double",
+    "fixed32",
+    "fixed64",
+    "float",
+    "int32",
+    "int64",
+    "sfixed32",
+    "sfixed64",
+    "sint32",
+    "sint64",
+    "string",
+    "uint32",
+    "uint64",
+}
+
+HEADER = '''"""
+Protobuf messages of the kinds, from the ``generated.proto`` files of
+Kubernetes, by full name.
+
+Only the kinds of the packages of the files given to the generator have
+messages:
+
+{packages}
+
+The fields of each message are given by number, as their JSON name, their
+label (``"optional"``, ``"repeated"``, ``"map"``, or ``"inline"`` for the
+messages whose fields are inlined in JSON) and their type, a scalar type or
+the full name of a message (of the values, for maps).
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+'''
+
+_TOKENS = re.compile(
+    r"//[^\n]*|/\*.*?\*/|\"(?:[^\"\\]|\\.)*\"|[A-Za-z_][\w.]*|\d+|\S", re.DOTALL
+)
+
+
+class ProtoField(NamedTuple):
+    name: str
+    number: int
+    # "optional", "required", "repeated" or "map"
+    label: str
+    # Scalar type or full name of a message, of the values for maps
+    type: str
+
+
+class ProtoSyntaxError(ValueError):
+    pass
+
+
+def to_message_name(schema_name: str) -> str:
+    """
+    Returns the full name of the protobuf message of an OpenAPI schema, e.g.
+    ``k8s.io.api.core.v1.Pod`` for ``io.k8s.api.core.v1.Pod``.
+    """
+    name = schema_name.replace("-", "_")
+    return "k8s.io." + name[len("io.k8s.") :] if name.startswith("io.k8s.") else name
+
+
+def get_proto_path(package: str) -> Optional[str]:
+    """
+    Returns the path of the ``generated.proto`` file of the package of some
+    OpenAPI schemas in the Kubernetes repository, e.g.
+    ``staging/src/k8s.io/api/core/v1/generated.proto`` for
+    ``io.k8s.api.core.v1``.
+    """
+    if not package.startswith("io.k8s."):
+        return None
+
+    parts = package[len("io.k8s.") :].split(".")
+    return "/".join(["staging", "src", "k8s.io", *parts, PROTO_FILE])
+
+
+class _Tokens:
+    def __init__(self, text: str):
+        self._tokens = [
+            token
+            for token in _TOKENS.findall(text)
+            if not token.startswith(("//", "/*"))
+        ]
+        self._position = 0
+
+    def __bool__(self) -> bool:
+        return self._position < len(self._tokens)
+
+    def peek(self) -> str:
+        return self._tokens[self._position] if self else ""
+
+    def next(self) -> str:
+        if not self:
+            raise ProtoSyntaxError("Unexpected end of file")
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def expect(self, expected: str):
+        token = self.next()
+        if token != expected:
+            raise ProtoSyntaxError(f"Expected {expected!r}, found {token!r}")
+
+    def back(self):
+        self._position -= 1
+
+    def skip_statement(self):
+        """
+        Skips up to the end of the statement, or of the block it starts.
+        """
+        depth = 0
+        while True:
+            token = self.next()
+            if token == "{":
+                depth += 1
+            elif token == "}":
+                depth -= 1
+                if depth == 0:
+                    return
+            elif token == ";" and depth == 0:
+                return
+
+
+def _parse_field(tokens: _Tokens, label: str) -> ProtoField:
+    if label == "map":
+        tokens.expect("<")
+        tokens.next()  # Keys are strings or numbers, strings in JSON either way
+        tokens.expect(",")
+        type = tokens.next()
+        tokens.expect(">")
+    else:
+        type = tokens.next()
+
+    name = tokens.next()
+    tokens.expect("=")
+    number = int(tokens.next())
+    if tokens.peek() == "[":
+        while tokens.next() != "]":
+            pass
+    tokens.expect(";")
+    return ProtoField(name, number, label, type)
+
+
+def _parse_message(tokens: _Tokens, scope: str, messages: Dict[str, List[ProtoField]]):
+    name = f"{scope}.{tokens.next()}"
+    tokens.expect("{")
+    fields = messages[name] = []
+
+    while tokens.peek() != "}":
+        token = tokens.next()
+        if token == "message":
+            _parse_message(tokens, name, messages)
+        elif token in ("option", "reserved", "extensions", "enum", "oneof", ";"):
+            tokens.back()
+            tokens.skip_statement()
+        elif token in ("optional", "required", "repeated", "map"):
+            fields.append(_parse_field(tokens, token))
+        else:
+            # Fields of proto3 have no label
+            tokens.back()
+            fields.append(_parse_field(tokens, "optional"))
+    tokens.expect("}")
+
+
+def _resolve(type: str, scope: str, messages: Dict[str, Any]) -> str:
+    if type in SCALAR_TYPES:
+        return type
+    if type.startswith("."):
+        return type[1:]
+
+    # Relative names are looked up from the innermost scope outwards
+    while scope:
+        candidate = f"{scope}.{type}"
+        if candidate in messages:
+            return candidate
+        scope = scope.rpartition(".")[0]
+    return type
+
+
+def parse_proto(text: str) -> Dict[str, List[ProtoField]]:
+    """
+    Returns the fields of the messages of a proto2 or proto3 file, by the
+    full names of the messages, with the types of the fields resolved to
+    full names.
+    """
+    tokens = _Tokens(text)
+    package = ""
+    messages: Dict[str, List[ProtoField]] = {}
+
+    while tokens:
+        token = tokens.next()
+        if token == "package":
+            package = tokens.next()
+            tokens.expect(";")
+        elif token == "message":
+            _parse_message(tokens, package, messages)
+        elif token in ("syntax", "import", "option", "enum", "service", "extend"):
+            tokens.skip_statement()
+        elif token != ";":
+            raise ProtoSyntaxError(f"Unexpected {token!r}")
+
+    return {
+        name: [
+            field._replace(type=_resolve(field.type, name, messages))
+            for field in fields
+        ]
+        for name, fields in messages.items()
+    }
+
+
+def _is_list_message(fields: List[ProtoField]) -> bool:
+    return (
+        len(fields) == 1 and fields[0].name == "items" and fields[0].label == "repeated"
+    )
+
+
+class ProtobufMessages:
+    """
+    Collects the protobuf messages of the kinds of the specs, from their
+    ``generated.proto`` files.
+
+    The fields are checked against the schemas of their messages, and named
+    after their properties: those missing from the schemas are either
+    embedded structs, whose fields are inlined in JSON, or fields removed
+    from the API since (or added after it), which are left out.
+    Messages wrapping a list of items with no schema of their own (e.g.
+    ``Verbs``) are encoded as lists in JSON, and are listed apart.
+    """
+
+    # Docstring and imports of the module
+    header = HEADER
+
+    def __init__(self, schemas: Dict[str, Any], messages: Dict[str, List[ProtoField]]):
+        self.schemas = schemas
+        self.messages = messages
+        self._schemas = {
+            to_message_name(name): schema for name, schema in schemas.items()
+        }
+
+    def get_kinds(self) -> Dict[Tuple[str, str], str]:
+        """
+        Returns the messages of the kinds of the specs, by ``apiVersion`` and
+        ``kind``.
+        """
+        kinds = {}
+        for name, schema in sorted(self.schemas.items()):
+            kind = get_kind(schema)
+            message = to_message_name(name)
+            if kind is not None and kind not in kinds and message in self.messages:
+                kinds[kind] = message
+        return kinds
+
+    @staticmethod
+    def _get_json_name(field: ProtoField, properties: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns the property of a field in the schema of its message, the
+        names of a few fields differing in case only (e.g. ``aPIGroup`` for
+        ``apiGroup``), or None if there is none.
+        """
+        if field.name in properties:
+            return field.name
+        return next(
+            (name for name in properties if name.lower() == field.name.lower()), None
+        )
+
+    def _is_inlined(self, field: ProtoField, properties: Dict[str, Any]) -> bool:
+        # Embedded structs may have gained fields since, so one in common is
+        # enough to tell them from fields removed from the API
+        embedded = self.messages.get(field.type) or []
+        return field.label == "optional" and any(
+            self._get_json_name(item, properties) for item in embedded
+        )
+
+    def get_fields(self, name: str) -> List[ProtoField]:
+        """
+        Returns the fields of a message as they are encoded in JSON, labelled
+        ``"inline"`` for embedded structs, by number.
+        """
+        # Types with their own JSON encoding, e.g. FieldsV1, have schemas
+        # without properties, and their fields are kept as they are
+        properties = (self._schemas.get(name) or {}).get("properties") or None
+
+        fields = []
+        for field in sorted(self.messages[name], key=lambda field: field.number):
+            label = "optional" if field.label == "required" else field.label
+            json_name = (
+                field.name
+                if properties is None
+                else self._get_json_name(field, properties)
+            )
+            if json_name is not None:
+                fields.append(field._replace(name=json_name, label=label))
+            elif self._is_inlined(field, properties):
+                fields.append(field._replace(label="inline"))
+        return fields
+
+    def iter_used(self, names: List[str]) -> Iterator[str]:
+        """
+        Yields the messages used by those of ``names``, these included.
+        """
+        seen: Set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in seen or name not in self.messages:
+                continue
+            seen.add(name)
+            yield name
+            pending.extend(field.type for field in self.get_fields(name))
+
+    def is_list_message(self, name: str) -> bool:
+        return name not in self._schemas and _is_list_message(self.messages[name])
+
+    def render(self) -> str:
+        """
+        Returns the source of the module with the messages of the kinds.
+        """
+        kinds = self.get_kinds()
+        used = sorted(self.iter_used(list(kinds.values())))
+
+        packages = sorted({name.rpartition(".")[0] for name in kinds.values()})
+        listed = "\n".join(f"* ``{package}``" for package in packages)
+        lines: List[str] = [self.header.format(packages=listed)]
+        lines.append("MESSAGES: Dict[str, Dict[int, Tuple[str, str, str]]] = {\n")
+        for name in used:
+            lines.append(f"    {name!r}: {{\n")
+            for field in self.get_fields(name):
+                value = (field.name, field.label, field.type)
+                lines.append(f"        {field.number}: {value!r},\n")
+            lines.append("    },\n")
+        lines.append("}\n")
+
+        lists = [name for name in used if self.is_list_message(name)]
+        lines.append("\n# Messages encoded as the list of their items in JSON\n")
+        lines.append(f"LIST_MESSAGES: FrozenSet[str] = frozenset({lists!r})\n")
+
+        lines.append("\nKINDS: Dict[Tuple[str, str], str] = {\n")
+        for kind, name in sorted(kinds.items()):
+            lines.append(f"    {kind!r}: {name!r},\n")
+        lines.append("}\n")
+        return "".join(lines)
@@ -0,0 +1,59 @@
+import re
+from typing import Any, Dict, List
+
+from generator.field_trees import FieldTrees, get_kind
+
+# Phrases flagging the fields populated by the server in their descriptions
+READ_ONLY_MARKERS = re.compile(
+    r"\bRead-only\b|\bread-only field\b|\bPopulated by the system\b"
+)
+
+OBJECT_META = "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"
+
+# Fields populated by the server whose descriptions do not say so
+READ_ONLY_FIELDS = {
+    OBJECT_META: {"managedFields"},
+}
+
+# Field holding the state observed by the server in every kind
+STATUS_FIELD = "status"
+
+HEADER = '''"""
+Fields populated by the server, which are left out when exporting objects
+to apply them again, by ``apiVersion`` and ``kind``.
+
+The values are nested dicts of the excluded fields, as ``exclude`` takes
+them in ``model_dump``, with ``"__all__"`` standing for every list item.
+"""
+
+from typing import Any, Dict, Tuple
+
+'''
+
+
+class ReadOnlyFields(FieldTrees):
+    """
+    Collects the fields populated by the server in every kind of the specs.
+    """
+
+    header = HEADER
+    table = "READ_ONLY_FIELDS"
+
+    def is_selected(self, name: str, field: str, schema: Dict[str, Any]) -> bool:
+        if field in READ_ONLY_FIELDS.get(name, ()):
+            return True
+        if field == STATUS_FIELD and get_kind(self.schemas[name]):
+            return True
+        return bool(READ_ONLY_MARKERS.search(schema.get("description", "")))
+
+    def get_roots(self) -> List[str]:
+        return [OBJECT_META]
+
+    def render_footer(self, variables: Dict[str, str]) -> str:
+        if OBJECT_META not in variables:
+            return ""
+        return (
+            "\n# Fields of the kinds missing above, e.g. custom resources\n"
+            "DEFAULT_READ_ONLY_FIELDS: Dict[str, Any] = "
+            f"{{'metadata': {variables[OBJECT_META]}, '{STATUS_FIELD}': True}}\n"
+        )
@@ -0,0 +1,193 @@
+import ast
+from typing import Dict, List, Set
+
+SELF_REFERENCE_COMMENT = (
+    "# {name} references itself, which pydantic resolves on creation"
+)
+CYCLE_COMMENT = "# Reference cycle: {names}"
+
+
+def _get_names(node: ast.AST) -> Set[str]:
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _get_cycles(dependencies: Dict[str, Set[str]], order: List[str]) -> List[List[str]]:
+    """
+    Returns the strongly connected components of the dependency graph
+    (Tarjan's algorithm), each in the original order of its classes.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    def visit(name: str):
+        index[name] = lowlink[name] = len(index)
+        stack.append(name)
+
+        for dep in sorted(dependencies[name], key=order.index):
+            if dep not in index:
+                visit(dep)
+                lowlink[name] = min(lowlink[name], lowlink[dep])
+            elif dep in stack:
+                lowlink[name] = min(lowlink[name], index[dep])
+
+        if lowlink[name] == index[name]:
+            component = []
+            while True:
+                member = stack.pop()
+                component.append(member)
+                if member == name:
+                    break
+            components.append(sorted(component, key=order.index))
+
+    for name in order:
+        if name not in index:
+            visit(name)
+
+    return components
+
+
+class ModuleSorter:
+    """
+    Reorders the classes of a generated module so every class comes after
+    the classes it uses, keeping the original order otherwise.
+
+    Classes that are part of a reference cycle are kept together, flagged
+    with a comment and rebuilt once the whole cycle has been defined, so no
+    model is left waiting for a deferred rebuild after the module is imported.
+    """
+
+    def __init__(self, body: str):
+        self.body = body
+        self.tree = ast.parse(body)
+        self.classes: Dict[str, ast.ClassDef] = {
+            node.name: node for node in self.tree.body if isinstance(node, ast.ClassDef)
+        }
+        self.order = list(self.classes)
+        self.dependencies = {
+            name: _get_names(node) & set(self.classes)
+            for name, node in self.classes.items()
+        }
+
+    def get_cycles(self) -> List[List[str]]:
+        """
+        Returns the groups of classes that reference each other, including
+        classes that reference themselves.
+        """
+        return [
+            component
+            for component in _get_cycles(self.dependencies, self.order)
+            if len(component) > 1 or component[0] in self.dependencies[component[0]]
+        ]
+
+    def get_order(self) -> List[List[str]]:
+        """
+        Returns the classes grouped by cycle, in dependency order.
+        """
+        components = _get_cycles(self.dependencies, self.order)
+        component_of = {
+            name: index
+            for index, component in enumerate(components)
+            for name in component
+        }
+
+        # Tarjan's algorithm yields components in reverse topological order;
+        # pick the earliest ready component each time to keep the output stable
+        pending = {
+            index: {
+                component_of[dep]
+                for name in component
+                for dep in self.dependencies[name]
+            }
+            - {index}
+            for index, component in enumerate(components)
+        }
+        ordered: List[List[str]] = []
+        done: Set[int] = set()
+
+        while pending:
+            index = min(
+                (index for index, deps in pending.items() if deps <= done),
+                key=lambda index: self.order.index(components[index][0]),
+            )
+            ordered.append(components[index])
+            done.add(index)
+            del pending[index]
+
+        return ordered
+
+    def _render_component(self, component: List[str]) -> str:
+        code = [
+            ast.get_source_segment(self.body, self.classes[name]) or ""
+            for name in component
+        ]
+
+        if len(component) == 1:
+            name = component[0]
+            if name not in self.dependencies[name]:
+                return code[0]
+            return SELF_REFERENCE_COMMENT.format(name=name) + "\n" + code[0]
+
+        names = " -> ".join([*component, component[0]])
+        rebuilds = "\n".join(f"{name}.model_rebuild()" for name in component)
+        return (
+            CYCLE_COMMENT.format(names=names)
+            + "\n"
+            + "\n\n\n".join(code)
+            + "\n\n\n"
+            + rebuilds
+        )
+
+    def sort(self) -> str:
+        """
+        Returns the module source with the classes in dependency order.
+        """
+        if not self.classes:
+            return self.body
+
+        first = min(node.lineno for node in self.classes.values())
+        head = "".join(self.body.splitlines(keepends=True)[: first - 1]).strip()
+
+        rebuilt = {
+            name
+            for component in self.get_cycles()
+            if len(component) > 1
+            for name in component
+        }
+        tail = [
+            ast.get_source_segment(self.body, node) or ""
+            for node in self.tree.body
+            if node.lineno > first
+            and not isinstance(node, ast.ClassDef)
+            and not _is_rebuild_of(node, rebuilt)
+        ]
+
+        classes = [self._render_component(component) for component in self.get_order()]
+        sections = [head, "\n\n\n".join(classes), "\n".join(tail)]
+        return "\n\n\n".join(section for section in sections if section) + "\n"
+
+
+def _is_rebuild_of(node: ast.stmt, names: Set[str]) -> bool:
+    """
+    Returns whether the statement is a ``<name>.model_rebuild()`` call for one
+    of the given classes (which are already rebuilt after their cycle).
+    """
+    if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)):
+        return False
+
+    function = node.value.func
+    return (
+        isinstance(function, ast.Attribute)
+        and function.attr == "model_rebuild"
+        and isinstance(function.value, ast.Name)
+        and function.value.id in names
+    )
+
+
+def sort_module(body: str) -> str:
+    """
+    Reorders the classes of a module so that no forward reference is left to
+    resolve after it is imported.
+    """
+    return ModuleSorter(body).sort()
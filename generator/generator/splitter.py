@@ -0,0 +1,360 @@
+import ast
+import keyword
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+KIND_BASE_CLASSES = {"NamespacedObject", "ClusterScopedObject"}
+LIST_BASE_CLASS = re.compile(r"^ObjectList\[(?P<item>\w+)\]$")
+
+INIT_TEMPLATE = '''from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+{imports}
+
+_MODULES = {{
+{modules}
+}}
+
+__all__ = [
+{names}
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        message = f"module {{__name__!r}} has no attribute {{name!r}}"
+        raise AttributeError(message) from None
+
+    value = getattr(importlib.import_module(f".{{module}}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
+'''
+
+
+def to_module_name(class_name: str) -> str:
+    """
+    Converts a class name to a module name, e.g. ``PodSpec`` to ``pod_spec``.
+    """
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", class_name)
+    name = name.lower()
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _get_names(node: ast.AST) -> Set[str]:
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+class ModuleSplitter:
+    """
+    Splits a generated module into dependency-closed chunks.
+
+    Every top-level kind (and its list) gets a chunk of its own together with
+    the models used by it alone. Models shared by several kinds are grouped by
+    the exact set of kinds using them, so a chunk only ever imports chunks
+    whose models it actually needs and the chunks never import each other in
+    a cycle.
+    """
+
+    def __init__(self, body: str, max_chunk_size: int = 40):
+        self.body = body
+        self.max_chunk_size = max_chunk_size
+        self.tree = ast.parse(body)
+        self.imports: List[ast.stmt] = []
+        self.classes: Dict[str, ast.ClassDef] = {}
+        self.statements: Dict[str, List[ast.stmt]] = defaultdict(list)
+
+        for node in self.tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self.imports.append(node)
+            elif isinstance(node, ast.ClassDef):
+                self.classes[node.name] = node
+            else:
+                self.statements[self._get_owner(node)].append(node)
+
+        self.order = list(self.classes)
+        self.dependencies = {
+            name: _get_names(node) & set(self.classes) - {name}
+            for name, node in self.classes.items()
+        }
+
+    def _get_owner(self, node: ast.stmt) -> str:
+        """
+        Returns the class a module level statement (e.g. a ``model_rebuild``
+        call) belongs to.
+        """
+        names = sorted(_get_names(node) & set(self.classes))
+
+        if not names:
+            raise ValueError(f"Unable to split statement: {ast.unparse(node)}")
+
+        return names[0]
+
+    def _get_root(self, name: str) -> Optional[str]:
+        """
+        Returns the kind a root class stands for, merging lists with their
+        items.
+        """
+        node = self.classes[name]
+        bases = [ast.unparse(base) for base in node.bases]
+
+        for base in bases:
+            match = LIST_BASE_CLASS.match(base)
+            if match and match.group("item") in self.classes:
+                return match.group("item")
+
+        if KIND_BASE_CLASSES.intersection(bases):
+            return name
+
+        return None
+
+    def _get_roots(self) -> Dict[str, str]:
+        referenced = {dep for deps in self.dependencies.values() for dep in deps}
+        roots = {}
+
+        for name in self.classes:
+            root = self._get_root(name)
+            if root is not None:
+                roots[name] = root
+            elif name not in referenced:
+                roots[name] = name
+
+        return roots
+
+    def _get_users(
+        self, roots: Dict[str, str], names: List[str]
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Returns, for every class in ``names``, the roots it is (transitively)
+        used by.
+        """
+        members = set(names)
+        users: Dict[str, Set[str]] = defaultdict(set)
+
+        for name, root in roots.items():
+            pending = [name]
+            seen = set()
+            while pending:
+                current = pending.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                users[current].add(root)
+                pending.extend(self.dependencies[current] & members)
+
+        return {name: tuple(sorted(users[name])) for name in names}
+
+    def _get_tops(self, names: List[str]) -> List[str]:
+        """
+        Returns the classes of a chunk that no other class of the chunk uses.
+        """
+        members = set(names)
+        tops = [
+            name
+            for name in names
+            if not any(name in self.dependencies[other] for other in members)
+        ]
+        return tops or names
+
+    def _group(
+        self, roots: Dict[str, str], names: List[str]
+    ) -> Dict[Tuple[str, ...], List[str]]:
+        groups: Dict[Tuple[str, ...], List[str]] = defaultdict(list)
+
+        for name, users in self._get_users(roots, names).items():
+            groups[users].append(name)
+
+        return groups
+
+    def _split_group(self, names: List[str]) -> List[List[str]]:
+        """
+        Splits a group that is still too large along the classes its top
+        classes use directly (e.g. ``PodSpec`` into containers, volumes, ...).
+        """
+        if len(names) <= self.max_chunk_size:
+            return [names]
+
+        # Kinds stay together with their lists
+        members = set(names)
+        tops = [
+            name
+            for name in names
+            if not any(
+                name in self.dependencies[other] and self._get_root(other) != name
+                for other in members
+            )
+        ]
+        roots = {}
+        for top in tops:
+            deps = self.dependencies[top] & members - set(tops)
+            roots.update((dep, dep) for dep in deps)
+
+        groups = self._group(roots, names)
+
+        # Keep classes (e.g. ``Container`` and ``EphemeralContainer``) together
+        # with the models only they share, rather than in chunks of their own
+        for users, group in list(groups.items()):
+            singles = [(user,) for user in users if groups.get((user,)) == [user]]
+            if len(users) > 1 and len(singles) == len(users):
+                for single in singles:
+                    group.extend(groups.pop(single))
+
+        # Leaves used by the top classes alone stay with them too
+        for users, group in list(groups.items()):
+            if group == list(users) and not self.dependencies[group[0]]:
+                groups[()].extend(groups.pop(users))
+
+        if len(groups) == 1:
+            return [names]
+
+        return [
+            chunk for group in groups.values() for chunk in self._split_group(group)
+        ]
+
+    def _get_chunk_name(self, names: List[str]) -> str:
+        """
+        Names a chunk after its top class or, if it has several, after the
+        longest name suffix most of them share (e.g. ``volume_source``).
+        """
+        kinds = [name for name in names if self._get_root(name) == name]
+        if kinds:
+            return to_module_name(kinds[0])
+
+        tops = sorted(to_module_name(name) for name in self._get_tops(names))
+        if len(tops) == 1:
+            return tops[0]
+
+        suffixes: Dict[str, int] = defaultdict(int)
+        for top in tops:
+            words = top.split("_")
+            for index in range(1, len(words)):
+                suffixes["_".join(words[index:])] += 1
+
+        common = [suffix for suffix, count in suffixes.items() if count * 2 > len(tops)]
+        return max(common, key=len) if common else tops[0]
+
+    def get_chunks(self) -> Dict[str, List[str]]:
+        """
+        Returns the classes of every chunk, keyed by the chunk module name.
+        """
+        chunks: Dict[str, List[str]] = {}
+
+        for group in self._group(self._get_roots(), list(self.classes)).values():
+            for names in self._split_group(group):
+                name = self._get_chunk_name(names)
+                while name in chunks:
+                    name = f"{name}_"
+                chunks[name] = sorted(names, key=self.order.index)
+
+        return chunks
+
+    def _render_import(self, node: ast.stmt, used: Set[str]) -> Optional[str]:
+        aliases = [
+            alias
+            for alias in node.names  # type: ignore[attr-defined]
+            if (alias.asname or alias.name).split(".")[0] in used
+            or getattr(node, "module", None) == "__future__"
+        ]
+        if not aliases:
+            return None
+
+        names = ", ".join(
+            f"{alias.name} as {alias.asname}" if alias.asname else alias.name
+            for alias in aliases
+        )
+        if isinstance(node, ast.Import):
+            return f"import {names}"
+
+        # Chunks live one package deeper than the module they come from
+        level = node.level + 1 if node.level else 0  # type: ignore[attr-defined]
+        module = node.module or ""  # type: ignore[attr-defined]
+        return f"from {'.' * level}{module} import {names}"
+
+    def _get_source(self, node: ast.stmt) -> str:
+        """
+        Returns the source of a statement, with the comments right above it.
+        """
+        lines = self.body.splitlines()
+        start = node.lineno - 1
+        while start > 0 and lines[start - 1].startswith("#"):
+            start -= 1
+
+        return "\n".join(lines[start : node.end_lineno])
+
+    def _render_chunk(self, names: List[str], chunk_of: Dict[str, str]) -> str:
+        nodes: List[ast.stmt] = [self.classes[name] for name in names]
+        for name in names:
+            nodes.extend(self.statements.get(name, []))
+
+        used = set().union(*(_get_names(node) for node in nodes))
+        imports = [
+            rendered
+            for rendered in (self._render_import(node, used) for node in self.imports)
+            if rendered
+        ]
+
+        siblings: Dict[str, List[str]] = defaultdict(list)
+        for name in sorted(used & set(self.classes) - set(names)):
+            siblings[chunk_of[name]].append(name)
+        imports.extend(
+            f"from .{chunk} import {', '.join(members)}"
+            for chunk, members in sorted(siblings.items())
+        )
+
+        code = [self._get_source(node) for node in nodes]
+        return "\n".join(imports) + "\n\n\n" + "\n\n\n".join(code) + "\n"
+
+    def _render_init(self, chunks: Dict[str, List[str]]) -> str:
+        imports = "\n".join(
+            f"    from .{chunk} import {', '.join(sorted(names))}"
+            for chunk, names in sorted(chunks.items())
+        )
+        chunk_of = {name: chunk for chunk, names in chunks.items() for name in names}
+        modules = "\n".join(
+            f'    "{name}": "{chunk}",' for name, chunk in sorted(chunk_of.items())
+        )
+        names = "\n".join(f'    "{name}",' for name in sorted(chunk_of))
+        return INIT_TEMPLATE.format(imports=imports, modules=modules, names=names)
+
+    def split(self) -> Dict[str, str]:
+        """
+        Returns the source of every chunk module, keyed by its name, plus the
+        ``__init__`` module lazily re-exporting all the classes.
+        """
+        chunks = self.get_chunks()
+        chunk_of = {name: chunk for chunk, names in chunks.items() for name in names}
+
+        modules = {
+            chunk: self._render_chunk(names, chunk_of)
+            for chunk, names in sorted(chunks.items())
+        }
+        modules["__init__"] = self._render_init(chunks)
+        return modules
+
+
+def split_module(
+    name: Tuple[str, ...],
+    body: str,
+    formatter: Optional[Callable[[str], str]] = None,
+) -> Iterable[Tuple[Tuple[str, ...], str]]:
+    """
+    Splits the module ``name`` (e.g. ``("io", "k8s", "api", "core", "v1.py")``)
+    into a package of chunk modules.
+
+    :return: Pairs of module name and body, one per chunk module.
+    """
+    package = (*name[:-1], name[-1][: -len(".py")])
+
+    for chunk, chunk_body in ModuleSplitter(body).split().items():
+        if formatter is not None:
+            chunk_body = formatter(chunk_body)
+        yield (*package, f"{chunk}.py"), chunk_body
@@ -1,15 +1,31 @@
 import argparse
 import datetime as dt
+import json
 import logging
 import shutil
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
+from datamodel_code_generator.format import CodeFormatter
 from datamodel_code_generator.parser.base import Result
 
+from generator.byte_fields import ByteFields
 from generator.extractor import K8sOpenAPIExtractor
+from generator.field_trees import FieldTrees
 from generator.parser import K8sOpenAPIParser
+from generator.protobuf import ProtobufMessages, ProtoField, parse_proto
+from generator.read_only import ReadOnlyFields
+
+# Modules with the read-only and byte fields and the protobuf messages by
+# kind, next to the ``io`` models package
+READ_ONLY_MODULE = "read_only.py"
+BYTE_FIELDS_MODULE = "byte_fields.py"
+PROTOBUF_MODULE = "protobuf.py"
+
+# Generator named in the headers of the modules datamodel-codegen does not
+# write
+TABLES_GENERATOR = "generator/main.py"
 
 
 def _get_default_output_path() -> Path:
@@ -46,14 +62,42 @@ def _get_options(args):
         default=_get_default_specs_path(),
         help="Output directory where the Kubernetes OpenAPI specs will be put at.",
     )
+    parser.add_argument(
+        "--spec-file",
+        default=None,
+        help=(
+            "OpenAPI spec written by a previous run (e.g. specs/v1_30_0.json)"
+            " to generate from instead of downloading the specs, with the"
+            " generated.proto files in the directory of the same name."
+        ),
+    )
+    parser.add_argument(
+        "--tables-only",
+        action="store_true",
+        help=(
+            "Only generate the modules of read-only and byte fields and of"
+            " protobuf messages, next to the models."
+        ),
+    )
+    parser.add_argument(
+        "--split-threshold",
+        type=int,
+        default=100,
+        help=(
+            "Split modules with more classes than this into packages of"
+            " per-kind modules. Use 0 to never split."
+        ),
+    )
 
     return parser.parse_args(args)
 
 
-def _generate_header(k8s_version: Optional[str]) -> str:
+def _generate_header(
+    k8s_version: Optional[str], generator: str = "datamodel-codegen"
+) -> str:
     timestamp = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat()
 
-    header = f"""# generated by datamodel-codegen:
+    header = f"""# generated by {generator}:
 #   timestamp: {timestamp}"""
 
     if k8s_version:
@@ -104,16 +148,89 @@ def _write_result(
         out_file.write(result.body)
 
 
-def _generate_models(output_path: Path, specs_path: Path):
+def _get_formatter(parser: K8sOpenAPIParser) -> CodeFormatter:
+    return CodeFormatter(
+        parser.target_python_version,
+        wrap_string_literal=parser.wrap_string_literal,
+        skip_string_normalization=not parser.use_double_quotes,
+    )
+
+
+def _write_field_trees(
+    spec_path: Path, output_path: Path, parser: K8sOpenAPIParser, header: str
+):
+    schemas = json.loads(spec_path.read_text())["components"]["schemas"]
+    formatter = _get_formatter(parser)
+
+    modules = {READ_ONLY_MODULE: ReadOnlyFields, BYTE_FIELDS_MODULE: ByteFields}
+    for module, trees_type in modules.items():
+        output_file = output_path / module
+        logging.info("Generating %s", output_file)
+        trees: FieldTrees = trees_type(schemas)
+        output_file.write_text(header + formatter.format_code(trees.render()))
+
+
+def _write_protobuf_messages(
+    spec_path: Path,
+    proto_paths: List[Path],
+    output_path: Path,
+    parser: K8sOpenAPIParser,
+    header: str,
+):
+    if not proto_paths:
+        logging.warning("No protos found, skipping %s", PROTOBUF_MODULE)
+        return
+
+    schemas = json.loads(spec_path.read_text())["components"]["schemas"]
+    messages: Dict[str, List[ProtoField]] = {}
+    for proto_path in proto_paths:
+        messages.update(parse_proto(proto_path.read_text()))
+
+    output_file = output_path / PROTOBUF_MODULE
+    logging.info("Generating %s", output_file)
+    source = ProtobufMessages(schemas, messages).render()
+    output_file.write_text(header + _get_formatter(parser).format_code(source))
+
+
+def _get_spec_version(spec_path: Path) -> str:
+    """
+    Returns the k8s version of a spec written by the extractor, from its name.
+    """
+    return spec_path.stem.replace("_", ".")
+
+
+def _generate_models(
+    output_path: Path,
+    specs_path: Path,
+    split_threshold: int = 0,
+    spec_file: Optional[Path] = None,
+    tables_only: bool = False,
+):
     extractor = K8sOpenAPIExtractor(output_path=specs_path)
-    parser = K8sOpenAPIParser(source=extractor.extract())
+    if spec_file is None:
+        spec_path = extractor.extract()
+        k8s_version = extractor.k8s_version
+    else:
+        spec_path = spec_file
+        k8s_version = _get_spec_version(spec_file)
+    parser = K8sOpenAPIParser(source=spec_path, split_threshold=split_threshold)
+
+    if not tables_only:
+        results: dict[tuple[str, ...], Result] = parser.parse()  # type: ignore
 
-    results: dict[tuple[str, ...], Result] = parser.parse()  # type: ignore
+        header = _generate_header(k8s_version)
+        for name, result in sorted(results.items()):
+            path = Path(*name[1:])
+            _write_result(path, result, output_path, header=header)
 
-    for name, result in sorted(results.items()):
-        header = _generate_header(extractor.k8s_version)
-        path = Path(*name[1:])
-        _write_result(path, result, output_path, header=header)
+    header = _generate_header(k8s_version, TABLES_GENERATOR)
+    _write_field_trees(spec_path, output_path.parent, parser, header)
+
+    if spec_file is None:
+        proto_paths = extractor.extract_protos(spec_path)
+    else:
+        proto_paths = sorted(spec_path.with_suffix("").glob("*.proto"))
+    _write_protobuf_messages(spec_path, proto_paths, output_path.parent, parser, header)
 
 
 def run(args):
@@ -125,7 +242,11 @@ def run(args):
     output_path = Path(options.output_path)
     specs_path = Path(options.specs_path)
 
-    _generate_models(output_path, specs_path)
+    spec_file = Path(options.spec_file) if options.spec_file else None
+
+    _generate_models(
+        output_path, specs_path, options.split_threshold, spec_file, options.tables_only
+    )
     _cleanup_empty_modules(output_path)
 
 
@@ -5,6 +5,8 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ...apimachinery.pkg import runtime
 from ...apimachinery.pkg.apis.meta import v1
 from ..core import v1 as v1_1
@@ -47,6 +49,23 @@ class StatefulSetPersistentVolumeClaimRetentionPolicy(BaseModel):
     )
 
 
+class ControllerRevision(NamespacedObject):
+    apiVersion: Optional[str] = "apps/v1"
+    data: Optional[runtime.RawExtension] = Field(
+        default=None, description="Data is the serialized representation of the state."
+    )
+    kind: Optional[str] = "ControllerRevision"
+    revision: int = Field(
+        ...,
+        description="Revision indicates the revision of the state represented by Data.",
+    )
+
+
+class ControllerRevisionList(ObjectList[ControllerRevision]):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "ControllerRevisionList"
+
+
 class DaemonSetCondition(BaseModel):
     lastTransitionTime: Optional[datetime] = Field(
         default=None,
@@ -493,72 +512,6 @@ class StatefulSetUpdateStrategy(BaseModel):
     )
 
 
-class ControllerRevision(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    data: Optional[runtime.RawExtension] = Field(
-        default=None, description="Data is the serialized representation of the state."
-    )
-    kind: Optional[str] = Field(
-        default="ControllerRevision",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
-    revision: int = Field(
-        ...,
-        description="Revision indicates the revision of the state represented by Data.",
-    )
-
-
-class ControllerRevisionList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ControllerRevision] = Field(
-        ..., description="Items is the list of ControllerRevisions"
-    )
-    kind: Optional[str] = Field(
-        default="ControllerRevisionList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
-
-
 class DaemonSetUpdateStrategy(BaseModel):
     rollingUpdate: Optional[RollingUpdateDaemonSet] = Field(
         default=None,
@@ -851,32 +804,9 @@ class StatefulSetSpec(BaseModel):
     )
 
 
-class DaemonSet(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="DaemonSet",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class DaemonSet(NamespacedObject):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "DaemonSet"
     spec: Optional[DaemonSetSpec] = Field(
         default=None,
         description=(
@@ -894,61 +824,14 @@ class DaemonSet(BaseModel):
     )
 
 
-class DaemonSetList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[DaemonSet] = Field(..., description="A list of daemon sets.")
-    kind: Optional[str] = Field(
-        default="DaemonSetList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class DaemonSetList(ObjectList[DaemonSet]):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "DaemonSetList"
 
 
-class Deployment(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Deployment",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class Deployment(NamespacedObject):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "Deployment"
     spec: Optional[DeploymentSpec] = Field(
         default=None,
         description="Specification of the desired behavior of the Deployment.",
@@ -958,61 +841,14 @@ class Deployment(BaseModel):
     )
 
 
-class DeploymentList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Deployment] = Field(
-        ..., description="Items is the list of Deployments."
-    )
-    kind: Optional[str] = Field(
-        default="DeploymentList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard list metadata."
-    )
+class DeploymentList(ObjectList[Deployment]):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "DeploymentList"
 
 
-class ReplicaSet(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ReplicaSet",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "If the Labels of a ReplicaSet are empty, they are defaulted to be the same"
-            " as the Pod(s) that the ReplicaSet manages. Standard object's metadata."
-            " More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class ReplicaSet(NamespacedObject):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "ReplicaSet"
     spec: Optional[ReplicaSetSpec] = Field(
         default=None,
         description=(
@@ -1032,67 +868,14 @@ class ReplicaSet(BaseModel):
     )
 
 
-class ReplicaSetList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ReplicaSet] = Field(
-        ...,
-        description=(
-            "List of ReplicaSets. More info:"
-            " https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ReplicaSetList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
+class ReplicaSetList(ObjectList[ReplicaSet]):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "ReplicaSetList"
 
 
-class StatefulSet(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="StatefulSet",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class StatefulSet(NamespacedObject):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "StatefulSet"
     spec: Optional[StatefulSetSpec] = Field(
         default=None,
         description="Spec defines the desired identities of pods in this set.",
@@ -1106,32 +889,6 @@ class StatefulSet(BaseModel):
     )
 
 
-class StatefulSetList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apps/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[StatefulSet] = Field(
-        ..., description="Items is the list of stateful sets."
-    )
-    kind: Optional[str] = Field(
-        default="StatefulSetList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class StatefulSetList(ObjectList[StatefulSet]):
+    apiVersion: Optional[str] = "apps/v1"
+    kind: Optional[str] = "StatefulSetList"
@@ -4,7 +4,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import NamespacedObject
 
 
 class ScaleSpec(BaseModel):
@@ -35,32 +35,9 @@ class ScaleStatus(BaseModel):
     )
 
 
-class Scale(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="autoscaling/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Scale",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class Scale(NamespacedObject):
+    apiVersion: Optional[str] = "autoscaling/v1"
+    kind: Optional[str] = "Scale"
     spec: Optional[ScaleSpec] = Field(
         default=None,
         description=(
@@ -5,6 +5,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 from ..core import v1 as v1_1
 
@@ -612,32 +614,9 @@ class CronJobSpec(BaseModel):
     )
 
 
-class Job(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="batch/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Job",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class Job(NamespacedObject):
+    apiVersion: Optional[str] = "batch/v1"
+    kind: Optional[str] = "Job"
     spec: Optional[JobSpec] = Field(
         default=None,
         description=(
@@ -654,61 +633,14 @@ class Job(BaseModel):
     )
 
 
-class JobList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="batch/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Job] = Field(..., description="items is the list of Jobs.")
-    kind: Optional[str] = Field(
-        default="JobList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class JobList(ObjectList[Job]):
+    apiVersion: Optional[str] = "batch/v1"
+    kind: Optional[str] = "JobList"
 
 
-class CronJob(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="batch/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="CronJob",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CronJob(NamespacedObject):
+    apiVersion: Optional[str] = "batch/v1"
+    kind: Optional[str] = "CronJob"
     spec: Optional[CronJobSpec] = Field(
         default=None,
         description=(
@@ -726,30 +658,6 @@ class CronJob(BaseModel):
     )
 
 
-class CronJobList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="batch/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CronJob] = Field(..., description="items is the list of CronJobs.")
-    kind: Optional[str] = Field(
-        default="CronJobList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CronJobList(ObjectList[CronJob]):
+    apiVersion: Optional[str] = "batch/v1"
+    kind: Optional[str] = "CronJobList"
@@ -5,6 +5,8 @@ from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import NamespacedObject
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -2892,32 +2894,9 @@ class Lifecycle(BaseModel):
     )
 
 
-class PersistentVolumeClaim(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default=None,
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="PersistentVolumeClaim",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PersistentVolumeClaim(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PersistentVolumeClaim"
     spec: Optional[PersistentVolumeClaimSpec] = Field(
         default=None,
         description=(
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ... import runtime
 
@@ -79,7 +79,7 @@ class APIResource(BaseModel):
 
 class APIResourceList(BaseModel):
     apiVersion: Optional[str] = Field(
-        default=None,
+        default="v1",
         description=(
             "APIVersion defines the versioned schema of this representation of an"
             " object. Servers should convert recognized schemas to the latest internal"
@@ -111,7 +111,9 @@ class APIResourceList(BaseModel):
 
 
 class FieldsV1(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
 
 
 class LabelSelectorRequirement(BaseModel):
@@ -229,7 +231,9 @@ class OwnerReference(BaseModel):
 
 
 class Patch(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
 
 
 class Preconditions(BaseModel):
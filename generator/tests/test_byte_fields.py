@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from generator.byte_fields import ByteFields
+
+SCHEMAS = {
+    "io.example.v1.Vault": {
+        "x-kubernetes-group-version-kind": [
+            {"group": "example.io", "kind": "Vault", "version": "v1"}
+        ],
+        "properties": {
+            "data": {
+                "type": "object",
+                "additionalProperties": {"type": "string", "format": "byte"},
+            },
+            "spec": {"$ref": "#/components/schemas/io.example.v1.VaultSpec"},
+        },
+    },
+    "io.example.v1.VaultSpec": {
+        "properties": {
+            "caBundle": {"type": "string", "format": "byte"},
+            "endpoints": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/io.example.v1.Endpoint"},
+            },
+            "name": {"type": "string"},
+        },
+    },
+    "io.example.v1.Endpoint": {
+        "properties": {
+            "certificates": {
+                "type": "array",
+                "items": {"type": "string", "format": "byte"},
+            },
+            "url": {"type": "string"},
+        },
+    },
+    "io.example.v1.Widget": {
+        "x-kubernetes-group-version-kind": [
+            {"group": "example.io", "kind": "Widget", "version": "v1"}
+        ],
+        "properties": {"name": {"type": "string"}},
+    },
+}
+
+
+class ByteFieldsTestCase(TestCase):
+    def setUp(self):
+        self.byte_fields = ByteFields(SCHEMAS)
+
+    def test_get_tree(self):
+        self.assertEqual(
+            self.byte_fields.get_tree("io.example.v1.VaultSpec"),
+            {
+                "caBundle": True,
+                "endpoints": {"__all__": "io.example.v1.Endpoint"},
+            },
+        )
+        self.assertEqual(
+            self.byte_fields.get_tree("io.example.v1.Endpoint"),
+            {"certificates": {"__all__": True}},
+        )
+
+    def test_render(self):
+        namespace: dict = {}
+        exec(self.byte_fields.render(), namespace)
+
+        self.assertEqual(
+            namespace["BYTE_FIELDS"],
+            {
+                ("example.io/v1", "Vault"): {
+                    "data": {"__all__": True},
+                    "spec": {
+                        "caBundle": True,
+                        "endpoints": {"__all__": {"certificates": {"__all__": True}}},
+                    },
+                },
+            },
+        )
+        self.assertNotIn("DEFAULT_READ_ONLY_FIELDS", namespace)
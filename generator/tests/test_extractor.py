@@ -59,3 +59,36 @@ class K8sOpenAPIExtractorTestCase(TestCase):
 
         with self.assertRaises(NoSchemaFoundError):
             self.extractor.extract()
+
+    def test_extract_protos(self):
+        self.output_path.mkdir(parents=True)
+        spec_path = self.output_path / "v1_30_0.json"
+        spec_path.write_text(
+            json.dumps({
+                "components": {
+                    "schemas": {
+                        "io.k8s.api.core.v1.Pod": {},
+                        "io.k8s.api.core.v1.PodSpec": {},
+                        "io.k8s.apimachinery.pkg.version.Info": {},
+                    }
+                }
+            })
+        )
+        found = mock.MagicMock(status_code=200, text='syntax = "proto2";\n')
+        self.extractor.client.get.side_effect = [found, mock.MagicMock(status_code=404)]
+
+        paths = self.extractor.extract_protos(spec_path)
+
+        self.assertEqual(
+            paths, [self.output_path / "v1_30_0" / "io.k8s.api.core.v1.proto"]
+        )
+        self.assertEqual(paths[0].read_text(), 'syntax = "proto2";\n')
+        self.assertEqual(
+            [call.args[0] for call in self.extractor.client.get.call_args_list],
+            [
+                "https://raw.githubusercontent.com/kubernetes/kubernetes/master/"
+                "staging/src/k8s.io/api/core/v1/generated.proto",
+                "https://raw.githubusercontent.com/kubernetes/kubernetes/master/"
+                "staging/src/k8s.io/apimachinery/pkg/version/generated.proto",
+            ],
+        )
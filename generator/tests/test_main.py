@@ -16,12 +16,21 @@ def output_path(data_path: Path):
 
 
 @mock.patch("generator.main.K8sOpenAPIExtractor.extract")
+@mock.patch("generator.main.K8sOpenAPIExtractor.extract_protos")
 @mock.patch("generator.main.K8sOpenAPIParser.parse")
+@mock.patch("generator.main._write_field_trees")
+@mock.patch("generator.main._write_protobuf_messages")
 @freeze_time("2024-01-01")
 def test_run(
-    mock_parse: mock.MagicMock, mock_extract: mock.MagicMock, output_path: Path
+    mock_write_protobuf_messages: mock.MagicMock,
+    mock_write_field_trees: mock.MagicMock,
+    mock_parse: mock.MagicMock,
+    mock_extract_protos: mock.MagicMock,
+    mock_extract: mock.MagicMock,
+    output_path: Path,
 ):
     mock_extract.return_value = [Path("path/to/spec")]
+    mock_extract_protos.return_value = [Path("path/to/spec/k8s.io.api.core.v1.proto")]
     mock_parse.return_value = {
         ("path", "to", "spec"): mock.MagicMock(body="class Test: pass"),
         # Ensure empty directories are removed
@@ -44,6 +53,11 @@ def test_run(
         ])
 
     assert (output_path / "models" / "to" / "spec.py").exists()
+    assert mock_write_field_trees.call_args[0][1] == output_path
+    assert mock_write_protobuf_messages.call_args[0][1] == [
+        Path("path/to/spec/k8s.io.api.core.v1.proto")
+    ]
+    assert mock_write_protobuf_messages.call_args[0][2] == output_path
     assert not (output_path / "models" / "empty").exists()
     assert not (output_path / "models" / "to" / "empty_file.py").exists()
 
@@ -59,3 +73,39 @@ class Test: pass"""
             f"Expected:\n{expected_output}\n\n"
             f"Actual:\n{output}"
         )
+
+
+@mock.patch("generator.main.K8sOpenAPIExtractor.extract")
+@mock.patch("generator.main.K8sOpenAPIParser.parse")
+@mock.patch("generator.main._write_field_trees")
+@mock.patch("generator.main._write_protobuf_messages")
+@freeze_time("2024-01-01")
+def test_run_tables_only(
+    mock_write_protobuf_messages: mock.MagicMock,
+    mock_write_field_trees: mock.MagicMock,
+    mock_parse: mock.MagicMock,
+    mock_extract: mock.MagicMock,
+    output_path: Path,
+):
+    spec_path = output_path / "specs" / "v1_30_0.json"
+    proto_path = output_path / "specs" / "v1_30_0" / "k8s.io.api.core.v1.proto"
+    proto_path.parent.mkdir(parents=True)
+    proto_path.write_text("")
+
+    run([
+        "--output-path",
+        str(output_path / "models"),
+        "--spec-file",
+        str(spec_path),
+        "--tables-only",
+    ])
+
+    mock_extract.assert_not_called()
+    mock_parse.assert_not_called()
+    assert mock_write_field_trees.call_args[0][0] == spec_path
+    assert mock_write_field_trees.call_args[0][3] == (
+        "# generated by generator/main.py:\n"
+        "#   timestamp: 2024-01-01T00:00:00+00:00\n"
+        "#   k8s version: v1.30.0\n\n"
+    )
+    assert mock_write_protobuf_messages.call_args[0][1] == [proto_path]
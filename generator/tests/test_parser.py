@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Tuple
 from unittest import TestCase
@@ -30,3 +31,47 @@ class K8sOpenAPIParserTestCase(TestCase):
 
         for name, result in results.items():
             self._compare_with_expected(name, result.body)
+
+    def test_parse_split(self):
+        parser = K8sOpenAPIParser(source=self.specs_path, split_threshold=100)
+        results = parser.parse()
+        package = ("io", "k8s", "api", "core", "v1")
+
+        self.assertNotIn((*package[:-1], "v1.py"), results)
+        self.assertIn((*package, "__init__.py"), results)
+        self.assertIn((*package, "pod_template_spec.py"), results)
+
+        for name, result in results.items():
+            if name[: len(package)] != package:
+                self._compare_with_expected(name, result.body)
+
+    def test_parse_byte_format(self):
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Kubernetes", "version": "v1.30.0"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "io.example.v1.VaultSpec": {
+                        "properties": {
+                            "caBundle": {"format": "byte", "type": "string"},
+                            "data": {
+                                "additionalProperties": {
+                                    "format": "byte",
+                                    "type": "string",
+                                },
+                                "type": "object",
+                            },
+                        },
+                        "type": "object",
+                    }
+                }
+            },
+        }
+        parser = K8sOpenAPIParser(source=json.dumps(spec))
+
+        result = parser.parse()[("io", "example", "v1.py")].body
+
+        self.assertIn("from kubedantic.types import Base64Bytes", result)
+        self.assertIn("caBundle: Optional[Base64Bytes] = None", result)
+        self.assertIn("data: Optional[Dict[str, Base64Bytes]] = None", result)
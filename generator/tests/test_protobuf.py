@@ -0,0 +1,181 @@
+from unittest import TestCase
+
+from generator.protobuf import (
+    ProtobufMessages,
+    ProtoField,
+    ProtoSyntaxError,
+    get_proto_path,
+    parse_proto,
+    to_message_name,
+)
+
+PROTO = """
+// This file was autogenerated by go-to-protobuf. Do not edit it manually!
+
+syntax = "proto2";
+
+package io.example.v1;
+
+import "k8s.io/apimachinery/pkg/apis/meta/v1/generated.proto";
+
+// Package-wide variables from generator "generated".
+option go_package = "example.io/api/v1";
+
+// Vault is an example kind.
+message Vault {
+  // Standard object's metadata.
+  // +optional
+  optional k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta metadata = 1;
+
+  optional VaultSpec spec = 2;
+
+  /* Data of the vault. */
+  map<string, bytes> data = 3;
+
+  optional Raw raw = 4;
+}
+
+message VaultSpec {
+  optional Reference reference = 1;
+
+  repeated Endpoint endpoints = 2;
+
+  optional int32 replicas = 3 [default = 1];
+
+  // Removed from the API
+  optional string legacy = 4;
+
+  optional Verbs verbs = 5;
+
+  optional string aPIGroup = 6;
+
+  message Endpoint {
+    reserved 2;
+    string url = 1;
+  }
+}
+
+message Reference {
+  optional string name = 1;
+
+  // Added after the API of the schemas
+  optional string namespace = 2;
+}
+
+// Encoded as the JSON in raw
+message Raw {
+  optional bytes raw = 1;
+}
+
+message Verbs {
+  repeated string items = 1;
+}
+"""
+
+SCHEMAS = {
+    "io.example.v1.Vault": {
+        "x-kubernetes-group-version-kind": [
+            {"group": "example.io", "kind": "Vault", "version": "v1"}
+        ],
+        "properties": {"metadata": {}, "spec": {}, "data": {}, "raw": {}},
+    },
+    "io.example.v1.Raw": {"type": "object"},
+    "io.example.v1.VaultSpec": {
+        "properties": {
+            "name": {},
+            "endpoints": {},
+            "replicas": {},
+            "verbs": {},
+            "apiGroup": {},
+        },
+    },
+    "io.example.v1.Reference": {"properties": {"name": {}}},
+}
+
+
+class ProtobufTestCase(TestCase):
+    def test_to_message_name(self):
+        self.assertEqual(
+            to_message_name(
+                "io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSON"
+            ),
+            "k8s.io.apiextensions_apiserver.pkg.apis.apiextensions.v1.JSON",
+        )
+
+    def test_get_proto_path(self):
+        self.assertEqual(
+            get_proto_path("io.k8s.apimachinery.pkg.apis.meta.v1"),
+            "staging/src/k8s.io/apimachinery/pkg/apis/meta/v1/generated.proto",
+        )
+        self.assertIsNone(get_proto_path("io.example.v1"))
+
+    def test_parse_proto(self):
+        messages = parse_proto(PROTO)
+
+        self.assertEqual(
+            messages["io.example.v1.Vault"],
+            [
+                ProtoField(
+                    "metadata",
+                    1,
+                    "optional",
+                    "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta",
+                ),
+                ProtoField("spec", 2, "optional", "io.example.v1.VaultSpec"),
+                ProtoField("data", 3, "map", "bytes"),
+                ProtoField("raw", 4, "optional", "io.example.v1.Raw"),
+            ],
+        )
+        self.assertEqual(
+            messages["io.example.v1.VaultSpec"][1],
+            ProtoField("endpoints", 2, "repeated", "io.example.v1.VaultSpec.Endpoint"),
+        )
+        self.assertEqual(
+            messages["io.example.v1.VaultSpec.Endpoint"],
+            [ProtoField("url", 1, "optional", "string")],
+        )
+
+    def test_parse_proto_error(self):
+        with self.assertRaises(ProtoSyntaxError):
+            parse_proto("message Vault { optional string name 1; }")
+
+    def test_render(self):
+        protobuf_messages = ProtobufMessages(SCHEMAS, parse_proto(PROTO))
+        namespace: dict = {}
+        exec(protobuf_messages.render(), namespace)
+
+        self.assertEqual(
+            namespace["KINDS"], {("example.io/v1", "Vault"): "io.example.v1.Vault"}
+        )
+        self.assertIn("messages:\n\n* ``io.example.v1``\n", namespace["__doc__"])
+        self.assertEqual(
+            namespace["MESSAGES"]["io.example.v1.VaultSpec"],
+            {
+                # Embedded, and removed from the API
+                1: ("reference", "inline", "io.example.v1.Reference"),
+                2: ("endpoints", "repeated", "io.example.v1.VaultSpec.Endpoint"),
+                3: ("replicas", "optional", "int32"),
+                5: ("verbs", "optional", "io.example.v1.Verbs"),
+                6: ("apiGroup", "optional", "string"),
+            },
+        )
+        self.assertEqual(
+            namespace["MESSAGES"]["io.example.v1.Reference"],
+            {1: ("name", "optional", "string")},
+        )
+        self.assertEqual(
+            namespace["MESSAGES"]["io.example.v1.Raw"],
+            {1: ("raw", "optional", "bytes")},
+        )
+        self.assertEqual(
+            set(namespace["MESSAGES"]),
+            {
+                "io.example.v1.Vault",
+                "io.example.v1.Raw",
+                "io.example.v1.VaultSpec",
+                "io.example.v1.VaultSpec.Endpoint",
+                "io.example.v1.Reference",
+                "io.example.v1.Verbs",
+            },
+        )
+        self.assertEqual(namespace["LIST_MESSAGES"], {"io.example.v1.Verbs"})
@@ -0,0 +1,164 @@
+import json
+from pathlib import Path
+from unittest import TestCase
+
+import pytest
+
+from generator.read_only import ReadOnlyFields
+
+SCHEMAS = {
+    "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta": {
+        "properties": {
+            "name": {"description": "Name must be unique.", "type": "string"},
+            "uid": {"description": "Populated by the system. Read-only."},
+            "managedFields": {"description": "For internal housekeeping."},
+        },
+    },
+    "io.example.v1.Widget": {
+        "x-kubernetes-group-version-kind": [
+            {"group": "example.io", "kind": "Widget", "version": "v1"}
+        ],
+        "properties": {
+            "metadata": {
+                "allOf": [
+                    {
+                        "$ref": "#/components/schemas/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"
+                    }
+                ]
+            },
+            "spec": {"$ref": "#/components/schemas/io.example.v1.WidgetSpec"},
+            "status": {"description": "Observed state of the widget."},
+        },
+    },
+    "io.example.v1.WidgetSpec": {
+        "properties": {
+            "parts": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/io.example.v1.Part"},
+            },
+            "schema": {"$ref": "#/components/schemas/io.example.v1.Schema"},
+            "template": {
+                "description": "This field is read-only and immutable.",
+                "$ref": "#/components/schemas/io.example.v1.Part",
+            },
+        },
+    },
+    "io.example.v1.Part": {
+        "properties": {
+            "name": {"type": "string"},
+            "revision": {"description": "Deprecated: a legacy read-only field."},
+        },
+    },
+    "io.example.v1.Schema": {
+        "properties": {
+            "items": {"$ref": "#/components/schemas/io.example.v1.Schema"},
+        },
+    },
+    "io.example.v2.Part": {
+        "x-kubernetes-group-version-kind": [
+            {"group": "example.io", "kind": "Part", "version": "v2"}
+        ],
+        "properties": {"status": {"type": "object"}},
+    },
+}
+
+
+class ReadOnlyFieldsTestCase(TestCase):
+    def setUp(self):
+        self.read_only = ReadOnlyFields(SCHEMAS)
+
+    def test_get_tree(self):
+        self.assertEqual(
+            self.read_only.get_tree("io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+            {"managedFields": True, "uid": True},
+        )
+        self.assertEqual(
+            self.read_only.get_tree("io.example.v1.WidgetSpec"),
+            {
+                "parts": {"__all__": "io.example.v1.Part"},
+                "template": "io.example.v1.Part",
+            },
+        )
+        self.assertEqual(
+            self.read_only.get_tree("io.example.v1.Widget"),
+            {
+                "metadata": "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta",
+                "spec": "io.example.v1.WidgetSpec",
+                "status": True,
+            },
+        )
+
+    def test_recursive_schemas(self):
+        self.assertEqual(self.read_only.get_tree("io.example.v1.Schema"), {})
+
+    def test_get_kinds(self):
+        self.assertEqual(
+            self.read_only.get_kinds(),
+            {
+                ("example.io/v1", "Widget"): "io.example.v1.Widget",
+                ("example.io/v2", "Part"): "io.example.v2.Part",
+            },
+        )
+
+    def test_render(self):
+        namespace: dict = {}
+        exec(self.read_only.render(), namespace)
+
+        self.assertEqual(namespace["_PART"], {"revision": True})
+        self.assertEqual(namespace["_V2_PART"], {"status": True})
+        self.assertEqual(
+            namespace["READ_ONLY_FIELDS"],
+            {
+                ("example.io/v1", "Widget"): {
+                    "metadata": {"managedFields": True, "uid": True},
+                    "spec": {
+                        "parts": {"__all__": {"revision": True}},
+                        "template": {"revision": True},
+                    },
+                    "status": True,
+                },
+                ("example.io/v2", "Part"): {"status": True},
+            },
+        )
+        self.assertEqual(
+            namespace["DEFAULT_READ_ONLY_FIELDS"],
+            {"metadata": {"managedFields": True, "uid": True}, "status": True},
+        )
+
+
+@pytest.mark.usefixtures("data_path")
+class ReadOnlyFieldsSpecsTestCase(TestCase):
+    data_path: Path
+
+    def test_kubernetes_specs(self):
+        spec_path = self.data_path / "extractor" / "expected" / "v1_30_0.json"
+        schemas = json.loads(spec_path.read_text())["components"]["schemas"]
+        namespace: dict = {}
+        exec(ReadOnlyFields(schemas).render(), namespace)
+        tables = namespace["READ_ONLY_FIELDS"]
+
+        deployment = tables[("apps/v1", "Deployment")]
+        self.assertIs(deployment["status"], True)
+        self.assertEqual(
+            sorted(deployment["metadata"]),
+            [
+                "creationTimestamp",
+                "deletionGracePeriodSeconds",
+                "deletionTimestamp",
+                "generation",
+                "managedFields",
+                "resourceVersion",
+                "selfLink",
+                "uid",
+            ],
+        )
+        self.assertIs(
+            deployment["spec"]["template"]["metadata"], deployment["metadata"]
+        )
+
+        claims = tables[("apps/v1", "StatefulSet")]["spec"]["volumeClaimTemplates"]
+        self.assertEqual(claims["__all__"]["status"], True)
+
+        lists = tables[("batch/v1", "JobList")]
+        self.assertEqual(lists["metadata"], {"resourceVersion": True, "selfLink": True})
+        self.assertIs(lists["items"]["__all__"], tables[("batch/v1", "Job")])
@@ -0,0 +1,106 @@
+import sys
+from types import ModuleType
+from typing import List
+from unittest import TestCase
+
+from pydantic import BaseModel
+
+from generator.sorter import ModuleSorter, sort_module
+
+MODULE = '''from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class Widget(BaseModel):
+    spec: Optional[WidgetSpec] = None
+
+
+class WidgetSpec(BaseModel):
+    parts: Optional[List[Part]] = None
+    schema_: Optional[Schema] = None
+
+
+class Part(BaseModel):
+    name: str
+
+
+class Schema(BaseModel):
+    items: Optional[Schema] = None
+
+
+class Node(BaseModel):
+    children: Optional[List[Leaf]] = None
+
+
+class Leaf(BaseModel):
+    parent: Optional[Node] = None
+'''
+
+
+class ModuleSorterTestCase(TestCase):
+    def setUp(self):
+        self.sorter = ModuleSorter(MODULE)
+
+    def test_get_cycles(self):
+        self.assertEqual(self.sorter.get_cycles(), [["Schema"], ["Node", "Leaf"]])
+
+    def test_get_order(self):
+        self.assertEqual(
+            self.sorter.get_order(),
+            [["Part"], ["Schema"], ["WidgetSpec"], ["Widget"], ["Node", "Leaf"]],
+        )
+
+    def test_sort(self):
+        body = sort_module(MODULE)
+
+        self.assertLess(body.index("class Part"), body.index("class WidgetSpec"))
+        self.assertLess(body.index("class WidgetSpec"), body.index("class Widget("))
+        self.assertIn(
+            "# Schema references itself, which pydantic resolves on creation\n"
+            "class Schema(BaseModel):",
+            body,
+        )
+        self.assertIn("# Reference cycle: Node -> Leaf -> Node\nclass Node", body)
+        self.assertTrue(
+            body.endswith("\n\n\nNode.model_rebuild()\nLeaf.model_rebuild()\n")
+        )
+
+    def test_sort_is_stable(self):
+        body = sort_module(MODULE)
+
+        self.assertEqual(sort_module(body), body)
+
+    def _load(self, name: str, body: str) -> ModuleType:
+        module = ModuleType(name)
+        sys.modules[name] = module
+        self.addCleanup(sys.modules.pop, name)
+
+        exec(compile(body, f"{name}.py", "exec"), module.__dict__)
+        return module
+
+    def _get_incomplete(self, module: ModuleType) -> List[str]:
+        return [
+            name
+            for name, value in vars(module).items()
+            if isinstance(value, type)
+            and issubclass(value, BaseModel)
+            and value.__module__ == module.__name__
+            and not value.__pydantic_complete__
+        ]
+
+    def test_sorted_models_are_complete(self):
+        unsorted = self._load("unsorted_module", MODULE)
+        self.assertEqual(
+            self._get_incomplete(unsorted), ["Widget", "WidgetSpec", "Node"]
+        )
+
+        module = self._load("sorted_module", sort_module(MODULE))
+        self.assertEqual(self._get_incomplete(module), [])
+
+    def test_sort_without_classes(self):
+        body = "from __future__ import annotations\n"
+
+        self.assertEqual(sort_module(body), body)
@@ -0,0 +1,148 @@
+import ast
+from unittest import TestCase
+
+from generator.splitter import ModuleSplitter, split_module, to_module_name
+
+MODULE = '''from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from ...apimachinery.pkg.apis.meta import v1
+
+
+class KeyToPath(BaseModel):
+    key: str
+
+
+class Volume(BaseModel):
+    items: Optional[List[KeyToPath]] = None
+
+
+class WidgetSpec(BaseModel):
+    volumes: Optional[List[Volume]] = None
+
+
+class Widget(NamespacedObject):
+    kind: Optional[str] = "Widget"
+    spec: Optional[WidgetSpec] = None
+
+
+class WidgetList(ObjectList[Widget]):
+    kind: Optional[str] = "WidgetList"
+
+
+class GadgetSpec(BaseModel):
+    selector: Optional[v1.LabelSelector] = None
+    volumes: Optional[List[Volume]] = None
+
+
+class Gadget(NamespacedObject):
+    kind: Optional[str] = "Gadget"
+    spec: Optional[GadgetSpec] = None
+
+
+Widget.model_rebuild()
+'''
+
+
+class ModuleSplitterTestCase(TestCase):
+    def setUp(self):
+        self.splitter = ModuleSplitter(MODULE)
+
+    def test_to_module_name(self):
+        self.assertEqual(to_module_name("PodSpec"), "pod_spec")
+        self.assertEqual(to_module_name("HTTPGetAction"), "http_get_action")
+        self.assertEqual(to_module_name("PodOS"), "pod_os")
+
+    def test_get_chunks(self):
+        self.assertEqual(
+            self.splitter.get_chunks(),
+            {
+                "widget": ["WidgetSpec", "Widget", "WidgetList"],
+                "volume": ["KeyToPath", "Volume"],
+                "gadget": ["GadgetSpec", "Gadget"],
+            },
+        )
+
+    def test_split_large_chunk(self):
+        splitter = ModuleSplitter(MODULE, max_chunk_size=1)
+
+        self.assertEqual(
+            splitter.get_chunks(),
+            {
+                "widget_spec": ["WidgetSpec"],
+                "widget": ["Widget", "WidgetList"],
+                "volume": ["KeyToPath", "Volume"],
+                "gadget_spec": ["GadgetSpec"],
+                "gadget": ["Gadget"],
+            },
+        )
+
+    def test_split(self):
+        modules = self.splitter.split()
+
+        self.assertEqual(set(modules), {"__init__", "widget", "volume", "gadget"})
+        self.assertEqual(
+            modules["widget"],
+            "from __future__ import annotations\n"
+            "from typing import List, Optional\n"
+            "from pydantic import BaseModel\n"
+            "from kubedantic.base import NamespacedObject, ObjectList\n"
+            "from .volume import Volume\n"
+            "\n\n"
+            "class WidgetSpec(BaseModel):\n"
+            "    volumes: Optional[List[Volume]] = None\n"
+            "\n\n"
+            "class Widget(NamespacedObject):\n"
+            '    kind: Optional[str] = "Widget"\n'
+            "    spec: Optional[WidgetSpec] = None\n"
+            "\n\n"
+            "class WidgetList(ObjectList[Widget]):\n"
+            '    kind: Optional[str] = "WidgetList"\n'
+            "\n\n"
+            "Widget.model_rebuild()\n",
+        )
+        self.assertIn(
+            "from ....apimachinery.pkg.apis.meta import v1", modules["gadget"]
+        )
+
+    def test_split_init(self):
+        init = self.splitter.split()["__init__"]
+        namespace: dict = {"__name__": "package"}
+
+        exec(compile(init, "__init__.py", "exec"), namespace)
+
+        self.assertEqual(namespace["_MODULES"]["Volume"], "volume")
+        self.assertEqual(namespace["_MODULES"]["WidgetList"], "widget")
+        self.assertEqual(namespace["__dir__"](), sorted(namespace["_MODULES"]))
+        with self.assertRaises(AttributeError):
+            namespace["__getattr__"]("Missing")
+
+    def test_split_module(self):
+        modules = dict(split_module(("io", "k8s", "api", "widgets", "v1.py"), MODULE))
+
+        self.assertEqual(
+            set(modules),
+            {
+                ("io", "k8s", "api", "widgets", "v1", "__init__.py"),
+                ("io", "k8s", "api", "widgets", "v1", "widget.py"),
+                ("io", "k8s", "api", "widgets", "v1", "volume.py"),
+                ("io", "k8s", "api", "widgets", "v1", "gadget.py"),
+            },
+        )
+        for body in modules.values():
+            ast.parse(body)
+
+    def test_split_keeps_comments(self):
+        body = MODULE.replace(
+            "class KeyToPath(BaseModel):",
+            "# KeyToPath comment\nclass KeyToPath(BaseModel):",
+        )
+
+        modules = ModuleSplitter(body).split()
+
+        self.assertIn("\n\n# KeyToPath comment\nclass KeyToPath", modules["volume"])
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .aio import avalidate_list
+    from .cbor import from_cbor, to_cbor
+    from .columnar import to_columns
+    from .hashing import content_hash
+    from .indexed import IndexedList
+    from .managed_fields import ManagedFields
+    from .paths import evolve
+    from .protobuf import from_protobuf
+    from .pruning import (
+        dump_apply_configuration,
+        prune_for_apply,
+        to_apply_configuration,
+    )
+    from .snapshot import Snapshot, write_snapshot
+    from .types import Base64Bytes
+
+# The helpers are imported on first use, keeping ``import kubedantic`` cheap
+_MODULES = {
+    "Base64Bytes": "types",
+    "IndexedList": "indexed",
+    "ManagedFields": "managed_fields",
+    "Snapshot": "snapshot",
+    "avalidate_list": "aio",
+    "content_hash": "hashing",
+    "dump_apply_configuration": "pruning",
+    "evolve": "paths",
+    "from_cbor": "cbor",
+    "from_protobuf": "protobuf",
+    "prune_for_apply": "pruning",
+    "to_apply_configuration": "pruning",
+    "to_cbor": "cbor",
+    "to_columns": "columnar",
+    "write_snapshot": "snapshot",
+}
+
+__all__ = [
+    "Base64Bytes",
+    "IndexedList",
+    "ManagedFields",
+    "Snapshot",
+    "avalidate_list",
+    "content_hash",
+    "dump_apply_configuration",
+    "evolve",
+    "from_cbor",
+    "from_protobuf",
+    "prune_for_apply",
+    "to_apply_configuration",
+    "to_cbor",
+    "to_columns",
+    "write_snapshot",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message) from None
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
@@ -0,0 +1,226 @@
+"""
+Validation of large lists in asyncio applications, without blocking the
+event loop for the whole list::
+
+    pods = await avalidate_list(PodList, await response.read())
+
+    async for pod in aiter_items(PodList, response.content.iter_chunked(65536)):
+        ...
+
+The items are decoded as the bytes arrive, and validated by chunks of about
+``chunk_size`` bytes (or :data:`kubedantic.bulk.BATCH_SIZE` items for decoded
+lists), yielding to the event loop in between, or both in an ``executor`` if
+given. Iterating over the items only validates the next chunk once the
+previous one is consumed.
+
+The longest pauses left are then the full collections of the garbage
+collector, which go over all the objects built so far.
+"""
+
+import asyncio
+import functools
+import typing
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import InitErrorDetails
+
+from . import interning, sharing
+from .base import validate_python
+from .bulk import BATCH_SIZE, Buffer, _Scanner
+
+L = TypeVar("L", bound=BaseModel)
+T = TypeVar("T")
+
+# Chunks small enough to validate in a few milliseconds
+CHUNK_SIZE = 1 << 18
+
+Source = Union[
+    bytes, bytearray, memoryview, str, Mapping[str, Any], AsyncIterable[bytes]
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    item_type = typing.get_args(model.model_fields["items"].annotation)[0]
+    return TypeAdapter(List[item_type])  # type: ignore[valid-type]
+
+
+def _offset_errors(
+    error: ValidationError, model: Type[BaseModel], position: int
+) -> ValidationError:
+    """
+    Returns ``error`` with the locations of a chunk turned into the
+    locations in the list.
+    """
+    details: List[InitErrorDetails] = []
+
+    for item in error.errors():
+        index, *rest = item["loc"]
+        detail: Dict[str, Any] = {
+            "type": item["type"],
+            "loc": ("items", position + int(index), *rest),
+            "input": item["input"],
+        }
+        if "ctx" in item:
+            detail["ctx"] = item["ctx"]
+        details.append(detail)  # type: ignore[arg-type]
+
+    return ValidationError.from_exception_data(model.__name__, details)
+
+
+async def _aiter_blocks(
+    source: Union[Buffer, str, AsyncIterable[bytes]], size: int
+) -> AsyncIterator[Buffer]:
+    if isinstance(source, str):
+        source = source.encode()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), size):
+            yield view[start : start + size]
+        return
+
+    async for data in source:
+        yield data
+
+
+async def _run(
+    executor: Optional[Executor], function: Callable[..., T], *args: Any
+) -> T:
+    """
+    Returns ``function(*args)`` called in ``executor``, or on the event loop
+    once it ran the other tasks.
+    """
+    if executor is None:
+        await asyncio.sleep(0)
+        return function(*args)
+    call = functools.partial(function, *args)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+def _validate_chunk(
+    model: Type[BaseModel], data: List[Any], context: Optional[Mapping[str, Any]]
+) -> List[Any]:
+    cache = sharing.get_cache(context)
+    if cache is not None:
+        # Subtrees are shared before their validation
+        item_type = typing.get_args(model.model_fields["items"].annotation)[0]
+        data = [cache.share(item_type, item, context) for item in data]
+
+    items = _get_adapter(model).validate_python(data, context=context)
+
+    if interning.is_enabled(context):
+        for item in items:
+            interning.intern_strings(item)
+    return items
+
+
+async def _validate(
+    model: Type[BaseModel],
+    data: List[Any],
+    position: int,
+    executor: Optional[Executor],
+    context: Optional[Mapping[str, Any]],
+) -> List[Any]:
+    try:
+        return await _run(executor, _validate_chunk, model, data, context)
+    except ValidationError as error:
+        raise _offset_errors(error, model, position) from None
+
+
+async def _aiter_chunks(
+    model: Type[BaseModel],
+    source: Source,
+    fields: Dict[str, Any],
+    chunk_size: int,
+    executor: Optional[Executor],
+    context: Optional[Mapping[str, Any]],
+) -> AsyncIterator[List[Any]]:
+    if isinstance(source, Mapping):
+        fields.update((key, value) for key, value in source.items() if key != "items")
+        items = source.get("items") or []
+        for position in range(0, len(items), BATCH_SIZE):
+            batch = items[position : position + BATCH_SIZE]
+            yield await _validate(model, batch, position, executor, context)
+        return
+
+    scanner = _Scanner(fields)
+    chunk: List[Any] = []
+    size = position = 0
+
+    async for block in _aiter_blocks(source, chunk_size):
+        for item, start, end in await _run(executor, scanner.feed, block):
+            chunk.append(item)
+            size += end - start
+            if size >= chunk_size:
+                yield await _validate(model, chunk, position, executor, context)
+                position += len(chunk)
+                chunk, size = [], 0
+
+    chunk.extend(item for item, _, _ in scanner.feed(b"", final=True))
+    if chunk:
+        yield await _validate(model, chunk, position, executor, context)
+
+
+async def aiter_items(
+    model: Type[BaseModel],
+    source: Source,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    context: Optional[Mapping[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    Yields the items of the list ``model`` (e.g. ``PodList``) in ``source``,
+    its JSON (or an async iterable of its bytes) or its decoded data,
+    validating a chunk at a time.
+
+    :raises pydantic.ValidationError: If an item is not valid, with its
+        location in the list.
+    """
+    fields: Dict[str, Any] = {}
+
+    async for items in _aiter_chunks(
+        model, source, fields, chunk_size, executor, context
+    ):
+        for item in items:
+            yield item
+
+
+async def avalidate_list(
+    model: Type[L],
+    source: Source,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    context: Optional[Mapping[str, Any]] = None,
+) -> L:
+    """
+    Returns the list ``model`` (e.g. ``PodList``) validated from ``source``
+    a chunk at a time, see :func:`aiter_items`.
+
+    :raises pydantic.ValidationError: If the list is not valid.
+    """
+    fields: Dict[str, Any] = {}
+    items: List[Any] = []
+
+    async for chunk in _aiter_chunks(
+        model, source, fields, chunk_size, executor, context
+    ):
+        items.extend(chunk)
+
+    # The other fields are small, and validated on their own
+    obj = validate_python(model, {**fields, "items": []}, context)
+    obj.items = items  # type: ignore[attr-defined]
+    return obj
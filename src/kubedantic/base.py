@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import importlib
+import json
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    SupportsIndex,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from . import interning, pickling, sharing
+from .models.io.k8s.apimachinery.pkg.apis.meta import v1
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+API_VERSION_DESCRIPTION = (
+    "APIVersion defines the versioned schema of this representation of an"
+    " object. Servers should convert recognized schemas to the latest internal"
+    " value, and may reject unrecognized values. More info:"
+    " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
+)
+KIND_DESCRIPTION = (
+    "Kind is a string value representing the REST resource this object"
+    " represents. Servers may infer this from the endpoint the client submits"
+    " requests to. Cannot be updated. In CamelCase. More info:"
+    " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+)
+
+# API groups whose models do not live under ``kubedantic.models.io.k8s.api``
+_GROUP_MODULES = {
+    "": "api.core",
+    "apiextensions.k8s.io": "apiextensions_apiserver.pkg.apis.apiextensions",
+    "apiregistration.k8s.io": "kube_aggregator.pkg.apis.apiregistration",
+}
+
+# Kinds served by every API group, which are left out of the OpenAPI specs and
+# declared by hand, by ``apiVersion``
+_KIND_MODULES = {"meta.k8s.io/v1": "kubedantic.table"}
+
+_registry: Dict[Tuple[str, str], Type[BaseModel]] = {}
+
+
+class UnknownKindError(LookupError):
+    pass
+
+
+class GroupVersionKind(NamedTuple):
+    group: str
+    version: str
+    kind: str
+
+    @classmethod
+    def from_api_version(cls, api_version: str, kind: str) -> GroupVersionKind:
+        group, _, version = api_version.rpartition("/")
+        return cls(group, version, kind)
+
+    @property
+    def api_version(self) -> str:
+        return f"{self.group}/{self.version}" if self.group else self.version
+
+
+def _register(model: Type[BaseModel]):
+    api_version = model.model_fields["apiVersion"].default
+    kind = model.model_fields["kind"].default
+
+    if api_version and kind:
+        _registry.setdefault((api_version, kind), model)
+
+
+def _import_model(api_version: str, kind: str) -> Optional[Type[BaseModel]]:
+    module_name = _KIND_MODULES.get(api_version)
+
+    if module_name is None:
+        gvk = GroupVersionKind.from_api_version(api_version, kind)
+        package = _GROUP_MODULES.get(gvk.group, f"api.{gvk.group.split('.')[0]}")
+        module_name = f"kubedantic.models.io.k8s.{package}.{gvk.version}"
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+    model = getattr(module, kind, None)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return None
+
+    # Skip nested types (e.g. PodSpec) that are not kinds of their own
+    field = model.model_fields.get("kind")
+    return model if field is not None and field.default == kind else None
+
+
+def get_model(api_version: str, kind: str) -> Type[BaseModel]:
+    """
+    Returns the model registered for the given ``apiVersion`` and ``kind``.
+
+    Generated models are imported on first lookup; any other subclass of
+    :class:`KubernetesObject` (e.g. a custom resource) is registered as soon
+    as it is defined.
+
+    :raises UnknownKindError: If no model is known for the pair.
+    """
+    key = (api_version, kind)
+
+    if key not in _registry:
+        model = _import_model(api_version, kind)
+        if model is None:
+            raise UnknownKindError(f"No model found for {api_version}, Kind={kind}")
+        _registry.setdefault(key, model)
+
+    return _registry[key]
+
+
+def validate_python(
+    model: Type[M], data: Any, context: Optional[Mapping[str, Any]] = None
+) -> M:
+    """
+    Returns ``data`` validated by ``model``, applying the opt-in features
+    requested in ``context``: string interning (see
+    :mod:`kubedantic.interning`) and subtree sharing (see
+    :mod:`kubedantic.sharing`).
+
+    The features are applied around the validation rather than by
+    validators of the models, so that validating without them costs
+    nothing.
+    """
+    cache = sharing.get_cache(context)
+    if cache is not None:
+        data = cache.share(model, data, context)
+
+    obj = model.model_validate(data, context=context)
+    if interning.is_enabled(context):
+        interning.intern_strings(obj)
+    return obj
+
+
+def validate_json(
+    model: Type[M],
+    data: Union[str, bytes, bytearray],
+    context: Optional[Mapping[str, Any]] = None,
+) -> M:
+    """
+    Returns the JSON ``data`` validated by ``model``, applying the opt-in
+    features requested in ``context``, see :func:`validate_python`.
+    """
+    # Subtrees are shared before their validation, from the decoded data
+    if sharing.get_cache(context) is not None:
+        return validate_python(model, json.loads(data), context)
+
+    obj = model.model_validate_json(data, context=context)
+    if interning.is_enabled(context):
+        interning.intern_strings(obj)
+    return obj
+
+
+class ObjectList(BaseModel, Generic[T]):
+    """
+    Generic list of Kubernetes objects.
+
+    Generated ``*List`` models subclass a parametrization of this class
+    (e.g. ``class PodList(ObjectList[Pod])``) and only override the
+    ``apiVersion`` and ``kind`` defaults.
+    """
+
+    # Parametrizations like ``ObjectList[Pod]`` are only used as bases, so
+    # building their schema would be wasted work; only the concrete
+    # subclasses are built (see ``__pydantic_init_subclass__``).
+    model_config = ConfigDict(defer_build=True)
+
+    apiVersion: Optional[str] = Field(default=None, description=API_VERSION_DESCRIPTION)
+    items: List[T] = Field(
+        ...,
+        description=(
+            "List of objects. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md"
+        ),
+    )
+    kind: Optional[str] = Field(default=None, description=KIND_DESCRIPTION)
+    metadata: Optional[v1.ListMeta] = Field(
+        default=None,
+        description=(
+            "Standard list metadata. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+        ),
+    )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if not cls.__pydantic_generic_metadata__["args"]:
+            cls.model_rebuild(raise_errors=False)
+            _register(cls)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Tuple[Any, ...]:
+        return pickling.reduce_model(self, protocol)
+
+
+class KubernetesObject(BaseModel):
+    """
+    Base class of every top-level Kubernetes kind.
+
+    Generated kinds subclass either :class:`NamespacedObject` or
+    :class:`ClusterScopedObject` and only override the ``apiVersion`` and
+    ``kind`` defaults.
+    """
+
+    apiVersion: Optional[str] = Field(default=None, description=API_VERSION_DESCRIPTION)
+    kind: Optional[str] = Field(default=None, description=KIND_DESCRIPTION)
+    metadata: Optional[v1.ObjectMeta] = Field(
+        default=None,
+        description=(
+            "Standard object's metadata. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
+        ),
+    )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _register(cls)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Tuple[Any, ...]:
+        return pickling.reduce_model(self, protocol)
+
+    @property
+    def gvk(self) -> GroupVersionKind:
+        api_version = self.apiVersion or ""
+        return GroupVersionKind.from_api_version(api_version, self.kind or "")
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.metadata.name if self.metadata else None
+
+    @property
+    def namespace(self) -> Optional[str]:
+        return self.metadata.namespace if self.metadata else None
+
+    @property
+    def key(self) -> str:
+        """
+        Returns the ``namespace/name`` key used by informer caches, or just
+        the name for objects without a namespace.
+        """
+        namespace = self.namespace
+        name = self.name or ""
+        return f"{namespace}/{name}" if namespace else name
+
+    @property
+    def uid(self) -> Optional[str]:
+        return self.metadata.uid if self.metadata else None
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        return self.metadata.resourceVersion if self.metadata else None
+
+    @property
+    def owner_references(self) -> List[v1.OwnerReference]:
+        if self.metadata is None or not self.metadata.ownerReferences:
+            return []
+        return self.metadata.ownerReferences
+
+    def controller_owner(self) -> Optional[v1.OwnerReference]:
+        """
+        Returns the owner reference flagged as the managing controller.
+        """
+        return next(
+            (owner for owner in self.owner_references if owner.controller),
+            None,
+        )
+
+    def is_owned_by(self, owner: Union[KubernetesObject, str]) -> bool:
+        """
+        Returns whether ``owner`` (an object or its UID) owns this object.
+        """
+        uid = owner if isinstance(owner, str) else owner.uid
+        return uid is not None and any(
+            reference.uid == uid for reference in self.owner_references
+        )
+
+
+class NamespacedObject(KubernetesObject):
+    """
+    Base class of kinds that live in a namespace.
+    """
+
+
+class ClusterScopedObject(KubernetesObject):
+    """
+    Base class of kinds that are not bound to a namespace.
+    """
+
+    @property
+    def key(self) -> str:
+        return self.name or ""
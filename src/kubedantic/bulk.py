@@ -0,0 +1,732 @@
+"""
+Validation of very large lists, such as ``kubectl get -A -o json`` dumps or
+backups, in worker processes::
+
+    for result in validate_file("dump.json", workers=8):
+        if isinstance(result, ItemError):
+            print(result.position, result.kind, result.name, result.errors)
+
+The items are validated by the models registered for their ``apiVersion`` and
+``kind`` (see :func:`kubedantic.base.get_model`). The file is not scanned
+before the workers start: only the fields of the list around the items are
+read, and the items are cut into ranges of about ``chunk_size`` bytes. Every
+worker decodes the items starting in its range, from the first place where
+one can start, and the ranges are checked to follow each other as their
+results come back in order; the few that started inside of an item are
+decoded again from the end of the previous range.
+
+The workers only win once validating the items outweighs sending the
+results back: sending every object back costs about as much as validating
+it again, so pass a ``transform`` (e.g.
+:func:`kubedantic.hashing.content_hash`) to return only what is needed from
+the workers, which then scale with the CPUs.
+
+Batches of decoded objects, such as the events of watch streams, can be
+validated by threads instead, which run in parallel on free-threaded builds
+of Python (3.13t and later)::
+
+    objects = validate_objects(event["object"] for event in events)
+"""
+
+import collections
+import itertools
+import json
+import os
+import re
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from .base import UnknownKindError, get_model, validate_python
+
+# Target size of the chunks sent to the workers, in bytes
+CHUNK_SIZE = 1 << 20
+
+# Size of the blocks the files are read by, from the first one doubling up to
+# the largest one, in bytes
+_FIRST_BLOCK_SIZE = 1 << 16
+BLOCK_SIZE = 1 << 24
+
+# Objects validated by each task of the threads
+BATCH_SIZE = 256
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Places where an item can start: an object after the opening bracket of the
+# items or after a comma, looked for from a little before the ranges
+_ITEM_START = re.compile(rb"[\[,][ \t\n\r]*\{")
+_LOOKBEHIND = 64
+
+# Bytes at the end of the files where the end of the items is looked for
+_TAIL_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# States of the scanner: before the list, before the first key of a list
+# object, before a key, its colon and its value, after the value, before the
+# first item, before an item, after it, and after the list
+(
+    _START,
+    _FIRST_KEY,
+    _KEY,
+    _COLON,
+    _VALUE,
+    _NEXT_KEY,
+    _ITEMS,
+    _ITEM,
+    _NEXT_ITEM,
+    _END,
+) = range(10)
+
+_TRANSITIONS = {
+    (_START, "{"): _FIRST_KEY,
+    (_START, "["): _ITEMS,
+    (_FIRST_KEY, "}"): _END,
+    (_COLON, ":"): _VALUE,
+    (_VALUE, "["): _ITEMS,
+    (_NEXT_KEY, ","): _KEY,
+    (_NEXT_KEY, "}"): _END,
+    (_ITEMS, "]"): _END,
+    (_NEXT_ITEM, ","): _ITEM,
+    (_NEXT_ITEM, "]"): _END,
+}
+
+
+class ItemError(NamedTuple):
+    """
+    Item of a list that could not be validated, with the errors of
+    ``ValidationError.errors()`` (without inputs, contexts and URLs).
+    """
+
+    position: int
+    api_version: Optional[str]
+    kind: Optional[str]
+    name: Optional[str]
+    errors: List[Dict[str, Any]]
+
+
+class _Layout(NamedTuple):
+    """
+    Offsets in a file of the items of a list: after their opening bracket,
+    and of their closing one.
+    """
+
+    items_start: int
+    items_end: int
+    is_array: bool
+
+
+class _Result(NamedTuple):
+    """
+    Results of the items of a range, from the offset of the first one (None
+    if none was found) to the offset of the next one (or of the end of the
+    items), with the positions of the errors counted from the range.
+    """
+
+    start: Optional[int]
+    end: int
+    values: List[Any]
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    # Partial literals, numbers and escapes fail a few characters before the
+    # end of the text, and partial strings where they start
+    return error.msg.startswith("Unterminated string") or error.pos > len(error.doc) - 8
+
+
+class _Scanner:
+    """
+    Decodes the items of a list (or of a JSON array) from its data, fed a
+    block at a time, and the other fields of the list into ``fields``.
+
+    The data is decoded as Latin-1 so that the offsets in the text are the
+    offsets in bytes, and the values that are not ASCII are decoded again as
+    UTF-8. With a ``stop`` offset, the scan pauses before the first item
+    starting from there, or at the end of the items.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        offset: int = 0,
+        state: int = _START,
+        is_array: bool = False,
+        stop: Optional[int] = None,
+    ):
+        self.fields = fields
+        self.is_array = is_array
+        self.stop = stop
+        self.paused = False
+        # Offsets of the items, once scanned
+        self.items_start: Optional[int] = None
+        self.items_end: Optional[int] = None
+        # The text from ``_offset``, and the position of the scan in it
+        self._text = ""
+        self._offset = offset
+        self._pos = 0
+        self._is_ascii = True
+        self._state = state
+        self._key = ""
+        # Offset the text must reach before decoding a value again, so that
+        # the values longer than the blocks are only decoded a few times
+        self._wanted = 0
+
+    @property
+    def position(self) -> int:
+        return self._offset + self._pos
+
+    @property
+    def done(self) -> bool:
+        return self._state == _END
+
+    def feed(self, data: Buffer, final: bool = False) -> List[Tuple[Any, int, int]]:
+        """
+        Scans the next block of data (the last one if ``final``), returning
+        the items it completes with their start and end offsets.
+
+        :raises ValueError: If the data is not a list or JSON array.
+        """
+        self._offset += self._pos
+        self._text = self._text[self._pos :] + str(data, "latin-1")
+        self._pos = 0
+        self._is_ascii = self._text.isascii()
+
+        items: List[Tuple[Any, int, int]] = []
+        while self._step(items, final):
+            pass
+
+        if final and not self.paused and self._state != _END:
+            self._fail("Unexpected end of data")
+        return items
+
+    def _fail(self, message: str, pos: Optional[int] = None) -> NoReturn:
+        offset = self._offset + (self._pos if pos is None else pos)
+        raise ValueError(f"Invalid JSON at byte {offset}: {message}")
+
+    def _step(self, items: List[Tuple[Any, int, int]], final: bool) -> bool:
+        """
+        Scans the next token, returning False once more data is needed.
+        """
+        if self.paused:
+            return False
+
+        self._pos = _WHITESPACE.match(self._text, self._pos).end()  # type: ignore[union-attr]
+        char = self._text[self._pos : self._pos + 1]
+        if not char:
+            return False
+
+        state = self._state
+        if state == _FIRST_KEY and char != "}":
+            state = _KEY
+        elif state == _ITEMS and char != "]":
+            state = _ITEM
+
+        if state == _ITEM and self.stop is not None and self.position >= self.stop:
+            self.paused = True
+            return False
+        if state in (_KEY, _ITEM) or (state == _VALUE and char != "["):
+            self._state = state
+            return self._decode(items, final)
+        if state == _VALUE and self._key != "items":
+            return self._decode(items, final)
+
+        return self._move(state, char)
+
+    def _move(self, state: int, char: str) -> bool:
+        next_state = _TRANSITIONS.get((state, char))
+        if next_state is None:
+            self._fail(f"Unexpected {char!r}")
+
+        if next_state == _ITEMS:
+            self.is_array = state == _START
+            self.items_start = self.position + 1
+        elif char == "]":
+            self.items_end = self.position
+            if self.stop is not None:
+                self.paused = True
+                return False
+            next_state = _END if self.is_array else _NEXT_KEY
+
+        self._pos += 1
+        self._state = next_state
+        return True
+
+    def _decode(self, items: List[Tuple[Any, int, int]], final: bool) -> bool:
+        start = self._pos
+        if not final and self._offset + len(self._text) < self._wanted:
+            return False
+
+        try:
+            value, end = _decoder.raw_decode(self._text, start)
+        except json.JSONDecodeError as error:
+            if final or not _is_truncated(error):
+                self._fail(error.msg, error.pos)
+            self._wanted = self._offset + 2 * len(self._text) - start
+            return False
+
+        # A number may go on in the next block
+        if end == len(self._text) and not final:
+            return False
+
+        self._pos = end
+        if not self._is_ascii:
+            value = self._decode_utf8(value, start, end)
+
+        if self._state == _KEY:
+            if not isinstance(value, str):
+                self._fail("Expecting a key", start)
+            self._key = value
+            self._state = _COLON
+        elif self._state == _VALUE:
+            self.fields[self._key] = value
+            self._state = _NEXT_KEY
+        else:
+            items.append((value, self._offset + start, self._offset + end))
+            self._state = _NEXT_ITEM
+        return True
+
+    def _decode_utf8(self, value: Any, start: int, end: int) -> Any:
+        text = self._text[start:end]
+        if text.isascii():
+            return value
+
+        try:
+            return json.loads(text.encode("latin-1"))
+        except UnicodeDecodeError as error:
+            self._fail("Invalid UTF-8", start + error.start)
+
+
+def _read_blocks(file: BinaryIO) -> Iterator[bytes]:
+    """
+    Yields the blocks of ``file`` from its position, ending with an empty
+    one.
+    """
+    size = _FIRST_BLOCK_SIZE
+
+    while True:
+        block = file.read(min(size, BLOCK_SIZE))
+        yield block
+        if not block:
+            return
+        size *= 2
+
+
+def _iter_values(
+    file: BinaryIO, fields: Dict[str, Any]
+) -> Iterator[Tuple[Any, int, int]]:
+    """
+    Yields the items of a list (or of a JSON array) with their start and end
+    offsets in bytes as they are scanned, storing the other fields of the
+    list in ``fields``.
+    """
+    scanner = _Scanner(fields)
+
+    for block in _read_blocks(file):
+        yield from scanner.feed(block, final=not block)
+
+
+def _find_items_end(
+    file: BinaryIO, size: int, layout: _Layout, fields: Dict[str, Any]
+) -> Optional[int]:
+    """
+    Returns the offset of the closing bracket of the items, looked for at
+    the end of ``file``, storing the fields of the list after the items in
+    ``fields``, or None if not found there.
+    """
+    tail_start = max(size - _TAIL_SIZE, layout.items_start)
+    file.seek(tail_start)
+    tail = file.read()
+    state = _END if layout.is_array else _NEXT_KEY
+    end = len(tail)
+
+    # The last bracket followed by the end of a list is the end of the items
+    while True:
+        end = tail.rfind(b"]", 0, end)
+        if end < 0:
+            return None
+
+        tail_fields: Dict[str, Any] = {}
+        scanner = _Scanner(tail_fields, tail_start + end + 1, state)
+        try:
+            scanner.feed(memoryview(tail)[end + 1 :], final=True)
+        except ValueError:
+            continue
+
+        fields.update(tail_fields)
+        return tail_start + end
+
+
+def _scan_layout(
+    file: BinaryIO, size: int, fields: Dict[str, Any]
+) -> Optional[_Layout]:
+    """
+    Returns where the items of the list (or of the JSON array) in ``file``
+    are, or None if it has none, storing the other fields of the list in
+    ``fields``. Only the fields around the items are decoded, unless the end
+    of the items is not found at the end of the file.
+
+    :raises ValueError: If the file is not a list or JSON array.
+    """
+    scanner = _Scanner(fields, stop=0)
+    for block in _read_blocks(file):
+        scanner.feed(block, final=not block)
+        if scanner.paused:
+            break
+    else:
+        return None
+
+    layout = _Layout(scanner.items_start or 0, size, scanner.is_array)
+    items_end = _find_items_end(file, size, layout, fields)
+    if items_end is not None:
+        return layout._replace(items_end=items_end)
+
+    # Scan all of the file, raising the error of invalid ones
+    file.seek(0)
+    scanner = _Scanner(fields)
+    for block in _read_blocks(file):
+        scanner.feed(block, final=not block)
+    return layout._replace(items_end=scanner.items_end or 0)
+
+
+def _get_item_type(fields: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Returns the ``apiVersion`` and ``kind`` of the items of typed lists
+    (e.g. ``PodList``), which leave them unset.
+    """
+    kind = fields.get("kind") or ""
+    if kind == "List" or not kind.endswith("List"):
+        return "", ""
+    return fields.get("apiVersion") or "", kind[: -len("List")]
+
+
+def _validate_item(
+    item: Any,
+    position: int,
+    item_type: Tuple[str, str],
+    transform: Optional[Callable[[BaseModel], Any]],
+    context: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    fields = item if isinstance(item, dict) else {}
+    api_version = fields.get("apiVersion") or item_type[0]
+    kind = fields.get("kind") or item_type[1]
+    name = (fields.get("metadata") or {}).get("name")
+
+    try:
+        obj = validate_python(get_model(api_version, kind), item, context)
+    except UnknownKindError as error:
+        errors = [{"type": "unknown_kind", "loc": (), "msg": str(error)}]
+        return ItemError(position, api_version, kind, name, errors)
+    except ValidationError as error:
+        errors = error.errors(
+            include_url=False, include_context=False, include_input=False
+        )  # type: ignore[assignment]
+        return ItemError(position, api_version, kind, name, errors)
+
+    return transform(obj) if transform is not None else obj
+
+
+def _scan_range(
+    file: BinaryIO, layout: _Layout, start: int, stop: int, state: int
+) -> Tuple[List[Any], int]:
+    """
+    Returns the items scanned from ``start`` (in ``state``) that start
+    before ``stop``, and the offset of the next item (or of the end of the
+    items).
+
+    :raises ValueError: If they are not valid JSON, or not the items of the
+        file.
+    """
+    scanner = _Scanner({}, start, state, layout.is_array, stop)
+    items: List[Any] = []
+
+    file.seek(start)
+    for block in _read_blocks(file):
+        items.extend(item for item, _, _ in scanner.feed(block, final=not block))
+        if scanner.paused:
+            break
+
+    if scanner.items_end is not None and scanner.items_end != layout.items_end:
+        raise ValueError(
+            f"Invalid JSON at byte {scanner.items_end}: Unexpected end of the items"
+        )
+    return items, scanner.position
+
+
+def _find_range(
+    file: BinaryIO, layout: _Layout, start: int, stop: int
+) -> Optional[Tuple[int, List[Any], int]]:
+    """
+    Returns the first offset from ``start`` and before ``stop`` that the
+    items can be scanned from, with the items and the offset after them, or
+    None if there is none.
+    """
+    window_start = max(start - _LOOKBEHIND, layout.items_start - 1)
+    file.seek(window_start)
+    window = file.read(stop - window_start)
+
+    for match in _ITEM_START.finditer(window):
+        offset = window_start + match.end() - 1
+        if offset < start:
+            continue
+        try:
+            items, end = _scan_range(file, layout, offset, stop, _ITEM)
+        except ValueError:
+            continue
+        return offset, items, end
+
+    return None
+
+
+def _validate_range(
+    path: str,
+    layout: _Layout,
+    start: int,
+    stop: int,
+    exact: bool,
+    item_type: Tuple[str, str],
+    transform: Optional[Callable[[BaseModel], Any]],
+) -> _Result:
+    """
+    Validates the items starting from ``start`` and before ``stop``, where
+    the first item (or the items) starts if ``exact``, and is guessed
+    otherwise.
+    """
+    with open(path, "rb") as file:
+        if exact:
+            state = _ITEMS if start == layout.items_start else _ITEM
+            items, end = _scan_range(file, layout, start, stop, state)
+        else:
+            found = _find_range(file, layout, start, stop)
+            if found is None:
+                return _Result(None, stop, [])
+            start, items, end = found
+
+    values = [
+        _validate_item(item, position, item_type, transform)
+        for position, item in enumerate(items)
+    ]
+    return _Result(start, end, values)
+
+
+def _offset_positions(values: List[Any], position: int) -> Iterator[Any]:
+    for value in values:
+        if isinstance(value, ItemError):
+            value = value._replace(position=value.position + position)
+        yield value
+
+
+def _map_ranges(
+    executor: Executor,
+    path: str,
+    layout: _Layout,
+    chunk_size: int,
+    workers: int,
+    *args: Any,
+) -> Iterator[List[Any]]:
+    """
+    Yields the values of the items of every range of ``chunk_size`` bytes
+    validated by ``executor``, checking that every range starts where the
+    previous one ends and validating it again from there otherwise.
+    """
+    starts = iter(range(layout.items_start, layout.items_end, chunk_size))
+    pending: Deque[Tuple[int, bool, Future]] = collections.deque()
+    start = layout.items_start
+
+    def submit(start: int, stop: int, exact: bool) -> Future:
+        return executor.submit(_validate_range, path, layout, start, stop, exact, *args)
+
+    try:
+        while True:
+            # Bound the results waiting in memory, keeping workers busy
+            for range_start in itertools.islice(starts, 2 * workers - len(pending)):
+                exact = range_start == layout.items_start
+                stop = min(range_start + chunk_size, layout.items_end)
+                pending.append((stop, exact, submit(range_start, stop, exact)))
+            if not pending:
+                return
+
+            stop, exact, future = pending.popleft()
+            # No item starts in the range
+            if start >= stop:
+                future.cancel()
+                continue
+
+            result: Optional[_Result]
+            if exact:
+                result = future.result()
+            else:
+                try:
+                    result = future.result()
+                except Exception:
+                    # The items of wrong guesses can fail in any way
+                    result = None
+                if result is None or result.start != start:
+                    result = submit(start, stop, True).result()
+
+            yield result.values
+            start = result.end
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+
+def _map_in_order(
+    executor: Executor,
+    function: Callable[..., List[Any]],
+    calls: Iterable[Tuple[Any, ...]],
+    workers: int,
+) -> Iterator[Any]:
+    """
+    Yields the items of the lists returned by ``function`` for every tuple of
+    arguments of ``calls``, in order.
+    """
+    pending: Deque[Future] = collections.deque()
+
+    try:
+        for args in calls:
+            pending.append(executor.submit(function, *args))
+            # Bound the results waiting in memory, keeping workers busy
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _iter_results(
+    path: str,
+    layout: _Layout,
+    chunk_size: int,
+    workers: int,
+    *args: Any,
+) -> Iterator[List[Any]]:
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            yield from _map_ranges(executor, path, layout, chunk_size, workers, *args)
+        return
+
+    start = layout.items_start
+    while start < layout.items_end:
+        stop = start + chunk_size
+        result = _validate_range(path, layout, start, stop, True, *args)
+        yield result.values
+        start = result.end
+
+
+def validate_file(
+    path: Union[str, "os.PathLike[str]"],
+    workers: Optional[int] = None,
+    transform: Optional[Callable[[BaseModel], Any]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yields the objects of the list (or JSON array) in the file at ``path``,
+    validated in ``workers`` processes (one per CPU by default, none if 1),
+    or an :class:`ItemError` for the items that are not valid.
+
+    ``transform`` is called on every object in the workers, yielding what it
+    returns instead; like the objects, it must be picklable.
+
+    :raises ValueError: If the file is not valid JSON, once the items before
+        the invalid part are yielded.
+    """
+    path = os.fspath(path)
+    fields: Dict[str, Any] = {}
+
+    with open(path, "rb") as file:
+        layout = _scan_layout(file, os.fstat(file.fileno()).st_size, fields)
+    if layout is None:
+        return
+
+    item_type = _get_item_type(fields)
+    workers = workers or os.cpu_count() or 1
+    position = 0
+
+    results = _iter_results(path, layout, chunk_size, workers, item_type, transform)
+    for values in results:
+        yield from _offset_positions(values, position)
+        position += len(values)
+
+
+def _is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _validate_batch(
+    batch: List[Any],
+    position: int,
+    transform: Optional[Callable[[BaseModel], Any]],
+    context: Optional[Mapping[str, Any]],
+) -> List[Any]:
+    return [
+        _validate_item(item, index, ("", ""), transform, context)
+        for index, item in enumerate(batch, position)
+    ]
+
+
+def _iter_batches(
+    objects: Iterable[Any], batch_size: int
+) -> Iterator[Tuple[List[Any], int]]:
+    iterator = iter(objects)
+    position = 0
+
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch, position
+        position += len(batch)
+
+
+def validate_objects(
+    objects: Iterable[Any],
+    workers: Optional[int] = None,
+    transform: Optional[Callable[[BaseModel], Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator[Any]:
+    """
+    Yields the decoded ``objects`` validated by the models of their
+    ``apiVersion`` and ``kind`` in ``workers`` threads, or an
+    :class:`ItemError` for the objects that are not valid, in order.
+
+    Threads only validate in parallel on free-threaded builds of Python, so
+    there is one per CPU by default on those builds, and none otherwise.
+    ``context`` is passed to every validation, e.g. the context of a
+    :class:`kubedantic.sharing.SubtreeCache`.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) if _is_free_threaded() else 1
+
+    batches = _iter_batches(objects, batch_size)
+
+    if workers == 1:
+        for batch, position in batches:
+            yield from _validate_batch(batch, position, transform, context)
+        return
+
+    with ThreadPoolExecutor(workers) as executor:
+        calls = ((batch, position, transform, context) for batch, position in batches)
+        yield from _map_in_order(executor, _validate_batch, calls, workers)
@@ -0,0 +1,497 @@
+"""
+Encoding of objects as CBOR (RFC 8949), following the conventions of the
+``application/cbor`` serializer of the Kubernetes API server::
+
+    data = to_cbor(pod)
+    assert from_cbor(data) == pod
+
+Following the API server:
+
+* the data starts with the self-described CBOR tag (55799);
+* strings, map keys included, are encoded as byte strings of UTF-8, and maps
+  are sorted by the bytes of their encoded keys, so that objects with the
+  same fields always have the same encoding;
+* fields holding bytes (``Secret.data``, ``caBundle``...) are encoded as
+  the raw bytes, tagged as expecting base64 (tag 22), instead of their
+  base64 text, see :mod:`kubedantic.models.byte_fields`;
+* floats take their shortest exact form, and NaN, infinities, integers
+  beyond 64 bits and indefinite lengths are refused.
+
+Decoding also accepts text strings, and the bytes tagged for base64url (21)
+or base16 (23) encoding; other tags are refused.
+
+The bytes are read and written by the C codec of ``cbor2`` (installed by the
+``cbor`` extra), the conventions being applied to the values around it, or
+else by a codec written in Python. Either way, the objects are dumped and
+validated as Python values rather than by the JSON path of pydantic, written
+in Rust: with cbor2, encoding still takes about 3 times as long and decoding
+1.4 times (4 and 1.7 times in Python, see ``benchmarks/cbor.py``), for a
+quarter less data.
+"""
+
+import base64
+import binascii
+import functools
+import io
+import math
+import struct
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .base import get_model, validate_python
+from .models.byte_fields import BYTE_FIELDS
+from .pruning import _get_type_fields
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None  # type: ignore[assignment]
+
+# Tags of the self-described CBOR data and of bytes expecting an encoding
+SELF_DESCRIBED_TAG = 55799
+BASE64URL_TAG = 21
+BASE64_TAG = 22
+BASE16_TAG = 23
+
+_SELF_DESCRIBED = b"\xd9\xd9\xf7"
+
+# Major types, shifted to the high bits of the initial byte
+_UNSIGNED = 0x00
+_NEGATIVE = 0x20
+_BYTES = 0x40
+_TEXT = 0x60
+_ARRAY = 0x80
+_MAP = 0xA0
+_TAG = 0xC0
+_SIMPLE = 0xE0
+
+_FALSE = b"\xf4"
+_TRUE = b"\xf5"
+_NULL = b"\xf6"
+
+_MAX_INT = 2**64 - 1
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_FLOAT16 = struct.Struct(">e")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT64 = struct.Struct(">d")
+
+
+def _head(major: int, value: int) -> bytes:
+    if value < 24:
+        return bytes((major | value,))
+    if value < 0x100:
+        return bytes((major | 24, value))
+    if value < 0x10000:
+        return bytes((major | 25,)) + _UINT16.pack(value)
+    if value < 0x100000000:
+        return bytes((major | 26,)) + _UINT32.pack(value)
+    return bytes((major | 27,)) + _UINT64.pack(value)
+
+
+def _check_int(value: int):
+    if not -_MAX_INT - 1 <= value <= _MAX_INT:
+        raise ValueError(f"Cannot encode {value} in CBOR, beyond 64 bits")
+
+
+def _encode_float(value: float) -> bytes:
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"Cannot encode {value} in CBOR")
+
+    for info, format in ((25, _FLOAT16), (26, _FLOAT32)):
+        try:
+            packed = format.pack(value)
+        except OverflowError:
+            continue
+        if format.unpack(packed)[0] == value:
+            return bytes((_SIMPLE | info,)) + packed
+    return bytes((_SIMPLE | 27,)) + _FLOAT64.pack(value)
+
+
+def _encode_str(value: str) -> bytes:
+    raw = value.encode()
+    return _head(_BYTES, len(raw)) + raw
+
+
+def _decode_base64(value: str) -> bytes:
+    try:
+        return base64.b64decode(value, validate=True)
+    except binascii.Error as error:
+        raise ValueError(f"Invalid base64 in a field of bytes: {error}") from None
+
+
+def _encode_base64(value: str) -> bytes:
+    raw = _decode_base64(value)
+    return _head(_TAG, BASE64_TAG) + _head(_BYTES, len(raw)) + raw
+
+
+def _encode_int(value: int) -> bytes:
+    _check_int(value)
+    if value >= 0:
+        return _head(_UNSIGNED, value)
+    return _head(_NEGATIVE, -1 - value)
+
+
+def _encode_scalar(value: Any) -> bytes:
+    if value is None:
+        return _NULL
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    if isinstance(value, int):
+        return _encode_int(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    raise TypeError(f"Cannot encode values of type {type(value).__name__}")
+
+
+def _encode_map(value: Dict[str, Any], tree: Any, out: List[bytes]):
+    out.append(_head(_MAP, len(value)))
+    # Keys are unique, so the items are never compared
+    items = sorted((_encode_str(key), key, item) for key, item in value.items())
+    if tree is None:
+        for encoded, _, item in items:
+            out.append(encoded)
+            _encode(item, None, out)
+    else:
+        every = tree.get("__all__")
+        for encoded, key, item in items:
+            out.append(encoded)
+            _encode(item, every if every is not None else tree.get(key), out)
+
+
+def _encode_array(value: List[Any], tree: Any, out: List[bytes]):
+    out.append(_head(_ARRAY, len(value)))
+    every = tree.get("__all__") if tree is not None else None
+    for item in value:
+        _encode(item, every, out)
+
+
+def _encode(value: Any, tree: Any, out: List[bytes]):
+    """
+    Appends the encoding of a JSON ``value`` to ``out``, with ``tree`` the
+    fields holding bytes below it, if any.
+    """
+    if isinstance(value, str):
+        out.append(_encode_base64(value) if tree is True else _encode_str(value))
+    elif isinstance(value, dict):
+        _encode_map(value, tree, out)
+    elif isinstance(value, list):
+        _encode_array(value, tree, out)
+    else:
+        out.append(_encode_scalar(value))
+
+
+def _encoded_length(key: str) -> int:
+    return len(key.encode())
+
+
+def _prepare(value: Any, tree: Any) -> Any:
+    """
+    Returns a JSON ``value`` as cbor2 should encode it, with ``tree`` the
+    fields holding bytes below it, if any: with its strings as bytes, its
+    maps in the order of their encoded keys, and the fields holding bytes as
+    their raw bytes, tagged as expecting base64.
+    """
+    if isinstance(value, str):
+        if tree is True:
+            return cbor2.CBORTag(BASE64_TAG, _decode_base64(value))
+        return value.encode()
+    if isinstance(value, dict):
+        # By length then bytes, the order of the encoded keys: UTF-8 keeps the
+        # order of the code points, but not always the lengths
+        keys = sorted(value)
+        keys.sort(key=len if "".join(keys).isascii() else _encoded_length)
+        if tree is None:
+            return {key.encode(): _prepare(value[key], None) for key in keys}
+        every = tree.get("__all__")
+        return {
+            key.encode(): _prepare(
+                value[key], every if every is not None else tree.get(key)
+            )
+            for key in keys
+        }
+    if isinstance(value, list):
+        every = tree.get("__all__") if tree is not None else None
+        return [_prepare(item, every) for item in value]
+    if isinstance(value, float):
+        # Written by _write_float, as cbor2 only shortens them in its
+        # canonical mode, which would sort the maps again
+        return _Float(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        _check_int(value)
+    elif not isinstance(value, bool) and value is not None:
+        raise TypeError(f"Cannot encode values of type {type(value).__name__}")
+    return value
+
+
+class _Float:
+    __slots__ = ("value",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+def _write_float(encoder: Any, value: _Float):
+    encoder.write(_encode_float(value.value))
+
+
+def to_cbor(obj: BaseModel) -> bytes:
+    """
+    Returns the CBOR encoding of the fields set of ``obj``, as the API server
+    encodes them.
+    """
+    data = obj.model_dump(
+        mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+    )
+    type_fields = _get_type_fields(obj)
+    for name, value in type_fields.items():
+        if value is not None:
+            data.setdefault(name, value)
+
+    gvk = (type_fields.get("apiVersion") or "", type_fields.get("kind") or "")
+    tree = BYTE_FIELDS.get(gvk)
+    if cbor2 is not None:
+        return _SELF_DESCRIBED + cbor2.dumps(_prepare(data, tree), default=_write_float)
+
+    out = [_SELF_DESCRIBED]
+    _encode(data, tree, out)
+    return b"".join(out)
+
+
+def _decode_utf8(raw: bytes, kind: str) -> str:
+    try:
+        return raw.decode()
+    except UnicodeDecodeError:
+        raise ValueError(f"Invalid UTF-8 in a CBOR {kind} string") from None
+
+
+def _encode_tagged(tag: int, raw: bytes) -> str:
+    """
+    Returns the text of ``raw`` in the encoding expected by ``tag``.
+    """
+    if tag == BASE64_TAG:
+        return base64.b64encode(raw).decode()
+    if tag == BASE64URL_TAG:
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+    return raw.hex()
+
+
+def _check_decoded_float(value: float) -> float:
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"Unsupported CBOR float {value}")
+    return value
+
+
+class _Decoder:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.position = 0
+
+    def _read(self, size: int) -> bytes:
+        start = self.position
+        end = self.position = start + size
+        if end > len(self.data):
+            raise ValueError("Truncated CBOR data")
+        return self.data[start:end]
+
+    def _read_head(self) -> Tuple[int, int]:
+        (initial,) = self._read(1)
+        major, info = initial & 0xE0, initial & 0x1F
+
+        if info < 24:
+            return major, info
+        if info == 31:
+            raise ValueError("Indefinite lengths are not supported")
+        if info > 27:
+            raise ValueError(f"Invalid CBOR initial byte {initial:#04x}")
+        if major == _SIMPLE:
+            # The bytes of floats are read along with their format
+            return major, info
+        size = 1 << (info - 24)
+        return major, int.from_bytes(self._read(size), "big")
+
+    def _read_str(self, major: int, length: int) -> str:
+        return _decode_utf8(self._read(length), "byte" if major == _BYTES else "text")
+
+    def _read_tagged(self, tag: int) -> Any:
+        if tag == SELF_DESCRIBED_TAG:
+            return self.decode()
+        if tag not in (BASE64URL_TAG, BASE64_TAG, BASE16_TAG):
+            raise ValueError(f"Unsupported CBOR tag {tag}")
+
+        major, length = self._read_head()
+        if major != _BYTES:
+            raise ValueError(f"CBOR tag {tag} expects a byte string")
+        return _encode_tagged(tag, self._read(length))
+
+    def _read_simple(self, info: int) -> Any:
+        if info == 20:
+            return False
+        if info == 21:
+            return True
+        if info == 22:
+            return None
+        if info < 25:
+            raise ValueError(f"Unsupported CBOR simple value {info}")
+
+        format = (_FLOAT16, _FLOAT32, _FLOAT64)[info - 25]
+        (value,) = format.unpack(self._read(format.size))
+        return _check_decoded_float(value)
+
+    def decode(self) -> Any:
+        major, argument = self._read_head()
+
+        if major == _BYTES or major == _TEXT:
+            return self._read_str(major, argument)
+        if major == _MAP:
+            result: Dict[str, Any] = {}
+            for _ in range(argument):
+                key = self.decode()
+                if not isinstance(key, str):
+                    raise ValueError("CBOR map keys must be strings")
+                if key in result:
+                    raise ValueError(f"Duplicate CBOR map key {key!r}")
+                result[key] = self.decode()
+            return result
+        if major == _ARRAY:
+            return [self.decode() for _ in range(argument)]
+        if major == _UNSIGNED:
+            return argument
+        if major == _NEGATIVE:
+            return -1 - argument
+        if major == _TAG:
+            return self._read_tagged(argument)
+        return self._read_simple(argument)
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Returns the JSON value of a ``value`` decoded by cbor2, with strings for
+    the byte strings.
+    """
+    if isinstance(value, bytes):
+        return _decode_utf8(value, "byte")
+    if isinstance(value, (str, bool)) or value is None:
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return _check_decoded_float(value)
+    if isinstance(value, (dict, cbor2.frozendict)):
+        return _map_to_json(value)
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, cbor2.CBORSimpleValue) or value is cbor2.undefined:
+        raise ValueError(f"Unsupported CBOR simple value {value}")
+    raise ValueError(f"Unsupported CBOR value of type {type(value).__name__}")
+
+
+def _map_to_json(value: Any) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for key, item in value.items():
+        if isinstance(key, bytes):
+            key = _decode_utf8(key, "byte")
+        elif not isinstance(key, str):
+            raise ValueError("CBOR map keys must be strings")
+        # Byte and text strings of the same key are different to cbor2
+        if key in result:
+            raise ValueError(f"Duplicate CBOR map key {key!r}")
+        result[key] = _to_json(item)
+    return result
+
+
+def _decode_tag(tag: Any, immutable: bool) -> Any:
+    if tag.tag not in (BASE64URL_TAG, BASE64_TAG, BASE16_TAG):
+        raise ValueError(f"Unsupported CBOR tag {tag.tag}")
+    if not isinstance(tag.value, bytes):
+        raise ValueError(f"CBOR tag {tag.tag} expects a byte string")
+    return _encode_tagged(tag.tag, tag.value)
+
+
+def _refuse_tag(tag: int, value: Any, immutable: bool) -> Any:
+    raise ValueError(f"Unsupported CBOR tag {tag}")
+
+
+# The tags that cbor2 decodes itself (bignums, dates, shared values...),
+# refused like the others but the self-described tag
+_REFUSED_TAGS = {
+    tag: functools.partial(_refuse_tag, tag)
+    for tag in (0, 1, 2, 3, 4, 5, 25, 28, 29, 30, 35, 36, 37, 52, 54, 100)
+    + (256, 258, 260, 261, 1004, 43000)
+}
+
+
+def _loads_cbor2(data: bytes) -> Any:
+    file = io.BytesIO(data)
+    # Tagged values are decoded as immutable ones, slower to convert
+    if data.startswith(_SELF_DESCRIBED):
+        file.seek(len(_SELF_DESCRIBED))
+
+    decoder = cbor2.CBORDecoder(
+        file,
+        tag_hook=_decode_tag,
+        semantic_decoders=_REFUSED_TAGS,
+        allow_indefinite=False,
+        allow_duplicate_keys=False,
+    )
+    try:
+        value = decoder.decode()
+    except cbor2.CBORDecodeError as error:
+        # The errors of the hooks are the causes of the errors of cbor2
+        if isinstance(error.__cause__, ValueError):
+            raise ValueError(str(error.__cause__)) from None
+        raise ValueError(f"Invalid CBOR data: {error}") from None
+
+    if file.tell() != len(data):
+        raise ValueError("Extra data after the CBOR item")
+    try:
+        return _to_json(value)
+    except RecursionError:
+        raise ValueError("CBOR data nested too deeply") from None
+
+
+def loads(data: bytes) -> Any:
+    """
+    Returns the JSON value encoded in CBOR ``data``, with strings for the
+    byte strings and base64 text for the bytes tagged as expecting it.
+
+    :raises ValueError: If ``data`` is not valid CBOR, or uses features out
+        of the Kubernetes conventions.
+    """
+    if cbor2 is not None:
+        return _loads_cbor2(bytes(data))
+
+    decoder = _Decoder(bytes(data))
+    try:
+        value = decoder.decode()
+    except RecursionError:
+        raise ValueError("CBOR data nested too deeply") from None
+
+    if decoder.position != len(decoder.data):
+        raise ValueError("Extra data after the CBOR item")
+    return value
+
+
+def from_cbor(
+    data: bytes,
+    model: Optional[Type[BaseModel]] = None,
+    context: Optional[Mapping[str, Any]] = None,
+) -> BaseModel:
+    """
+    Returns the object encoded in CBOR ``data``, validated by ``model``, or
+    by the model registered for its ``apiVersion`` and ``kind`` (see
+    :func:`kubedantic.base.get_model`).
+
+    :raises ValueError: If ``data`` is not valid CBOR.
+    :raises pydantic.ValidationError: If it is not a valid object.
+    """
+    value = loads(data)
+    if model is None:
+        fields = value if isinstance(value, dict) else {}
+        model = get_model(fields.get("apiVersion") or "", fields.get("kind") or "")
+    return validate_python(model, value, context)
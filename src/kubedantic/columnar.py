@@ -0,0 +1,324 @@
+"""
+Columnar export of objects to NumPy arrays, for analytics over many of them::
+
+    columns = to_columns(
+        pods,
+        {
+            "metadata.namespace": CATEGORY,
+            "spec.nodeName": CATEGORY,
+            "spec.containers[0].resources.requests.cpu": QUANTITY,
+            "status.containerStatuses[0].restartCount": INT,
+            "metadata.creationTimestamp": TIMESTAMP,
+        },
+    )
+    pods_per_node = numpy.bincount(columns["spec.nodeName"])
+
+The objects are models, or the dicts loaded from their JSON, and the fields
+are paths as taken by :func:`kubedantic.paths.get_path`, each read once per
+object in a single pass. Given as a list of paths, the type of each column
+is inferred from its first value that is set, strings being categories.
+
+Columns are converted as follows:
+
+- :data:`INT` and :data:`BOOL` columns fill unset values with 0 and False, as
+  the API server omits them;
+- :data:`FLOAT` and :data:`QUANTITY` columns fill them with NaN, quantities
+  (e.g. ``"500Mi"``) being resolved to numbers;
+- :data:`TIMESTAMP` columns are ``datetime64[us]`` in UTC, NaT when unset;
+- :data:`CATEGORY` columns are ``int32`` codes into
+  :attr:`Columns.categories`, -1 when unset, each string being looked up
+  once;
+- :data:`STR` columns are object arrays of the strings, None when unset.
+
+Requires NumPy, e.g. with ``pip install kubedantic[columnar]``.
+"""
+
+import functools
+import re
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy
+from pydantic import BaseModel
+
+from .paths import Segment, get_path, parse_path
+
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+QUANTITY = "quantity"
+TIMESTAMP = "timestamp"
+CATEGORY = "category"
+STR = "str"
+
+_QUANTITY = re.compile(
+    r"(?P<number>[+-]?(?:\d+\.?\d*|\.\d+))"
+    r"(?:(?P<suffix>Ki|Mi|Gi|Ti|Pi|Ei|n|u|m|k|M|G|T|P|E)|[eE](?P<exponent>[+-]?\d+))?"
+)
+_SUFFIXES = {
+    "n": Decimal("1e-9"),
+    "u": Decimal("1e-6"),
+    "m": Decimal("1e-3"),
+    "k": Decimal("1e3"),
+    "M": Decimal("1e6"),
+    "G": Decimal("1e9"),
+    "T": Decimal("1e12"),
+    "P": Decimal("1e15"),
+    "E": Decimal("1e18"),
+    "Ki": Decimal(2**10),
+    "Mi": Decimal(2**20),
+    "Gi": Decimal(2**30),
+    "Ti": Decimal(2**40),
+    "Pi": Decimal(2**50),
+    "Ei": Decimal(2**60),
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# Microseconds of NaT in datetime64[us] arrays
+_NAT = numpy.iinfo(numpy.int64).min
+
+
+class Columns(Dict[str, numpy.ndarray]):
+    """
+    Arrays of the columns by path, with the categories of the
+    :data:`CATEGORY` columns.
+    """
+
+    def __init__(self, *args: Any, categories: Dict[str, numpy.ndarray], **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.categories = categories
+
+    def decode(self, path: str) -> numpy.ndarray:
+        """
+        Returns the strings of a :data:`CATEGORY` column, None when unset.
+        """
+        categories = self.categories[path]
+        # The code -1 of unset values picks the trailing None
+        strings = numpy.empty(len(categories) + 1, dtype=object)
+        strings[:-1] = categories
+        return strings[self[path]]
+
+    def to_records(self) -> numpy.ndarray:
+        """
+        Returns the columns as a structured array, with a field per path.
+        """
+        size = len(next(iter(self.values()), ()))
+        records = numpy.empty(
+            size, dtype=[(path, array.dtype) for path, array in self.items()]
+        )
+        for path, array in self.items():
+            records[path] = array
+        return records
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_quantity(value: str) -> float:
+    match = _QUANTITY.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid quantity {value!r}")
+
+    number = Decimal(match.group("number"))
+    if match.group("suffix"):
+        number *= _SUFFIXES[match.group("suffix")]
+    elif match.group("exponent"):
+        number = number.scaleb(int(match.group("exponent")))
+    return float(number)
+
+
+def parse_quantity(value: Union[str, int, float]) -> float:
+    """
+    Returns the number of a quantity, e.g. 0.1 for ``"100m"`` or 1048576
+    for ``"1Mi"``.
+
+    :raises ValueError: If ``value`` is not a valid quantity.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    return _parse_quantity(value)
+
+
+def _to_microseconds(value: Union[datetime, str]) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _infer_type(values: List[Any]) -> str:
+    value = next((value for value in values if value is not None), None)
+
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return FLOAT
+    if isinstance(value, datetime):
+        return TIMESTAMP
+    return CATEGORY
+
+
+def _encode_categories(values: List[Any]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    codes: Dict[Any, int] = {}
+    array = numpy.fromiter(
+        (
+            -1 if value is None else codes.setdefault(value, len(codes))
+            for value in values
+        ),
+        dtype=numpy.int32,
+        count=len(values),
+    )
+    categories = numpy.empty(len(codes), dtype=object)
+    categories[:] = list(codes)
+    return array, categories
+
+
+_CONVERTERS: Dict[str, Callable[[List[Any]], numpy.ndarray]] = {
+    INT: lambda values: numpy.array(
+        [value or 0 for value in values], dtype=numpy.int64
+    ),
+    FLOAT: lambda values: numpy.array(
+        [numpy.nan if value is None else value for value in values],
+        dtype=numpy.float64,
+    ),
+    BOOL: lambda values: numpy.array(
+        [bool(value) for value in values], dtype=numpy.bool_
+    ),
+    QUANTITY: lambda values: numpy.array(
+        [numpy.nan if value is None else parse_quantity(value) for value in values],
+        dtype=numpy.float64,
+    ),
+    TIMESTAMP: lambda values: numpy.array(
+        [_NAT if value is None else _to_microseconds(value) for value in values],
+        dtype=numpy.int64,
+    ).view("datetime64[us]"),
+}
+
+
+_TYPES = {*_CONVERTERS, CATEGORY, STR}
+
+
+def _to_str_array(values: List[Any]) -> numpy.ndarray:
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _get_steps(obj: Any, segments: Tuple[Segment, ...]) -> Optional[List[Any]]:
+    """
+    Returns the getters of the nodes along a path in ``obj``, with the names
+    of nested fields merged in one ``attrgetter``, or None if a node along
+    the path is unset.
+    """
+    steps: List[Any] = []
+    names: List[str] = []
+    node = obj
+
+    for segment in segments:
+        if node is None:
+            return None
+        if isinstance(node, BaseModel) and segment in type(node).model_fields:
+            names.append(segment)  # type: ignore[arg-type]
+            node = getattr(node, segment)  # type: ignore[arg-type]
+            continue
+        if not isinstance(node, (dict, list, tuple)):
+            return None
+        if names:
+            steps.append(attrgetter(".".join(names)))
+            names = []
+        try:
+            node = node[segment]  # type: ignore[index]
+        except (IndexError, KeyError):
+            return None
+        steps.append(itemgetter(segment))
+
+    if names:
+        steps.append(attrgetter(".".join(names)))
+    return steps
+
+
+class _Reader:
+    """
+    Reads the values at a path, with the getters of the nodes along it in
+    the first object where it is set; objects of another type, or where a
+    node is unset, fall back to :func:`kubedantic.paths.get_path`.
+    """
+
+    __slots__ = ("segments", "steps", "type")
+
+    def __init__(self, path: str):
+        self.segments = parse_path(path)
+        self.steps: Optional[List[Any]] = None
+        self.type: Optional[type] = None
+
+    def read(self, obj: Any) -> Any:
+        if self.type is type(obj):
+            value = obj
+            try:
+                for step in self.steps:  # type: ignore[union-attr]
+                    value = step(value)
+                return value
+            except (AttributeError, IndexError, KeyError, TypeError):
+                pass
+        elif self.steps is None:
+            self.steps = _get_steps(obj, self.segments)
+            if self.steps is not None:
+                self.type = type(obj)
+        return get_path(obj, self.segments)
+
+
+def to_columns(
+    objects: Iterable[Union[BaseModel, Mapping[str, Any]]],
+    fields: Union[Sequence[str], Mapping[str, Optional[str]]],
+) -> Columns:
+    """
+    Returns the values of ``fields`` in ``objects`` as arrays, by path.
+
+    ``fields`` maps the paths to the types of their columns, e.g.
+    :data:`QUANTITY`, or lists paths whose types are inferred from their
+    values (as do paths mapped to None).
+
+    :raises kubedantic.paths.InvalidPathError: If a path is malformed or
+        names a field a model does not have.
+    :raises ValueError: If a value cannot be converted to its column type.
+    """
+    types = dict(fields) if isinstance(fields, Mapping) else dict.fromkeys(fields)
+    for path, column_type in types.items():
+        if column_type is not None and column_type not in _TYPES:
+            raise ValueError(f"Unknown column type {column_type!r} for {path}")
+
+    values: Dict[str, List[Any]] = {path: [] for path in types}
+    readers = [(values[path].append, _Reader(path).read) for path in types]
+
+    for obj in objects:
+        for append, read in readers:
+            append(read(obj))
+
+    columns = Columns(categories={})
+    for path, column_values in values.items():
+        column_type = types[path] or _infer_type(column_values)
+        if column_type == CATEGORY:
+            codes, categories = _encode_categories(column_values)
+            columns[path] = codes
+            columns.categories[path] = categories
+        elif column_type == STR:
+            columns[path] = _to_str_array(column_values)
+        else:
+            columns[path] = _CONVERTERS[column_type](column_values)
+
+    return columns
@@ -0,0 +1,346 @@
+"""
+Immutable, hashable variants of the generated models.
+
+The frozen variant of a model has the same fields, with lists turned into
+tuples and dicts into :class:`FrozenDict`, and caches its structural hash::
+
+    FrozenPod = frozen(Pod)
+    pods = {freeze(pod) for pod in pods}
+
+The read-only variant of a model, see :func:`read_only`, turns lists into
+:class:`FrozenList` instead, so its instances can be nested in mutable
+models, which serialize them as lists.
+"""
+
+import copy
+import threading
+import typing
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    SupportsIndex,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, PrivateAttr
+from pydantic_core import core_schema
+
+from . import pickling
+
+K = TypeVar("K")
+V = TypeVar("V")
+M = TypeVar("M", bound=BaseModel)
+
+# Frozen and read-only classes by original model, and the namespace their
+# forward references are resolved in
+_frozen: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_read_only: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_originals: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_namespace: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+class FrozenDict(Dict[K, V]):
+    """
+    Immutable and hashable ``dict``.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset(self.items()))
+            return self._hash
+
+    def _immutable(self, *args: Any, **kwargs: Any):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        key, value = typing.get_args(source) or (Any, Any)
+        return core_schema.no_info_after_validator_function(
+            cls,
+            handler.generate_schema(Dict[key, value]),  # type: ignore[valid-type]
+        )
+
+
+class FrozenList(List[V]):
+    """
+    Immutable and hashable ``list``.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(tuple(self))
+            return self._hash
+
+    def _immutable(self, *args: Any, **kwargs: Any):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable  # type: ignore[assignment]
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        (item,) = typing.get_args(source) or (Any,)
+        return core_schema.no_info_after_validator_function(
+            cls,
+            handler.generate_schema(List[item]),  # type: ignore[valid-type]
+        )
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Deep-freezes a free-form JSON value.
+    """
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict((key, _freeze_value(item)) for key, item in value.items())
+    return value
+
+
+def _freeze_extra(model: BaseModel) -> Dict[str, Any]:
+    """
+    Returns the deep-frozen extra fields of a model (e.g. the free-form data
+    of ``RawExtension``).
+    """
+    extra = model.__pydantic_extra__ or {}
+    return {name: _freeze_value(value) for name, value in extra.items()}
+
+
+class _FrozenAny:
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            _freeze_value, core_schema.any_schema()
+        )
+
+
+class FrozenModel(BaseModel):
+    """
+    Base class of the frozen variants, caching their structural hash.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    _hash: Optional[int] = PrivateAttr(default=None)
+    # Content digests by ignored paths, see :mod:`kubedantic.hashing`
+    _digests: Optional[Dict[Any, bytes]] = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any) -> None:
+        super().model_post_init(context)
+        if self.__pydantic_extra__:
+            self.__pydantic_extra__.update(_freeze_extra(self))
+
+    def __hash__(self) -> int:
+        private = self.__pydantic_private__
+        value = private.get("_hash") if private is not None else None
+
+        if value is None:
+            extra = tuple((self.__pydantic_extra__ or {}).items())
+            value = hash((type(self), tuple(self.__dict__.values()), extra))
+            if private is not None:
+                private["_hash"] = value
+
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(other) is _originals.get(type(self)):
+            # Read-only subtrees equal the mutable ones they were decoded
+            # from (e.g. the pod specs shared by :mod:`kubedantic.sharing`)
+            return self.__dict__ == other.__dict__ and (
+                self.__pydantic_extra__ or {}
+            ) == _freeze_extra(other)
+        if type(other) is not type(self):
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        return self.__dict__ == other.__dict__ and (
+            self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ):
+        copied = super().model_copy(update=update, deep=deep)
+        # The cached hashes no longer hold once fields are replaced
+        if update and copied.__pydantic_private__ is not None:
+            copied.__pydantic_private__.update(_hash=None, _digests=None)
+        return copied
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Tuple[Any, ...]:
+        # The frozen classes are created at runtime, so they are pickled
+        # through their original model, and the variant to restore
+        original = _originals[type(self)]
+        if _read_only.get(original) is type(self):
+            return pickling.reduce_model(self, protocol, _unpickle_read_only, original)
+        return pickling.reduce_model(self, protocol, _unpickle, original)
+
+
+def _get_name(model: Type[BaseModel], read_only: bool) -> str:
+    """
+    Returns the name the frozen or read-only variant of ``model`` is known by
+    in the forward references.
+    """
+    return f"_ReadOnly{id(model)}" if read_only else f"_Frozen{id(model)}"
+
+
+def _freeze_annotation(
+    annotation: Any, pending: List[Type[BaseModel]], read_only: bool
+) -> Any:
+    if annotation is Any:
+        return _FrozenAny
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        variants = _read_only if read_only else _frozen
+        if annotation not in variants and annotation not in pending:
+            pending.append(annotation)
+        return _get_name(annotation, read_only)
+
+    origin = typing.get_origin(annotation)
+    args = [
+        _freeze_annotation(arg, pending, read_only)
+        for arg in typing.get_args(annotation)
+    ]
+
+    if origin is list and read_only:
+        return FrozenList[args[0]]  # type: ignore[valid-type]
+    if origin is list:
+        return Tuple[args[0], ...]
+    if origin is dict:
+        return FrozenDict[args[0], args[1]]  # type: ignore[valid-type]
+    if origin is Union:
+        return Union[tuple(args)]
+
+    return annotation
+
+
+def _create(
+    model: Type[BaseModel], pending: List[Type[BaseModel]], read_only: bool
+) -> Type[BaseModel]:
+    fields: Dict[str, Any] = {}
+
+    for name, field in model.model_fields.items():
+        field = copy.copy(field)
+        field.annotation = _freeze_annotation(field.annotation, pending, read_only)
+        fields[name] = (field.annotation, field)
+
+    # Keep the helpers of the original class (e.g. ``KubernetesObject.key``)
+    metaclass: Any = type(model)
+    frozen_model = typing.cast(
+        Type[BaseModel],
+        metaclass(
+            model.__name__,
+            (FrozenModel, model),
+            {
+                "__module__": __name__,
+                "__qualname__": (
+                    f"{'read_only' if read_only else 'frozen'}({model.__qualname__})"
+                ),
+                "__annotations__": {name: value[0] for name, value in fields.items()},
+                **{name: value[1] for name, value in fields.items()},
+            },
+        ),
+    )
+    _namespace[_get_name(model, read_only)] = frozen_model
+    return frozen_model
+
+
+def _get_variant(model: Type[M], read_only: bool) -> Type[M]:
+    if isinstance(model, type) and issubclass(model, FrozenModel):
+        return model
+
+    variants = _read_only if read_only else _frozen
+    with _lock:
+        if model not in variants:
+            pending: List[Type[BaseModel]] = [model]
+            created = []
+            while pending:
+                original = pending.pop()
+                variants[original] = _create(original, pending, read_only)
+                _originals[variants[original]] = original
+                created.append(variants[original])
+
+            for frozen_model in created:
+                frozen_model.model_rebuild(force=True, _types_namespace=_namespace)
+
+    return typing.cast(Type[M], variants[model])
+
+
+def frozen(model: Type[M]) -> Type[M]:
+    """
+    Returns the frozen variant of ``model``, creating it (and the frozen
+    variants of the models it uses) on first use.
+    """
+    return _get_variant(model, read_only=False)
+
+
+def read_only(model: Type[M]) -> Type[M]:
+    """
+    Returns the read-only variant of ``model``, frozen but with lists turned
+    into :class:`FrozenList` rather than tuples, creating it (and the
+    read-only variants of the models it uses) on first use.
+
+    Frozen models are their own read-only variants.
+    """
+    return _get_variant(model, read_only=True)
+
+
+def _unpickle(model: Type[BaseModel], data: pickling.Buffer) -> BaseModel:
+    return pickling.restore(frozen(model), data)
+
+
+def _unpickle_read_only(model: Type[BaseModel], data: pickling.Buffer) -> BaseModel:
+    return pickling.restore(read_only(model), data)
+
+
+def freeze(obj: M) -> M:
+    """
+    Returns an immutable, hashable copy of a model instance.
+    """
+    if isinstance(obj, FrozenModel):
+        return obj
+
+    data = obj.model_dump(by_alias=True, exclude_unset=True)
+    return frozen(type(obj)).model_validate(data)
+
+
+def thaw(obj: M) -> M:
+    """
+    Returns a mutable copy of a frozen model instance.
+    """
+    if not isinstance(obj, FrozenModel):
+        return obj
+
+    data = obj.model_dump(by_alias=True, exclude_unset=True)
+    return _originals[type(obj)].model_validate(data)  # type: ignore[return-value]
@@ -0,0 +1,106 @@
+"""
+Stable content digests of objects, e.g. to detect drift between the desired
+and the live state of a cluster::
+
+    if content_hash(desired) != content_hash(live):
+        apply(desired)
+
+The digest covers the fields that are set, by their JSON names, so it does
+not depend on field or key order, on fields set to ``None`` or on the
+version of Python. Fields populated by the server are left out.
+
+:mod:`kubedantic.frozen` models cache their digests, until copied with
+changes (e.g. by :func:`kubedantic.paths.evolve`). Mutable models can change
+anywhere below the root without it noticing, so their digests are computed
+on every call.
+"""
+
+import functools
+import hashlib
+import json
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .paths import Segment, parse_path
+
+# Fields populated by the server, which are skipped by default
+SERVER_FIELDS = (
+    "status",
+    "metadata.resourceVersion",
+    "metadata.uid",
+    "metadata.managedFields",
+    "metadata.generation",
+)
+
+DIGEST_SIZE = 16
+
+# Nested dicts of the excluded fields, keys and indexes, e.g. {"status": True}
+Exclude = Dict[Any, Any]
+
+
+def _encode_default(value: Any) -> str:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot hash values of type {type(value).__name__}")
+
+
+_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    sort_keys=True,
+    separators=(",", ":"),
+    default=_encode_default,
+)
+
+
+def _add_path(exclude: Exclude, segments: Tuple[Segment, ...]):
+    head, rest = segments[0], segments[1:]
+    current = exclude.get(head)
+
+    if not rest:
+        exclude[head] = True
+    elif current is not True:
+        if current is None:
+            current = exclude[head] = {}
+        _add_path(current, rest)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_exclude(paths: Tuple[str, ...]) -> Exclude:
+    """
+    Returns the ignored paths in the form pydantic excludes fields in.
+    """
+    exclude: Exclude = {}
+    for path in paths:
+        _add_path(exclude, parse_path(path))
+    return exclude
+
+
+def _digest(obj: BaseModel, exclude: Optional[Exclude]) -> bytes:
+    data = obj.model_dump(by_alias=True, exclude_none=True, exclude=exclude)
+    raw = _encoder.encode(data).encode()
+    return hashlib.blake2b(raw, digest_size=DIGEST_SIZE).digest()
+
+
+def content_hash(obj: BaseModel, ignore: Iterable[str] = ()) -> str:
+    """
+    Returns the hex digest of the content of ``obj``, leaving out the fields
+    populated by the server (see :data:`SERVER_FIELDS`) and the paths in
+    ``ignore``, e.g. ``metadata.annotations["deployment.kubernetes.io/revision"]``.
+    """
+    paths = (*SERVER_FIELDS, *ignore)
+
+    # Only frozen models, which have a private ``_digests`` attribute, cache
+    private = obj.__pydantic_private__
+    if private is None or "_digests" not in private:
+        return _digest(obj, _get_exclude(paths)).hex()
+
+    if private["_digests"] is None:
+        private["_digests"] = {}
+    cache: Dict[Tuple[str, ...], bytes] = private["_digests"]
+
+    digest = cache.get(paths)
+    if digest is None:
+        digest = cache[paths] = _digest(obj, _get_exclude(paths))
+    return digest.hex()
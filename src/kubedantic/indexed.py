@@ -0,0 +1,335 @@
+"""
+Random access to the items of very large lists dumped as JSON, such as
+snapshots of whole clusters, without loading them::
+
+    with IndexedList("snapshot.json") as snapshot:
+        deployment = snapshot.get("web", namespace="shop", kind="Deployment")
+
+The dump is scanned once into an index of the byte range, ``apiVersion``,
+``kind``, namespace and name of every item, which is saved next to it (in
+``snapshot.json.index``) and reused as long as the dump is unchanged. The
+dump itself is memory-mapped, and only the items accessed are validated.
+"""
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .base import get_model, validate_json
+from .bulk import _get_item_type, _iter_values
+
+INDEX_SUFFIX = ".index"
+
+_MAGIC = b"KDINDEX1"
+_HEADER_SIZE = struct.Struct("<I")
+
+
+class ItemInfo(NamedTuple):
+    """
+    Type, name and byte range of an item in a dump.
+    """
+
+    api_version: str
+    kind: str
+    namespace: Optional[str]
+    name: Optional[str]
+    start: int
+    end: int
+
+
+class _Index:
+    """
+    Index of the items of a dump, in arrays and tables of the distinct
+    types and namespaces.
+    """
+
+    def __init__(self, size: int, mtime_ns: int, fields: Dict[str, Any]):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.fields = fields
+        self.starts = array.array("Q")
+        self.ends = array.array("Q")
+        # Positions in the tables, with "" for an unset namespace or name
+        self.type_ids = array.array("I")
+        self.namespace_ids = array.array("I")
+        self.types: List[Tuple[str, str]] = []
+        self.namespaces: List[str] = []
+        self.names: List[str] = []
+
+
+def _get_id(table: List[Any], ids: Dict[Any, int], value: Any) -> int:
+    value_id = ids.get(value)
+    if value_id is None:
+        value_id = ids[value] = len(table)
+        table.append(value)
+    return value_id
+
+
+def _build_index(path: str, stat: os.stat_result) -> _Index:
+    index = _Index(stat.st_size, stat.st_mtime_ns, {})
+    type_ids: Dict[Tuple[str, str], int] = {}
+    namespace_ids: Dict[str, int] = {}
+
+    with open(path, "rb") as file:
+        for item, start, end in _iter_values(file, index.fields):
+            fields = item if isinstance(item, dict) else {}
+            metadata = fields.get("metadata")
+            metadata = metadata if isinstance(metadata, dict) else {}
+            item_type = (fields.get("apiVersion") or "", fields.get("kind") or "")
+
+            index.starts.append(start)
+            index.ends.append(end)
+            index.type_ids.append(_get_id(index.types, type_ids, item_type))
+            namespace = metadata.get("namespace") or ""
+            index.namespace_ids.append(
+                _get_id(index.namespaces, namespace_ids, namespace)
+            )
+            index.names.append(metadata.get("name") or "")
+
+    return index
+
+
+def _save_index(index: _Index, path: str):
+    header = json.dumps(
+        {
+            "size": index.size,
+            "mtime_ns": index.mtime_ns,
+            "byteorder": sys.byteorder,
+            "count": len(index.names),
+            "fields": index.fields,
+            "types": index.types,
+            "namespaces": index.namespaces,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    # Written aside first, so that a failure never leaves a partial index
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+            for values in (
+                index.starts,
+                index.ends,
+                index.type_ids,
+                index.namespace_ids,
+            ):
+                values.tofile(file)
+            # Names never contain NUL characters
+            file.write("\0".join(index.names).encode())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _read_index(data: bytes, stat: os.stat_result) -> Optional[_Index]:
+    if not data.startswith(_MAGIC):
+        return None
+
+    offset = len(_MAGIC)
+    (header_size,) = _HEADER_SIZE.unpack_from(data, offset)
+    offset += _HEADER_SIZE.size
+    header = json.loads(data[offset : offset + header_size])
+    offset += header_size
+
+    if (header["size"], header["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+        return None
+
+    index = _Index(header["size"], header["mtime_ns"], header["fields"])
+    index.types = [tuple(item_type) for item_type in header["types"]]  # type: ignore[misc]
+    index.namespaces = header["namespaces"]
+
+    view = memoryview(data)
+    count = header["count"]
+    for values in (index.starts, index.ends, index.type_ids, index.namespace_ids):
+        end = offset + count * values.itemsize
+        values.frombytes(view[offset:end])
+        if len(values) != count:
+            return None
+        if header["byteorder"] != sys.byteorder:
+            values.byteswap()
+        offset = end
+
+    index.names = bytes(view[offset:]).decode().split("\0") if count else []
+    if (
+        len(index.names) != count
+        or max(index.ends, default=0) > index.size
+        or max(index.type_ids, default=0) >= max(len(index.types), 1)
+        or max(index.namespace_ids, default=0) >= max(len(index.namespaces), 1)
+    ):
+        return None
+    return index
+
+
+def _load_index(path: str, stat: os.stat_result) -> Optional[_Index]:
+    """
+    Returns the index saved at ``path``, if it is the index of the dump of
+    ``stat`` and whole.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+
+    try:
+        return _read_index(data, stat)
+    except (struct.error, ValueError, KeyError, TypeError):
+        # Truncated or corrupt, it is built again
+        return None
+
+
+class IndexedList:
+    """
+    Items of the list (or JSON array) dumped at ``path``, validated on
+    access.
+
+    The index is saved at ``index_path`` (next to the dump by default), or
+    only kept in memory if ``save_index`` is false.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        index_path: Union[str, "os.PathLike[str]", None] = None,
+        save_index: bool = True,
+    ):
+        self.path = os.fspath(path)
+        self.index_path = (
+            os.fspath(index_path) if index_path else self.path + INDEX_SUFFIX
+        )
+
+        stat = os.stat(self.path)
+        index = _load_index(self.index_path, stat)
+        if index is None:
+            index = _build_index(self.path, stat)
+            if save_index:
+                _save_index(index, self.index_path)
+
+        self._index = index
+        self._item_type = _get_item_type(index.fields)
+        self._keys: Optional[Dict[Tuple[str, str], List[int]]] = None
+
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "IndexedList":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """
+        Returns the fields of the list other than its items, e.g. its
+        ``metadata.resourceVersion``.
+        """
+        return self._index.fields
+
+    def __len__(self) -> int:
+        return len(self._index.names)
+
+    def __getitem__(self, position: int) -> BaseModel:
+        return self.validate(position)
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        return (self.validate(position) for position in range(len(self)))
+
+    def info(self, position: int) -> ItemInfo:
+        index = self._index
+        api_version, kind = index.types[index.type_ids[position]]
+        namespace = index.namespaces[index.namespace_ids[position]]
+        name = index.names[position]
+        return ItemInfo(
+            api_version or self._item_type[0],
+            kind or self._item_type[1],
+            namespace or None,
+            name or None,
+            index.starts[position],
+            index.ends[position],
+        )
+
+    def raw(self, position: int) -> bytes:
+        """
+        Returns the JSON of the item at ``position``, as in the dump.
+        """
+        index = self._index
+        return self._map[index.starts[position] : index.ends[position]]
+
+    def validate(
+        self, position: int, context: Optional[Mapping[str, Any]] = None
+    ) -> BaseModel:
+        """
+        Returns the item at ``position`` validated by the model registered
+        for its ``apiVersion`` and ``kind``.
+
+        :raises kubedantic.base.UnknownKindError: If there is no such model.
+        :raises pydantic.ValidationError: If the item is not valid.
+        """
+        info = self.info(position)
+        model = get_model(info.api_version, info.kind)
+        data = self._map[info.start : info.end]
+        return validate_json(model, data, context)
+
+    def _get_keys(self) -> Dict[Tuple[str, str], List[int]]:
+        if self._keys is not None:
+            return self._keys
+
+        index = self._index
+        keys: Dict[Tuple[str, str], List[int]] = {}
+        for position, (namespace_id, name) in enumerate(
+            zip(index.namespace_ids, index.names)
+        ):
+            key = (index.namespaces[namespace_id], name)
+            keys.setdefault(key, []).append(position)
+
+        self._keys = keys
+        return keys
+
+    def positions(
+        self, name: str, namespace: Optional[str] = None, kind: Optional[str] = None
+    ) -> List[int]:
+        """
+        Returns the positions of the items named ``name`` in ``namespace``
+        (none for cluster-scoped items), of any kind by default.
+        """
+        positions = self._get_keys().get((namespace or "", name), [])
+        if kind is None:
+            return list(positions)
+        return [position for position in positions if self.info(position).kind == kind]
+
+    def get(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        kind: Optional[str] = None,
+        context: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[BaseModel]:
+        """
+        Returns the first item named ``name`` in ``namespace`` (of ``kind``
+        if given) validated, see :meth:`positions`, or ``None``.
+        """
+        positions = self.positions(name, namespace, kind)
+        return self.validate(positions[0], context) if positions else None
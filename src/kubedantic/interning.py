@@ -0,0 +1,138 @@
+"""
+Opt-in interning of the strings repeated across many objects (label keys,
+namespaces, node names, image references...), applied to validated objects::
+
+    pod = intern_strings(Pod.model_validate(data))
+
+or requested in the context of the helpers validating objects (e.g.
+:func:`kubedantic.base.validate_json` or :func:`kubedantic.bulk.validate_objects`)::
+
+    pod = validate_json(Pod, data, context={"intern_strings": True})
+"""
+
+import sys
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import BaseModel
+
+CONTEXT_KEY = "intern_strings"
+
+VALUE = "value"
+KEYS = "keys"
+ITEMS = "items"
+
+# Fields of every model identifying the type of an object
+TYPE_FIELDS = {"apiVersion": VALUE, "kind": VALUE}
+
+# Fields whose values are repeated across objects, keyed by model name.
+# ``VALUE`` interns a string, ``KEYS`` the keys of a mapping and ``ITEMS``
+# both its keys and values.
+INTERNED_FIELDS: Dict[str, Dict[str, str]] = {
+    "ObjectMeta": {
+        "annotations": KEYS,
+        "generateName": VALUE,
+        "labels": ITEMS,
+        "namespace": VALUE,
+    },
+    "OwnerReference": {"apiVersion": VALUE, "kind": VALUE},
+    "ManagedFieldsEntry": {
+        "apiVersion": VALUE,
+        "fieldsType": VALUE,
+        "manager": VALUE,
+        "operation": VALUE,
+    },
+    "PodSpec": {
+        "dnsPolicy": VALUE,
+        "nodeName": VALUE,
+        "nodeSelector": ITEMS,
+        "priorityClassName": VALUE,
+        "restartPolicy": VALUE,
+        "schedulerName": VALUE,
+        "serviceAccount": VALUE,
+        "serviceAccountName": VALUE,
+    },
+    "Container": {
+        "image": VALUE,
+        "imagePullPolicy": VALUE,
+        "name": VALUE,
+        "terminationMessagePath": VALUE,
+        "terminationMessagePolicy": VALUE,
+    },
+    "ContainerPort": {"name": VALUE, "protocol": VALUE},
+    "ContainerStatus": {"image": VALUE, "imageID": VALUE, "name": VALUE},
+    "EnvVar": {"name": VALUE},
+    "VolumeMount": {"mountPath": VALUE, "name": VALUE},
+    "Volume": {"name": VALUE},
+    "Toleration": {"effect": VALUE, "key": VALUE, "operator": VALUE},
+    "PodStatus": {"hostIP": VALUE, "phase": VALUE, "qosClass": VALUE},
+    "PodCondition": {"status": VALUE, "type": VALUE},
+    "NodeSelectorRequirement": {"key": VALUE, "operator": VALUE},
+    "LabelSelector": {"matchLabels": ITEMS},
+    "LabelSelectorRequirement": {"key": VALUE, "operator": VALUE},
+}
+
+
+def _intern(value: Any, mode: str) -> Any:
+    if mode == VALUE:
+        return sys.intern(value) if type(value) is str else value
+
+    if not isinstance(value, dict):
+        return value
+
+    if mode == KEYS:
+        return type(value)((sys.intern(key), item) for key, item in value.items())
+
+    return type(value)(
+        (sys.intern(key), sys.intern(item) if type(item) is str else item)
+        for key, item in value.items()
+    )
+
+
+def _intern_children(value: Any):
+    """
+    Interns the models nested in a field that is not interned itself.
+    """
+    if isinstance(value, BaseModel):
+        _intern_model(value)
+        return
+
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return
+
+    for item in value:
+        if isinstance(item, BaseModel):
+            _intern_model(item)
+
+
+def _intern_model(model: BaseModel):
+    fields = INTERNED_FIELDS.get(type(model).__name__, TYPE_FIELDS)
+    values = model.__dict__
+
+    for name, value in values.items():
+        if value is None:
+            continue
+
+        mode = fields.get(name) or TYPE_FIELDS.get(name)
+        if mode is not None:
+            values[name] = _intern(value, mode)
+        else:
+            _intern_children(value)
+
+
+def intern_strings(model: BaseModel) -> BaseModel:
+    """
+    Interns, in place, the repeated strings of a model and its submodels.
+
+    :return: The same model, for chaining.
+    """
+    _intern_model(model)
+    return model
+
+
+def is_enabled(context: Optional[Mapping[str, Any]]) -> bool:
+    """
+    Returns whether interning was requested in a validation context.
+    """
+    return bool(context and context.get(CONTEXT_KEY))
@@ -0,0 +1,280 @@
+"""
+Field ownership of objects, from their ``metadata.managedFields``, e.g. to
+find out whether the HPA and a GitOps tool both manage the replicas::
+
+    managed = ManagedFields.from_object(deployment)
+    managed.owners("spec.replicas")  # ["kube-controller-manager", "argocd"]
+    managed.conflicts("argocd")  # {"kube-controller-manager": FieldSet(...)}
+
+The ``fieldsV1`` of every entry is a trie in JSON, keyed by path elements:
+``f:<name>`` for fields and map keys, ``k:<json>`` for list items by their
+key fields, ``v:<json>`` for set items and ``i:<index>`` for list items by
+position, where ``.`` marks a field with children as a member of the set.
+:class:`FieldSet` wraps that trie as is: nothing is decoded up front, a
+lookup only follows its own path and set operations share the subtrees they
+do not change.
+"""
+
+import functools
+import json
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .models.io.k8s.apimachinery.pkg.apis.meta.v1 import ManagedFieldsEntry
+from .paths import parse_path
+
+# Nested dicts of path elements, as in ``FieldsV1``
+Fields = Mapping[str, Any]
+
+Path = Union[str, Tuple[Union[str, int], ...]]
+
+_PREFIXES = ("f:", "k:", "v:", "i:")
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def key_element(**fields: Any) -> str:
+    """
+    Returns the path element of the list item with the given key fields,
+    e.g. ``key_element(name="web")`` for the ``web`` container.
+    """
+    return f"k:{json.dumps(fields, sort_keys=True, separators=(',', ':'))}"
+
+
+def value_element(value: Any) -> str:
+    """
+    Returns the path element of an item of a set, e.g. of finalizers.
+    """
+    return f"v:{json.dumps(value, separators=(',', ':'))}"
+
+
+def _get_element(segment: Union[str, int]) -> str:
+    if isinstance(segment, int):
+        return f"i:{segment}"
+    if segment.startswith(_PREFIXES):
+        return segment
+    return f"f:{segment}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_elements(path: str) -> Tuple[str, ...]:
+    return tuple(_get_element(segment) for segment in parse_path(path))
+
+
+def to_elements(path: Path) -> Tuple[str, ...]:
+    """
+    Returns the path elements of a field path, either a string such as
+    ``metadata.labels["app.kubernetes.io/name"]`` or a tuple of names, indexes
+    and elements such as ``("spec", "containers", key_element(name="web"))``.
+    """
+    if isinstance(path, str):
+        return _parse_elements(path)
+    return tuple(_get_element(segment) for segment in path)
+
+
+def _is_member(node: Fields) -> bool:
+    return not node or "." in node
+
+
+def _join(member: bool, children: Dict[str, Any]) -> Optional[Fields]:
+    """
+    Returns the node of a field from its membership and children, or None if
+    it is not in the set at all.
+    """
+    if not children:
+        return _EMPTY if member else None
+    if member:
+        children["."] = _EMPTY
+    return children
+
+
+def _union(left: Fields, right: Fields) -> Dict[str, Any]:
+    children = {key: node for key, node in left.items() if key != "."}
+
+    for key, node in right.items():
+        if key == ".":
+            continue
+        other = children.get(key)
+        if other is None or other is node:
+            children[key] = node
+            continue
+        member = _is_member(node) or _is_member(other)
+        children[key] = _join(member, _union(other, node))
+
+    return children
+
+
+def _intersection(left: Fields, right: Fields) -> Dict[str, Any]:
+    children = {}
+
+    for key, node in left.items():
+        other = right.get(key)
+        if key == "." or other is None:
+            continue
+        if other is node:
+            children[key] = node
+            continue
+        member = _is_member(node) and _is_member(other)
+        joined = _join(member, _intersection(node, other))
+        if joined is not None:
+            children[key] = joined
+
+    return children
+
+
+def _difference(left: Fields, right: Fields) -> Dict[str, Any]:
+    children = {}
+
+    for key, node in left.items():
+        other = right.get(key)
+        if key == ".":
+            continue
+        if other is None:
+            children[key] = node
+            continue
+        member = _is_member(node) and not _is_member(other)
+        joined = _join(member, _difference(node, other))
+        if joined is not None:
+            children[key] = joined
+
+    return children
+
+
+def _iter_paths(node: Fields, prefix: Tuple[str, ...]) -> Iterator[Tuple[str, ...]]:
+    for key, child in node.items():
+        if key == ".":
+            continue
+        path = (*prefix, key)
+        if _is_member(child):
+            yield path
+        yield from _iter_paths(child, path)
+
+
+class FieldSet:
+    """
+    Set of field paths, backed by the trie of a ``FieldsV1`` (which is not
+    copied, nor modified).
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Optional[Fields] = None):
+        self.fields: Fields = _EMPTY if fields is None else fields
+
+    def __contains__(self, path: Path) -> bool:
+        node = self.fields
+        elements = to_elements(path)
+
+        for element in elements:
+            node = node.get(element)  # type: ignore[assignment]
+            if node is None:
+                return False
+
+        return bool(elements) and _is_member(node)
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        """
+        Yields the path elements of every field in the set.
+        """
+        return _iter_paths(self.fields, ())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return any(key != "." for key in self.fields)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FieldSet):
+            return NotImplemented
+        return set(self) == set(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.fields!r})"
+
+    def __or__(self, other: "FieldSet") -> "FieldSet":
+        return FieldSet(_union(self.fields, other.fields))
+
+    def __and__(self, other: "FieldSet") -> "FieldSet":
+        return FieldSet(_intersection(self.fields, other.fields))
+
+    def __sub__(self, other: "FieldSet") -> "FieldSet":
+        return FieldSet(_difference(self.fields, other.fields))
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+
+class ManagedFields:
+    """
+    Field sets of the managers of an object, decoded on first use.
+    """
+
+    def __init__(self, entries: List[ManagedFieldsEntry]):
+        self.entries = entries
+        self._sets: Optional[Dict[str, FieldSet]] = None
+
+    @classmethod
+    def from_object(cls, obj: BaseModel) -> "ManagedFields":
+        metadata = getattr(obj, "metadata", None)
+        return cls(getattr(metadata, "managedFields", None) or [])
+
+    def _get_sets(self) -> Dict[str, FieldSet]:
+        if self._sets is not None:
+            return self._sets
+
+        # A manager can have several entries, e.g. for Apply and Update
+        sets: Dict[str, FieldSet] = {}
+        for entry in self.entries:
+            fields = entry.fieldsV1.model_extra if entry.fieldsV1 else None
+            if entry.manager is None or not fields:
+                continue
+            current = sets.get(entry.manager)
+            field_set = FieldSet(fields)
+            sets[entry.manager] = field_set if current is None else current | field_set
+
+        self._sets = sets
+        return sets
+
+    @property
+    def managers(self) -> List[str]:
+        return list(self._get_sets())
+
+    def get(self, manager: str) -> FieldSet:
+        """
+        Returns the fields owned by ``manager``, empty if it owns none.
+        """
+        return self._get_sets().get(manager) or FieldSet()
+
+    def owners(self, path: Path) -> List[str]:
+        """
+        Returns the managers that own the field at ``path``.
+        """
+        elements = to_elements(path)
+        return [
+            manager
+            for manager, field_set in self._get_sets().items()
+            if elements in field_set
+        ]
+
+    def conflicts(self, manager: str) -> Dict[str, FieldSet]:
+        """
+        Returns the fields owned by ``manager`` that other managers own too,
+        by manager.
+        """
+        sets = self._get_sets()
+        owned = sets.get(manager)
+        if owned is None:
+            return {}
+
+        conflicts = {}
+        for other, field_set in sets.items():
+            if other == manager:
+                continue
+            shared = owned & field_set
+            if shared:
+                conflicts[other] = shared
+
+        return conflicts
@@ -0,0 +1,86 @@
+# generated by generator/main.py:
+#   timestamp: 2026-10-19T15:26:05+00:00
+#   k8s version: v1.30.0
+
+"""
+Fields holding bytes, base64-encoded in JSON and YAML, by ``apiVersion`` and
+``kind``.
+
+The values are nested dicts of the fields, as ``exclude`` takes them in
+``model_dump``, with ``"__all__"`` standing for every list item or map value.
+"""
+
+from typing import Any, Dict, Tuple
+
+_WEBHOOK_CLIENT_CONFIG = {"caBundle": True}
+_MUTATING_WEBHOOK = {"clientConfig": _WEBHOOK_CLIENT_CONFIG}
+_MUTATING_WEBHOOK_CONFIGURATION = {"webhooks": {"__all__": _MUTATING_WEBHOOK}}
+_MUTATING_WEBHOOK_CONFIGURATION_LIST = {
+    "items": {"__all__": _MUTATING_WEBHOOK_CONFIGURATION}
+}
+_VALIDATING_WEBHOOK = {"clientConfig": _WEBHOOK_CLIENT_CONFIG}
+_VALIDATING_WEBHOOK_CONFIGURATION = {"webhooks": {"__all__": _VALIDATING_WEBHOOK}}
+_VALIDATING_WEBHOOK_CONFIGURATION_LIST = {
+    "items": {"__all__": _VALIDATING_WEBHOOK_CONFIGURATION}
+}
+_CERTIFICATE_SIGNING_REQUEST_SPEC = {"request": True}
+_CERTIFICATE_SIGNING_REQUEST_STATUS = {"certificate": True}
+_CERTIFICATE_SIGNING_REQUEST = {
+    "spec": _CERTIFICATE_SIGNING_REQUEST_SPEC,
+    "status": _CERTIFICATE_SIGNING_REQUEST_STATUS,
+}
+_CERTIFICATE_SIGNING_REQUEST_LIST = {"items": {"__all__": _CERTIFICATE_SIGNING_REQUEST}}
+_CONFIG_MAP = {"binaryData": {"__all__": True}}
+_CONFIG_MAP_LIST = {"items": {"__all__": _CONFIG_MAP}}
+_SECRET = {"data": {"__all__": True}}
+_SECRET_LIST = {"items": {"__all__": _SECRET}}
+_V1_WEBHOOK_CLIENT_CONFIG = {"caBundle": True}
+_WEBHOOK_CONVERSION = {"clientConfig": _V1_WEBHOOK_CLIENT_CONFIG}
+_CUSTOM_RESOURCE_CONVERSION = {"webhook": _WEBHOOK_CONVERSION}
+_CUSTOM_RESOURCE_DEFINITION_SPEC = {"conversion": _CUSTOM_RESOURCE_CONVERSION}
+_CUSTOM_RESOURCE_DEFINITION = {"spec": _CUSTOM_RESOURCE_DEFINITION_SPEC}
+_CUSTOM_RESOURCE_DEFINITION_LIST = {"items": {"__all__": _CUSTOM_RESOURCE_DEFINITION}}
+_APISERVICE_SPEC = {"caBundle": True}
+_APISERVICE = {"spec": _APISERVICE_SPEC}
+_APISERVICE_LIST = {"items": {"__all__": _APISERVICE}}
+
+BYTE_FIELDS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    (
+        "admissionregistration.k8s.io/v1",
+        "MutatingWebhookConfiguration",
+    ): _MUTATING_WEBHOOK_CONFIGURATION,
+    (
+        "admissionregistration.k8s.io/v1",
+        "MutatingWebhookConfigurationList",
+    ): _MUTATING_WEBHOOK_CONFIGURATION_LIST,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingWebhookConfiguration",
+    ): _VALIDATING_WEBHOOK_CONFIGURATION,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingWebhookConfigurationList",
+    ): _VALIDATING_WEBHOOK_CONFIGURATION_LIST,
+    (
+        "apiextensions.k8s.io/v1",
+        "CustomResourceDefinition",
+    ): _CUSTOM_RESOURCE_DEFINITION,
+    (
+        "apiextensions.k8s.io/v1",
+        "CustomResourceDefinitionList",
+    ): _CUSTOM_RESOURCE_DEFINITION_LIST,
+    ("apiregistration.k8s.io/v1", "APIService"): _APISERVICE,
+    ("apiregistration.k8s.io/v1", "APIServiceList"): _APISERVICE_LIST,
+    (
+        "certificates.k8s.io/v1",
+        "CertificateSigningRequest",
+    ): _CERTIFICATE_SIGNING_REQUEST,
+    (
+        "certificates.k8s.io/v1",
+        "CertificateSigningRequestList",
+    ): _CERTIFICATE_SIGNING_REQUEST_LIST,
+    ("v1", "ConfigMap"): _CONFIG_MAP,
+    ("v1", "ConfigMapList"): _CONFIG_MAP_LIST,
+    ("v1", "Secret"): _SECRET,
+    ("v1", "SecretList"): _SECRET_LIST,
+}
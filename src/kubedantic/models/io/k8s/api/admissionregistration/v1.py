@@ -8,6 +8,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject, ObjectList
+from kubedantic.types import Base64Bytes
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -368,7 +371,7 @@ class Variable(BaseModel):
 
 
 class WebhookClientConfig(BaseModel):
-    caBundle: Optional[str] = Field(
+    caBundle: Optional[Base64Bytes] = Field(
         default=None,
         description=(
             "`caBundle` is a PEM encoded CA bundle which will be used to validate the"
@@ -644,32 +647,9 @@ class MutatingWebhook(BaseModel):
     )
 
 
-class MutatingWebhookConfiguration(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="MutatingWebhookConfiguration",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class MutatingWebhookConfiguration(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "MutatingWebhookConfiguration"
     webhooks: Optional[List[MutatingWebhook]] = Field(
         default=None,
         description=(
@@ -678,35 +658,9 @@ class MutatingWebhookConfiguration(BaseModel):
     )
 
 
-class MutatingWebhookConfigurationList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[MutatingWebhookConfiguration] = Field(
-        ..., description="List of MutatingWebhookConfiguration."
-    )
-    kind: Optional[str] = Field(
-        default="MutatingWebhookConfigurationList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
+class MutatingWebhookConfigurationList(ObjectList[MutatingWebhookConfiguration]):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "MutatingWebhookConfigurationList"
 
 
 class ParamRef(BaseModel):
@@ -1084,32 +1038,9 @@ class ValidatingWebhook(BaseModel):
     )
 
 
-class ValidatingWebhookConfiguration(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingWebhookConfiguration",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class ValidatingWebhookConfiguration(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "ValidatingWebhookConfiguration"
     webhooks: Optional[List[ValidatingWebhook]] = Field(
         default=None,
         description=(
@@ -1118,63 +1049,14 @@ class ValidatingWebhookConfiguration(BaseModel):
     )
 
 
-class ValidatingWebhookConfigurationList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ValidatingWebhookConfiguration] = Field(
-        ..., description="List of ValidatingWebhookConfiguration."
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingWebhookConfigurationList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
+class ValidatingWebhookConfigurationList(ObjectList[ValidatingWebhookConfiguration]):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "ValidatingWebhookConfigurationList"
 
 
-class ValidatingAdmissionPolicy(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingAdmissionPolicy",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class ValidatingAdmissionPolicy(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "ValidatingAdmissionPolicy"
     spec: Optional[ValidatingAdmissionPolicySpec] = Field(
         default=None,
         description=(
@@ -1191,32 +1073,9 @@ class ValidatingAdmissionPolicy(BaseModel):
     )
 
 
-class ValidatingAdmissionPolicyBinding(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingAdmissionPolicyBinding",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class ValidatingAdmissionPolicyBinding(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1"
+    kind: Optional[str] = "ValidatingAdmissionPolicyBinding"
     spec: Optional[ValidatingAdmissionPolicyBindingSpec] = Field(
         default=None,
         description=(
@@ -8,6 +8,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -603,32 +605,9 @@ class ValidatingAdmissionPolicyStatus(BaseModel):
     )
 
 
-class ValidatingAdmissionPolicy(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingAdmissionPolicy",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class ValidatingAdmissionPolicy(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1alpha1"
+    kind: Optional[str] = "ValidatingAdmissionPolicy"
     spec: Optional[ValidatingAdmissionPolicySpec] = Field(
         default=None,
         description=(
@@ -645,32 +624,9 @@ class ValidatingAdmissionPolicy(BaseModel):
     )
 
 
-class ValidatingAdmissionPolicyBinding(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="admissionregistration.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ValidatingAdmissionPolicyBinding",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata; More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata."
-        ),
-    )
+class ValidatingAdmissionPolicyBinding(ClusterScopedObject):
+    apiVersion: Optional[str] = "admissionregistration.k8s.io/v1alpha1"
+    kind: Optional[str] = "ValidatingAdmissionPolicyBinding"
     spec: Optional[ValidatingAdmissionPolicyBindingSpec] = Field(
         default=None,
         description=(
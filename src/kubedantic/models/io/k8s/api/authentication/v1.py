@@ -9,7 +9,7 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, NamespacedObject
 
 
 class BoundObjectReference(BaseModel):
@@ -141,32 +141,9 @@ class TokenReviewStatus(BaseModel):
     )
 
 
-class TokenRequest(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authentication.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="TokenRequest",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class TokenRequest(NamespacedObject):
+    apiVersion: Optional[str] = "authentication.k8s.io/v1"
+    kind: Optional[str] = "TokenRequest"
     spec: TokenRequestSpec = Field(
         ..., description="Spec holds information about the request being evaluated"
     )
@@ -179,64 +156,18 @@ class TokenRequest(BaseModel):
     )
 
 
-class SelfSubjectReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authentication.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="SelfSubjectReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class SelfSubjectReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authentication.k8s.io/v1"
+    kind: Optional[str] = "SelfSubjectReview"
     status: Optional[SelfSubjectReviewStatus] = Field(
         default=None,
         description="Status is filled in by the server with the user attributes.",
     )
 
 
-class TokenReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authentication.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="TokenReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class TokenReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authentication.k8s.io/v1"
+    kind: Optional[str] = "TokenReview"
     spec: TokenReviewSpec = Field(
         ..., description="Spec holds information about the request being evaluated"
     )
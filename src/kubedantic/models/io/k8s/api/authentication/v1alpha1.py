@@ -8,7 +8,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1 as v1_1
+from kubedantic.base import ClusterScopedObject
+
 from . import v1
 
 
@@ -18,32 +19,9 @@ class SelfSubjectReviewStatus(BaseModel):
     )
 
 
-class SelfSubjectReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authentication.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="SelfSubjectReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1_1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class SelfSubjectReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authentication.k8s.io/v1alpha1"
+    kind: Optional[str] = "SelfSubjectReview"
     status: Optional[SelfSubjectReviewStatus] = Field(
         default=None,
         description="Status is filled in by the server with the user attributes.",
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, NamespacedObject
 
 
 class NonResourceAttributes(BaseModel):
@@ -249,32 +249,9 @@ class SubjectRulesReviewStatus(BaseModel):
     )
 
 
-class LocalSubjectAccessReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="LocalSubjectAccessReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class LocalSubjectAccessReview(NamespacedObject):
+    apiVersion: Optional[str] = "authorization.k8s.io/v1"
+    kind: Optional[str] = "LocalSubjectAccessReview"
     spec: SubjectAccessReviewSpec = Field(
         ...,
         description=(
@@ -292,32 +269,9 @@ class LocalSubjectAccessReview(BaseModel):
     )
 
 
-class SelfSubjectAccessReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="SelfSubjectAccessReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class SelfSubjectAccessReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authorization.k8s.io/v1"
+    kind: Optional[str] = "SelfSubjectAccessReview"
     spec: SelfSubjectAccessReviewSpec = Field(
         ...,
         description=(
@@ -334,32 +288,9 @@ class SelfSubjectAccessReview(BaseModel):
     )
 
 
-class SelfSubjectRulesReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="SelfSubjectRulesReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class SelfSubjectRulesReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authorization.k8s.io/v1"
+    kind: Optional[str] = "SelfSubjectRulesReview"
     spec: SelfSubjectRulesReviewSpec = Field(
         ..., description="Spec holds information about the request being evaluated."
     )
@@ -372,32 +303,9 @@ class SelfSubjectRulesReview(BaseModel):
     )
 
 
-class SubjectAccessReview(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="SubjectAccessReview",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class SubjectAccessReview(ClusterScopedObject):
+    apiVersion: Optional[str] = "authorization.k8s.io/v1"
+    kind: Optional[str] = "SubjectAccessReview"
     spec: SubjectAccessReviewSpec = Field(
         ..., description="Spec holds information about the request being evaluated"
     )
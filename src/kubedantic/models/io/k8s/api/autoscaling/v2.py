@@ -9,12 +9,14 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
 class CrossVersionObjectReference(BaseModel):
     apiVersion: Optional[str] = Field(
-        default=None, description="apiVersion is the API version of the referent"
+        default="v1", description="apiVersion is the API version of the referent"
     )
     kind: str = Field(
         ...,
@@ -509,32 +511,9 @@ class HorizontalPodAutoscalerStatus(BaseModel):
     )
 
 
-class HorizontalPodAutoscaler(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="autoscaling/v2",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="HorizontalPodAutoscaler",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "metadata is the standard object metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class HorizontalPodAutoscaler(NamespacedObject):
+    apiVersion: Optional[str] = "autoscaling/v2"
+    kind: Optional[str] = "HorizontalPodAutoscaler"
     spec: Optional[HorizontalPodAutoscalerSpec] = Field(
         default=None,
         description=(
@@ -548,28 +527,6 @@ class HorizontalPodAutoscaler(BaseModel):
     )
 
 
-class HorizontalPodAutoscalerList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="autoscaling/v2",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[HorizontalPodAutoscaler] = Field(
-        ..., description="items is the list of horizontal pod autoscaler objects."
-    )
-    kind: Optional[str] = Field(
-        default="HorizontalPodAutoscalerList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="metadata is the standard list metadata."
-    )
+class HorizontalPodAutoscalerList(ObjectList[HorizontalPodAutoscaler]):
+    apiVersion: Optional[str] = "autoscaling/v2"
+    kind: Optional[str] = "HorizontalPodAutoscalerList"
@@ -9,7 +9,8 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
+from kubedantic.types import Base64Bytes
 
 
 class CertificateSigningRequestCondition(BaseModel):
@@ -97,7 +98,7 @@ class CertificateSigningRequestSpec(BaseModel):
             " immutable."
         ),
     )
-    request: str = Field(
+    request: Base64Bytes = Field(
         ...,
         description=(
             "request contains an x509 certificate signing request encoded in a"
@@ -174,7 +175,7 @@ class CertificateSigningRequestSpec(BaseModel):
 
 
 class CertificateSigningRequestStatus(BaseModel):
-    certificate: Optional[str] = Field(
+    certificate: Optional[Base64Bytes] = Field(
         default=None,
         description=(
             "certificate is populated with an issued certificate by the signer after an"
@@ -208,26 +209,9 @@ class CertificateSigningRequestStatus(BaseModel):
     )
 
 
-class CertificateSigningRequest(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="certificates.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="CertificateSigningRequest",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = None
+class CertificateSigningRequest(ClusterScopedObject):
+    apiVersion: Optional[str] = "certificates.k8s.io/v1"
+    kind: Optional[str] = "CertificateSigningRequest"
     spec: CertificateSigningRequestSpec = Field(
         ...,
         description=(
@@ -247,26 +231,6 @@ class CertificateSigningRequest(BaseModel):
     )
 
 
-class CertificateSigningRequestList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="certificates.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CertificateSigningRequest] = Field(
-        ..., description="items is a collection of CertificateSigningRequest objects"
-    )
-    kind: Optional[str] = Field(
-        default="CertificateSigningRequestList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = None
+class CertificateSigningRequestList(ObjectList[CertificateSigningRequest]):
+    apiVersion: Optional[str] = "certificates.k8s.io/v1"
+    kind: Optional[str] = "CertificateSigningRequestList"
@@ -4,11 +4,11 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
 
 
 class ClusterTrustBundleSpec(BaseModel):
@@ -45,55 +45,14 @@ class ClusterTrustBundleSpec(BaseModel):
     )
 
 
-class ClusterTrustBundle(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="certificates.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ClusterTrustBundle",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="metadata contains the object metadata."
-    )
+class ClusterTrustBundle(ClusterScopedObject):
+    apiVersion: Optional[str] = "certificates.k8s.io/v1alpha1"
+    kind: Optional[str] = "ClusterTrustBundle"
     spec: ClusterTrustBundleSpec = Field(
         ..., description="spec contains the signer (if any) and trust anchors."
     )
 
 
-class ClusterTrustBundleList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="certificates.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ClusterTrustBundle] = Field(
-        ..., description="items is a collection of ClusterTrustBundle objects"
-    )
-    kind: Optional[str] = Field(
-        default="ClusterTrustBundleList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="metadata contains the list metadata."
-    )
+class ClusterTrustBundleList(ObjectList[ClusterTrustBundle]):
+    apiVersion: Optional[str] = "certificates.k8s.io/v1alpha1"
+    kind: Optional[str] = "ClusterTrustBundleList"
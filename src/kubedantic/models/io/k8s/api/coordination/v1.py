@@ -5,11 +5,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import NamespacedObject, ObjectList
 
 
 class LeaseSpec(BaseModel):
@@ -46,32 +46,9 @@ class LeaseSpec(BaseModel):
     )
 
 
-class Lease(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="coordination.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Lease",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class Lease(NamespacedObject):
+    apiVersion: Optional[str] = "coordination.k8s.io/v1"
+    kind: Optional[str] = "Lease"
     spec: Optional[LeaseSpec] = Field(
         default=None,
         description=(
@@ -81,30 +58,6 @@ class Lease(BaseModel):
     )
 
 
-class LeaseList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="coordination.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Lease] = Field(..., description="items is a list of schema objects.")
-    kind: Optional[str] = Field(
-        default="LeaseList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class LeaseList(ObjectList[Lease]):
+    apiVersion: Optional[str] = "coordination.k8s.io/v1"
+    kind: Optional[str] = "LeaseList"
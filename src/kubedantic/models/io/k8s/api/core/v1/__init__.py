@@ -0,0 +1,668 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .affinity import (
+        Affinity,
+        NodeAffinity,
+        PodAffinity,
+        PodAffinityTerm,
+        PodAntiAffinity,
+        PreferredSchedulingTerm,
+        WeightedPodAffinityTerm,
+    )
+    from .app_armor_profile import (
+        AppArmorProfile,
+        SeccompProfile,
+        SELinuxOptions,
+        WindowsSecurityContextOptions,
+    )
+    from .binding import Binding
+    from .component_status import (
+        ComponentCondition,
+        ComponentStatus,
+        ComponentStatusList,
+    )
+    from .config_map import ConfigMap, ConfigMapList
+    from .container import (
+        Capabilities,
+        ConfigMapEnvSource,
+        ConfigMapKeySelector,
+        Container,
+        ContainerPort,
+        ContainerResizePolicy,
+        EnvFromSource,
+        EnvVar,
+        EnvVarSource,
+        EphemeralContainer,
+        ExecAction,
+        GRPCAction,
+        HTTPGetAction,
+        HTTPHeader,
+        Lifecycle,
+        LifecycleHandler,
+        Probe,
+        ResourceClaim,
+        ResourceRequirements,
+        SecretEnvSource,
+        SecretKeySelector,
+        SecurityContext,
+        SleepAction,
+        TCPSocketAction,
+        VolumeDevice,
+        VolumeMount,
+    )
+    from .endpoints import (
+        EndpointAddress,
+        EndpointPort,
+        Endpoints,
+        EndpointsList,
+        EndpointSubset,
+    )
+    from .event import Event, EventList, EventSeries, EventSource
+    from .field_selector import ObjectFieldSelector, ResourceFieldSelector
+    from .limit_range import LimitRange, LimitRangeItem, LimitRangeList, LimitRangeSpec
+    from .local_object_reference import LocalObjectReference
+    from .namespace import (
+        Namespace,
+        NamespaceCondition,
+        NamespaceList,
+        NamespaceSpec,
+        NamespaceStatus,
+    )
+    from .node import (
+        AttachedVolume,
+        ConfigMapNodeConfigSource,
+        ContainerImage,
+        DaemonEndpoint,
+        Node,
+        NodeAddress,
+        NodeCondition,
+        NodeConfigSource,
+        NodeConfigStatus,
+        NodeDaemonEndpoints,
+        NodeList,
+        NodeRuntimeHandler,
+        NodeRuntimeHandlerFeatures,
+        NodeSpec,
+        NodeStatus,
+        NodeSystemInfo,
+        Taint,
+    )
+    from .object_reference import ObjectReference
+    from .persistent_volume import (
+        AzureFilePersistentVolumeSource,
+        CephFSPersistentVolumeSource,
+        CinderPersistentVolumeSource,
+        CSIPersistentVolumeSource,
+        FlexPersistentVolumeSource,
+        GlusterfsPersistentVolumeSource,
+        ISCSIPersistentVolumeSource,
+        LocalVolumeSource,
+        PersistentVolume,
+        PersistentVolumeList,
+        PersistentVolumeSpec,
+        PersistentVolumeStatus,
+        RBDPersistentVolumeSource,
+        ScaleIOPersistentVolumeSource,
+        SecretReference,
+        StorageOSPersistentVolumeSource,
+        VolumeNodeAffinity,
+    )
+    from .persistent_volume_claim import (
+        ModifyVolumeStatus,
+        PersistentVolumeClaim,
+        PersistentVolumeClaimCondition,
+        PersistentVolumeClaimList,
+        PersistentVolumeClaimStatus,
+    )
+    from .persistent_volume_claim_spec import (
+        PersistentVolumeClaimSpec,
+        TypedLocalObjectReference,
+        TypedObjectReference,
+        VolumeResourceRequirements,
+    )
+    from .pod import (
+        ContainerState,
+        ContainerStateRunning,
+        ContainerStateTerminated,
+        ContainerStateWaiting,
+        ContainerStatus,
+        HostIP,
+        Pod,
+        PodCondition,
+        PodIP,
+        PodList,
+        PodResourceClaimStatus,
+        PodStatus,
+        VolumeMountStatus,
+    )
+    from .pod_dns_config import PodDNSConfig, PodDNSConfigOption
+    from .pod_resource_claim import ClaimSource, PodResourceClaim
+    from .pod_security_context import PodSecurityContext, Sysctl
+    from .pod_spec import (
+        HostAlias,
+        PodOS,
+        PodReadinessGate,
+        PodSchedulingGate,
+        PodSpec,
+        Toleration,
+        TopologySpreadConstraint,
+    )
+    from .pod_template import PodTemplate, PodTemplateList
+    from .pod_template_spec import PodTemplateSpec
+    from .replication_controller import (
+        ReplicationController,
+        ReplicationControllerCondition,
+        ReplicationControllerList,
+        ReplicationControllerSpec,
+        ReplicationControllerStatus,
+    )
+    from .resource_quota import (
+        ResourceQuota,
+        ResourceQuotaList,
+        ResourceQuotaSpec,
+        ResourceQuotaStatus,
+        ScopedResourceSelectorRequirement,
+        ScopeSelector,
+    )
+    from .secret import Secret, SecretList
+    from .service import (
+        ClientIPConfig,
+        LoadBalancerIngress,
+        LoadBalancerStatus,
+        PortStatus,
+        Service,
+        ServiceList,
+        ServicePort,
+        ServiceSpec,
+        ServiceStatus,
+        SessionAffinityConfig,
+    )
+    from .service_account import ServiceAccount, ServiceAccountList
+    from .topology_selector_term import (
+        TopologySelectorLabelRequirement,
+        TopologySelectorTerm,
+    )
+    from .volume import (
+        AzureFileVolumeSource,
+        CephFSVolumeSource,
+        CinderVolumeSource,
+        ClusterTrustBundleProjection,
+        ConfigMapProjection,
+        ConfigMapVolumeSource,
+        CSIVolumeSource,
+        DownwardAPIProjection,
+        DownwardAPIVolumeFile,
+        DownwardAPIVolumeSource,
+        EmptyDirVolumeSource,
+        EphemeralVolumeSource,
+        FlexVolumeSource,
+        GitRepoVolumeSource,
+        GlusterfsVolumeSource,
+        ISCSIVolumeSource,
+        KeyToPath,
+        PersistentVolumeClaimTemplate,
+        PersistentVolumeClaimVolumeSource,
+        ProjectedVolumeSource,
+        RBDVolumeSource,
+        ScaleIOVolumeSource,
+        SecretProjection,
+        SecretVolumeSource,
+        ServiceAccountTokenProjection,
+        StorageOSVolumeSource,
+        Volume,
+        VolumeProjection,
+    )
+    from .volume_source import (
+        AWSElasticBlockStoreVolumeSource,
+        AzureDiskVolumeSource,
+        FCVolumeSource,
+        FlockerVolumeSource,
+        GCEPersistentDiskVolumeSource,
+        HostPathVolumeSource,
+        NFSVolumeSource,
+        NodeSelector,
+        NodeSelectorRequirement,
+        NodeSelectorTerm,
+        PhotonPersistentDiskVolumeSource,
+        PortworxVolumeSource,
+        QuobyteVolumeSource,
+        VsphereVirtualDiskVolumeSource,
+    )
+
+_MODULES = {
+    "AWSElasticBlockStoreVolumeSource": "volume_source",
+    "Affinity": "affinity",
+    "AppArmorProfile": "app_armor_profile",
+    "AttachedVolume": "node",
+    "AzureDiskVolumeSource": "volume_source",
+    "AzureFilePersistentVolumeSource": "persistent_volume",
+    "AzureFileVolumeSource": "volume",
+    "Binding": "binding",
+    "CSIPersistentVolumeSource": "persistent_volume",
+    "CSIVolumeSource": "volume",
+    "Capabilities": "container",
+    "CephFSPersistentVolumeSource": "persistent_volume",
+    "CephFSVolumeSource": "volume",
+    "CinderPersistentVolumeSource": "persistent_volume",
+    "CinderVolumeSource": "volume",
+    "ClaimSource": "pod_resource_claim",
+    "ClientIPConfig": "service",
+    "ClusterTrustBundleProjection": "volume",
+    "ComponentCondition": "component_status",
+    "ComponentStatus": "component_status",
+    "ComponentStatusList": "component_status",
+    "ConfigMap": "config_map",
+    "ConfigMapEnvSource": "container",
+    "ConfigMapKeySelector": "container",
+    "ConfigMapList": "config_map",
+    "ConfigMapNodeConfigSource": "node",
+    "ConfigMapProjection": "volume",
+    "ConfigMapVolumeSource": "volume",
+    "Container": "container",
+    "ContainerImage": "node",
+    "ContainerPort": "container",
+    "ContainerResizePolicy": "container",
+    "ContainerState": "pod",
+    "ContainerStateRunning": "pod",
+    "ContainerStateTerminated": "pod",
+    "ContainerStateWaiting": "pod",
+    "ContainerStatus": "pod",
+    "DaemonEndpoint": "node",
+    "DownwardAPIProjection": "volume",
+    "DownwardAPIVolumeFile": "volume",
+    "DownwardAPIVolumeSource": "volume",
+    "EmptyDirVolumeSource": "volume",
+    "EndpointAddress": "endpoints",
+    "EndpointPort": "endpoints",
+    "EndpointSubset": "endpoints",
+    "Endpoints": "endpoints",
+    "EndpointsList": "endpoints",
+    "EnvFromSource": "container",
+    "EnvVar": "container",
+    "EnvVarSource": "container",
+    "EphemeralContainer": "container",
+    "EphemeralVolumeSource": "volume",
+    "Event": "event",
+    "EventList": "event",
+    "EventSeries": "event",
+    "EventSource": "event",
+    "ExecAction": "container",
+    "FCVolumeSource": "volume_source",
+    "FlexPersistentVolumeSource": "persistent_volume",
+    "FlexVolumeSource": "volume",
+    "FlockerVolumeSource": "volume_source",
+    "GCEPersistentDiskVolumeSource": "volume_source",
+    "GRPCAction": "container",
+    "GitRepoVolumeSource": "volume",
+    "GlusterfsPersistentVolumeSource": "persistent_volume",
+    "GlusterfsVolumeSource": "volume",
+    "HTTPGetAction": "container",
+    "HTTPHeader": "container",
+    "HostAlias": "pod_spec",
+    "HostIP": "pod",
+    "HostPathVolumeSource": "volume_source",
+    "ISCSIPersistentVolumeSource": "persistent_volume",
+    "ISCSIVolumeSource": "volume",
+    "KeyToPath": "volume",
+    "Lifecycle": "container",
+    "LifecycleHandler": "container",
+    "LimitRange": "limit_range",
+    "LimitRangeItem": "limit_range",
+    "LimitRangeList": "limit_range",
+    "LimitRangeSpec": "limit_range",
+    "LoadBalancerIngress": "service",
+    "LoadBalancerStatus": "service",
+    "LocalObjectReference": "local_object_reference",
+    "LocalVolumeSource": "persistent_volume",
+    "ModifyVolumeStatus": "persistent_volume_claim",
+    "NFSVolumeSource": "volume_source",
+    "Namespace": "namespace",
+    "NamespaceCondition": "namespace",
+    "NamespaceList": "namespace",
+    "NamespaceSpec": "namespace",
+    "NamespaceStatus": "namespace",
+    "Node": "node",
+    "NodeAddress": "node",
+    "NodeAffinity": "affinity",
+    "NodeCondition": "node",
+    "NodeConfigSource": "node",
+    "NodeConfigStatus": "node",
+    "NodeDaemonEndpoints": "node",
+    "NodeList": "node",
+    "NodeRuntimeHandler": "node",
+    "NodeRuntimeHandlerFeatures": "node",
+    "NodeSelector": "volume_source",
+    "NodeSelectorRequirement": "volume_source",
+    "NodeSelectorTerm": "volume_source",
+    "NodeSpec": "node",
+    "NodeStatus": "node",
+    "NodeSystemInfo": "node",
+    "ObjectFieldSelector": "field_selector",
+    "ObjectReference": "object_reference",
+    "PersistentVolume": "persistent_volume",
+    "PersistentVolumeClaim": "persistent_volume_claim",
+    "PersistentVolumeClaimCondition": "persistent_volume_claim",
+    "PersistentVolumeClaimList": "persistent_volume_claim",
+    "PersistentVolumeClaimSpec": "persistent_volume_claim_spec",
+    "PersistentVolumeClaimStatus": "persistent_volume_claim",
+    "PersistentVolumeClaimTemplate": "volume",
+    "PersistentVolumeClaimVolumeSource": "volume",
+    "PersistentVolumeList": "persistent_volume",
+    "PersistentVolumeSpec": "persistent_volume",
+    "PersistentVolumeStatus": "persistent_volume",
+    "PhotonPersistentDiskVolumeSource": "volume_source",
+    "Pod": "pod",
+    "PodAffinity": "affinity",
+    "PodAffinityTerm": "affinity",
+    "PodAntiAffinity": "affinity",
+    "PodCondition": "pod",
+    "PodDNSConfig": "pod_dns_config",
+    "PodDNSConfigOption": "pod_dns_config",
+    "PodIP": "pod",
+    "PodList": "pod",
+    "PodOS": "pod_spec",
+    "PodReadinessGate": "pod_spec",
+    "PodResourceClaim": "pod_resource_claim",
+    "PodResourceClaimStatus": "pod",
+    "PodSchedulingGate": "pod_spec",
+    "PodSecurityContext": "pod_security_context",
+    "PodSpec": "pod_spec",
+    "PodStatus": "pod",
+    "PodTemplate": "pod_template",
+    "PodTemplateList": "pod_template",
+    "PodTemplateSpec": "pod_template_spec",
+    "PortStatus": "service",
+    "PortworxVolumeSource": "volume_source",
+    "PreferredSchedulingTerm": "affinity",
+    "Probe": "container",
+    "ProjectedVolumeSource": "volume",
+    "QuobyteVolumeSource": "volume_source",
+    "RBDPersistentVolumeSource": "persistent_volume",
+    "RBDVolumeSource": "volume",
+    "ReplicationController": "replication_controller",
+    "ReplicationControllerCondition": "replication_controller",
+    "ReplicationControllerList": "replication_controller",
+    "ReplicationControllerSpec": "replication_controller",
+    "ReplicationControllerStatus": "replication_controller",
+    "ResourceClaim": "container",
+    "ResourceFieldSelector": "field_selector",
+    "ResourceQuota": "resource_quota",
+    "ResourceQuotaList": "resource_quota",
+    "ResourceQuotaSpec": "resource_quota",
+    "ResourceQuotaStatus": "resource_quota",
+    "ResourceRequirements": "container",
+    "SELinuxOptions": "app_armor_profile",
+    "ScaleIOPersistentVolumeSource": "persistent_volume",
+    "ScaleIOVolumeSource": "volume",
+    "ScopeSelector": "resource_quota",
+    "ScopedResourceSelectorRequirement": "resource_quota",
+    "SeccompProfile": "app_armor_profile",
+    "Secret": "secret",
+    "SecretEnvSource": "container",
+    "SecretKeySelector": "container",
+    "SecretList": "secret",
+    "SecretProjection": "volume",
+    "SecretReference": "persistent_volume",
+    "SecretVolumeSource": "volume",
+    "SecurityContext": "container",
+    "Service": "service",
+    "ServiceAccount": "service_account",
+    "ServiceAccountList": "service_account",
+    "ServiceAccountTokenProjection": "volume",
+    "ServiceList": "service",
+    "ServicePort": "service",
+    "ServiceSpec": "service",
+    "ServiceStatus": "service",
+    "SessionAffinityConfig": "service",
+    "SleepAction": "container",
+    "StorageOSPersistentVolumeSource": "persistent_volume",
+    "StorageOSVolumeSource": "volume",
+    "Sysctl": "pod_security_context",
+    "TCPSocketAction": "container",
+    "Taint": "node",
+    "Toleration": "pod_spec",
+    "TopologySelectorLabelRequirement": "topology_selector_term",
+    "TopologySelectorTerm": "topology_selector_term",
+    "TopologySpreadConstraint": "pod_spec",
+    "TypedLocalObjectReference": "persistent_volume_claim_spec",
+    "TypedObjectReference": "persistent_volume_claim_spec",
+    "Volume": "volume",
+    "VolumeDevice": "container",
+    "VolumeMount": "container",
+    "VolumeMountStatus": "pod",
+    "VolumeNodeAffinity": "persistent_volume",
+    "VolumeProjection": "volume",
+    "VolumeResourceRequirements": "persistent_volume_claim_spec",
+    "VsphereVirtualDiskVolumeSource": "volume_source",
+    "WeightedPodAffinityTerm": "affinity",
+    "WindowsSecurityContextOptions": "app_armor_profile",
+}
+
+__all__ = [
+    "AWSElasticBlockStoreVolumeSource",
+    "Affinity",
+    "AppArmorProfile",
+    "AttachedVolume",
+    "AzureDiskVolumeSource",
+    "AzureFilePersistentVolumeSource",
+    "AzureFileVolumeSource",
+    "Binding",
+    "CSIPersistentVolumeSource",
+    "CSIVolumeSource",
+    "Capabilities",
+    "CephFSPersistentVolumeSource",
+    "CephFSVolumeSource",
+    "CinderPersistentVolumeSource",
+    "CinderVolumeSource",
+    "ClaimSource",
+    "ClientIPConfig",
+    "ClusterTrustBundleProjection",
+    "ComponentCondition",
+    "ComponentStatus",
+    "ComponentStatusList",
+    "ConfigMap",
+    "ConfigMapEnvSource",
+    "ConfigMapKeySelector",
+    "ConfigMapList",
+    "ConfigMapNodeConfigSource",
+    "ConfigMapProjection",
+    "ConfigMapVolumeSource",
+    "Container",
+    "ContainerImage",
+    "ContainerPort",
+    "ContainerResizePolicy",
+    "ContainerState",
+    "ContainerStateRunning",
+    "ContainerStateTerminated",
+    "ContainerStateWaiting",
+    "ContainerStatus",
+    "DaemonEndpoint",
+    "DownwardAPIProjection",
+    "DownwardAPIVolumeFile",
+    "DownwardAPIVolumeSource",
+    "EmptyDirVolumeSource",
+    "EndpointAddress",
+    "EndpointPort",
+    "EndpointSubset",
+    "Endpoints",
+    "EndpointsList",
+    "EnvFromSource",
+    "EnvVar",
+    "EnvVarSource",
+    "EphemeralContainer",
+    "EphemeralVolumeSource",
+    "Event",
+    "EventList",
+    "EventSeries",
+    "EventSource",
+    "ExecAction",
+    "FCVolumeSource",
+    "FlexPersistentVolumeSource",
+    "FlexVolumeSource",
+    "FlockerVolumeSource",
+    "GCEPersistentDiskVolumeSource",
+    "GRPCAction",
+    "GitRepoVolumeSource",
+    "GlusterfsPersistentVolumeSource",
+    "GlusterfsVolumeSource",
+    "HTTPGetAction",
+    "HTTPHeader",
+    "HostAlias",
+    "HostIP",
+    "HostPathVolumeSource",
+    "ISCSIPersistentVolumeSource",
+    "ISCSIVolumeSource",
+    "KeyToPath",
+    "Lifecycle",
+    "LifecycleHandler",
+    "LimitRange",
+    "LimitRangeItem",
+    "LimitRangeList",
+    "LimitRangeSpec",
+    "LoadBalancerIngress",
+    "LoadBalancerStatus",
+    "LocalObjectReference",
+    "LocalVolumeSource",
+    "ModifyVolumeStatus",
+    "NFSVolumeSource",
+    "Namespace",
+    "NamespaceCondition",
+    "NamespaceList",
+    "NamespaceSpec",
+    "NamespaceStatus",
+    "Node",
+    "NodeAddress",
+    "NodeAffinity",
+    "NodeCondition",
+    "NodeConfigSource",
+    "NodeConfigStatus",
+    "NodeDaemonEndpoints",
+    "NodeList",
+    "NodeRuntimeHandler",
+    "NodeRuntimeHandlerFeatures",
+    "NodeSelector",
+    "NodeSelectorRequirement",
+    "NodeSelectorTerm",
+    "NodeSpec",
+    "NodeStatus",
+    "NodeSystemInfo",
+    "ObjectFieldSelector",
+    "ObjectReference",
+    "PersistentVolume",
+    "PersistentVolumeClaim",
+    "PersistentVolumeClaimCondition",
+    "PersistentVolumeClaimList",
+    "PersistentVolumeClaimSpec",
+    "PersistentVolumeClaimStatus",
+    "PersistentVolumeClaimTemplate",
+    "PersistentVolumeClaimVolumeSource",
+    "PersistentVolumeList",
+    "PersistentVolumeSpec",
+    "PersistentVolumeStatus",
+    "PhotonPersistentDiskVolumeSource",
+    "Pod",
+    "PodAffinity",
+    "PodAffinityTerm",
+    "PodAntiAffinity",
+    "PodCondition",
+    "PodDNSConfig",
+    "PodDNSConfigOption",
+    "PodIP",
+    "PodList",
+    "PodOS",
+    "PodReadinessGate",
+    "PodResourceClaim",
+    "PodResourceClaimStatus",
+    "PodSchedulingGate",
+    "PodSecurityContext",
+    "PodSpec",
+    "PodStatus",
+    "PodTemplate",
+    "PodTemplateList",
+    "PodTemplateSpec",
+    "PortStatus",
+    "PortworxVolumeSource",
+    "PreferredSchedulingTerm",
+    "Probe",
+    "ProjectedVolumeSource",
+    "QuobyteVolumeSource",
+    "RBDPersistentVolumeSource",
+    "RBDVolumeSource",
+    "ReplicationController",
+    "ReplicationControllerCondition",
+    "ReplicationControllerList",
+    "ReplicationControllerSpec",
+    "ReplicationControllerStatus",
+    "ResourceClaim",
+    "ResourceFieldSelector",
+    "ResourceQuota",
+    "ResourceQuotaList",
+    "ResourceQuotaSpec",
+    "ResourceQuotaStatus",
+    "ResourceRequirements",
+    "SELinuxOptions",
+    "ScaleIOPersistentVolumeSource",
+    "ScaleIOVolumeSource",
+    "ScopeSelector",
+    "ScopedResourceSelectorRequirement",
+    "SeccompProfile",
+    "Secret",
+    "SecretEnvSource",
+    "SecretKeySelector",
+    "SecretList",
+    "SecretProjection",
+    "SecretReference",
+    "SecretVolumeSource",
+    "SecurityContext",
+    "Service",
+    "ServiceAccount",
+    "ServiceAccountList",
+    "ServiceAccountTokenProjection",
+    "ServiceList",
+    "ServicePort",
+    "ServiceSpec",
+    "ServiceStatus",
+    "SessionAffinityConfig",
+    "SleepAction",
+    "StorageOSPersistentVolumeSource",
+    "StorageOSVolumeSource",
+    "Sysctl",
+    "TCPSocketAction",
+    "Taint",
+    "Toleration",
+    "TopologySelectorLabelRequirement",
+    "TopologySelectorTerm",
+    "TopologySpreadConstraint",
+    "TypedLocalObjectReference",
+    "TypedObjectReference",
+    "Volume",
+    "VolumeDevice",
+    "VolumeMount",
+    "VolumeMountStatus",
+    "VolumeNodeAffinity",
+    "VolumeProjection",
+    "VolumeResourceRequirements",
+    "VsphereVirtualDiskVolumeSource",
+    "WeightedPodAffinityTerm",
+    "WindowsSecurityContextOptions",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message) from None
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
@@ -0,0 +1,230 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from ....apimachinery.pkg.apis.meta import v1
+from .volume_source import NodeSelector, NodeSelectorTerm
+
+
+class PreferredSchedulingTerm(BaseModel):
+    preference: NodeSelectorTerm = Field(
+        ...,
+        description="A node selector term, associated with the corresponding weight.",
+    )
+    weight: int = Field(
+        ...,
+        description=(
+            "Weight associated with matching the corresponding nodeSelectorTerm, in the"
+            " range 1-100."
+        ),
+    )
+
+
+class NodeAffinity(BaseModel):
+    preferredDuringSchedulingIgnoredDuringExecution: Optional[
+        List[PreferredSchedulingTerm]
+    ] = Field(
+        default=None,
+        description=(
+            "The scheduler will prefer to schedule pods to nodes that satisfy the"
+            " affinity expressions specified by this field, but it may choose a node"
+            " that violates one or more of the expressions. The node that is most"
+            " preferred is the one with the greatest sum of weights, i.e. for each node"
+            " that meets all of the scheduling requirements (resource request,"
+            " requiredDuringScheduling affinity expressions, etc.), compute a sum by"
+            ' iterating through the elements of this field and adding "weight" to the'
+            " sum if the node matches the corresponding matchExpressions; the node(s)"
+            " with the highest sum are the most preferred."
+        ),
+    )
+    requiredDuringSchedulingIgnoredDuringExecution: Optional[NodeSelector] = Field(
+        default=None,
+        description=(
+            "If the affinity requirements specified by this field are not met at"
+            " scheduling time, the pod will not be scheduled onto the node. If the"
+            " affinity requirements specified by this field cease to be met at some"
+            " point during pod execution (e.g. due to an update), the system may or may"
+            " not try to eventually evict the pod from its node."
+        ),
+    )
+
+
+class PodAffinityTerm(BaseModel):
+    labelSelector: Optional[v1.LabelSelector] = Field(
+        default=None,
+        description=(
+            "A label query over a set of resources, in this case pods. If it's null,"
+            " this PodAffinityTerm matches with no Pods."
+        ),
+    )
+    matchLabelKeys: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "MatchLabelKeys is a set of pod label keys to select which pods will be"
+            " taken into consideration. The keys are used to lookup values from the"
+            " incoming pod labels, those key-value labels are merged with"
+            " `labelSelector` as `key in (value)` to select the group of existing pods"
+            " which pods will be taken into consideration for the incoming pod's pod"
+            " (anti) affinity. Keys that don't exist in the incoming pod labels will be"
+            " ignored. The default value is empty. The same key is forbidden to exist"
+            " in both matchLabelKeys and labelSelector. Also, matchLabelKeys cannot be"
+            " set when labelSelector isn't set. This is an alpha field and requires"
+            " enabling MatchLabelKeysInPodAffinity feature gate."
+        ),
+    )
+    mismatchLabelKeys: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "MismatchLabelKeys is a set of pod label keys to select which pods will be"
+            " taken into consideration. The keys are used to lookup values from the"
+            " incoming pod labels, those key-value labels are merged with"
+            " `labelSelector` as `key notin (value)` to select the group of existing"
+            " pods which pods will be taken into consideration for the incoming pod's"
+            " pod (anti) affinity. Keys that don't exist in the incoming pod labels"
+            " will be ignored. The default value is empty. The same key is forbidden to"
+            " exist in both mismatchLabelKeys and labelSelector. Also,"
+            " mismatchLabelKeys cannot be set when labelSelector isn't set. This is an"
+            " alpha field and requires enabling MatchLabelKeysInPodAffinity feature"
+            " gate."
+        ),
+    )
+    namespaceSelector: Optional[v1.LabelSelector] = Field(
+        default=None,
+        description=(
+            "A label query over the set of namespaces that the term applies to. The"
+            " term is applied to the union of the namespaces selected by this field and"
+            " the ones listed in the namespaces field. null selector and null or empty"
+            ' namespaces list means "this pod\'s namespace". An empty selector ({})'
+            " matches all namespaces."
+        ),
+    )
+    namespaces: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "namespaces specifies a static list of namespace names that the term"
+            " applies to. The term is applied to the union of the namespaces listed in"
+            " this field and the ones selected by namespaceSelector. null or empty"
+            ' namespaces list and null namespaceSelector means "this pod\'s namespace".'
+        ),
+    )
+    topologyKey: str = Field(
+        ...,
+        description=(
+            "This pod should be co-located (affinity) or not co-located (anti-affinity)"
+            " with the pods matching the labelSelector in the specified namespaces,"
+            " where co-located is defined as running on a node whose value of the label"
+            " with key topologyKey matches that of any node on which any of the"
+            " selected pods is running. Empty topologyKey is not allowed."
+        ),
+    )
+
+
+class WeightedPodAffinityTerm(BaseModel):
+    podAffinityTerm: PodAffinityTerm = Field(
+        ...,
+        description=(
+            "Required. A pod affinity term, associated with the corresponding weight."
+        ),
+    )
+    weight: int = Field(
+        ...,
+        description=(
+            "weight associated with matching the corresponding podAffinityTerm, in the"
+            " range 1-100."
+        ),
+    )
+
+
+class PodAffinity(BaseModel):
+    preferredDuringSchedulingIgnoredDuringExecution: Optional[
+        List[WeightedPodAffinityTerm]
+    ] = Field(
+        default=None,
+        description=(
+            "The scheduler will prefer to schedule pods to nodes that satisfy the"
+            " affinity expressions specified by this field, but it may choose a node"
+            " that violates one or more of the expressions. The node that is most"
+            " preferred is the one with the greatest sum of weights, i.e. for each node"
+            " that meets all of the scheduling requirements (resource request,"
+            " requiredDuringScheduling affinity expressions, etc.), compute a sum by"
+            ' iterating through the elements of this field and adding "weight" to the'
+            " sum if the node has pods which matches the corresponding podAffinityTerm;"
+            " the node(s) with the highest sum are the most preferred."
+        ),
+    )
+    requiredDuringSchedulingIgnoredDuringExecution: Optional[List[PodAffinityTerm]] = (
+        Field(
+            default=None,
+            description=(
+                "If the affinity requirements specified by this field are not met at"
+                " scheduling time, the pod will not be scheduled onto the node. If the"
+                " affinity requirements specified by this field cease to be met at some"
+                " point during pod execution (e.g. due to a pod label update), the"
+                " system may or may not try to eventually evict the pod from its node."
+                " When there are multiple elements, the lists of nodes corresponding to"
+                " each podAffinityTerm are intersected, i.e. all terms must be"
+                " satisfied."
+            ),
+        )
+    )
+
+
+class PodAntiAffinity(BaseModel):
+    preferredDuringSchedulingIgnoredDuringExecution: Optional[
+        List[WeightedPodAffinityTerm]
+    ] = Field(
+        default=None,
+        description=(
+            "The scheduler will prefer to schedule pods to nodes that satisfy the"
+            " anti-affinity expressions specified by this field, but it may choose a"
+            " node that violates one or more of the expressions. The node that is most"
+            " preferred is the one with the greatest sum of weights, i.e. for each node"
+            " that meets all of the scheduling requirements (resource request,"
+            " requiredDuringScheduling anti-affinity expressions, etc.), compute a sum"
+            ' by iterating through the elements of this field and adding "weight" to'
+            " the sum if the node has pods which matches the corresponding"
+            " podAffinityTerm; the node(s) with the highest sum are the most preferred."
+        ),
+    )
+    requiredDuringSchedulingIgnoredDuringExecution: Optional[List[PodAffinityTerm]] = (
+        Field(
+            default=None,
+            description=(
+                "If the anti-affinity requirements specified by this field are not met"
+                " at scheduling time, the pod will not be scheduled onto the node. If"
+                " the anti-affinity requirements specified by this field cease to be"
+                " met at some point during pod execution (e.g. due to a pod label"
+                " update), the system may or may not try to eventually evict the pod"
+                " from its node. When there are multiple elements, the lists of nodes"
+                " corresponding to each podAffinityTerm are intersected, i.e. all terms"
+                " must be satisfied."
+            ),
+        )
+    )
+
+
+class Affinity(BaseModel):
+    nodeAffinity: Optional[NodeAffinity] = Field(
+        default=None,
+        description="Describes node affinity scheduling rules for the pod.",
+    )
+    podAffinity: Optional[PodAffinity] = Field(
+        default=None,
+        description=(
+            "Describes pod affinity scheduling rules (e.g. co-locate this pod in the"
+            " same node, zone, etc. as some other pod(s))."
+        ),
+    )
+    podAntiAffinity: Optional[PodAntiAffinity] = Field(
+        default=None,
+        description=(
+            "Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod"
+            " in the same node, zone, etc. as some other pod(s))."
+        ),
+    )
@@ -0,0 +1,108 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class AppArmorProfile(BaseModel):
+    localhostProfile: Optional[str] = Field(
+        default=None,
+        description=(
+            "localhostProfile indicates a profile loaded on the node that should be"
+            " used. The profile must be preconfigured on the node to work. Must match"
+            " the loaded name of the profile. Must be set if and only if type is"
+            ' "Localhost".'
+        ),
+    )
+    type: str = Field(
+        ...,
+        description=(
+            "type indicates which kind of AppArmor profile will be applied. Valid"
+            " options are:\n  Localhost - a profile pre-loaded on the node.\n "
+            " RuntimeDefault - the container runtime's default profile.\n  Unconfined -"
+            " no AppArmor enforcement."
+        ),
+    )
+
+
+class SELinuxOptions(BaseModel):
+    level: Optional[str] = Field(
+        default=None,
+        description="Level is SELinux level label that applies to the container.",
+    )
+    role: Optional[str] = Field(
+        default=None,
+        description="Role is a SELinux role label that applies to the container.",
+    )
+    type: Optional[str] = Field(
+        default=None,
+        description="Type is a SELinux type label that applies to the container.",
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description="User is a SELinux user label that applies to the container.",
+    )
+
+
+class SeccompProfile(BaseModel):
+    localhostProfile: Optional[str] = Field(
+        default=None,
+        description=(
+            "localhostProfile indicates a profile defined in a file on the node should"
+            " be used. The profile must be preconfigured on the node to work. Must be a"
+            " descending path, relative to the kubelet's configured seccomp profile"
+            ' location. Must be set if type is "Localhost". Must NOT be set for any'
+            " other type."
+        ),
+    )
+    type: str = Field(
+        ...,
+        description=(
+            "type indicates which kind of seccomp profile will be applied. Valid"
+            " options are:\n\nLocalhost - a profile defined in a file on the node"
+            " should be used. RuntimeDefault - the container runtime default profile"
+            " should be used. Unconfined - no profile should be applied."
+        ),
+    )
+
+
+class WindowsSecurityContextOptions(BaseModel):
+    gmsaCredentialSpec: Optional[str] = Field(
+        default=None,
+        description=(
+            "GMSACredentialSpec is where the GMSA admission webhook"
+            " (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of"
+            " the GMSA credential spec named by the GMSACredentialSpecName field."
+        ),
+    )
+    gmsaCredentialSpecName: Optional[str] = Field(
+        default=None,
+        description=(
+            "GMSACredentialSpecName is the name of the GMSA credential spec to use."
+        ),
+    )
+    hostProcess: Optional[bool] = Field(
+        default=None,
+        description=(
+            "HostProcess determines if a container should be run as a 'Host Process'"
+            " container. All of a Pod's containers must have the same effective"
+            " HostProcess value (it is not allowed to have a mix of HostProcess"
+            " containers and non-HostProcess containers). In addition, if HostProcess"
+            " is true then HostNetwork must also be set to true."
+        ),
+    )
+    runAsUserName: Optional[str] = Field(
+        default=None,
+        description=(
+            "The UserName in Windows to run the entrypoint of the container process."
+            " Defaults to the user specified in image metadata if unspecified. May also"
+            " be set in PodSecurityContext. If set in both SecurityContext and"
+            " PodSecurityContext, the value specified in SecurityContext takes"
+            " precedence."
+        ),
+    )
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from kubedantic.base import NamespacedObject
+
+from .object_reference import ObjectReference
+
+
+class Binding(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "Binding"
+    target: ObjectReference = Field(
+        ...,
+        description="The target object that you want to bind to the standard object.",
+    )
@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import ClusterScopedObject, ObjectList
+
+
+class ComponentCondition(BaseModel):
+    error: Optional[str] = Field(
+        default=None,
+        description=(
+            "Condition error code for a component. For example, a health check error"
+            " code."
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description=(
+            "Message about the condition for a component. For example, information"
+            " about a health check."
+        ),
+    )
+    status: str = Field(
+        ...,
+        description=(
+            'Status of the condition for a component. Valid values for "Healthy":'
+            ' "True", "False", or "Unknown".'
+        ),
+    )
+    type: str = Field(
+        ..., description='Type of condition for a component. Valid value: "Healthy"'
+    )
+
+
+class ComponentStatus(ClusterScopedObject):
+    apiVersion: Optional[str] = "v1"
+    conditions: Optional[List[ComponentCondition]] = Field(
+        default=None, description="List of component conditions observed"
+    )
+    kind: Optional[str] = "ComponentStatus"
+
+
+class ComponentStatusList(ObjectList[ComponentStatus]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ComponentStatusList"
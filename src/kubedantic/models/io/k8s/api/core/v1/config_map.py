@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from pydantic import Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+from kubedantic.types import Base64Bytes
+
+
+class ConfigMap(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    binaryData: Optional[Dict[str, Base64Bytes]] = Field(
+        default=None,
+        description=(
+            "BinaryData contains the binary data. Each key must consist of alphanumeric"
+            " characters, '-', '_' or '.'. BinaryData can contain byte sequences that"
+            " are not in the UTF-8 range. The keys stored in BinaryData must not"
+            " overlap with the ones in the Data field, this is enforced during"
+            " validation process. Using this field will require 1.10+ apiserver and"
+            " kubelet."
+        ),
+    )
+    data: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "Data contains the configuration data. Each key must consist of"
+            " alphanumeric characters, '-', '_' or '.'. Values with non-UTF-8 byte"
+            " sequences must use the BinaryData field. The keys stored in Data must not"
+            " overlap with the keys in the BinaryData field, this is enforced during"
+            " validation process."
+        ),
+    )
+    immutable: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Immutable, if set to true, ensures that data stored in the ConfigMap"
+            " cannot be updated (only object metadata can be modified). If not set to"
+            " true, the field can be modified at any time. Defaulted to nil."
+        ),
+    )
+    kind: Optional[str] = "ConfigMap"
+
+
+class ConfigMapList(ObjectList[ConfigMap]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ConfigMapList"
@@ -0,0 +1,1080 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .app_armor_profile import (
+    AppArmorProfile,
+    SeccompProfile,
+    SELinuxOptions,
+    WindowsSecurityContextOptions,
+)
+from .field_selector import ObjectFieldSelector, ResourceFieldSelector
+
+
+class Capabilities(BaseModel):
+    add: Optional[List[str]] = Field(default=None, description="Added capabilities")
+    drop: Optional[List[str]] = Field(default=None, description="Removed capabilities")
+
+
+class ConfigMapEnvSource(BaseModel):
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None, description="Specify whether the ConfigMap must be defined"
+    )
+
+
+class ConfigMapKeySelector(BaseModel):
+    key: str = Field(..., description="The key to select.")
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description="Specify whether the ConfigMap or its key must be defined",
+    )
+
+
+class ContainerPort(BaseModel):
+    containerPort: int = Field(
+        ...,
+        description=(
+            "Number of port to expose on the pod's IP address. This must be a valid"
+            " port number, 0 < x < 65536."
+        ),
+    )
+    hostIP: Optional[str] = Field(
+        default=None, description="What host IP to bind the external port to."
+    )
+    hostPort: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of port to expose on the host. If specified, this must be a valid"
+            " port number, 0 < x < 65536. If HostNetwork is specified, this must match"
+            " ContainerPort. Most containers do not need this."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "If specified, this must be an IANA_SVC_NAME and unique within the pod."
+            " Each named port in a pod must have a unique name. Name for the port that"
+            " can be referred to by services."
+        ),
+    )
+    protocol: Optional[str] = Field(
+        default="TCP",
+        description='Protocol for port. Must be UDP, TCP, or SCTP. Defaults to "TCP".',
+    )
+
+
+class ContainerResizePolicy(BaseModel):
+    resourceName: str = Field(
+        ...,
+        description=(
+            "Name of the resource to which this resource resize policy applies."
+            " Supported values: cpu, memory."
+        ),
+    )
+    restartPolicy: str = Field(
+        ...,
+        description=(
+            "Restart policy to apply when specified resource is resized. If not"
+            " specified, it defaults to NotRequired."
+        ),
+    )
+
+
+class ExecAction(BaseModel):
+    command: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Command is the command line to execute inside the container, the working"
+            " directory for the command  is root ('/') in the container's filesystem."
+            " The command is simply exec'd, it is not run inside a shell, so"
+            " traditional shell instructions ('|', etc) won't work. To use a shell, you"
+            " need to explicitly call out to that shell. Exit status of 0 is treated as"
+            " live/healthy and non-zero is unhealthy."
+        ),
+    )
+
+
+class GRPCAction(BaseModel):
+    port: int = Field(
+        ...,
+        description=(
+            "Port number of the gRPC service. Number must be in the range 1 to 65535."
+        ),
+    )
+    service: Optional[str] = Field(
+        default="",
+        description=(
+            "Service is the name of the service to place in the gRPC HealthCheckRequest"
+            " (see"
+            " https://github.com/grpc/grpc/blob/master/doc/health-checking.md).\n\nIf"
+            " this is not specified, the default behavior is defined by gRPC."
+        ),
+    )
+
+
+class HTTPHeader(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "The header field name. This will be canonicalized upon output, so"
+            " case-variant names will be understood as the same header."
+        ),
+    )
+    value: str = Field(..., description="The header field value")
+
+
+class ResourceClaim(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "Name must match the name of one entry in pod.spec.resourceClaims of the"
+            " Pod where this field is used. It makes that resource available inside a"
+            " container."
+        ),
+    )
+
+
+class SecretEnvSource(BaseModel):
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None, description="Specify whether the Secret must be defined"
+    )
+
+
+class SecretKeySelector(BaseModel):
+    key: str = Field(
+        ...,
+        description=(
+            "The key of the secret to select from.  Must be a valid secret key."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description="Specify whether the Secret or its key must be defined",
+    )
+
+
+class SleepAction(BaseModel):
+    seconds: int = Field(..., description="Seconds is the number of seconds to sleep.")
+
+
+class VolumeDevice(BaseModel):
+    devicePath: str = Field(
+        ...,
+        description=(
+            "devicePath is the path inside of the container that the device will be"
+            " mapped to."
+        ),
+    )
+    name: str = Field(
+        ...,
+        description="name must match the name of a persistentVolumeClaim in the pod",
+    )
+
+
+class VolumeMount(BaseModel):
+    mountPath: str = Field(
+        ...,
+        description=(
+            "Path within the container at which the volume should be mounted.  Must not"
+            " contain ':'."
+        ),
+    )
+    mountPropagation: Optional[str] = Field(
+        default=None,
+        description=(
+            "mountPropagation determines how mounts are propagated from the host to"
+            " container and the other way around. When not set, MountPropagationNone is"
+            " used. This field is beta in 1.10. When RecursiveReadOnly is set to"
+            " IfPossible or to Enabled, MountPropagation must be None or unspecified"
+            " (which defaults to None)."
+        ),
+    )
+    name: str = Field(..., description="This must match the Name of a Volume.")
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Mounted read-only if true, read-write otherwise (false or unspecified)."
+            " Defaults to false."
+        ),
+    )
+    recursiveReadOnly: Optional[str] = Field(
+        default=None,
+        description=(
+            "RecursiveReadOnly specifies whether read-only mounts should be handled"
+            " recursively.\n\nIf ReadOnly is false, this field has no meaning and must"
+            " be unspecified.\n\nIf ReadOnly is true, and this field is set to"
+            " Disabled, the mount is not made recursively read-only.  If this field is"
+            " set to IfPossible, the mount is made recursively read-only, if it is"
+            " supported by the container runtime.  If this field is set to Enabled, the"
+            " mount is made recursively read-only if it is supported by the container"
+            " runtime, otherwise the pod will not be started and an error will be"
+            " generated to indicate the reason.\n\nIf this field is set to IfPossible"
+            " or Enabled, MountPropagation must be set to None (or be unspecified,"
+            " which defaults to None).\n\nIf this field is not specified, it is treated"
+            " as an equivalent of Disabled."
+        ),
+    )
+    subPath: Optional[str] = Field(
+        default=None,
+        description=(
+            "Path within the volume from which the container's volume should be"
+            ' mounted. Defaults to "" (volume\'s root).'
+        ),
+    )
+    subPathExpr: Optional[str] = Field(
+        default=None,
+        description=(
+            "Expanded path within the volume from which the container's volume should"
+            " be mounted. Behaves similarly to SubPath but environment variable"
+            " references $(VAR_NAME) are expanded using the container's environment."
+            ' Defaults to "" (volume\'s root). SubPathExpr and SubPath are mutually'
+            " exclusive."
+        ),
+    )
+
+
+class EnvFromSource(BaseModel):
+    configMapRef: Optional[ConfigMapEnvSource] = Field(
+        default=None, description="The ConfigMap to select from"
+    )
+    prefix: Optional[str] = Field(
+        default=None,
+        description=(
+            "An optional identifier to prepend to each key in the ConfigMap. Must be a"
+            " C_IDENTIFIER."
+        ),
+    )
+    secretRef: Optional[SecretEnvSource] = Field(
+        default=None, description="The Secret to select from"
+    )
+
+
+class HTTPGetAction(BaseModel):
+    host: Optional[str] = Field(
+        default=None,
+        description=(
+            "Host name to connect to, defaults to the pod IP. You probably want to set"
+            ' "Host" in httpHeaders instead.'
+        ),
+    )
+    httpHeaders: Optional[List[HTTPHeader]] = Field(
+        default=None,
+        description=(
+            "Custom headers to set in the request. HTTP allows repeated headers."
+        ),
+    )
+    path: Optional[str] = Field(
+        default=None, description="Path to access on the HTTP server."
+    )
+    port: Union[int, str] = Field(
+        ...,
+        description=(
+            "Name or number of the port to access on the container. Number must be in"
+            " the range 1 to 65535. Name must be an IANA_SVC_NAME."
+        ),
+    )
+    scheme: Optional[str] = Field(
+        default=None,
+        description="Scheme to use for connecting to the host. Defaults to HTTP.",
+    )
+
+
+class ResourceRequirements(BaseModel):
+    claims: Optional[List[ResourceClaim]] = Field(
+        default=None,
+        description=(
+            "Claims lists the names of resources, defined in spec.resourceClaims, that"
+            " are used by this container.\n\nThis is an alpha field and requires"
+            " enabling the DynamicResourceAllocation feature gate.\n\nThis field is"
+            " immutable. It can only be set for containers."
+        ),
+    )
+    limits: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Limits describes the maximum amount of compute resources allowed. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/"
+        ),
+    )
+    requests: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Requests describes the minimum amount of compute resources required. If"
+            " Requests is omitted for a container, it defaults to Limits if that is"
+            " explicitly specified, otherwise to an implementation-defined value."
+            " Requests cannot exceed Limits. More info:"
+            " https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/"
+        ),
+    )
+
+
+class SecurityContext(BaseModel):
+    allowPrivilegeEscalation: Optional[bool] = Field(
+        default=None,
+        description=(
+            "AllowPrivilegeEscalation controls whether a process can gain more"
+            " privileges than its parent process. This bool directly controls if the"
+            " no_new_privs flag will be set on the container process."
+            " AllowPrivilegeEscalation is true always when the container is: 1) run as"
+            " Privileged 2) has CAP_SYS_ADMIN Note that this field cannot be set when"
+            " spec.os.name is windows."
+        ),
+    )
+    appArmorProfile: Optional[AppArmorProfile] = Field(
+        default=None,
+        description=(
+            "appArmorProfile is the AppArmor options to use by this container. If set,"
+            " this profile overrides the pod's appArmorProfile. Note that this field"
+            " cannot be set when spec.os.name is windows."
+        ),
+    )
+    capabilities: Optional[Capabilities] = Field(
+        default=None,
+        description=(
+            "The capabilities to add/drop when running containers. Defaults to the"
+            " default set of capabilities granted by the container runtime. Note that"
+            " this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    privileged: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Run container in privileged mode. Processes in privileged containers are"
+            " essentially equivalent to root on the host. Defaults to false. Note that"
+            " this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    procMount: Optional[str] = Field(
+        default=None,
+        description=(
+            "procMount denotes the type of proc mount to use for the containers. The"
+            " default is DefaultProcMount which uses the container runtime defaults for"
+            " readonly paths and masked paths. This requires the ProcMountType feature"
+            " flag to be enabled. Note that this field cannot be set when spec.os.name"
+            " is windows."
+        ),
+    )
+    readOnlyRootFilesystem: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether this container has a read-only root filesystem. Default is false."
+            " Note that this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    runAsGroup: Optional[int] = Field(
+        default=None,
+        description=(
+            "The GID to run the entrypoint of the container process. Uses runtime"
+            " default if unset. May also be set in PodSecurityContext.  If set in both"
+            " SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence. Note that this field cannot be set when"
+            " spec.os.name is windows."
+        ),
+    )
+    runAsNonRoot: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Indicates that the container must run as a non-root user. If true, the"
+            " Kubelet will validate the image at runtime to ensure that it does not run"
+            " as UID 0 (root) and fail to start the container if it does. If unset or"
+            " false, no such validation will be performed. May also be set in"
+            " PodSecurityContext.  If set in both SecurityContext and"
+            " PodSecurityContext, the value specified in SecurityContext takes"
+            " precedence."
+        ),
+    )
+    runAsUser: Optional[int] = Field(
+        default=None,
+        description=(
+            "The UID to run the entrypoint of the container process. Defaults to user"
+            " specified in image metadata if unspecified. May also be set in"
+            " PodSecurityContext.  If set in both SecurityContext and"
+            " PodSecurityContext, the value specified in SecurityContext takes"
+            " precedence. Note that this field cannot be set when spec.os.name is"
+            " windows."
+        ),
+    )
+    seLinuxOptions: Optional[SELinuxOptions] = Field(
+        default=None,
+        description=(
+            "The SELinux context to be applied to the container. If unspecified, the"
+            " container runtime will allocate a random SELinux context for each"
+            " container.  May also be set in PodSecurityContext.  If set in both"
+            " SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence. Note that this field cannot be set when"
+            " spec.os.name is windows."
+        ),
+    )
+    seccompProfile: Optional[SeccompProfile] = Field(
+        default=None,
+        description=(
+            "The seccomp options to use by this container. If seccomp options are"
+            " provided at both the pod & container level, the container options"
+            " override the pod options. Note that this field cannot be set when"
+            " spec.os.name is windows."
+        ),
+    )
+    windowsOptions: Optional[WindowsSecurityContextOptions] = Field(
+        default=None,
+        description=(
+            "The Windows specific settings applied to all containers. If unspecified,"
+            " the options from the PodSecurityContext will be used. If set in both"
+            " SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence. Note that this field cannot be set when"
+            " spec.os.name is linux."
+        ),
+    )
+
+
+class TCPSocketAction(BaseModel):
+    host: Optional[str] = Field(
+        default=None,
+        description="Optional: Host name to connect to, defaults to the pod IP.",
+    )
+    port: Union[int, str] = Field(
+        ...,
+        description=(
+            "Number or name of the port to access on the container. Number must be in"
+            " the range 1 to 65535. Name must be an IANA_SVC_NAME."
+        ),
+    )
+
+
+class EnvVarSource(BaseModel):
+    configMapKeyRef: Optional[ConfigMapKeySelector] = Field(
+        default=None, description="Selects a key of a ConfigMap."
+    )
+    fieldRef: Optional[ObjectFieldSelector] = Field(
+        default=None,
+        description=(
+            "Selects a field of the pod: supports metadata.name, metadata.namespace,"
+            " `metadata.labels['<KEY>']`, `metadata.annotations['<KEY>']`,"
+            " spec.nodeName, spec.serviceAccountName, status.hostIP, status.podIP,"
+            " status.podIPs."
+        ),
+    )
+    resourceFieldRef: Optional[ResourceFieldSelector] = Field(
+        default=None,
+        description=(
+            "Selects a resource of the container: only resources limits and requests"
+            " (limits.cpu, limits.memory, limits.ephemeral-storage, requests.cpu,"
+            " requests.memory and requests.ephemeral-storage) are currently supported."
+        ),
+    )
+    secretKeyRef: Optional[SecretKeySelector] = Field(
+        default=None, description="Selects a key of a secret in the pod's namespace"
+    )
+
+
+class LifecycleHandler(BaseModel):
+    exec: Optional[ExecAction] = Field(
+        default=None, description="Exec specifies the action to take."
+    )
+    httpGet: Optional[HTTPGetAction] = Field(
+        default=None, description="HTTPGet specifies the http request to perform."
+    )
+    sleep: Optional[SleepAction] = Field(
+        default=None,
+        description=(
+            "Sleep represents the duration that the container should sleep before being"
+            " terminated."
+        ),
+    )
+    tcpSocket: Optional[TCPSocketAction] = Field(
+        default=None,
+        description=(
+            "Deprecated. TCPSocket is NOT supported as a LifecycleHandler and kept for"
+            " the backward compatibility. There are no validation of this field and"
+            " lifecycle hooks will fail in runtime when tcp handler is specified."
+        ),
+    )
+
+
+class Probe(BaseModel):
+    exec: Optional[ExecAction] = Field(
+        default=None, description="Exec specifies the action to take."
+    )
+    failureThreshold: Optional[int] = Field(
+        default=None,
+        description=(
+            "Minimum consecutive failures for the probe to be considered failed after"
+            " having succeeded. Defaults to 3. Minimum value is 1."
+        ),
+    )
+    grpc: Optional[GRPCAction] = Field(
+        default=None, description="GRPC specifies an action involving a GRPC port."
+    )
+    httpGet: Optional[HTTPGetAction] = Field(
+        default=None, description="HTTPGet specifies the http request to perform."
+    )
+    initialDelaySeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of seconds after the container has started before liveness probes"
+            " are initiated. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes"
+        ),
+    )
+    periodSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "How often (in seconds) to perform the probe. Default to 10 seconds."
+            " Minimum value is 1."
+        ),
+    )
+    successThreshold: Optional[int] = Field(
+        default=None,
+        description=(
+            "Minimum consecutive successes for the probe to be considered successful"
+            " after having failed. Defaults to 1. Must be 1 for liveness and startup."
+            " Minimum value is 1."
+        ),
+    )
+    tcpSocket: Optional[TCPSocketAction] = Field(
+        default=None, description="TCPSocket specifies an action involving a TCP port."
+    )
+    terminationGracePeriodSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Optional duration in seconds the pod needs to terminate gracefully upon"
+            " probe failure. The grace period is the duration in seconds after the"
+            " processes running in the pod are sent a termination signal and the time"
+            " when the processes are forcibly halted with a kill signal. Set this value"
+            " longer than the expected cleanup time for your process. If this value is"
+            " nil, the pod's terminationGracePeriodSeconds will be used. Otherwise,"
+            " this value overrides the value provided by the pod spec. Value must be"
+            " non-negative integer. The value zero indicates stop immediately via the"
+            " kill signal (no opportunity to shut down). This is a beta field and"
+            " requires enabling ProbeTerminationGracePeriod feature gate. Minimum value"
+            " is 1. spec.terminationGracePeriodSeconds is used if unset."
+        ),
+    )
+    timeoutSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of seconds after which the probe times out. Defaults to 1 second."
+            " Minimum value is 1. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes"
+        ),
+    )
+
+
+class EnvVar(BaseModel):
+    name: str = Field(
+        ..., description="Name of the environment variable. Must be a C_IDENTIFIER."
+    )
+    value: Optional[str] = Field(
+        default=None,
+        description=(
+            "Variable references $(VAR_NAME) are expanded using the previously defined"
+            " environment variables in the container and any service environment"
+            " variables. If a variable cannot be resolved, the reference in the input"
+            " string will be unchanged. Double $$ are reduced to a single $, which"
+            ' allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will'
+            ' produce the string literal "$(VAR_NAME)". Escaped references will never'
+            " be expanded, regardless of whether the variable exists or not. Defaults"
+            ' to "".'
+        ),
+    )
+    valueFrom: Optional[EnvVarSource] = Field(
+        default=None,
+        description=(
+            "Source for the environment variable's value. Cannot be used if value is"
+            " not empty."
+        ),
+    )
+
+
+class Lifecycle(BaseModel):
+    postStart: Optional[LifecycleHandler] = Field(
+        default=None,
+        description=(
+            "PostStart is called immediately after a container is created. If the"
+            " handler fails, the container is terminated and restarted according to its"
+            " restart policy. Other management of the container blocks until the hook"
+            " completes. More info:"
+            " https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks"
+        ),
+    )
+    preStop: Optional[LifecycleHandler] = Field(
+        default=None,
+        description=(
+            "PreStop is called immediately before a container is terminated due to an"
+            " API request or management event such as liveness/startup probe failure,"
+            " preemption, resource contention, etc. The handler is not called if the"
+            " container crashes or exits. The Pod's termination grace period countdown"
+            " begins before the PreStop hook is executed. Regardless of the outcome of"
+            " the handler, the container will eventually terminate within the Pod's"
+            " termination grace period (unless delayed by finalizers). Other management"
+            " of the container blocks until the hook completes or until the termination"
+            " grace period is reached. More info:"
+            " https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks"
+        ),
+    )
+
+
+class Container(BaseModel):
+    args: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Arguments to the entrypoint. The container image's CMD is used if this is"
+            " not provided. Variable references $(VAR_NAME) are expanded using the"
+            " container's environment. If a variable cannot be resolved, the reference"
+            " in the input string will be unchanged. Double $$ are reduced to a single"
+            ' $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)"'
+            ' will produce the string literal "$(VAR_NAME)". Escaped references will'
+            " never be expanded, regardless of whether the variable exists or not."
+            " Cannot be updated. More info:"
+            " https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell"
+        ),
+    )
+    command: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Entrypoint array. Not executed within a shell. The container image's"
+            " ENTRYPOINT is used if this is not provided. Variable references"
+            " $(VAR_NAME) are expanded using the container's environment. If a"
+            " variable cannot be resolved, the reference in the input string will be"
+            " unchanged. Double $$ are reduced to a single $, which allows for escaping"
+            ' the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string'
+            ' literal "$(VAR_NAME)". Escaped references will never be expanded,'
+            " regardless of whether the variable exists or not. Cannot be updated. More"
+            " info:"
+            " https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell"
+        ),
+    )
+    env: Optional[List[EnvVar]] = Field(
+        default=None,
+        description=(
+            "List of environment variables to set in the container. Cannot be updated."
+        ),
+    )
+    envFrom: Optional[List[EnvFromSource]] = Field(
+        default=None,
+        description=(
+            "List of sources to populate environment variables in the container. The"
+            " keys defined within a source must be a C_IDENTIFIER. All invalid keys"
+            " will be reported as an event when the container is starting. When a key"
+            " exists in multiple sources, the value associated with the last source"
+            " will take precedence. Values defined by an Env with a duplicate key will"
+            " take precedence. Cannot be updated."
+        ),
+    )
+    image: Optional[str] = Field(
+        default=None,
+        description=(
+            "Container image name. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images This field is"
+            " optional to allow higher level config management to default or override"
+            " container images in workload controllers like Deployments and"
+            " StatefulSets."
+        ),
+    )
+    imagePullPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always"
+            " if :latest tag is specified, or IfNotPresent otherwise. Cannot be"
+            " updated. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images#updating-images"
+        ),
+    )
+    lifecycle: Optional[Lifecycle] = Field(
+        default=None,
+        description=(
+            "Actions that the management system should take in response to container"
+            " lifecycle events. Cannot be updated."
+        ),
+    )
+    livenessProbe: Optional[Probe] = Field(
+        default=None,
+        description=(
+            "Periodic probe of container liveness. Container will be restarted if the"
+            " probe fails. Cannot be updated. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes"
+        ),
+    )
+    name: str = Field(
+        ...,
+        description=(
+            "Name of the container specified as a DNS_LABEL. Each container in a pod"
+            " must have a unique name (DNS_LABEL). Cannot be updated."
+        ),
+    )
+    ports: Optional[List[ContainerPort]] = Field(
+        default=None,
+        description=(
+            "List of ports to expose from the container. Not specifying a port here"
+            " DOES NOT prevent that port from being exposed. Any port which is"
+            ' listening on the default "0.0.0.0" address inside a container will be'
+            " accessible from the network. Modifying this array with strategic merge"
+            " patch may corrupt the data. For more information See"
+            " https://github.com/kubernetes/kubernetes/issues/108255. Cannot be"
+            " updated."
+        ),
+    )
+    readinessProbe: Optional[Probe] = Field(
+        default=None,
+        description=(
+            "Periodic probe of container service readiness. Container will be removed"
+            " from service endpoints if the probe fails. Cannot be updated. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes"
+        ),
+    )
+    resizePolicy: Optional[List[ContainerResizePolicy]] = Field(
+        default=None, description="Resources resize policy for the container."
+    )
+    resources: Optional[ResourceRequirements] = Field(
+        default=None,
+        description=(
+            "Compute Resources required by this container. Cannot be updated. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/"
+        ),
+    )
+    restartPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "RestartPolicy defines the restart behavior of individual containers in a"
+            " pod. This field may only be set for init containers, and the only allowed"
+            ' value is "Always". For non-init containers or when this field is not'
+            " specified, the restart behavior is defined by the Pod's restart policy"
+            ' and the container type. Setting the RestartPolicy as "Always" for the'
+            " init container will have the following effect: this init container will"
+            " be continually restarted on exit until all regular containers have"
+            " terminated. Once all regular containers have completed, all init"
+            ' containers with restartPolicy "Always" will be shut down. This lifecycle'
+            " differs from normal init containers and is often referred to as a"
+            ' "sidecar" container. Although this init container still starts in the'
+            " init container sequence, it does not wait for the container to complete"
+            " before proceeding to the next init container. Instead, the next init"
+            " container starts immediately after this init container is started, or"
+            " after any startupProbe has successfully completed."
+        ),
+    )
+    securityContext: Optional[SecurityContext] = Field(
+        default=None,
+        description=(
+            "SecurityContext defines the security options the container should be run"
+            " with. If set, the fields of SecurityContext override the equivalent"
+            " fields of PodSecurityContext. More info:"
+            " https://kubernetes.io/docs/tasks/configure-pod-container/security-context/"
+        ),
+    )
+    startupProbe: Optional[Probe] = Field(
+        default=None,
+        description=(
+            "StartupProbe indicates that the Pod has successfully initialized. If"
+            " specified, no other probes are executed until this completes"
+            " successfully. If this probe fails, the Pod will be restarted, just as if"
+            " the livenessProbe failed. This can be used to provide different probe"
+            " parameters at the beginning of a Pod's lifecycle, when it might take a"
+            " long time to load data or warm a cache, than during steady-state"
+            " operation. This cannot be updated. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes"
+        ),
+    )
+    stdin: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether this container should allocate a buffer for stdin in the container"
+            " runtime. If this is not set, reads from stdin in the container will"
+            " always result in EOF. Default is false."
+        ),
+    )
+    stdinOnce: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether the container runtime should close the stdin channel after it has"
+            " been opened by a single attach. When stdin is true the stdin stream will"
+            " remain open across multiple attach sessions. If stdinOnce is set to true,"
+            " stdin is opened on container start, is empty until the first client"
+            " attaches to stdin, and then remains open and accepts data until the"
+            " client disconnects, at which time stdin is closed and remains closed"
+            " until the container is restarted. If this flag is false, a container"
+            " processes that reads from stdin will never receive an EOF. Default is"
+            " false"
+        ),
+    )
+    terminationMessagePath: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional: Path at which the file to which the container's termination"
+            " message will be written is mounted into the container's filesystem."
+            " Message written is intended to be brief final status, such as an"
+            " assertion failure message. Will be truncated by the node if greater than"
+            " 4096 bytes. The total message length across all containers will be"
+            " limited to 12kb. Defaults to /dev/termination-log. Cannot be updated."
+        ),
+    )
+    terminationMessagePolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Indicate how the termination message should be populated. File will use"
+            " the contents of terminationMessagePath to populate the container status"
+            " message on both success and failure. FallbackToLogsOnError will use the"
+            " last chunk of container log output if the termination message file is"
+            " empty and the container exited with an error. The log output is limited"
+            " to 2048 bytes or 80 lines, whichever is smaller. Defaults to File. Cannot"
+            " be updated."
+        ),
+    )
+    tty: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether this container should allocate a TTY for itself, also requires"
+            " 'stdin' to be true. Default is false."
+        ),
+    )
+    volumeDevices: Optional[List[VolumeDevice]] = Field(
+        default=None,
+        description=(
+            "volumeDevices is the list of block devices to be used by the container."
+        ),
+    )
+    volumeMounts: Optional[List[VolumeMount]] = Field(
+        default=None,
+        description=(
+            "Pod volumes to mount into the container's filesystem. Cannot be updated."
+        ),
+    )
+    workingDir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Container's working directory. If not specified, the container runtime's"
+            " default will be used, which might be configured in the container image."
+            " Cannot be updated."
+        ),
+    )
+
+
+class EphemeralContainer(BaseModel):
+    args: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Arguments to the entrypoint. The image's CMD is used if this is not"
+            " provided. Variable references $(VAR_NAME) are expanded using the"
+            " container's environment. If a variable cannot be resolved, the reference"
+            " in the input string will be unchanged. Double $$ are reduced to a single"
+            ' $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)"'
+            ' will produce the string literal "$(VAR_NAME)". Escaped references will'
+            " never be expanded, regardless of whether the variable exists or not."
+            " Cannot be updated. More info:"
+            " https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell"
+        ),
+    )
+    command: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Entrypoint array. Not executed within a shell. The image's ENTRYPOINT is"
+            " used if this is not provided. Variable references $(VAR_NAME) are"
+            " expanded using the container's environment. If a variable cannot be"
+            " resolved, the reference in the input string will be unchanged. Double $$"
+            " are reduced to a single $, which allows for escaping the $(VAR_NAME)"
+            ' syntax: i.e. "$$(VAR_NAME)" will produce the string literal'
+            ' "$(VAR_NAME)". Escaped references will never be expanded, regardless of'
+            " whether the variable exists or not. Cannot be updated. More info:"
+            " https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell"
+        ),
+    )
+    env: Optional[List[EnvVar]] = Field(
+        default=None,
+        description=(
+            "List of environment variables to set in the container. Cannot be updated."
+        ),
+    )
+    envFrom: Optional[List[EnvFromSource]] = Field(
+        default=None,
+        description=(
+            "List of sources to populate environment variables in the container. The"
+            " keys defined within a source must be a C_IDENTIFIER. All invalid keys"
+            " will be reported as an event when the container is starting. When a key"
+            " exists in multiple sources, the value associated with the last source"
+            " will take precedence. Values defined by an Env with a duplicate key will"
+            " take precedence. Cannot be updated."
+        ),
+    )
+    image: Optional[str] = Field(
+        default=None,
+        description=(
+            "Container image name. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images"
+        ),
+    )
+    imagePullPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always"
+            " if :latest tag is specified, or IfNotPresent otherwise. Cannot be"
+            " updated. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images#updating-images"
+        ),
+    )
+    lifecycle: Optional[Lifecycle] = Field(
+        default=None, description="Lifecycle is not allowed for ephemeral containers."
+    )
+    livenessProbe: Optional[Probe] = Field(
+        default=None, description="Probes are not allowed for ephemeral containers."
+    )
+    name: str = Field(
+        ...,
+        description=(
+            "Name of the ephemeral container specified as a DNS_LABEL. This name must"
+            " be unique among all containers, init containers and ephemeral containers."
+        ),
+    )
+    ports: Optional[List[ContainerPort]] = Field(
+        default=None, description="Ports are not allowed for ephemeral containers."
+    )
+    readinessProbe: Optional[Probe] = Field(
+        default=None, description="Probes are not allowed for ephemeral containers."
+    )
+    resizePolicy: Optional[List[ContainerResizePolicy]] = Field(
+        default=None, description="Resources resize policy for the container."
+    )
+    resources: Optional[ResourceRequirements] = Field(
+        default=None,
+        description=(
+            "Resources are not allowed for ephemeral containers. Ephemeral containers"
+            " use spare resources already allocated to the pod."
+        ),
+    )
+    restartPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Restart policy for the container to manage the restart behavior of each"
+            " container within a pod. This may only be set for init containers. You"
+            " cannot set this field on ephemeral containers."
+        ),
+    )
+    securityContext: Optional[SecurityContext] = Field(
+        default=None,
+        description=(
+            "Optional: SecurityContext defines the security options the ephemeral"
+            " container should be run with. If set, the fields of SecurityContext"
+            " override the equivalent fields of PodSecurityContext."
+        ),
+    )
+    startupProbe: Optional[Probe] = Field(
+        default=None, description="Probes are not allowed for ephemeral containers."
+    )
+    stdin: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether this container should allocate a buffer for stdin in the container"
+            " runtime. If this is not set, reads from stdin in the container will"
+            " always result in EOF. Default is false."
+        ),
+    )
+    stdinOnce: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether the container runtime should close the stdin channel after it has"
+            " been opened by a single attach. When stdin is true the stdin stream will"
+            " remain open across multiple attach sessions. If stdinOnce is set to true,"
+            " stdin is opened on container start, is empty until the first client"
+            " attaches to stdin, and then remains open and accepts data until the"
+            " client disconnects, at which time stdin is closed and remains closed"
+            " until the container is restarted. If this flag is false, a container"
+            " processes that reads from stdin will never receive an EOF. Default is"
+            " false"
+        ),
+    )
+    targetContainerName: Optional[str] = Field(
+        default=None,
+        description=(
+            "If set, the name of the container from PodSpec that this ephemeral"
+            " container targets. The ephemeral container will be run in the namespaces"
+            " (IPC, PID, etc) of this container. If not set then the ephemeral"
+            " container uses the namespaces configured in the Pod spec.\n\nThe"
+            " container runtime must implement support for this feature. If the runtime"
+            " does not support namespace targeting then the result of setting this"
+            " field is undefined."
+        ),
+    )
+    terminationMessagePath: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional: Path at which the file to which the container's termination"
+            " message will be written is mounted into the container's filesystem."
+            " Message written is intended to be brief final status, such as an"
+            " assertion failure message. Will be truncated by the node if greater than"
+            " 4096 bytes. The total message length across all containers will be"
+            " limited to 12kb. Defaults to /dev/termination-log. Cannot be updated."
+        ),
+    )
+    terminationMessagePolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Indicate how the termination message should be populated. File will use"
+            " the contents of terminationMessagePath to populate the container status"
+            " message on both success and failure. FallbackToLogsOnError will use the"
+            " last chunk of container log output if the termination message file is"
+            " empty and the container exited with an error. The log output is limited"
+            " to 2048 bytes or 80 lines, whichever is smaller. Defaults to File. Cannot"
+            " be updated."
+        ),
+    )
+    tty: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Whether this container should allocate a TTY for itself, also requires"
+            " 'stdin' to be true. Default is false."
+        ),
+    )
+    volumeDevices: Optional[List[VolumeDevice]] = Field(
+        default=None,
+        description=(
+            "volumeDevices is the list of block devices to be used by the container."
+        ),
+    )
+    volumeMounts: Optional[List[VolumeMount]] = Field(
+        default=None,
+        description=(
+            "Pod volumes to mount into the container's filesystem. Subpath mounts are"
+            " not allowed for ephemeral containers. Cannot be updated."
+        ),
+    )
+    workingDir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Container's working directory. If not specified, the container runtime's"
+            " default will be used, which might be configured in the container image."
+            " Cannot be updated."
+        ),
+    )
@@ -0,0 +1,119 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .object_reference import ObjectReference
+
+
+class EndpointPort(BaseModel):
+    appProtocol: Optional[str] = Field(
+        default=None,
+        description=(
+            "The application protocol for this port. This is used as a hint for"
+            " implementations to offer richer behavior for protocols that they"
+            " understand. This field follows standard Kubernetes label syntax. Valid"
+            " values are either:\n\n* Un-prefixed protocol names - reserved for IANA"
+            " standard service names (as per RFC-6335 and"
+            " https://www.iana.org/assignments/service-names).\n\n* Kubernetes-defined"
+            " prefixed names:\n  * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over"
+            " cleartext as described in"
+            " https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-\n"
+            "  * 'kubernetes.io/ws'  - WebSocket over cleartext as described in"
+            " https://www.rfc-editor.org/rfc/rfc6455\n  * 'kubernetes.io/wss' -"
+            " WebSocket over TLS as described in"
+            " https://www.rfc-editor.org/rfc/rfc6455\n\n* Other protocols should use"
+            " implementation-defined prefixed names such as"
+            " mycompany.com/my-custom-protocol."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "The name of this port.  This must match the 'name' field in the"
+            " corresponding ServicePort. Must be a DNS_LABEL. Optional only if one port"
+            " is defined."
+        ),
+    )
+    port: int = Field(..., description="The port number of the endpoint.")
+    protocol: Optional[str] = Field(
+        default=None,
+        description=(
+            "The IP protocol for this port. Must be UDP, TCP, or SCTP. Default is TCP."
+        ),
+    )
+
+
+class EndpointAddress(BaseModel):
+    hostname: Optional[str] = Field(
+        default=None, description="The Hostname of this endpoint"
+    )
+    ip: str = Field(
+        ...,
+        description=(
+            "The IP of this endpoint. May not be loopback (127.0.0.0/8 or ::1),"
+            " link-local (169.254.0.0/16 or fe80::/10), or link-local multicast"
+            " (224.0.0.0/24 or ff02::/16)."
+        ),
+    )
+    nodeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional: Node hosting this endpoint. This can be used to determine"
+            " endpoints local to a node."
+        ),
+    )
+    targetRef: Optional[ObjectReference] = Field(
+        default=None, description="Reference to object providing the endpoint."
+    )
+
+
+class EndpointSubset(BaseModel):
+    addresses: Optional[List[EndpointAddress]] = Field(
+        default=None,
+        description=(
+            "IP addresses which offer the related ports that are marked as ready. These"
+            " endpoints should be considered safe for load balancers and clients to"
+            " utilize."
+        ),
+    )
+    notReadyAddresses: Optional[List[EndpointAddress]] = Field(
+        default=None,
+        description=(
+            "IP addresses which offer the related ports but are not currently marked as"
+            " ready because they have not yet finished starting, have recently failed a"
+            " readiness check, or have recently failed a liveness check."
+        ),
+    )
+    ports: Optional[List[EndpointPort]] = Field(
+        default=None, description="Port numbers available on the related IP addresses."
+    )
+
+
+class Endpoints(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "Endpoints"
+    subsets: Optional[List[EndpointSubset]] = Field(
+        default=None,
+        description=(
+            "The set of all endpoints is the union of all subsets. Addresses are placed"
+            " into subsets according to the IPs they share. A single address with"
+            " multiple ports, some of which are ready and some of which are not"
+            " (because they come from different containers) will result in the address"
+            " being displayed in different subsets for the different ports. No address"
+            " will appear in both Addresses and NotReadyAddresses in the same subset."
+            " Sets of addresses and ports that comprise a service."
+        ),
+    )
+
+
+class EndpointsList(ObjectList[Endpoints]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "EndpointsList"
@@ -0,0 +1,118 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from ....apimachinery.pkg.apis.meta import v1
+from .object_reference import ObjectReference
+
+
+class EventSource(BaseModel):
+    component: Optional[str] = Field(
+        default=None, description="Component from which the event is generated."
+    )
+    host: Optional[str] = Field(
+        default=None, description="Node name on which the event is generated."
+    )
+
+
+class EventSeries(BaseModel):
+    count: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of occurrences in this series up to the last heartbeat time"
+        ),
+    )
+    lastObservedTime: Optional[datetime] = Field(
+        default=None, description="Time of the last occurrence observed"
+    )
+
+
+class Event(NamespacedObject):
+    action: Optional[str] = Field(
+        default=None,
+        description="What action was taken/failed regarding to the Regarding object.",
+    )
+    apiVersion: Optional[str] = "v1"
+    count: Optional[int] = Field(
+        default=None, description="The number of times this event has occurred."
+    )
+    eventTime: Optional[datetime] = Field(
+        default=None, description="Time when this Event was first observed."
+    )
+    firstTimestamp: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "The time at which the event was first recorded. (Time of server receipt is"
+            " in TypeMeta.)"
+        ),
+    )
+    involvedObject: ObjectReference = Field(
+        ..., description="The object that this event is about."
+    )
+    kind: Optional[str] = "Event"
+    lastTimestamp: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "The time at which the most recent occurrence of this event was recorded."
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="A human-readable description of the status of this operation.",
+    )
+    metadata: v1.ObjectMeta
+    reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "This should be a short, machine understandable string that gives the"
+            " reason for the transition into the object's current status."
+        ),
+    )
+    related: Optional[ObjectReference] = Field(
+        default=None, description="Optional secondary object for more complex actions."
+    )
+    reportingComponent: Optional[str] = Field(
+        default="",
+        description=(
+            "Name of the controller that emitted this Event, e.g."
+            " `kubernetes.io/kubelet`."
+        ),
+    )
+    reportingInstance: Optional[str] = Field(
+        default="", description="ID of the controller instance, e.g. `kubelet-xyzf`."
+    )
+    series: Optional[EventSeries] = Field(
+        default=None,
+        description=(
+            "Data about the Event series this event represents or nil if it's a"
+            " singleton Event."
+        ),
+    )
+    source: Optional[EventSource] = Field(
+        default=None,
+        description=(
+            "The component reporting this event. Should be a short machine"
+            " understandable string."
+        ),
+    )
+    type: Optional[str] = Field(
+        default=None,
+        description=(
+            "Type of this event (Normal, Warning), new types could be added in the"
+            " future"
+        ),
+    )
+
+
+class EventList(ObjectList[Event]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "EventList"
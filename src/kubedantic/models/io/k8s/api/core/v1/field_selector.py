@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class ObjectFieldSelector(BaseModel):
+    apiVersion: Optional[str] = Field(
+        default=None,
+        description=(
+            "Version of the schema the FieldPath is written in terms of, defaults to"
+            ' "v1".'
+        ),
+    )
+    fieldPath: str = Field(
+        ..., description="Path of the field to select in the specified API version."
+    )
+
+
+class ResourceFieldSelector(BaseModel):
+    containerName: Optional[str] = Field(
+        default=None,
+        description="Container name: required for volumes, optional for env vars",
+    )
+    divisor: Optional[Union[str, float]] = Field(
+        default=None,
+        description=(
+            'Specifies the output format of the exposed resources, defaults to "1"'
+        ),
+    )
+    resource: str = Field(..., description="Required: resource to select")
@@ -0,0 +1,68 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+
+class LimitRangeItem(BaseModel):
+    default: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Default resource requirement limit value by resource name if resource"
+            " limit is omitted."
+        ),
+    )
+    defaultRequest: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "DefaultRequest is the default resource requirement request value by"
+            " resource name if resource request is omitted."
+        ),
+    )
+    max: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None, description="Max usage constraints on this kind by resource name."
+    )
+    maxLimitRequestRatio: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "MaxLimitRequestRatio if specified, the named resource must have a request"
+            " and limit that are both non-zero where limit divided by request is less"
+            " than or equal to the enumerated value; this represents the max burst for"
+            " the named resource."
+        ),
+    )
+    min: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None, description="Min usage constraints on this kind by resource name."
+    )
+    type: str = Field(..., description="Type of resource that this limit applies to.")
+
+
+class LimitRangeSpec(BaseModel):
+    limits: List[LimitRangeItem] = Field(
+        ...,
+        description="Limits is the list of LimitRangeItem objects that are enforced.",
+    )
+
+
+class LimitRange(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "LimitRange"
+    spec: Optional[LimitRangeSpec] = Field(
+        default=None,
+        description=(
+            "Spec defines the limits enforced. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class LimitRangeList(ObjectList[LimitRange]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "LimitRangeList"
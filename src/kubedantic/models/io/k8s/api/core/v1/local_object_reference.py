@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LocalObjectReference(BaseModel):
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
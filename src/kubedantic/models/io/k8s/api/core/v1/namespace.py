@@ -0,0 +1,81 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import ClusterScopedObject, ObjectList
+
+
+class NamespaceSpec(BaseModel):
+    finalizers: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Finalizers is an opaque list of values that must be empty to permanently"
+            " remove object from storage. More info:"
+            " https://kubernetes.io/docs/tasks/administer-cluster/namespaces/"
+        ),
+    )
+
+
+class NamespaceCondition(BaseModel):
+    lastTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "Time is a wrapper around time.Time which supports correct marshaling to"
+            " YAML and JSON.  Wrappers are provided for many of the factory methods"
+            " that the time package offers."
+        ),
+    )
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: str = Field(
+        ..., description="Status of the condition, one of True, False, Unknown."
+    )
+    type: str = Field(..., description="Type of namespace controller condition.")
+
+
+class NamespaceStatus(BaseModel):
+    conditions: Optional[List[NamespaceCondition]] = Field(
+        default=None,
+        description=(
+            "Represents the latest available observations of a namespace's current"
+            " state."
+        ),
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description=(
+            "Phase is the current lifecycle phase of the namespace. More info:"
+            " https://kubernetes.io/docs/tasks/administer-cluster/namespaces/"
+        ),
+    )
+
+
+class Namespace(ClusterScopedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "Namespace"
+    spec: Optional[NamespaceSpec] = Field(
+        default=None,
+        description=(
+            "Spec defines the behavior of the Namespace. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+    status: Optional[NamespaceStatus] = Field(
+        default=None,
+        description=(
+            "Status describes the current status of a Namespace. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class NamespaceList(ObjectList[Namespace]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "NamespaceList"
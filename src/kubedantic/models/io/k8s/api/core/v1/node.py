@@ -0,0 +1,426 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import ClusterScopedObject, ObjectList
+
+
+class AttachedVolume(BaseModel):
+    devicePath: str = Field(
+        ...,
+        description=(
+            "DevicePath represents the device path where the volume should be available"
+        ),
+    )
+    name: str = Field(..., description="Name of the attached volume")
+
+
+class ConfigMapNodeConfigSource(BaseModel):
+    kubeletConfigKey: str = Field(
+        ...,
+        description=(
+            "KubeletConfigKey declares which key of the referenced ConfigMap"
+            " corresponds to the KubeletConfiguration structure This field is required"
+            " in all cases."
+        ),
+    )
+    name: str = Field(
+        ...,
+        description=(
+            "Name is the metadata.name of the referenced ConfigMap. This field is"
+            " required in all cases."
+        ),
+    )
+    namespace: str = Field(
+        ...,
+        description=(
+            "Namespace is the metadata.namespace of the referenced ConfigMap. This"
+            " field is required in all cases."
+        ),
+    )
+    resourceVersion: Optional[str] = Field(
+        default=None,
+        description=(
+            "ResourceVersion is the metadata.ResourceVersion of the referenced"
+            " ConfigMap. This field is forbidden in Node.Spec, and required in"
+            " Node.Status."
+        ),
+    )
+    uid: Optional[str] = Field(
+        default=None,
+        description=(
+            "UID is the metadata.UID of the referenced ConfigMap. This field is"
+            " forbidden in Node.Spec, and required in Node.Status."
+        ),
+    )
+
+
+class ContainerImage(BaseModel):
+    names: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Names by which this image is known. e.g."
+            ' ["kubernetes.example/hyperkube:v1.0.7",'
+            ' "cloud-vendor.registry.example/cloud-vendor/hyperkube:v1.0.7"]'
+        ),
+    )
+    sizeBytes: Optional[int] = Field(
+        default=None, description="The size of the image in bytes."
+    )
+
+
+class DaemonEndpoint(BaseModel):
+    Port: int = Field(..., description="Port number of the given endpoint.")
+
+
+class NodeAddress(BaseModel):
+    address: str = Field(..., description="The node address.")
+    type: str = Field(
+        ..., description="Node address type, one of Hostname, ExternalIP or InternalIP."
+    )
+
+
+class NodeConfigSource(BaseModel):
+    configMap: Optional[ConfigMapNodeConfigSource] = Field(
+        default=None, description="ConfigMap is a reference to a Node's ConfigMap"
+    )
+
+
+class NodeConfigStatus(BaseModel):
+    active: Optional[NodeConfigSource] = Field(
+        default=None,
+        description=(
+            "Active reports the checkpointed config the node is actively using. Active"
+            " will represent either the current version of the Assigned config, or the"
+            " current LastKnownGood config, depending on whether attempting to use the"
+            " Assigned config results in an error."
+        ),
+    )
+    assigned: Optional[NodeConfigSource] = Field(
+        default=None,
+        description=(
+            "Assigned reports the checkpointed config the node will try to use. When"
+            " Node.Spec.ConfigSource is updated, the node checkpoints the associated"
+            " config payload to local disk, along with a record indicating intended"
+            " config. The node refers to this record to choose its config checkpoint,"
+            " and reports this record in Assigned. Assigned only updates in the status"
+            " after the record has been checkpointed to disk. When the Kubelet is"
+            " restarted, it tries to make the Assigned config the Active config by"
+            " loading and validating the checkpointed payload identified by Assigned."
+        ),
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description=(
+            "Error describes any problems reconciling the Spec.ConfigSource to the"
+            " Active config. Errors may occur, for example, attempting to checkpoint"
+            " Spec.ConfigSource to the local Assigned record, attempting to checkpoint"
+            " the payload associated with Spec.ConfigSource, attempting to load or"
+            " validate the Assigned config, etc. Errors may occur at different points"
+            " while syncing config. Earlier errors (e.g. download or checkpointing"
+            " errors) will not result in a rollback to LastKnownGood, and may resolve"
+            " across Kubelet retries. Later errors (e.g. loading or validating a"
+            " checkpointed config) will result in a rollback to LastKnownGood. In the"
+            " latter case, it is usually possible to resolve the error by fixing the"
+            " config assigned in Spec.ConfigSource. You can find additional information"
+            " for debugging by searching the error message in the Kubelet log. Error is"
+            " a human-readable description of the error state; machines can check"
+            " whether or not Error is empty, but should not rely on the stability of"
+            " the Error text across Kubelet versions."
+        ),
+    )
+    lastKnownGood: Optional[NodeConfigSource] = Field(
+        default=None,
+        description=(
+            "LastKnownGood reports the checkpointed config the node will fall back to"
+            " when it encounters an error attempting to use the Assigned config. The"
+            " Assigned config becomes the LastKnownGood config when the node determines"
+            " that the Assigned config is stable and correct. This is currently"
+            " implemented as a 10-minute soak period starting when the local record of"
+            " Assigned config is updated. If the Assigned config is Active at the end"
+            " of this period, it becomes the LastKnownGood. Note that if"
+            " Spec.ConfigSource is reset to nil (use local defaults), the LastKnownGood"
+            " is also immediately reset to nil, because the local default config is"
+            " always assumed good. You should not make assumptions about the node's"
+            " method of determining config stability and correctness, as this may"
+            " change or become configurable in the future."
+        ),
+    )
+
+
+class NodeDaemonEndpoints(BaseModel):
+    kubeletEndpoint: Optional[DaemonEndpoint] = Field(
+        default=None, description="Endpoint on which Kubelet is listening."
+    )
+
+
+class NodeRuntimeHandlerFeatures(BaseModel):
+    recursiveReadOnlyMounts: Optional[bool] = Field(
+        default=None,
+        description=(
+            "RecursiveReadOnlyMounts is set to true if the runtime handler supports"
+            " RecursiveReadOnlyMounts."
+        ),
+    )
+
+
+class NodeSystemInfo(BaseModel):
+    architecture: str = Field(..., description="The Architecture reported by the node")
+    bootID: str = Field(..., description="Boot ID reported by the node.")
+    containerRuntimeVersion: str = Field(
+        ...,
+        description=(
+            "ContainerRuntime Version reported by the node through runtime remote API"
+            " (e.g. containerd://1.4.2)."
+        ),
+    )
+    kernelVersion: str = Field(
+        ...,
+        description=(
+            "Kernel Version reported by the node from 'uname -r' (e.g."
+            " 3.16.0-0.bpo.4-amd64)."
+        ),
+    )
+    kubeProxyVersion: str = Field(
+        ..., description="KubeProxy Version reported by the node."
+    )
+    kubeletVersion: str = Field(
+        ..., description="Kubelet Version reported by the node."
+    )
+    machineID: str = Field(
+        ...,
+        description=(
+            "MachineID reported by the node. For unique machine identification in the"
+            " cluster this field is preferred. Learn more from man(5) machine-id:"
+            " http://man7.org/linux/man-pages/man5/machine-id.5.html"
+        ),
+    )
+    operatingSystem: str = Field(
+        ..., description="The Operating System reported by the node"
+    )
+    osImage: str = Field(
+        ...,
+        description=(
+            "OS Image reported by the node from /etc/os-release (e.g. Debian GNU/Linux"
+            " 7 (wheezy))."
+        ),
+    )
+    systemUUID: str = Field(
+        ...,
+        description=(
+            "SystemUUID reported by the node. For unique machine identification"
+            " MachineID is preferred. This field is specific to Red Hat hosts"
+            " https://access.redhat.com/documentation/en-us/red_hat_subscription_management/1/html/rhsm/uuid"
+        ),
+    )
+
+
+class NodeCondition(BaseModel):
+    lastHeartbeatTime: Optional[datetime] = Field(
+        default=None, description="Last time we got an update on a given condition."
+    )
+    lastTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description="Last time the condition transit from one status to another.",
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="Human readable message indicating details about last transition.",
+    )
+    reason: Optional[str] = Field(
+        default=None, description="(brief) reason for the condition's last transition."
+    )
+    status: str = Field(
+        ..., description="Status of the condition, one of True, False, Unknown."
+    )
+    type: str = Field(..., description="Type of node condition.")
+
+
+class NodeRuntimeHandler(BaseModel):
+    features: Optional[NodeRuntimeHandlerFeatures] = Field(
+        default=None, description="Supported features."
+    )
+    name: Optional[str] = Field(
+        default="",
+        description="Runtime handler name. Empty for the default runtime handler.",
+    )
+
+
+class NodeStatus(BaseModel):
+    addresses: Optional[List[NodeAddress]] = Field(
+        default=None,
+        description=(
+            "List of addresses reachable to the node. Queried from cloud provider, if"
+            " available. More info:"
+            " https://kubernetes.io/docs/concepts/nodes/node/#addresses Note: This"
+            " field is declared as mergeable, but the merge key is not sufficiently"
+            " unique, which can cause data corruption when it is merged. Callers should"
+            " instead use a full-replacement patch. See https://pr.k8s.io/79391 for an"
+            " example. Consumers should assume that addresses can change during the"
+            " lifetime of a Node. However, there are some exceptions where this may not"
+            " be possible, such as Pods that inherit a Node's address in its own status"
+            " or consumers of the downward API (status.hostIP)."
+        ),
+    )
+    allocatable: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Allocatable represents the resources of a node that are available for"
+            " scheduling. Defaults to Capacity."
+        ),
+    )
+    capacity: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Capacity represents the total resources of a node. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#capacity"
+        ),
+    )
+    conditions: Optional[List[NodeCondition]] = Field(
+        default=None,
+        description=(
+            "Conditions is an array of current observed node conditions. More info:"
+            " https://kubernetes.io/docs/concepts/nodes/node/#condition"
+        ),
+    )
+    config: Optional[NodeConfigStatus] = Field(
+        default=None,
+        description=(
+            "Status of the config assigned to the node via the dynamic Kubelet config"
+            " feature."
+        ),
+    )
+    daemonEndpoints: Optional[NodeDaemonEndpoints] = Field(
+        default=None, description="Endpoints of daemons running on the Node."
+    )
+    images: Optional[List[ContainerImage]] = Field(
+        default=None, description="List of container images on this node"
+    )
+    nodeInfo: Optional[NodeSystemInfo] = Field(
+        default=None,
+        description=(
+            "Set of ids/uuids to uniquely identify the node. More info:"
+            " https://kubernetes.io/docs/concepts/nodes/node/#info"
+        ),
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description=(
+            "NodePhase is the recently observed lifecycle phase of the node. More info:"
+            " https://kubernetes.io/docs/concepts/nodes/node/#phase The field is never"
+            " populated, and now is deprecated."
+        ),
+    )
+    runtimeHandlers: Optional[List[NodeRuntimeHandler]] = Field(
+        default=None, description="The available runtime handlers."
+    )
+    volumesAttached: Optional[List[AttachedVolume]] = Field(
+        default=None, description="List of volumes that are attached to the node."
+    )
+    volumesInUse: Optional[List[str]] = Field(
+        default=None,
+        description="List of attachable volumes in use (mounted) by the node.",
+    )
+
+
+class Taint(BaseModel):
+    effect: str = Field(
+        ...,
+        description=(
+            "Required. The effect of the taint on pods that do not tolerate the taint."
+            " Valid effects are NoSchedule, PreferNoSchedule and NoExecute."
+        ),
+    )
+    key: str = Field(
+        ..., description="Required. The taint key to be applied to a node."
+    )
+    timeAdded: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "TimeAdded represents the time at which the taint was added. It is only"
+            " written for NoExecute taints."
+        ),
+    )
+    value: Optional[str] = Field(
+        default=None, description="The taint value corresponding to the taint key."
+    )
+
+
+class NodeSpec(BaseModel):
+    configSource: Optional[NodeConfigSource] = Field(
+        default=None,
+        description=(
+            "Deprecated: Previously used to specify the source of the node's"
+            " configuration for the DynamicKubeletConfig feature. This feature is"
+            " removed."
+        ),
+    )
+    externalID: Optional[str] = Field(
+        default=None,
+        description=(
+            "Deprecated. Not all kubelets will set this field. Remove field after 1.13."
+            " see: https://issues.k8s.io/61966"
+        ),
+    )
+    podCIDR: Optional[str] = Field(
+        default=None,
+        description="PodCIDR represents the pod IP range assigned to the node.",
+    )
+    podCIDRs: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "podCIDRs represents the IP ranges assigned to the node for usage by Pods"
+            " on that node. If this field is specified, the 0th entry must match the"
+            " podCIDR field. It may contain at most 1 value for each of IPv4 and IPv6."
+        ),
+    )
+    providerID: Optional[str] = Field(
+        default=None,
+        description=(
+            "ID of the node assigned by the cloud provider in the format:"
+            " <ProviderName>://<ProviderSpecificNodeID>"
+        ),
+    )
+    taints: Optional[List[Taint]] = Field(
+        default=None, description="If specified, the node's taints."
+    )
+    unschedulable: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Unschedulable controls node schedulability of new pods. By default, node"
+            " is schedulable. More info:"
+            " https://kubernetes.io/docs/concepts/nodes/node/#manual-node-administration"
+        ),
+    )
+
+
+class Node(ClusterScopedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "Node"
+    spec: Optional[NodeSpec] = Field(
+        default=None,
+        description=(
+            "Spec defines the behavior of a node."
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+    status: Optional[NodeStatus] = Field(
+        default=None,
+        description=(
+            "Most recently observed status of the node. Populated by the system."
+            " Read-only. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class NodeList(ObjectList[Node]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "NodeList"
@@ -0,0 +1,65 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ObjectReference(BaseModel):
+    apiVersion: Optional[str] = Field(
+        default=None, description="API version of the referent."
+    )
+    fieldPath: Optional[str] = Field(
+        default=None,
+        description=(
+            "If referring to a piece of an object instead of an entire object, this"
+            " string should contain a valid JSON/Go field access statement, such as"
+            " desiredState.manifest.containers[2]. For example, if the object reference"
+            " is to a container within a pod, this would take on a value like:"
+            ' "spec.containers{name}" (where "name" refers to the name of the container'
+            " that triggered the event) or if no container name is specified"
+            ' "spec.containers[2]" (container with index 2 in this pod). This syntax is'
+            " chosen only to have some well-defined way of referencing a part of an"
+            " object."
+        ),
+    )
+    kind: Optional[str] = Field(
+        default=None,
+        description=(
+            "Kind of the referent. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    namespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "Namespace of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/namespaces/"
+        ),
+    )
+    resourceVersion: Optional[str] = Field(
+        default=None,
+        description=(
+            "Specific resourceVersion to which this reference is made, if any. More"
+            " info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency"
+        ),
+    )
+    uid: Optional[str] = Field(
+        default=None,
+        description=(
+            "UID of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#uids"
+        ),
+    )
@@ -0,0 +1,880 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import ClusterScopedObject, ObjectList
+
+from .object_reference import ObjectReference
+from .volume_source import (
+    AWSElasticBlockStoreVolumeSource,
+    AzureDiskVolumeSource,
+    FCVolumeSource,
+    FlockerVolumeSource,
+    GCEPersistentDiskVolumeSource,
+    HostPathVolumeSource,
+    NFSVolumeSource,
+    NodeSelector,
+    PhotonPersistentDiskVolumeSource,
+    PortworxVolumeSource,
+    QuobyteVolumeSource,
+    VsphereVirtualDiskVolumeSource,
+)
+
+
+class AzureFilePersistentVolumeSource(BaseModel):
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretName: str = Field(
+        ...,
+        description=(
+            "secretName is the name of secret that contains Azure Storage Account Name"
+            " and Key"
+        ),
+    )
+    secretNamespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "secretNamespace is the namespace of the secret that contains Azure Storage"
+            " Account Name and Key default is the same as the Pod"
+        ),
+    )
+    shareName: str = Field(..., description="shareName is the azure Share Name")
+
+
+class GlusterfsPersistentVolumeSource(BaseModel):
+    endpoints: str = Field(
+        ...,
+        description=(
+            "endpoints is the endpoint name that details Glusterfs topology. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+    endpointsNamespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "endpointsNamespace is the namespace that contains Glusterfs endpoint. If"
+            " this field is empty, the EndpointNamespace defaults to the same namespace"
+            " as the bound PVC. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "path is the Glusterfs volume path. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the Glusterfs volume to be mounted with read-only"
+            " permissions. Defaults to false. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+
+
+class LocalVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. It applies only when the Path is a"
+            " block device. Must be a filesystem type supported by the host operating"
+            ' system. Ex. "ext4", "xfs", "ntfs". The default value is to auto-select a'
+            " filesystem if unspecified."
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "path of the full path to the volume on the node. It can be either a"
+            " directory or block device (disk, partition, ...)."
+        ),
+    )
+
+
+class SecretReference(BaseModel):
+    name: Optional[str] = Field(
+        default=None,
+        description="name is unique within a namespace to reference a secret resource.",
+    )
+    namespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "namespace defines the space within which the secret name must be unique."
+        ),
+    )
+
+
+class StorageOSPersistentVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Implicitly inferred to be "ext4" if unspecified.'
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: Optional[ObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef specifies the secret to use for obtaining the StorageOS API"
+            " credentials.  If not specified, default values will be attempted."
+        ),
+    )
+    volumeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeName is the human-readable name of the StorageOS volume.  Volume"
+            " names are only unique within a namespace."
+        ),
+    )
+    volumeNamespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeNamespace specifies the scope of the volume within StorageOS.  If no"
+            " namespace is specified then the Pod's namespace will be used.  This"
+            " allows the Kubernetes name scoping to be mirrored within StorageOS for"
+            " tighter integration. Set VolumeName to any name to override the default"
+            ' behaviour. Set to "default" if you are not using namespaces within'
+            " StorageOS. Namespaces that do not pre-exist within StorageOS will be"
+            " created."
+        ),
+    )
+
+
+class CSIPersistentVolumeSource(BaseModel):
+    controllerExpandSecretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "controllerExpandSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " ControllerExpandVolume call. This field is optional, and may be empty if"
+            " no secret is required. If the secret object contains more than one"
+            " secret, all secrets are passed."
+        ),
+    )
+    controllerPublishSecretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "controllerPublishSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " ControllerPublishVolume and ControllerUnpublishVolume calls. This field"
+            " is optional, and may be empty if no secret is required. If the secret"
+            " object contains more than one secret, all secrets are passed."
+        ),
+    )
+    driver: str = Field(
+        ...,
+        description=(
+            "driver is the name of the driver to use for this volume. Required."
+        ),
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType to mount. Must be a filesystem type supported by the host operating"
+            ' system. Ex. "ext4", "xfs", "ntfs".'
+        ),
+    )
+    nodeExpandSecretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "nodeExpandSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " NodeExpandVolume call. This field is optional, may be omitted if no"
+            " secret is required. If the secret object contains more than one secret,"
+            " all secrets are passed."
+        ),
+    )
+    nodePublishSecretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "nodePublishSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " NodePublishVolume and NodeUnpublishVolume calls. This field is optional,"
+            " and may be empty if no secret is required. If the secret object contains"
+            " more than one secret, all secrets are passed."
+        ),
+    )
+    nodeStageSecretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "nodeStageSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " NodeStageVolume and NodeStageVolume and NodeUnstageVolume calls. This"
+            " field is optional, and may be empty if no secret is required. If the"
+            " secret object contains more than one secret, all secrets are passed."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly value to pass to ControllerPublishVolumeRequest. Defaults to"
+            " false (read/write)."
+        ),
+    )
+    volumeAttributes: Optional[Dict[str, str]] = Field(
+        default=None, description="volumeAttributes of the volume to publish."
+    )
+    volumeHandle: str = Field(
+        ...,
+        description=(
+            "volumeHandle is the unique volume name returned by the CSI volume plugin’s"
+            " CreateVolume to refer to the volume on all subsequent calls. Required."
+        ),
+    )
+
+
+class CephFSPersistentVolumeSource(BaseModel):
+    monitors: List[str] = Field(
+        ...,
+        description=(
+            "monitors is Required: Monitors is a collection of Ceph monitors More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description=(
+            "path is Optional: Used as the mounted root, rather than the full Ceph"
+            " tree, default is /"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: Defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts. More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    secretFile: Optional[str] = Field(
+        default=None,
+        description=(
+            "secretFile is Optional: SecretFile is the path to key ring for User,"
+            " default is /etc/ceph/user.secret More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    secretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "secretRef is Optional: SecretRef is reference to the authentication secret"
+            " for User, default is empty. More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description=(
+            "user is Optional: User is the rados user name, default is admin More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+
+
+class CinderPersistentVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType Filesystem type to mount. Must be a filesystem type supported by"
+            ' the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly'
+            ' inferred to be "ext4" if unspecified. More info:'
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: Defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts. More info:"
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    secretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "secretRef is Optional: points to a secret object containing parameters"
+            " used to connect to OpenStack."
+        ),
+    )
+    volumeID: str = Field(
+        ...,
+        description=(
+            "volumeID used to identify the volume in cinder. More info:"
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+
+
+class FlexPersistentVolumeSource(BaseModel):
+    driver: str = Field(
+        ..., description="driver is the name of the driver to use for this volume."
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the Filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The'
+            " default filesystem depends on FlexVolume script."
+        ),
+    )
+    options: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "options is Optional: this field holds extra command options if any."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "secretRef is Optional: SecretRef is reference to the secret object"
+            " containing sensitive information to pass to the plugin scripts. This may"
+            " be empty if no secret object is specified. If the secret object contains"
+            " more than one secret, all secrets are passed to the plugin scripts."
+        ),
+    )
+
+
+class ISCSIPersistentVolumeSource(BaseModel):
+    chapAuthDiscovery: Optional[bool] = Field(
+        default=None,
+        description=(
+            "chapAuthDiscovery defines whether support iSCSI Discovery CHAP"
+            " authentication"
+        ),
+    )
+    chapAuthSession: Optional[bool] = Field(
+        default=None,
+        description=(
+            "chapAuthSession defines whether support iSCSI Session CHAP authentication"
+        ),
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#iscsi"
+        ),
+    )
+    initiatorName: Optional[str] = Field(
+        default=None,
+        description=(
+            "initiatorName is the custom iSCSI Initiator Name. If initiatorName is"
+            " specified with iscsiInterface simultaneously, new iSCSI interface <target"
+            " portal>:<volume name> will be created for the connection."
+        ),
+    )
+    iqn: str = Field(..., description="iqn is Target iSCSI Qualified Name.")
+    iscsiInterface: Optional[str] = Field(
+        default=None,
+        description=(
+            "iscsiInterface is the interface Name that uses an iSCSI transport."
+            " Defaults to 'default' (tcp)."
+        ),
+    )
+    lun: int = Field(..., description="lun is iSCSI Target Lun number.")
+    portals: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "portals is the iSCSI Target Portal List. The Portal is either an IP or"
+            " ip_addr:port if the port is other than default (typically TCP ports 860"
+            " and 3260)."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to"
+            " false."
+        ),
+    )
+    secretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "secretRef is the CHAP Secret for iSCSI target and initiator authentication"
+        ),
+    )
+    targetPortal: str = Field(
+        ...,
+        description=(
+            "targetPortal is iSCSI Target Portal. The Portal is either an IP or"
+            " ip_addr:port if the port is other than default (typically TCP ports 860"
+            " and 3260)."
+        ),
+    )
+
+
+class PersistentVolumeStatus(BaseModel):
+    lastPhaseTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "lastPhaseTransitionTime is the time the phase transitioned from one to"
+            " another and automatically resets to current time everytime a volume phase"
+            " transitions. This is a beta field and requires the"
+            " PersistentVolumeLastPhaseTransitionTime feature to be enabled (enabled by"
+            " default)."
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description=(
+            "message is a human-readable message indicating details about why the"
+            " volume is in this state."
+        ),
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description=(
+            "phase indicates if a volume is available, bound to a claim, or released by"
+            " a claim. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#phase"
+        ),
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "reason is a brief CamelCase string that describes any failure and is meant"
+            " for machine parsing and tidy display in the CLI."
+        ),
+    )
+
+
+class RBDPersistentVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#rbd"
+        ),
+    )
+    image: str = Field(
+        ...,
+        description=(
+            "image is the rados image name. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    keyring: Optional[str] = Field(
+        default=None,
+        description=(
+            "keyring is the path to key ring for RBDUser. Default is /etc/ceph/keyring."
+            " More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    monitors: List[str] = Field(
+        ...,
+        description=(
+            "monitors is a collection of Ceph monitors. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    pool: Optional[str] = Field(
+        default=None,
+        description=(
+            "pool is the rados pool name. Default is rbd. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to"
+            " false. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    secretRef: Optional[SecretReference] = Field(
+        default=None,
+        description=(
+            "secretRef is name of the authentication secret for RBDUser. If provided"
+            " overrides keyring. Default is nil. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description=(
+            "user is the rados user name. Default is admin. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+
+
+class ScaleIOPersistentVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Default is "xfs"'
+        ),
+    )
+    gateway: str = Field(
+        ..., description="gateway is the host address of the ScaleIO API Gateway."
+    )
+    protectionDomain: Optional[str] = Field(
+        default=None,
+        description=(
+            "protectionDomain is the name of the ScaleIO Protection Domain for the"
+            " configured storage."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: SecretReference = Field(
+        ...,
+        description=(
+            "secretRef references to the secret for ScaleIO user and other sensitive"
+            " information. If this is not provided, Login operation will fail."
+        ),
+    )
+    sslEnabled: Optional[bool] = Field(
+        default=None,
+        description=(
+            "sslEnabled is the flag to enable/disable SSL communication with Gateway,"
+            " default false"
+        ),
+    )
+    storageMode: Optional[str] = Field(
+        default=None,
+        description=(
+            "storageMode indicates whether the storage for a volume should be"
+            " ThickProvisioned or ThinProvisioned. Default is ThinProvisioned."
+        ),
+    )
+    storagePool: Optional[str] = Field(
+        default=None,
+        description=(
+            "storagePool is the ScaleIO Storage Pool associated with the protection"
+            " domain."
+        ),
+    )
+    system: str = Field(
+        ...,
+        description=(
+            "system is the name of the storage system as configured in ScaleIO."
+        ),
+    )
+    volumeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeName is the name of a volume already created in the ScaleIO system"
+            " that is associated with this volume source."
+        ),
+    )
+
+
+class VolumeNodeAffinity(BaseModel):
+    required: Optional[NodeSelector] = Field(
+        default=None,
+        description="required specifies hard node constraints that must be met.",
+    )
+
+
+class PersistentVolumeSpec(BaseModel):
+    accessModes: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "accessModes contains all ways the volume can be mounted. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes"
+        ),
+    )
+    awsElasticBlockStore: Optional[AWSElasticBlockStoreVolumeSource] = Field(
+        default=None,
+        description=(
+            "awsElasticBlockStore represents an AWS Disk resource that is attached to a"
+            " kubelet's host machine and then exposed to the pod. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore"
+        ),
+    )
+    azureDisk: Optional[AzureDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "azureDisk represents an Azure Data Disk mount on the host and bind mount"
+            " to the pod."
+        ),
+    )
+    azureFile: Optional[AzureFilePersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "azureFile represents an Azure File Service mount on the host and bind"
+            " mount to the pod."
+        ),
+    )
+    capacity: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "capacity is the description of the persistent volume's resources and"
+            " capacity. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#capacity"
+        ),
+    )
+    cephfs: Optional[CephFSPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "cephFS represents a Ceph FS mount on the host that shares a pod's lifetime"
+        ),
+    )
+    cinder: Optional[CinderPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "cinder represents a cinder volume attached and mounted on kubelets host"
+            " machine. More info: https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    claimRef: Optional[ObjectReference] = Field(
+        default=None,
+        description=(
+            "claimRef is part of a bi-directional binding between PersistentVolume and"
+            " PersistentVolumeClaim. Expected to be non-nil when bound."
+            " claim.VolumeName is the authoritative bind between PV and PVC. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#binding"
+        ),
+    )
+    csi: Optional[CSIPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "csi represents storage that is handled by an external CSI driver (Beta"
+            " feature)."
+        ),
+    )
+    fc: Optional[FCVolumeSource] = Field(
+        default=None,
+        description=(
+            "fc represents a Fibre Channel resource that is attached to a kubelet's"
+            " host machine and then exposed to the pod."
+        ),
+    )
+    flexVolume: Optional[FlexPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "flexVolume represents a generic volume resource that is"
+            " provisioned/attached using an exec based plugin."
+        ),
+    )
+    flocker: Optional[FlockerVolumeSource] = Field(
+        default=None,
+        description=(
+            "flocker represents a Flocker volume attached to a kubelet's host machine"
+            " and exposed to the pod for its usage. This depends on the Flocker control"
+            " service being running"
+        ),
+    )
+    gcePersistentDisk: Optional[GCEPersistentDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "gcePersistentDisk represents a GCE Disk resource that is attached to a"
+            " kubelet's host machine and then exposed to the pod. Provisioned by an"
+            " admin. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+    glusterfs: Optional[GlusterfsPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "glusterfs represents a Glusterfs volume that is attached to a host and"
+            " exposed to the pod. Provisioned by an admin. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md"
+        ),
+    )
+    hostPath: Optional[HostPathVolumeSource] = Field(
+        default=None,
+        description=(
+            "hostPath represents a directory on the host. Provisioned by a developer or"
+            " tester. This is useful for single-node development and testing only!"
+            " On-host storage is not supported in any way and WILL NOT WORK in a"
+            " multi-node cluster. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#hostpath"
+        ),
+    )
+    iscsi: Optional[ISCSIPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "iscsi represents an ISCSI Disk resource that is attached to a kubelet's"
+            " host machine and then exposed to the pod. Provisioned by an admin."
+        ),
+    )
+    local: Optional[LocalVolumeSource] = Field(
+        default=None,
+        description="local represents directly-attached storage with node affinity",
+    )
+    mountOptions: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            'mountOptions is the list of mount options, e.g. ["ro", "soft"]. Not'
+            " validated - mount will simply fail if one is invalid. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes/#mount-options"
+        ),
+    )
+    nfs: Optional[NFSVolumeSource] = Field(
+        default=None,
+        description=(
+            "nfs represents an NFS mount on the host. Provisioned by an admin. More"
+            " info: https://kubernetes.io/docs/concepts/storage/volumes#nfs"
+        ),
+    )
+    nodeAffinity: Optional[VolumeNodeAffinity] = Field(
+        default=None,
+        description=(
+            "nodeAffinity defines constraints that limit what nodes this volume can be"
+            " accessed from. This field influences the scheduling of pods that use this"
+            " volume."
+        ),
+    )
+    persistentVolumeReclaimPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "persistentVolumeReclaimPolicy defines what happens to a persistent volume"
+            " when released from its claim. Valid options are Retain (default for"
+            " manually created PersistentVolumes), Delete (default for dynamically"
+            " provisioned PersistentVolumes), and Recycle (deprecated). Recycle must be"
+            " supported by the volume plugin underlying this PersistentVolume. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#reclaiming"
+        ),
+    )
+    photonPersistentDisk: Optional[PhotonPersistentDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "photonPersistentDisk represents a PhotonController persistent disk"
+            " attached and mounted on kubelets host machine"
+        ),
+    )
+    portworxVolume: Optional[PortworxVolumeSource] = Field(
+        default=None,
+        description=(
+            "portworxVolume represents a portworx volume attached and mounted on"
+            " kubelets host machine"
+        ),
+    )
+    quobyte: Optional[QuobyteVolumeSource] = Field(
+        default=None,
+        description=(
+            "quobyte represents a Quobyte mount on the host that shares a pod's"
+            " lifetime"
+        ),
+    )
+    rbd: Optional[RBDPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "rbd represents a Rados Block Device mount on the host that shares a pod's"
+            " lifetime. More info: https://examples.k8s.io/volumes/rbd/README.md"
+        ),
+    )
+    scaleIO: Optional[ScaleIOPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "scaleIO represents a ScaleIO persistent volume attached and mounted on"
+            " Kubernetes nodes."
+        ),
+    )
+    storageClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "storageClassName is the name of StorageClass to which this persistent"
+            " volume belongs. Empty value means that this volume does not belong to any"
+            " StorageClass."
+        ),
+    )
+    storageos: Optional[StorageOSPersistentVolumeSource] = Field(
+        default=None,
+        description=(
+            "storageOS represents a StorageOS volume that is attached to the kubelet's"
+            " host machine and mounted into the pod More info:"
+            " https://examples.k8s.io/volumes/storageos/README.md"
+        ),
+    )
+    volumeAttributesClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of VolumeAttributesClass to which this persistent volume belongs."
+            " Empty value is not allowed. When this field is not set, it indicates that"
+            " this volume does not belong to any VolumeAttributesClass. This field is"
+            " mutable and can be changed by the CSI driver after a volume has been"
+            " updated successfully to a new class. For an unbound PersistentVolume, the"
+            " volumeAttributesClassName will be matched with unbound"
+            " PersistentVolumeClaims during the binding process. This is an alpha field"
+            " and requires enabling VolumeAttributesClass feature."
+        ),
+    )
+    volumeMode: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeMode defines if a volume is intended to be used with a formatted"
+            " filesystem or to remain in raw block state. Value of Filesystem is"
+            " implied when not included in spec."
+        ),
+    )
+    vsphereVolume: Optional[VsphereVirtualDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "vsphereVolume represents a vSphere volume attached and mounted on kubelets"
+            " host machine"
+        ),
+    )
+
+
+class PersistentVolume(ClusterScopedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PersistentVolume"
+    spec: Optional[PersistentVolumeSpec] = Field(
+        default=None,
+        description=(
+            "spec defines a specification of a persistent volume owned by the cluster."
+            " Provisioned by an administrator. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistent-volumes"
+        ),
+    )
+    status: Optional[PersistentVolumeStatus] = Field(
+        default=None,
+        description=(
+            "status represents the current information/status for the persistent"
+            " volume. Populated by the system. Read-only. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistent-volumes"
+        ),
+    )
+
+
+class PersistentVolumeList(ObjectList[PersistentVolume]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PersistentVolumeList"
@@ -0,0 +1,207 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .persistent_volume_claim_spec import PersistentVolumeClaimSpec
+
+
+class ModifyVolumeStatus(BaseModel):
+    status: str = Field(
+        ...,
+        description=(
+            "status is the status of the ControllerModifyVolume operation. It can be in"
+            " any of following states:\n - Pending\n   Pending indicates that the"
+            " PersistentVolumeClaim cannot be modified due to unmet requirements, such"
+            " as\n   the specified VolumeAttributesClass not existing.\n - InProgress\n"
+            "   InProgress indicates that the volume is being modified.\n -"
+            " Infeasible\n  Infeasible indicates that the request has been rejected as"
+            " invalid by the CSI driver. To\n\t  resolve the error, a valid"
+            " VolumeAttributesClass needs to be specified.\nNote: New statuses can be"
+            " added in the future. Consumers should check for unknown statuses and fail"
+            " appropriately."
+        ),
+    )
+    targetVolumeAttributesClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "targetVolumeAttributesClassName is the name of the VolumeAttributesClass"
+            " the PVC currently being reconciled"
+        ),
+    )
+
+
+class PersistentVolumeClaimCondition(BaseModel):
+    lastProbeTime: Optional[datetime] = Field(
+        default=None, description="lastProbeTime is the time we probed the condition."
+    )
+    lastTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "lastTransitionTime is the time the condition transitioned from one status"
+            " to another."
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description=(
+            "message is the human-readable message indicating details about last"
+            " transition."
+        ),
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "reason is a unique, this should be a short, machine understandable string"
+            " that gives the reason for condition's last transition. If it reports"
+            ' "Resizing" that means the underlying persistent volume is being resized.'
+        ),
+    )
+    status: str
+    type: str
+
+
+class PersistentVolumeClaimStatus(BaseModel):
+    accessModes: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "accessModes contains the actual access modes the volume backing the PVC"
+            " has. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1"
+        ),
+    )
+    allocatedResourceStatuses: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "allocatedResourceStatuses stores status of resource being resized for the"
+            " given PVC. Key names follow standard Kubernetes label syntax. Valid"
+            " values are either:\n\t* Un-prefixed keys:\n\t\t- storage - the capacity"
+            " of the volume.\n\t* Custom resources must use implementation-defined"
+            ' prefixed names such as "example.com/my-custom-resource"\nApart from above'
+            " values - keys that are unprefixed or have kubernetes.io prefix are"
+            " considered reserved and hence may not be used.\n\nClaimResourceStatus can"
+            " be in any of following states:\n\t-"
+            " ControllerResizeInProgress:\n\t\tState set when resize controller starts"
+            " resizing the volume in control-plane.\n\t-"
+            " ControllerResizeFailed:\n\t\tState set when resize has failed in resize"
+            " controller with a terminal error.\n\t- NodeResizePending:\n\t\tState set"
+            " when resize controller has finished resizing the volume but further"
+            " resizing of\n\t\tvolume is needed on the node.\n\t-"
+            " NodeResizeInProgress:\n\t\tState set when kubelet starts resizing the"
+            " volume.\n\t- NodeResizeFailed:\n\t\tState set when resizing has failed in"
+            " kubelet with a terminal error. Transient errors don't"
+            " set\n\t\tNodeResizeFailed.\nFor example: if expanding a PVC for more"
+            " capacity - this field can be one of the following states:\n\t-"
+            " pvc.status.allocatedResourceStatus['storage'] ="
+            ' "ControllerResizeInProgress"\n     -'
+            " pvc.status.allocatedResourceStatus['storage'] ="
+            ' "ControllerResizeFailed"\n     -'
+            " pvc.status.allocatedResourceStatus['storage'] = \"NodeResizePending\"\n  "
+            "   - pvc.status.allocatedResourceStatus['storage'] ="
+            ' "NodeResizeInProgress"\n     -'
+            " pvc.status.allocatedResourceStatus['storage'] ="
+            ' "NodeResizeFailed"\nWhen this field is not set, it means that no resize'
+            " operation is in progress for the given PVC.\n\nA controller that receives"
+            " PVC update with previously unknown resourceName or ClaimResourceStatus"
+            " should ignore the update for the purpose it was designed. For example - a"
+            " controller that only is responsible for resizing capacity of the volume,"
+            " should ignore PVC updates that change other valid resources associated"
+            " with PVC.\n\nThis is an alpha field and requires enabling"
+            " RecoverVolumeExpansionFailure feature."
+        ),
+    )
+    allocatedResources: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "allocatedResources tracks the resources allocated to a PVC including its"
+            " capacity. Key names follow standard Kubernetes label syntax. Valid values"
+            " are either:\n\t* Un-prefixed keys:\n\t\t- storage - the capacity of the"
+            " volume.\n\t* Custom resources must use implementation-defined prefixed"
+            ' names such as "example.com/my-custom-resource"\nApart from above values -'
+            " keys that are unprefixed or have kubernetes.io prefix are considered"
+            " reserved and hence may not be used.\n\nCapacity reported here may be"
+            " larger than the actual capacity when a volume expansion operation is"
+            " requested. For storage quota, the larger value from allocatedResources"
+            " and PVC.spec.resources is used. If allocatedResources is not set,"
+            " PVC.spec.resources alone is used for quota calculation. If a volume"
+            " expansion capacity request is lowered, allocatedResources is only lowered"
+            " if there are no expansion operations in progress and if the actual volume"
+            " capacity is equal or lower than the requested capacity.\n\nA controller"
+            " that receives PVC update with previously unknown resourceName should"
+            " ignore the update for the purpose it was designed. For example - a"
+            " controller that only is responsible for resizing capacity of the volume,"
+            " should ignore PVC updates that change other valid resources associated"
+            " with PVC.\n\nThis is an alpha field and requires enabling"
+            " RecoverVolumeExpansionFailure feature."
+        ),
+    )
+    capacity: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "capacity represents the actual resources of the underlying volume."
+        ),
+    )
+    conditions: Optional[List[PersistentVolumeClaimCondition]] = Field(
+        default=None,
+        description=(
+            "conditions is the current Condition of persistent volume claim. If"
+            " underlying persistent volume is being resized then the Condition will be"
+            " set to 'Resizing'."
+        ),
+    )
+    currentVolumeAttributesClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "currentVolumeAttributesClassName is the current name of the"
+            " VolumeAttributesClass the PVC is using. When unset, there is no"
+            " VolumeAttributeClass applied to this PersistentVolumeClaim This is an"
+            " alpha field and requires enabling VolumeAttributesClass feature."
+        ),
+    )
+    modifyVolumeStatus: Optional[ModifyVolumeStatus] = Field(
+        default=None,
+        description=(
+            "ModifyVolumeStatus represents the status object of ControllerModifyVolume"
+            " operation. When this is unset, there is no ModifyVolume operation being"
+            " attempted. This is an alpha field and requires enabling"
+            " VolumeAttributesClass feature."
+        ),
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description="phase represents the current phase of PersistentVolumeClaim.",
+    )
+
+
+class PersistentVolumeClaim(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PersistentVolumeClaim"
+    spec: Optional[PersistentVolumeClaimSpec] = Field(
+        default=None,
+        description=(
+            "spec defines the desired characteristics of a volume requested by a pod"
+            " author. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims"
+        ),
+    )
+    status: Optional[PersistentVolumeClaimStatus] = Field(
+        default=None,
+        description=(
+            "status represents the current information/status of a persistent volume"
+            " claim. Read-only. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims"
+        ),
+    )
+
+
+class PersistentVolumeClaimList(ObjectList[PersistentVolumeClaim]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PersistentVolumeClaimList"
@@ -0,0 +1,180 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from ....apimachinery.pkg.apis.meta import v1
+
+
+class TypedLocalObjectReference(BaseModel):
+    apiGroup: Optional[str] = Field(
+        default=None,
+        description=(
+            "APIGroup is the group for the resource being referenced. If APIGroup is"
+            " not specified, the specified Kind must be in the core API group. For any"
+            " other third-party types, APIGroup is required."
+        ),
+    )
+    kind: str = Field(..., description="Kind is the type of resource being referenced")
+    name: str = Field(..., description="Name is the name of resource being referenced")
+
+
+class TypedObjectReference(BaseModel):
+    apiGroup: Optional[str] = Field(
+        default=None,
+        description=(
+            "APIGroup is the group for the resource being referenced. If APIGroup is"
+            " not specified, the specified Kind must be in the core API group. For any"
+            " other third-party types, APIGroup is required."
+        ),
+    )
+    kind: str = Field(..., description="Kind is the type of resource being referenced")
+    name: str = Field(..., description="Name is the name of resource being referenced")
+    namespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "Namespace is the namespace of resource being referenced Note that when a"
+            " namespace is specified, a gateway.networking.k8s.io/ReferenceGrant object"
+            " is required in the referent namespace to allow that namespace's owner to"
+            " accept the reference. See the ReferenceGrant documentation for details."
+            " (Alpha) This field requires the CrossNamespaceVolumeDataSource feature"
+            " gate to be enabled."
+        ),
+    )
+
+
+class VolumeResourceRequirements(BaseModel):
+    limits: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Limits describes the maximum amount of compute resources allowed. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/"
+        ),
+    )
+    requests: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Requests describes the minimum amount of compute resources required. If"
+            " Requests is omitted for a container, it defaults to Limits if that is"
+            " explicitly specified, otherwise to an implementation-defined value."
+            " Requests cannot exceed Limits. More info:"
+            " https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/"
+        ),
+    )
+
+
+class PersistentVolumeClaimSpec(BaseModel):
+    accessModes: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "accessModes contains the desired access modes the volume should have. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1"
+        ),
+    )
+    dataSource: Optional[TypedLocalObjectReference] = Field(
+        default=None,
+        description=(
+            "dataSource field can be used to specify either: * An existing"
+            " VolumeSnapshot object (snapshot.storage.k8s.io/VolumeSnapshot) * An"
+            " existing PVC (PersistentVolumeClaim) If the provisioner or an external"
+            " controller can support the specified data source, it will create a new"
+            " volume based on the contents of the specified data source. When the"
+            " AnyVolumeDataSource feature gate is enabled, dataSource contents will be"
+            " copied to dataSourceRef, and dataSourceRef contents will be copied to"
+            " dataSource when dataSourceRef.namespace is not specified. If the"
+            " namespace is specified, then dataSourceRef will not be copied to"
+            " dataSource."
+        ),
+    )
+    dataSourceRef: Optional[TypedObjectReference] = Field(
+        default=None,
+        description=(
+            "dataSourceRef specifies the object from which to populate the volume with"
+            " data, if a non-empty volume is desired. This may be any object from a"
+            " non-empty API group (non core object) or a PersistentVolumeClaim object."
+            " When this field is specified, volume binding will only succeed if the"
+            " type of the specified object matches some installed volume populator or"
+            " dynamic provisioner. This field will replace the functionality of the"
+            " dataSource field and as such if both fields are non-empty, they must have"
+            " the same value. For backwards compatibility, when namespace isn't"
+            " specified in dataSourceRef, both fields (dataSource and dataSourceRef)"
+            " will be set to the same value automatically if one of them is empty and"
+            " the other is non-empty. When namespace is specified in dataSourceRef,"
+            " dataSource isn't set to the same value and must be empty. There are three"
+            " important differences between dataSource and dataSourceRef: * While"
+            " dataSource only allows two specific types of objects, dataSourceRef\n "
+            " allows any non-core object, as well as PersistentVolumeClaim objects.\n*"
+            " While dataSource ignores disallowed values (dropping them),"
+            " dataSourceRef\n  preserves all values, and generates an error if a"
+            " disallowed value is\n  specified.\n* While dataSource only allows local"
+            " objects, dataSourceRef allows objects\n  in any namespaces.\n(Beta) Using"
+            " this field requires the AnyVolumeDataSource feature gate to be enabled."
+            " (Alpha) Using the namespace field of dataSourceRef requires the"
+            " CrossNamespaceVolumeDataSource feature gate to be enabled."
+        ),
+    )
+    resources: Optional[VolumeResourceRequirements] = Field(
+        default=None,
+        description=(
+            "resources represents the minimum resources the volume should have. If"
+            " RecoverVolumeExpansionFailure feature is enabled users are allowed to"
+            " specify resource requirements that are lower than previous value but must"
+            " still be higher than capacity recorded in the status field of the claim."
+            " More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#resources"
+        ),
+    )
+    selector: Optional[v1.LabelSelector] = Field(
+        default=None,
+        description="selector is a label query over volumes to consider for binding.",
+    )
+    storageClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "storageClassName is the name of the StorageClass required by the claim."
+            " More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#class-1"
+        ),
+    )
+    volumeAttributesClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeAttributesClassName may be used to set the VolumeAttributesClass"
+            " used by this claim. If specified, the CSI driver will create or update"
+            " the volume with the attributes defined in the corresponding"
+            " VolumeAttributesClass. This has a different purpose than"
+            " storageClassName, it can be changed after the claim is created. An empty"
+            " string value means that no VolumeAttributesClass will be applied to the"
+            " claim but it's not allowed to reset this field to empty string once it is"
+            " set. If unspecified and the PersistentVolumeClaim is unbound, the default"
+            " VolumeAttributesClass will be set by the persistentvolume controller if"
+            " it exists. If the resource referred to by volumeAttributesClass does not"
+            " exist, this PersistentVolumeClaim will be set to a Pending state, as"
+            " reflected by the modifyVolumeStatus field, until such as a resource"
+            " exists. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volume-attributes-classes/"
+            " (Alpha) Using this field requires the VolumeAttributesClass feature gate"
+            " to be enabled."
+        ),
+    )
+    volumeMode: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeMode defines what type of volume is required by the claim. Value of"
+            " Filesystem is implied when not included in claim spec."
+        ),
+    )
+    volumeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeName is the binding reference to the PersistentVolume backing this"
+            " claim."
+        ),
+    )
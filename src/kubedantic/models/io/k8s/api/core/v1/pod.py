@@ -0,0 +1,425 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .container import ResourceRequirements
+from .pod_spec import PodSpec
+
+
+class ContainerStateWaiting(BaseModel):
+    message: Optional[str] = Field(
+        default=None,
+        description="Message regarding why the container is not yet running.",
+    )
+    reason: Optional[str] = Field(
+        default=None, description="(brief) reason the container is not yet running."
+    )
+
+
+class HostIP(BaseModel):
+    ip: Optional[str] = Field(
+        default=None, description="IP is the IP address assigned to the host"
+    )
+
+
+class PodIP(BaseModel):
+    ip: Optional[str] = Field(
+        default=None, description="IP is the IP address assigned to the pod"
+    )
+
+
+class PodResourceClaimStatus(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "Name uniquely identifies this resource claim inside the pod. This must"
+            " match the name of an entry in pod.spec.resourceClaims, which implies that"
+            " the string must be a DNS_LABEL."
+        ),
+    )
+    resourceClaimName: Optional[str] = Field(
+        default=None,
+        description=(
+            "ResourceClaimName is the name of the ResourceClaim that was generated for"
+            " the Pod in the namespace of the Pod. If this is unset, then generating a"
+            " ResourceClaim was not necessary. The pod.spec.resourceClaims entry can be"
+            " ignored in this case."
+        ),
+    )
+
+
+class VolumeMountStatus(BaseModel):
+    mountPath: str = Field(
+        ..., description="MountPath corresponds to the original VolumeMount."
+    )
+    name: str = Field(
+        ..., description="Name corresponds to the name of the original VolumeMount."
+    )
+    readOnly: Optional[bool] = Field(
+        default=None, description="ReadOnly corresponds to the original VolumeMount."
+    )
+    recursiveReadOnly: Optional[str] = Field(
+        default=None,
+        description=(
+            "RecursiveReadOnly must be set to Disabled, Enabled, or unspecified (for"
+            " non-readonly mounts). An IfPossible value in the original VolumeMount"
+            " must be translated to Disabled or Enabled, depending on the mount result."
+        ),
+    )
+
+
+class ContainerStateRunning(BaseModel):
+    startedAt: Optional[datetime] = Field(
+        default=None, description="Time at which the container was last (re-)started"
+    )
+
+
+class ContainerStateTerminated(BaseModel):
+    containerID: Optional[str] = Field(
+        default=None,
+        description="Container's ID in the format '<type>://<container_id>'",
+    )
+    exitCode: int = Field(
+        ..., description="Exit status from the last termination of the container"
+    )
+    finishedAt: Optional[datetime] = Field(
+        default=None, description="Time at which the container last terminated"
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="Message regarding the last termination of the container",
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description="(brief) reason from the last termination of the container",
+    )
+    signal: Optional[int] = Field(
+        default=None, description="Signal from the last termination of the container"
+    )
+    startedAt: Optional[datetime] = Field(
+        default=None,
+        description="Time at which previous execution of the container started",
+    )
+
+
+class PodCondition(BaseModel):
+    lastProbeTime: Optional[datetime] = Field(
+        default=None, description="Last time we probed the condition."
+    )
+    lastTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description="Last time the condition transitioned from one status to another.",
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="Human-readable message indicating details about last transition.",
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "Unique, one-word, CamelCase reason for the condition's last transition."
+        ),
+    )
+    status: str = Field(
+        ...,
+        description=(
+            "Status is the status of the condition. Can be True, False, Unknown. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-conditions"
+        ),
+    )
+    type: str = Field(
+        ...,
+        description=(
+            "Type is the type of the condition. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-conditions"
+        ),
+    )
+
+
+class ContainerState(BaseModel):
+    running: Optional[ContainerStateRunning] = Field(
+        default=None, description="Details about a running container"
+    )
+    terminated: Optional[ContainerStateTerminated] = Field(
+        default=None, description="Details about a terminated container"
+    )
+    waiting: Optional[ContainerStateWaiting] = Field(
+        default=None, description="Details about a waiting container"
+    )
+
+
+class ContainerStatus(BaseModel):
+    allocatedResources: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "AllocatedResources represents the compute resources allocated for this"
+            " container by the node. Kubelet sets this value to"
+            " Container.Resources.Requests upon successful pod admission and after"
+            " successfully admitting desired pod resize."
+        ),
+    )
+    containerID: Optional[str] = Field(
+        default=None,
+        description=(
+            "ContainerID is the ID of the container in the format"
+            " '<type>://<container_id>'. Where type is a container runtime identifier,"
+            ' returned from Version call of CRI API (for example "containerd").'
+        ),
+    )
+    image: str = Field(
+        ...,
+        description=(
+            "Image is the name of container image that the container is running. The"
+            " container image may not match the image used in the PodSpec, as it may"
+            " have been resolved by the runtime. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images."
+        ),
+    )
+    imageID: str = Field(
+        ...,
+        description=(
+            "ImageID is the image ID of the container's image. The image ID may not"
+            " match the image ID of the image used in the PodSpec, as it may have been"
+            " resolved by the runtime."
+        ),
+    )
+    lastState: Optional[ContainerState] = Field(
+        default=None,
+        description=(
+            "LastTerminationState holds the last termination state of the container to"
+            " help debug container crashes and restarts. This field is not populated if"
+            " the container is still running and RestartCount is 0."
+        ),
+    )
+    name: str = Field(
+        ...,
+        description=(
+            "Name is a DNS_LABEL representing the unique name of the container. Each"
+            " container in a pod must have a unique name across all container types."
+            " Cannot be updated."
+        ),
+    )
+    ready: bool = Field(
+        ...,
+        description=(
+            "Ready specifies whether the container is currently passing its readiness"
+            " check. The value will change as readiness probes keep executing. If no"
+            " readiness probes are specified, this field defaults to true once the"
+            " container is fully started (see Started field).\n\nThe value is typically"
+            " used to determine whether a container is ready to accept traffic."
+        ),
+    )
+    resources: Optional[ResourceRequirements] = Field(
+        default=None,
+        description=(
+            "Resources represents the compute resource requests and limits that have"
+            " been successfully enacted on the running container after it has been"
+            " started or has been successfully resized."
+        ),
+    )
+    restartCount: int = Field(
+        ...,
+        description=(
+            "RestartCount holds the number of times the container has been restarted."
+            " Kubelet makes an effort to always increment the value, but there are"
+            " cases when the state may be lost due to node restarts and then the value"
+            " may be reset to 0. The value is never negative."
+        ),
+    )
+    started: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Started indicates whether the container has finished its postStart"
+            " lifecycle hook and passed its startup probe. Initialized as false,"
+            " becomes true after startupProbe is considered successful. Resets to false"
+            " when the container is restarted, or if kubelet loses state temporarily."
+            " In both cases, startup probes will run again. Is always true when no"
+            " startupProbe is defined and container is running and has passed the"
+            " postStart lifecycle hook. The null value must be treated the same as"
+            " false."
+        ),
+    )
+    state: Optional[ContainerState] = Field(
+        default=None,
+        description="State holds details about the container's current condition.",
+    )
+    volumeMounts: Optional[List[VolumeMountStatus]] = Field(
+        default=None, description="Status of volume mounts."
+    )
+
+
+class PodStatus(BaseModel):
+    conditions: Optional[List[PodCondition]] = Field(
+        default=None,
+        description=(
+            "Current service state of pod. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-conditions"
+        ),
+    )
+    containerStatuses: Optional[List[ContainerStatus]] = Field(
+        default=None,
+        description=(
+            "The list has one entry per container in the manifest. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-and-container-status"
+        ),
+    )
+    ephemeralContainerStatuses: Optional[List[ContainerStatus]] = Field(
+        default=None,
+        description="Status for any ephemeral containers that have run in this pod.",
+    )
+    hostIP: Optional[str] = Field(
+        default=None,
+        description=(
+            "hostIP holds the IP address of the host to which the pod is assigned."
+            " Empty if the pod has not started yet. A pod can be assigned to a node"
+            " that has a problem in kubelet which in turns mean that HostIP will not be"
+            " updated even if there is a node is assigned to pod"
+        ),
+    )
+    hostIPs: Optional[List[HostIP]] = Field(
+        default=None,
+        description=(
+            "hostIPs holds the IP addresses allocated to the host. If this field is"
+            " specified, the first entry must match the hostIP field. This list is"
+            " empty if the pod has not started yet. A pod can be assigned to a node"
+            " that has a problem in kubelet which in turns means that HostIPs will not"
+            " be updated even if there is a node is assigned to this pod."
+        ),
+    )
+    initContainerStatuses: Optional[List[ContainerStatus]] = Field(
+        default=None,
+        description=(
+            "The list has one entry per init container in the manifest. The most recent"
+            " successful init container will have ready = true, the most recently"
+            " started container will have startTime set. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-and-container-status"
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description=(
+            "A human readable message indicating details about why the pod is in this"
+            " condition."
+        ),
+    )
+    nominatedNodeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "nominatedNodeName is set only when this pod preempts other pods on the"
+            " node, but it cannot be scheduled right away as preemption victims receive"
+            " their graceful termination periods. This field does not guarantee that"
+            " the pod will be scheduled on this node. Scheduler may decide to place the"
+            " pod elsewhere if other nodes become available sooner. Scheduler may also"
+            " decide to give the resources on this node to a higher priority pod that"
+            " is created after preemption. As a result, this field may be different"
+            " than PodSpec.nodeName when the pod is scheduled."
+        ),
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description=(
+            "The phase of a Pod is a simple, high-level summary of where the Pod is in"
+            " its lifecycle. The conditions array, the reason and message fields, and"
+            " the individual container status arrays contain more detail about the"
+            " pod's status. There are five possible phase values:\n\nPending: The pod"
+            " has been accepted by the Kubernetes system, but one or more of the"
+            " container images has not been created. This includes time before being"
+            " scheduled as well as time spent downloading images over the network,"
+            " which could take a while. Running: The pod has been bound to a node, and"
+            " all of the containers have been created. At least one container is still"
+            " running, or is in the process of starting or restarting. Succeeded: All"
+            " containers in the pod have terminated in success, and will not be"
+            " restarted. Failed: All containers in the pod have terminated, and at"
+            " least one container has terminated in failure. The container either"
+            " exited with non-zero status or was terminated by the system. Unknown: For"
+            " some reason the state of the pod could not be obtained, typically due to"
+            " an error in communicating with the host of the pod.\n\nMore info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-phase"
+        ),
+    )
+    podIP: Optional[str] = Field(
+        default=None,
+        description=(
+            "podIP address allocated to the pod. Routable at least within the cluster."
+            " Empty if not yet allocated."
+        ),
+    )
+    podIPs: Optional[List[PodIP]] = Field(
+        default=None,
+        description=(
+            "podIPs holds the IP addresses allocated to the pod. If this field is"
+            " specified, the 0th entry must match the podIP field. Pods may be"
+            " allocated at most 1 value for each of IPv4 and IPv6. This list is empty"
+            " if no IPs have been allocated yet."
+        ),
+    )
+    qosClass: Optional[str] = Field(
+        default=None,
+        description=(
+            "The Quality of Service (QOS) classification assigned to the pod based on"
+            " resource requirements See PodQOSClass type for available QOS classes More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-qos/#quality-of-service-classes"
+        ),
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "A brief CamelCase message indicating details about why the pod is in this"
+            " state. e.g. 'Evicted'"
+        ),
+    )
+    resize: Optional[str] = Field(
+        default=None,
+        description=(
+            "Status of resources resize desired for pod's containers. It is empty if"
+            " no resources resize is pending. Any changes to container resources will"
+            ' automatically set this to "Proposed"'
+        ),
+    )
+    resourceClaimStatuses: Optional[List[PodResourceClaimStatus]] = Field(
+        default=None, description="Status of resource claims."
+    )
+    startTime: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "RFC 3339 date and time at which the object was acknowledged by the"
+            " Kubelet. This is before the Kubelet pulled the container image(s) for the"
+            " pod."
+        ),
+    )
+
+
+class Pod(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "Pod"
+    spec: Optional[PodSpec] = Field(
+        default=None,
+        description=(
+            "Specification of the desired behavior of the pod. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+    status: Optional[PodStatus] = Field(
+        default=None,
+        description=(
+            "Most recently observed status of the pod. This data may not be up to date."
+            " Populated by the system. Read-only. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class PodList(ObjectList[Pod]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PodList"
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PodDNSConfigOption(BaseModel):
+    name: Optional[str] = Field(default=None, description="Required.")
+    value: Optional[str] = None
+
+
+class PodDNSConfig(BaseModel):
+    nameservers: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "A list of DNS name server IP addresses. This will be appended to the base"
+            " nameservers generated from DNSPolicy. Duplicated nameservers will be"
+            " removed."
+        ),
+    )
+    options: Optional[List[PodDNSConfigOption]] = Field(
+        default=None,
+        description=(
+            "A list of DNS resolver options. This will be merged with the base options"
+            " generated from DNSPolicy. Duplicated entries will be removed. Resolution"
+            " options given in Options will override those that appear in the base"
+            " DNSPolicy."
+        ),
+    )
+    searches: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "A list of DNS search domains for host-name lookup. This will be appended"
+            " to the base search paths generated from DNSPolicy. Duplicated search"
+            " paths will be removed."
+        ),
+    )
@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ClaimSource(BaseModel):
+    resourceClaimName: Optional[str] = Field(
+        default=None,
+        description=(
+            "ResourceClaimName is the name of a ResourceClaim object in the same"
+            " namespace as this pod."
+        ),
+    )
+    resourceClaimTemplateName: Optional[str] = Field(
+        default=None,
+        description=(
+            "ResourceClaimTemplateName is the name of a ResourceClaimTemplate object in"
+            " the same namespace as this pod.\n\nThe template will be used to create a"
+            " new ResourceClaim, which will be bound to this pod. When this pod is"
+            " deleted, the ResourceClaim will also be deleted. The pod name and"
+            " resource name, along with a generated component, will be used to form a"
+            " unique name for the ResourceClaim, which will be recorded in"
+            " pod.status.resourceClaimStatuses.\n\nThis field is immutable and no"
+            " changes will be made to the corresponding ResourceClaim by the control"
+            " plane after creating the ResourceClaim."
+        ),
+    )
+
+
+class PodResourceClaim(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "Name uniquely identifies this resource claim inside the pod. This must be"
+            " a DNS_LABEL."
+        ),
+    )
+    source: Optional[ClaimSource] = Field(
+        default=None, description="Source describes where to find the ResourceClaim."
+    )
@@ -0,0 +1,136 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from .app_armor_profile import (
+    AppArmorProfile,
+    SeccompProfile,
+    SELinuxOptions,
+    WindowsSecurityContextOptions,
+)
+
+
+class Sysctl(BaseModel):
+    name: str = Field(..., description="Name of a property to set")
+    value: str = Field(..., description="Value of a property to set")
+
+
+class PodSecurityContext(BaseModel):
+    appArmorProfile: Optional[AppArmorProfile] = Field(
+        default=None,
+        description=(
+            "appArmorProfile is the AppArmor options to use by the containers in this"
+            " pod. Note that this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    fsGroup: Optional[int] = Field(
+        default=None,
+        description=(
+            "A special supplemental group that applies to all containers in a pod. Some"
+            " volume types allow the Kubelet to change the ownership of that volume to"
+            " be owned by the pod:\n\n1. The owning GID will be the FSGroup 2. The"
+            " setgid bit is set (new files created in the volume will be owned by"
+            " FSGroup) 3. The permission bits are OR'd with rw-rw----\n\nIf unset, the"
+            " Kubelet will not modify the ownership and permissions of any volume. Note"
+            " that this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    fsGroupChangePolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsGroupChangePolicy defines behavior of changing ownership and permission"
+            " of the volume before being exposed inside Pod. This field will only apply"
+            " to volume types which support fsGroup based ownership(and permissions)."
+            " It will have no effect on ephemeral volume types such as: secret,"
+            ' configmaps and emptydir. Valid values are "OnRootMismatch" and "Always".'
+            ' If not specified, "Always" is used. Note that this field cannot be set'
+            " when spec.os.name is windows."
+        ),
+    )
+    runAsGroup: Optional[int] = Field(
+        default=None,
+        description=(
+            "The GID to run the entrypoint of the container process. Uses runtime"
+            " default if unset. May also be set in SecurityContext.  If set in both"
+            " SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence for that container. Note that this field"
+            " cannot be set when spec.os.name is windows."
+        ),
+    )
+    runAsNonRoot: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Indicates that the container must run as a non-root user. If true, the"
+            " Kubelet will validate the image at runtime to ensure that it does not run"
+            " as UID 0 (root) and fail to start the container if it does. If unset or"
+            " false, no such validation will be performed. May also be set in"
+            " SecurityContext.  If set in both SecurityContext and PodSecurityContext,"
+            " the value specified in SecurityContext takes precedence."
+        ),
+    )
+    runAsUser: Optional[int] = Field(
+        default=None,
+        description=(
+            "The UID to run the entrypoint of the container process. Defaults to user"
+            " specified in image metadata if unspecified. May also be set in"
+            " SecurityContext.  If set in both SecurityContext and PodSecurityContext,"
+            " the value specified in SecurityContext takes precedence for that"
+            " container. Note that this field cannot be set when spec.os.name is"
+            " windows."
+        ),
+    )
+    seLinuxOptions: Optional[SELinuxOptions] = Field(
+        default=None,
+        description=(
+            "The SELinux context to be applied to all containers. If unspecified, the"
+            " container runtime will allocate a random SELinux context for each"
+            " container.  May also be set in SecurityContext.  If set in both"
+            " SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence for that container. Note that this field"
+            " cannot be set when spec.os.name is windows."
+        ),
+    )
+    seccompProfile: Optional[SeccompProfile] = Field(
+        default=None,
+        description=(
+            "The seccomp options to use by the containers in this pod. Note that this"
+            " field cannot be set when spec.os.name is windows."
+        ),
+    )
+    supplementalGroups: Optional[List[int]] = Field(
+        default=None,
+        description=(
+            "A list of groups applied to the first process run in each container, in"
+            " addition to the container's primary GID, the fsGroup (if specified), and"
+            " group memberships defined in the container image for the uid of the"
+            " container process. If unspecified, no additional groups are added to any"
+            " container. Note that group memberships defined in the container image for"
+            " the uid of the container process are still effective, even if they are"
+            " not included in this list. Note that this field cannot be set when"
+            " spec.os.name is windows."
+        ),
+    )
+    sysctls: Optional[List[Sysctl]] = Field(
+        default=None,
+        description=(
+            "Sysctls hold a list of namespaced sysctls used for the pod. Pods with"
+            " unsupported sysctls (by the container runtime) might fail to launch. Note"
+            " that this field cannot be set when spec.os.name is windows."
+        ),
+    )
+    windowsOptions: Optional[WindowsSecurityContextOptions] = Field(
+        default=None,
+        description=(
+            "The Windows specific settings applied to all containers. If unspecified,"
+            " the options within a container's SecurityContext will be used. If set in"
+            " both SecurityContext and PodSecurityContext, the value specified in"
+            " SecurityContext takes precedence. Note that this field cannot be set when"
+            " spec.os.name is linux."
+        ),
+    )
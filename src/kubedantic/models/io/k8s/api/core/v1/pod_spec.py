@@ -0,0 +1,601 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from ....apimachinery.pkg.apis.meta import v1
+from .affinity import Affinity
+from .container import Container, EphemeralContainer
+from .local_object_reference import LocalObjectReference
+from .pod_dns_config import PodDNSConfig
+from .pod_resource_claim import PodResourceClaim
+from .pod_security_context import PodSecurityContext
+from .volume import Volume
+
+
+class HostAlias(BaseModel):
+    hostnames: Optional[List[str]] = Field(
+        default=None, description="Hostnames for the above IP address."
+    )
+    ip: Optional[str] = Field(
+        default=None, description="IP address of the host file entry."
+    )
+
+
+class PodOS(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "Name is the name of the operating system. The currently supported values"
+            " are linux and windows. Additional value may be defined in future and can"
+            " be one of:"
+            " https://github.com/opencontainers/runtime-spec/blob/master/config.md#platform-specific-configuration"
+            " Clients should expect to handle additional values and treat unrecognized"
+            " values in this field as os: null"
+        ),
+    )
+
+
+class PodReadinessGate(BaseModel):
+    conditionType: str = Field(
+        ...,
+        description=(
+            "ConditionType refers to a condition in the pod's condition list with"
+            " matching type."
+        ),
+    )
+
+
+class PodSchedulingGate(BaseModel):
+    name: str = Field(
+        ...,
+        description=(
+            "Name of the scheduling gate. Each scheduling gate must have a unique name"
+            " field."
+        ),
+    )
+
+
+class Toleration(BaseModel):
+    effect: Optional[str] = Field(
+        default=None,
+        description=(
+            "Effect indicates the taint effect to match. Empty means match all taint"
+            " effects. When specified, allowed values are NoSchedule, PreferNoSchedule"
+            " and NoExecute."
+        ),
+    )
+    key: Optional[str] = Field(
+        default=None,
+        description=(
+            "Key is the taint key that the toleration applies to. Empty means match all"
+            " taint keys. If the key is empty, operator must be Exists; this"
+            " combination means to match all values and all keys."
+        ),
+    )
+    operator: Optional[str] = Field(
+        default=None,
+        description=(
+            "Operator represents a key's relationship to the value. Valid operators are"
+            " Exists and Equal. Defaults to Equal. Exists is equivalent to wildcard for"
+            " value, so that a pod can tolerate all taints of a particular category."
+        ),
+    )
+    tolerationSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "TolerationSeconds represents the period of time the toleration (which must"
+            " be of effect NoExecute, otherwise this field is ignored) tolerates the"
+            " taint. By default, it is not set, which means tolerate the taint forever"
+            " (do not evict). Zero and negative values will be treated as 0 (evict"
+            " immediately) by the system."
+        ),
+    )
+    value: Optional[str] = Field(
+        default=None,
+        description=(
+            "Value is the taint value the toleration matches to. If the operator is"
+            " Exists, the value should be empty, otherwise just a regular string."
+        ),
+    )
+
+
+class TopologySpreadConstraint(BaseModel):
+    labelSelector: Optional[v1.LabelSelector] = Field(
+        default=None,
+        description=(
+            "LabelSelector is used to find matching pods. Pods that match this label"
+            " selector are counted to determine the number of pods in their"
+            " corresponding topology domain."
+        ),
+    )
+    matchLabelKeys: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "MatchLabelKeys is a set of pod label keys to select the pods over which"
+            " spreading will be calculated. The keys are used to lookup values from the"
+            " incoming pod labels, those key-value labels are ANDed with labelSelector"
+            " to select the group of existing pods over which spreading will be"
+            " calculated for the incoming pod. The same key is forbidden to exist in"
+            " both MatchLabelKeys and LabelSelector. MatchLabelKeys cannot be set when"
+            " LabelSelector isn't set. Keys that don't exist in the incoming pod labels"
+            " will be ignored. A null or empty list means only match against"
+            " labelSelector.\n\nThis is a beta field and requires the"
+            " MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by"
+            " default)."
+        ),
+    )
+    maxSkew: int = Field(
+        ...,
+        description=(
+            "MaxSkew describes the degree to which pods may be unevenly distributed."
+            " When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted"
+            " difference between the number of matching pods in the target topology and"
+            " the global minimum. The global minimum is the minimum number of matching"
+            " pods in an eligible domain or zero if the number of eligible domains is"
+            " less than MinDomains. For example, in a 3-zone cluster, MaxSkew is set to"
+            " 1, and pods with the same labelSelector spread as 2/2/1: In this case,"
+            " the global minimum is 1. | zone1 | zone2 | zone3 | |  P P  |  P P  |   P "
+            "  | - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to"
+            " become 2/2/2; scheduling it onto zone1(zone2) would make the"
+            " ActualSkew(3-1) on zone1(zone2) violate MaxSkew(1). - if MaxSkew is 2,"
+            " incoming pod can be scheduled onto any zone. When"
+            " `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence"
+            " to topologies that satisfy it. It's a required field. Default value is 1"
+            " and 0 is not allowed."
+        ),
+    )
+    minDomains: Optional[int] = Field(
+        default=None,
+        description=(
+            "MinDomains indicates a minimum number of eligible domains. When the number"
+            " of eligible domains with matching topology keys is less than minDomains,"
+            ' Pod Topology Spread treats "global minimum" as 0, and then the'
+            " calculation of Skew is performed. And when the number of eligible domains"
+            " with matching topology keys equals or greater than minDomains, this value"
+            " has no effect on scheduling. As a result, when the number of eligible"
+            " domains is less than minDomains, scheduler won't schedule more than"
+            " maxSkew Pods to those domains. If value is nil, the constraint behaves as"
+            " if MinDomains is equal to 1. Valid values are integers greater than 0."
+            " When value is not nil, WhenUnsatisfiable must be DoNotSchedule.\n\nFor"
+            " example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5"
+            " and pods with the same labelSelector spread as 2/2/2: | zone1 | zone2 |"
+            " zone3 | |  P P  |  P P  |  P P  | The number of domains is less than"
+            ' 5(MinDomains), so "global minimum" is treated as 0. In this situation,'
+            " new pod with the same labelSelector cannot be scheduled, because computed"
+            " skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,"
+            " it will violate MaxSkew."
+        ),
+    )
+    nodeAffinityPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "NodeAffinityPolicy indicates how we will treat Pod's"
+            " nodeAffinity/nodeSelector when calculating pod topology spread skew."
+            " Options are: - Honor: only nodes matching nodeAffinity/nodeSelector are"
+            " included in the calculations. - Ignore: nodeAffinity/nodeSelector are"
+            " ignored. All nodes are included in the calculations.\n\nIf this value is"
+            " nil, the behavior is equivalent to the Honor policy. This is a beta-level"
+            " feature default enabled by the NodeInclusionPolicyInPodTopologySpread"
+            " feature flag."
+        ),
+    )
+    nodeTaintsPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "NodeTaintsPolicy indicates how we will treat node taints when calculating"
+            " pod topology spread skew. Options are: - Honor: nodes without taints,"
+            " along with tainted nodes for which the incoming pod has a toleration, are"
+            " included. - Ignore: node taints are ignored. All nodes are"
+            " included.\n\nIf this value is nil, the behavior is equivalent to the"
+            " Ignore policy. This is a beta-level feature default enabled by the"
+            " NodeInclusionPolicyInPodTopologySpread feature flag."
+        ),
+    )
+    topologyKey: str = Field(
+        ...,
+        description=(
+            "TopologyKey is the key of node labels. Nodes that have a label with this"
+            " key and identical values are considered to be in the same topology. We"
+            ' consider each <key, value> as a "bucket", and try to put balanced number'
+            " of pods into each bucket. We define a domain as a particular instance of"
+            " a topology. Also, we define an eligible domain as a domain whose nodes"
+            " meet the requirements of nodeAffinityPolicy and nodeTaintsPolicy. e.g. If"
+            ' TopologyKey is "kubernetes.io/hostname", each Node is a domain of that'
+            ' topology. And, if TopologyKey is "topology.kubernetes.io/zone", each zone'
+            " is a domain of that topology. It's a required field."
+        ),
+    )
+    whenUnsatisfiable: str = Field(
+        ...,
+        description=(
+            "WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy"
+            " the spread constraint. - DoNotSchedule (default) tells the scheduler not"
+            " to schedule it. - ScheduleAnyway tells the scheduler to schedule the pod"
+            " in any location,\n  but giving higher precedence to topologies that would"
+            ' help reduce the\n  skew.\nA constraint is considered "Unsatisfiable" for'
+            " an incoming pod if and only if every possible node assignment for that"
+            ' pod would violate "MaxSkew" on some topology. For example, in a 3-zone'
+            " cluster, MaxSkew is set to 1, and pods with the same labelSelector spread"
+            " as 3/1/1: | zone1 | zone2 | zone3 | | P P P |   P   |   P   | If"
+            " WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be"
+            " scheduled to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on"
+            " zone2(zone3) satisfies MaxSkew(1). In other words, the cluster can still"
+            " be imbalanced, but scheduler won't make it *more* imbalanced. It's a"
+            " required field."
+        ),
+    )
+
+
+class PodSpec(BaseModel):
+    activeDeadlineSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Optional duration in seconds the pod may be active on the node relative to"
+            " StartTime before the system will actively try to mark it failed and kill"
+            " associated containers. Value must be a positive integer."
+        ),
+    )
+    affinity: Optional[Affinity] = Field(
+        default=None, description="If specified, the pod's scheduling constraints"
+    )
+    automountServiceAccountToken: Optional[bool] = Field(
+        default=None,
+        description=(
+            "AutomountServiceAccountToken indicates whether a service account token"
+            " should be automatically mounted."
+        ),
+    )
+    containers: List[Container] = Field(
+        ...,
+        description=(
+            "List of containers belonging to the pod. Containers cannot currently be"
+            " added or removed. There must be at least one container in a Pod. Cannot"
+            " be updated."
+        ),
+    )
+    dnsConfig: Optional[PodDNSConfig] = Field(
+        default=None,
+        description=(
+            "Specifies the DNS parameters of a pod. Parameters specified here will be"
+            " merged to the generated DNS configuration based on DNSPolicy."
+        ),
+    )
+    dnsPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            'Set DNS policy for the pod. Defaults to "ClusterFirst". Valid values are'
+            " 'ClusterFirstWithHostNet', 'ClusterFirst', 'Default' or 'None'. DNS"
+            " parameters given in DNSConfig will be merged with the policy selected"
+            " with DNSPolicy. To have DNS options set along with hostNetwork, you have"
+            " to specify DNS policy explicitly to 'ClusterFirstWithHostNet'."
+        ),
+    )
+    enableServiceLinks: Optional[bool] = Field(
+        default=None,
+        description=(
+            "EnableServiceLinks indicates whether information about services should be"
+            " injected into pod's environment variables, matching the syntax of Docker"
+            " links. Optional: Defaults to true."
+        ),
+    )
+    ephemeralContainers: Optional[List[EphemeralContainer]] = Field(
+        default=None,
+        description=(
+            "List of ephemeral containers run in this pod. Ephemeral containers may be"
+            " run in an existing pod to perform user-initiated actions such as"
+            " debugging. This list cannot be specified when creating a pod, and it"
+            " cannot be modified by updating the pod spec. In order to add an ephemeral"
+            " container to an existing pod, use the pod's ephemeralcontainers"
+            " subresource."
+        ),
+    )
+    hostAliases: Optional[List[HostAlias]] = Field(
+        default=None,
+        description=(
+            "HostAliases is an optional list of hosts and IPs that will be injected"
+            " into the pod's hosts file if specified."
+        ),
+    )
+    hostIPC: Optional[bool] = Field(
+        default=None,
+        description="Use the host's ipc namespace. Optional: Default to false.",
+    )
+    hostNetwork: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Host networking requested for this pod. Use the host's network namespace."
+            " If this option is set, the ports that will be used must be specified."
+            " Default to false."
+        ),
+    )
+    hostPID: Optional[bool] = Field(
+        default=None,
+        description="Use the host's pid namespace. Optional: Default to false.",
+    )
+    hostUsers: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Use the host's user namespace. Optional: Default to true. If set to true"
+            " or not present, the pod will be run in the host user namespace, useful"
+            " for when the pod needs a feature only available to the host user"
+            " namespace, such as loading a kernel module with CAP_SYS_MODULE. When set"
+            " to false, a new userns is created for the pod. Setting false is useful"
+            " for mitigating container breakout vulnerabilities even allowing users to"
+            " run their containers as root without actually having root privileges on"
+            " the host. This field is alpha-level and is only honored by servers that"
+            " enable the UserNamespacesSupport feature."
+        ),
+    )
+    hostname: Optional[str] = Field(
+        default=None,
+        description=(
+            "Specifies the hostname of the Pod If not specified, the pod's hostname"
+            " will be set to a system-defined value."
+        ),
+    )
+    imagePullSecrets: Optional[List[LocalObjectReference]] = Field(
+        default=None,
+        description=(
+            "ImagePullSecrets is an optional list of references to secrets in the same"
+            " namespace to use for pulling any of the images used by this PodSpec. If"
+            " specified, these secrets will be passed to individual puller"
+            " implementations for them to use. More info:"
+            " https://kubernetes.io/docs/concepts/containers/images#specifying-imagepullsecrets-on-a-pod"
+        ),
+    )
+    initContainers: Optional[List[Container]] = Field(
+        default=None,
+        description=(
+            "List of initialization containers belonging to the pod. Init containers"
+            " are executed in order prior to containers being started. If any init"
+            " container fails, the pod is considered to have failed and is handled"
+            " according to its restartPolicy. The name for an init container or normal"
+            " container must be unique among all containers. Init containers may not"
+            " have Lifecycle actions, Readiness probes, Liveness probes, or Startup"
+            " probes. The resourceRequirements of an init container are taken into"
+            " account during scheduling by finding the highest request/limit for each"
+            " resource type, and then using the max of of that value or the sum of the"
+            " normal containers. Limits are applied to init containers in a similar"
+            " fashion. Init containers cannot currently be added or removed. Cannot be"
+            " updated. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/init-containers/"
+        ),
+    )
+    nodeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "NodeName indicates in which node this pod is scheduled. If empty, this pod"
+            " is a candidate for scheduling by the scheduler defined in schedulerName."
+            " Once this field is set, the kubelet for this node becomes responsible for"
+            " the lifecycle of this pod. This field should not be used to express a"
+            " desire for the pod to be scheduled on a specific node."
+            " https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#nodename"
+        ),
+    )
+    nodeSelector: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "NodeSelector is a selector which must be true for the pod to fit on a"
+            " node. Selector which must match a node's labels for the pod to be"
+            " scheduled on that node. More info:"
+            " https://kubernetes.io/docs/concepts/configuration/assign-pod-node/"
+        ),
+    )
+    os: Optional[PodOS] = Field(
+        default=None,
+        description=(
+            "Specifies the OS of the containers in the pod. Some pod and container"
+            " fields are restricted if this is set.\n\nIf the OS field is set to linux,"
+            " the following fields must be unset: -securityContext.windowsOptions\n\nIf"
+            " the OS field is set to windows, following fields must be unset: -"
+            " spec.hostPID - spec.hostIPC - spec.hostUsers -"
+            " spec.securityContext.appArmorProfile -"
+            " spec.securityContext.seLinuxOptions - spec.securityContext.seccompProfile"
+            " - spec.securityContext.fsGroup - spec.securityContext.fsGroupChangePolicy"
+            " - spec.securityContext.sysctls - spec.shareProcessNamespace -"
+            " spec.securityContext.runAsUser - spec.securityContext.runAsGroup -"
+            " spec.securityContext.supplementalGroups -"
+            " spec.containers[*].securityContext.appArmorProfile -"
+            " spec.containers[*].securityContext.seLinuxOptions -"
+            " spec.containers[*].securityContext.seccompProfile -"
+            " spec.containers[*].securityContext.capabilities -"
+            " spec.containers[*].securityContext.readOnlyRootFilesystem -"
+            " spec.containers[*].securityContext.privileged -"
+            " spec.containers[*].securityContext.allowPrivilegeEscalation -"
+            " spec.containers[*].securityContext.procMount -"
+            " spec.containers[*].securityContext.runAsUser -"
+            " spec.containers[*].securityContext.runAsGroup"
+        ),
+    )
+    overhead: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Overhead represents the resource overhead associated with running a pod"
+            " for a given RuntimeClass. This field will be autopopulated at admission"
+            " time by the RuntimeClass admission controller. If the RuntimeClass"
+            " admission controller is enabled, overhead must not be set in Pod create"
+            " requests. The RuntimeClass admission controller will reject Pod create"
+            " requests which have the overhead already set. If RuntimeClass is"
+            " configured and selected in the PodSpec, Overhead will be set to the value"
+            " defined in the corresponding RuntimeClass, otherwise it will remain unset"
+            " and treated as zero. More info:"
+            " https://git.k8s.io/enhancements/keps/sig-node/688-pod-overhead/README.md"
+        ),
+    )
+    preemptionPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "PreemptionPolicy is the Policy for preempting pods with lower priority."
+            " One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if"
+            " unset."
+        ),
+    )
+    priority: Optional[int] = Field(
+        default=None,
+        description=(
+            "The priority value. Various system components use this field to find the"
+            " priority of the pod. When Priority Admission Controller is enabled, it"
+            " prevents users from setting this field. The admission controller"
+            " populates this field from PriorityClassName. The higher the value, the"
+            " higher the priority."
+        ),
+    )
+    priorityClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            'If specified, indicates the pod\'s priority. "system-node-critical" and'
+            ' "system-cluster-critical" are two special keywords which indicate the'
+            " highest priorities with the former being the highest priority. Any other"
+            " name must be defined by creating a PriorityClass object with that name."
+            " If not specified, the pod priority will be default or zero if there is no"
+            " default."
+        ),
+    )
+    readinessGates: Optional[List[PodReadinessGate]] = Field(
+        default=None,
+        description=(
+            "If specified, all readiness gates will be evaluated for pod readiness. A"
+            " pod is ready when all its containers are ready AND all conditions"
+            ' specified in the readiness gates have status equal to "True" More info:'
+            " https://git.k8s.io/enhancements/keps/sig-network/580-pod-readiness-gates"
+        ),
+    )
+    resourceClaims: Optional[List[PodResourceClaim]] = Field(
+        default=None,
+        description=(
+            "ResourceClaims defines which ResourceClaims must be allocated and reserved"
+            " before the Pod is allowed to start. The resources will be made available"
+            " to those containers which consume them by name.\n\nThis is an alpha field"
+            " and requires enabling the DynamicResourceAllocation feature gate.\n\nThis"
+            " field is immutable."
+        ),
+    )
+    restartPolicy: Optional[str] = Field(
+        default=None,
+        description=(
+            "Restart policy for all containers within the pod. One of Always,"
+            " OnFailure, Never. In some contexts, only a subset of those values may be"
+            " permitted. Default to Always. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#restart-policy"
+        ),
+    )
+    runtimeClassName: Optional[str] = Field(
+        default=None,
+        description=(
+            "RuntimeClassName refers to a RuntimeClass object in the node.k8s.io group,"
+            " which should be used to run this pod.  If no RuntimeClass resource"
+            " matches the named class, the pod will not be run. If unset or empty, the"
+            ' "legacy" RuntimeClass will be used, which is an implicit class with an'
+            " empty definition that uses the default runtime handler. More info:"
+            " https://git.k8s.io/enhancements/keps/sig-node/585-runtime-class"
+        ),
+    )
+    schedulerName: Optional[str] = Field(
+        default=None,
+        description=(
+            "If specified, the pod will be dispatched by specified scheduler. If not"
+            " specified, the pod will be dispatched by default scheduler."
+        ),
+    )
+    schedulingGates: Optional[List[PodSchedulingGate]] = Field(
+        default=None,
+        description=(
+            "SchedulingGates is an opaque list of values that if specified will block"
+            " scheduling the pod. If schedulingGates is not empty, the pod will stay in"
+            " the SchedulingGated state and the scheduler will not attempt to schedule"
+            " the pod.\n\nSchedulingGates can only be set at pod creation time, and be"
+            " removed only afterwards."
+        ),
+    )
+    securityContext: Optional[PodSecurityContext] = Field(
+        default=None,
+        description=(
+            "SecurityContext holds pod-level security attributes and common container"
+            " settings. Optional: Defaults to empty.  See type description for default"
+            " values of each field."
+        ),
+    )
+    serviceAccount: Optional[str] = Field(
+        default=None,
+        description=(
+            "DeprecatedServiceAccount is a deprecated alias for ServiceAccountName."
+            " Deprecated: Use serviceAccountName instead."
+        ),
+    )
+    serviceAccountName: Optional[str] = Field(
+        default=None,
+        description=(
+            "ServiceAccountName is the name of the ServiceAccount to use to run this"
+            " pod. More info:"
+            " https://kubernetes.io/docs/tasks/configure-pod-container/configure-service-account/"
+        ),
+    )
+    setHostnameAsFQDN: Optional[bool] = Field(
+        default=None,
+        description=(
+            "If true the pod's hostname will be configured as the pod's FQDN, rather"
+            " than the leaf name (the default). In Linux containers, this means setting"
+            " the FQDN in the hostname field of the kernel (the nodename field of"
+            " struct utsname). In Windows containers, this means setting the registry"
+            " value of hostname for the registry key"
+            " HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Services\\Tcpip\\Parameters"
+            " to FQDN. If a pod does not have FQDN, this has no effect. Default to"
+            " false."
+        ),
+    )
+    shareProcessNamespace: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Share a single process namespace between all of the containers in a pod."
+            " When this is set containers will be able to view and signal processes"
+            " from other containers in the same pod, and the first process in each"
+            " container will not be assigned PID 1. HostPID and ShareProcessNamespace"
+            " cannot both be set. Optional: Default to false."
+        ),
+    )
+    subdomain: Optional[str] = Field(
+        default=None,
+        description=(
+            "If specified, the fully qualified Pod hostname will be"
+            ' "<hostname>.<subdomain>.<pod namespace>.svc.<cluster domain>". If not'
+            " specified, the pod will not have a domainname at all."
+        ),
+    )
+    terminationGracePeriodSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Optional duration in seconds the pod needs to terminate gracefully. May be"
+            " decreased in delete request. Value must be non-negative integer. The"
+            " value zero indicates stop immediately via the kill signal (no opportunity"
+            " to shut down). If this value is nil, the default grace period will be"
+            " used instead. The grace period is the duration in seconds after the"
+            " processes running in the pod are sent a termination signal and the time"
+            " when the processes are forcibly halted with a kill signal. Set this value"
+            " longer than the expected cleanup time for your process. Defaults to 30"
+            " seconds."
+        ),
+    )
+    tolerations: Optional[List[Toleration]] = Field(
+        default=None, description="If specified, the pod's tolerations."
+    )
+    topologySpreadConstraints: Optional[List[TopologySpreadConstraint]] = Field(
+        default=None,
+        description=(
+            "TopologySpreadConstraints describes how a group of pods ought to spread"
+            " across topology domains. Scheduler will schedule pods in a way which"
+            " abides by the constraints. All topologySpreadConstraints are ANDed."
+        ),
+    )
+    volumes: Optional[List[Volume]] = Field(
+        default=None,
+        description=(
+            "List of volumes that can be mounted by containers belonging to the pod."
+            " More info: https://kubernetes.io/docs/concepts/storage/volumes"
+        ),
+    )
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .pod_template_spec import PodTemplateSpec
+
+
+class PodTemplate(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PodTemplate"
+    template: Optional[PodTemplateSpec] = Field(
+        default=None,
+        description=(
+            "Template defines the pods that will be created from this pod template."
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class PodTemplateList(ObjectList[PodTemplate]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "PodTemplateList"
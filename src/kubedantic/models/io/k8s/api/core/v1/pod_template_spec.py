@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from ....apimachinery.pkg.apis.meta import v1
+from .pod_spec import PodSpec
+
+
+class PodTemplateSpec(BaseModel):
+    metadata: Optional[v1.ObjectMeta] = Field(
+        default=None,
+        description=(
+            "Standard object's metadata. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
+        ),
+    )
+    spec: Optional[PodSpec] = Field(
+        default=None,
+        description=(
+            "Specification of the desired behavior of the pod. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
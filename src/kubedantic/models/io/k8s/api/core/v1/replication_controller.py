@@ -0,0 +1,144 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .pod_template_spec import PodTemplateSpec
+
+
+class ReplicationControllerCondition(BaseModel):
+    lastTransitionTime: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "The last time the condition transitioned from one status to another."
+        ),
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="A human readable message indicating details about the transition.",
+    )
+    reason: Optional[str] = Field(
+        default=None, description="The reason for the condition's last transition."
+    )
+    status: str = Field(
+        ..., description="Status of the condition, one of True, False, Unknown."
+    )
+    type: str = Field(..., description="Type of replication controller condition.")
+
+
+class ReplicationControllerStatus(BaseModel):
+    availableReplicas: Optional[int] = Field(
+        default=None,
+        description=(
+            "The number of available replicas (ready for at least minReadySeconds) for"
+            " this replication controller."
+        ),
+    )
+    conditions: Optional[List[ReplicationControllerCondition]] = Field(
+        default=None,
+        description=(
+            "Represents the latest available observations of a replication controller's"
+            " current state."
+        ),
+    )
+    fullyLabeledReplicas: Optional[int] = Field(
+        default=None,
+        description=(
+            "The number of pods that have labels matching the labels of the pod"
+            " template of the replication controller."
+        ),
+    )
+    observedGeneration: Optional[int] = Field(
+        default=None,
+        description=(
+            "ObservedGeneration reflects the generation of the most recently observed"
+            " replication controller."
+        ),
+    )
+    readyReplicas: Optional[int] = Field(
+        default=None,
+        description="The number of ready replicas for this replication controller.",
+    )
+    replicas: int = Field(
+        ...,
+        description=(
+            "Replicas is the most recently observed number of replicas. More info:"
+            " https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller"
+        ),
+    )
+
+
+class ReplicationControllerSpec(BaseModel):
+    minReadySeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Minimum number of seconds for which a newly created pod should be ready"
+            " without any of its container crashing, for it to be considered available."
+            " Defaults to 0 (pod will be considered available as soon as it is ready)"
+        ),
+    )
+    replicas: Optional[int] = Field(
+        default=None,
+        description=(
+            "Replicas is the number of desired replicas. This is a pointer to"
+            " distinguish between explicit zero and unspecified. Defaults to 1. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller"
+        ),
+    )
+    selector: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "Selector is a label query over pods that should match the Replicas count."
+            " If Selector is empty, it is defaulted to the labels present on the Pod"
+            " template. Label keys and values that must match in order to be controlled"
+            " by this replication controller, if empty defaulted to labels on Pod"
+            " template. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors"
+        ),
+    )
+    template: Optional[PodTemplateSpec] = Field(
+        default=None,
+        description=(
+            "Template is the object that describes the pod that will be created if"
+            " insufficient replicas are detected. This takes precedence over a"
+            " TemplateRef. The only allowed template.spec.restartPolicy value is"
+            ' "Always". More info:'
+            " https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template"
+        ),
+    )
+
+
+class ReplicationController(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ReplicationController"
+    spec: Optional[ReplicationControllerSpec] = Field(
+        default=None,
+        description=(
+            "Spec defines the specification of the desired behavior of the replication"
+            " controller. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+    status: Optional[ReplicationControllerStatus] = Field(
+        default=None,
+        description=(
+            "Status is the most recently observed status of the replication controller."
+            " This data may be out of date by some window of time. Populated by the"
+            " system. Read-only. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class ReplicationControllerList(ObjectList[ReplicationController]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ReplicationControllerList"
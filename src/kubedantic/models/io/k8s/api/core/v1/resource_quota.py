@@ -0,0 +1,106 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+
+class ScopedResourceSelectorRequirement(BaseModel):
+    operator: str = Field(
+        ...,
+        description=(
+            "Represents a scope's relationship to a set of values. Valid operators are"
+            " In, NotIn, Exists, DoesNotExist."
+        ),
+    )
+    scopeName: str = Field(
+        ..., description="The name of the scope that the selector applies to."
+    )
+    values: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "An array of string values. If the operator is In or NotIn, the values"
+            " array must be non-empty. If the operator is Exists or DoesNotExist, the"
+            " values array must be empty. This array is replaced during a strategic"
+            " merge patch."
+        ),
+    )
+
+
+class ResourceQuotaStatus(BaseModel):
+    hard: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Hard is the set of enforced hard limits for each named resource. More"
+            " info: https://kubernetes.io/docs/concepts/policy/resource-quotas/"
+        ),
+    )
+    used: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "Used is the current observed total usage of the resource in the namespace."
+        ),
+    )
+
+
+class ScopeSelector(BaseModel):
+    matchExpressions: Optional[List[ScopedResourceSelectorRequirement]] = Field(
+        default=None,
+        description="A list of scope selector requirements by scope of the resources.",
+    )
+
+
+class ResourceQuotaSpec(BaseModel):
+    hard: Optional[Dict[str, Union[str, float]]] = Field(
+        default=None,
+        description=(
+            "hard is the set of desired hard limits for each named resource. More info:"
+            " https://kubernetes.io/docs/concepts/policy/resource-quotas/"
+        ),
+    )
+    scopeSelector: Optional[ScopeSelector] = Field(
+        default=None,
+        description=(
+            "scopeSelector is also a collection of filters like scopes that must match"
+            " each object tracked by a quota but expressed using ScopeSelectorOperator"
+            " in combination with possible values. For a resource to match, both scopes"
+            " AND scopeSelector (if specified in spec), must be matched."
+        ),
+    )
+    scopes: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "A collection of filters that must match each object tracked by a quota. If"
+            " not specified, the quota matches all objects."
+        ),
+    )
+
+
+class ResourceQuota(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ResourceQuota"
+    spec: Optional[ResourceQuotaSpec] = Field(
+        default=None,
+        description=(
+            "Spec defines the desired quota."
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+    status: Optional[ResourceQuotaStatus] = Field(
+        default=None,
+        description=(
+            "Status defines the actual enforced quota and its current usage."
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status"
+        ),
+    )
+
+
+class ResourceQuotaList(ObjectList[ResourceQuota]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ResourceQuotaList"
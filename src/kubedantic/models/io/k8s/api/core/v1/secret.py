@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from pydantic import Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+from kubedantic.types import Base64Bytes
+
+
+class Secret(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    data: Optional[Dict[str, Base64Bytes]] = Field(
+        default=None,
+        description=(
+            "Data contains the secret data. Each key must consist of alphanumeric"
+            " characters, '-', '_' or '.'. The serialized form of the secret data is a"
+            " base64 encoded string, representing the arbitrary (possibly non-string)"
+            " data value here. Described in"
+            " https://tools.ietf.org/html/rfc4648#section-4"
+        ),
+    )
+    immutable: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Immutable, if set to true, ensures that data stored in the Secret cannot"
+            " be updated (only object metadata can be modified). If not set to true,"
+            " the field can be modified at any time. Defaulted to nil."
+        ),
+    )
+    kind: Optional[str] = "Secret"
+    stringData: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "stringData allows specifying non-binary secret data in string form. It is"
+            " provided as a write-only input field for convenience. All keys and values"
+            " are merged into the data field on write, overwriting any existing values."
+            " The stringData field is never output when reading from the API."
+        ),
+    )
+    type: Optional[str] = Field(
+        default=None,
+        description=(
+            "Used to facilitate programmatic handling of secret data. More info:"
+            " https://kubernetes.io/docs/concepts/configuration/secret/#secret-types"
+        ),
+    )
+
+
+class SecretList(ObjectList[Secret]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "SecretList"
@@ -0,0 +1,57 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from kubedantic.base import NamespacedObject, ObjectList
+
+from .local_object_reference import LocalObjectReference
+from .object_reference import ObjectReference
+
+
+class ServiceAccount(NamespacedObject):
+    apiVersion: Optional[str] = "v1"
+    automountServiceAccountToken: Optional[bool] = Field(
+        default=None,
+        description=(
+            "AutomountServiceAccountToken indicates whether pods running as this"
+            " service account should have an API token automatically mounted. Can be"
+            " overridden at the pod level."
+        ),
+    )
+    imagePullSecrets: Optional[List[LocalObjectReference]] = Field(
+        default=None,
+        description=(
+            "ImagePullSecrets is a list of references to secrets in the same namespace"
+            " to use for pulling any images in pods that reference this ServiceAccount."
+            " ImagePullSecrets are distinct from Secrets because Secrets can be mounted"
+            " in the pod, but ImagePullSecrets are only accessed by the kubelet. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/containers/images/#specifying-imagepullsecrets-on-a-pod"
+        ),
+    )
+    kind: Optional[str] = "ServiceAccount"
+    secrets: Optional[List[ObjectReference]] = Field(
+        default=None,
+        description=(
+            "Secrets is a list of the secrets in the same namespace that pods running"
+            " using this ServiceAccount are allowed to use. Pods are only limited to"
+            " this list if this service account has a"
+            ' "kubernetes.io/enforce-mountable-secrets" annotation set to "true". This'
+            " field should not be used to find auto-generated service account token"
+            " secrets for use outside of pods. Instead, tokens can be requested"
+            " directly using the TokenRequest API, or service account token secrets can"
+            " be manually created. More info:"
+            " https://kubernetes.io/docs/concepts/configuration/secret"
+        ),
+    )
+
+
+class ServiceAccountList(ObjectList[ServiceAccount]):
+    apiVersion: Optional[str] = "v1"
+    kind: Optional[str] = "ServiceAccountList"
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TopologySelectorLabelRequirement(BaseModel):
+    key: str = Field(..., description="The label key that the selector applies to.")
+    values: List[str] = Field(
+        ...,
+        description=(
+            "An array of string values. One value must match the label to be selected."
+            " Each entry in Values is ORed."
+        ),
+    )
+
+
+class TopologySelectorTerm(BaseModel):
+    matchLabelExpressions: Optional[List[TopologySelectorLabelRequirement]] = Field(
+        default=None, description="A list of topology selector requirements by labels."
+    )
@@ -0,0 +1,1155 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from ....apimachinery.pkg.apis.meta import v1
+from .field_selector import ObjectFieldSelector, ResourceFieldSelector
+from .local_object_reference import LocalObjectReference
+from .persistent_volume_claim_spec import PersistentVolumeClaimSpec
+from .volume_source import (
+    AWSElasticBlockStoreVolumeSource,
+    AzureDiskVolumeSource,
+    FCVolumeSource,
+    FlockerVolumeSource,
+    GCEPersistentDiskVolumeSource,
+    HostPathVolumeSource,
+    NFSVolumeSource,
+    PhotonPersistentDiskVolumeSource,
+    PortworxVolumeSource,
+    QuobyteVolumeSource,
+    VsphereVirtualDiskVolumeSource,
+)
+
+
+class AzureFileVolumeSource(BaseModel):
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretName: str = Field(
+        ...,
+        description=(
+            "secretName is the  name of secret that contains Azure Storage Account Name"
+            " and Key"
+        ),
+    )
+    shareName: str = Field(..., description="shareName is the azure share Name")
+
+
+class GitRepoVolumeSource(BaseModel):
+    directory: Optional[str] = Field(
+        default=None,
+        description=(
+            "directory is the target directory name. Must not contain or start with"
+            " '..'.  If '.' is supplied, the volume directory will be the git"
+            " repository.  Otherwise, if specified, the volume will contain the git"
+            " repository in the subdirectory with the given name."
+        ),
+    )
+    repository: str = Field(..., description="repository is the URL")
+    revision: Optional[str] = Field(
+        default=None,
+        description="revision is the commit hash for the specified revision.",
+    )
+
+
+class GlusterfsVolumeSource(BaseModel):
+    endpoints: str = Field(
+        ...,
+        description=(
+            "endpoints is the endpoint name that details Glusterfs topology. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "path is the Glusterfs volume path. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the Glusterfs volume to be mounted with read-only"
+            " permissions. Defaults to false. More info:"
+            " https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod"
+        ),
+    )
+
+
+class KeyToPath(BaseModel):
+    key: str = Field(..., description="key is the key to project.")
+    mode: Optional[int] = Field(
+        default=None,
+        description=(
+            "mode is Optional: mode bits used to set permissions on this file. Must be"
+            " an octal value between 0000 and 0777 or a decimal value between 0 and"
+            " 511. YAML accepts both octal and decimal values, JSON requires decimal"
+            " values for mode bits. If not specified, the volume defaultMode will be"
+            " used. This might be in conflict with other options that affect the file"
+            " mode, like fsGroup, and the result can be other mode bits set."
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "path is the relative path of the file to map the key to. May not be an"
+            " absolute path. May not contain the path element '..'. May not start with"
+            " the string '..'."
+        ),
+    )
+
+
+class PersistentVolumeClaimVolumeSource(BaseModel):
+    claimName: str = Field(
+        ...,
+        description=(
+            "claimName is the name of a PersistentVolumeClaim in the same namespace as"
+            " the pod using this volume. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly Will force the ReadOnly setting in VolumeMounts. Default false."
+        ),
+    )
+
+
+class RBDVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#rbd"
+        ),
+    )
+    image: str = Field(
+        ...,
+        description=(
+            "image is the rados image name. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    keyring: Optional[str] = Field(
+        default=None,
+        description=(
+            "keyring is the path to key ring for RBDUser. Default is /etc/ceph/keyring."
+            " More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    monitors: List[str] = Field(
+        ...,
+        description=(
+            "monitors is a collection of Ceph monitors. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    pool: Optional[str] = Field(
+        default=None,
+        description=(
+            "pool is the rados pool name. Default is rbd. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to"
+            " false. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef is name of the authentication secret for RBDUser. If provided"
+            " overrides keyring. Default is nil. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description=(
+            "user is the rados user name. Default is admin. More info:"
+            " https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it"
+        ),
+    )
+
+
+class ScaleIOVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Default is "xfs".'
+        ),
+    )
+    gateway: str = Field(
+        ..., description="gateway is the host address of the ScaleIO API Gateway."
+    )
+    protectionDomain: Optional[str] = Field(
+        default=None,
+        description=(
+            "protectionDomain is the name of the ScaleIO Protection Domain for the"
+            " configured storage."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly Defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: LocalObjectReference = Field(
+        ...,
+        description=(
+            "secretRef references to the secret for ScaleIO user and other sensitive"
+            " information. If this is not provided, Login operation will fail."
+        ),
+    )
+    sslEnabled: Optional[bool] = Field(
+        default=None,
+        description=(
+            "sslEnabled Flag enable/disable SSL communication with Gateway, default"
+            " false"
+        ),
+    )
+    storageMode: Optional[str] = Field(
+        default=None,
+        description=(
+            "storageMode indicates whether the storage for a volume should be"
+            " ThickProvisioned or ThinProvisioned. Default is ThinProvisioned."
+        ),
+    )
+    storagePool: Optional[str] = Field(
+        default=None,
+        description=(
+            "storagePool is the ScaleIO Storage Pool associated with the protection"
+            " domain."
+        ),
+    )
+    system: str = Field(
+        ...,
+        description=(
+            "system is the name of the storage system as configured in ScaleIO."
+        ),
+    )
+    volumeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeName is the name of a volume already created in the ScaleIO system"
+            " that is associated with this volume source."
+        ),
+    )
+
+
+class SecretProjection(BaseModel):
+    items: Optional[List[KeyToPath]] = Field(
+        default=None,
+        description=(
+            "items if unspecified, each key-value pair in the Data field of the"
+            " referenced Secret will be projected into the volume as a file whose name"
+            " is the key and content is the value. If specified, the listed keys will"
+            " be projected into the specified paths, and unlisted keys will not be"
+            " present. If a key is specified which is not present in the Secret, the"
+            " volume setup will error unless it is marked optional. Paths must be"
+            " relative and may not contain the '..' path or start with '..'."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description=(
+            "optional field specify whether the Secret or its key must be defined"
+        ),
+    )
+
+
+class SecretVolumeSource(BaseModel):
+    defaultMode: Optional[int] = Field(
+        default=None,
+        description=(
+            "defaultMode is Optional: mode bits used to set permissions on created"
+            " files by default. Must be an octal value between 0000 and 0777 or a"
+            " decimal value between 0 and 511. YAML accepts both octal and decimal"
+            " values, JSON requires decimal values for mode bits. Defaults to 0644."
+            " Directories within the path are not affected by this setting. This might"
+            " be in conflict with other options that affect the file mode, like"
+            " fsGroup, and the result can be other mode bits set."
+        ),
+    )
+    items: Optional[List[KeyToPath]] = Field(
+        default=None,
+        description=(
+            "items If unspecified, each key-value pair in the Data field of the"
+            " referenced Secret will be projected into the volume as a file whose name"
+            " is the key and content is the value. If specified, the listed keys will"
+            " be projected into the specified paths, and unlisted keys will not be"
+            " present. If a key is specified which is not present in the Secret, the"
+            " volume setup will error unless it is marked optional. Paths must be"
+            " relative and may not contain the '..' path or start with '..'."
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description=(
+            "optional field specify whether the Secret or its keys must be defined"
+        ),
+    )
+    secretName: Optional[str] = Field(
+        default=None,
+        description=(
+            "secretName is the name of the secret in the pod's namespace to use. More"
+            " info: https://kubernetes.io/docs/concepts/storage/volumes#secret"
+        ),
+    )
+
+
+class ServiceAccountTokenProjection(BaseModel):
+    audience: Optional[str] = Field(
+        default=None,
+        description=(
+            "audience is the intended audience of the token. A recipient of a token"
+            " must identify itself with an identifier specified in the audience of the"
+            " token, and otherwise should reject the token. The audience defaults to"
+            " the identifier of the apiserver."
+        ),
+    )
+    expirationSeconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "expirationSeconds is the requested duration of validity of the service"
+            " account token. As the token approaches expiration, the kubelet volume"
+            " plugin will proactively rotate the service account token. The kubelet"
+            " will start trying to rotate the token if the token is older than 80"
+            " percent of its time to live or if the token is older than 24"
+            " hours.Defaults to 1 hour and must be at least 10 minutes."
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "path is the path relative to the mount point of the file to project the"
+            " token into."
+        ),
+    )
+
+
+class StorageOSVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Implicitly inferred to be "ext4" if unspecified.'
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef specifies the secret to use for obtaining the StorageOS API"
+            " credentials.  If not specified, default values will be attempted."
+        ),
+    )
+    volumeName: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeName is the human-readable name of the StorageOS volume.  Volume"
+            " names are only unique within a namespace."
+        ),
+    )
+    volumeNamespace: Optional[str] = Field(
+        default=None,
+        description=(
+            "volumeNamespace specifies the scope of the volume within StorageOS.  If no"
+            " namespace is specified then the Pod's namespace will be used.  This"
+            " allows the Kubernetes name scoping to be mirrored within StorageOS for"
+            " tighter integration. Set VolumeName to any name to override the default"
+            ' behaviour. Set to "default" if you are not using namespaces within'
+            " StorageOS. Namespaces that do not pre-exist within StorageOS will be"
+            " created."
+        ),
+    )
+
+
+class CSIVolumeSource(BaseModel):
+    driver: str = Field(
+        ...,
+        description=(
+            "driver is the name of the CSI driver that handles this volume. Consult"
+            " with your admin for the correct name as registered in the cluster."
+        ),
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            'fsType to mount. Ex. "ext4", "xfs", "ntfs". If not provided, the empty'
+            " value is passed to the associated CSI driver which will determine the"
+            " default filesystem to apply."
+        ),
+    )
+    nodePublishSecretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "nodePublishSecretRef is a reference to the secret object containing"
+            " sensitive information to pass to the CSI driver to complete the CSI"
+            " NodePublishVolume and NodeUnpublishVolume calls. This field is optional,"
+            " and  may be empty if no secret is required. If the secret object contains"
+            " more than one secret, all secret references are passed."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly specifies a read-only configuration for the volume. Defaults to"
+            " false (read/write)."
+        ),
+    )
+    volumeAttributes: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "volumeAttributes stores driver-specific properties that are passed to the"
+            " CSI driver. Consult your driver's documentation for supported values."
+        ),
+    )
+
+
+class CephFSVolumeSource(BaseModel):
+    monitors: List[str] = Field(
+        ...,
+        description=(
+            "monitors is Required: Monitors is a collection of Ceph monitors More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description=(
+            "path is Optional: Used as the mounted root, rather than the full Ceph"
+            " tree, default is /"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: Defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts. More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    secretFile: Optional[str] = Field(
+        default=None,
+        description=(
+            "secretFile is Optional: SecretFile is the path to key ring for User,"
+            " default is /etc/ceph/user.secret More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef is Optional: SecretRef is reference to the authentication secret"
+            " for User, default is empty. More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description=(
+            "user is optional: User is the rados user name, default is admin More info:"
+            " https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it"
+        ),
+    )
+
+
+class CinderVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Examples: "ext4", "xfs", "ntfs".'
+            ' Implicitly inferred to be "ext4" if unspecified. More info:'
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts. More info:"
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef is optional: points to a secret object containing parameters"
+            " used to connect to OpenStack."
+        ),
+    )
+    volumeID: str = Field(
+        ...,
+        description=(
+            "volumeID used to identify the volume in cinder. More info:"
+            " https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+
+
+class ConfigMapProjection(BaseModel):
+    items: Optional[List[KeyToPath]] = Field(
+        default=None,
+        description=(
+            "items if unspecified, each key-value pair in the Data field of the"
+            " referenced ConfigMap will be projected into the volume as a file whose"
+            " name is the key and content is the value. If specified, the listed keys"
+            " will be projected into the specified paths, and unlisted keys will not be"
+            " present. If a key is specified which is not present in the ConfigMap, the"
+            " volume setup will error unless it is marked optional. Paths must be"
+            " relative and may not contain the '..' path or start with '..'."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description=(
+            "optional specify whether the ConfigMap or its keys must be defined"
+        ),
+    )
+
+
+class ConfigMapVolumeSource(BaseModel):
+    defaultMode: Optional[int] = Field(
+        default=None,
+        description=(
+            "defaultMode is optional: mode bits used to set permissions on created"
+            " files by default. Must be an octal value between 0000 and 0777 or a"
+            " decimal value between 0 and 511. YAML accepts both octal and decimal"
+            " values, JSON requires decimal values for mode bits. Defaults to 0644."
+            " Directories within the path are not affected by this setting. This might"
+            " be in conflict with other options that affect the file mode, like"
+            " fsGroup, and the result can be other mode bits set."
+        ),
+    )
+    items: Optional[List[KeyToPath]] = Field(
+        default=None,
+        description=(
+            "items if unspecified, each key-value pair in the Data field of the"
+            " referenced ConfigMap will be projected into the volume as a file whose"
+            " name is the key and content is the value. If specified, the listed keys"
+            " will be projected into the specified paths, and unlisted keys will not be"
+            " present. If a key is specified which is not present in the ConfigMap, the"
+            " volume setup will error unless it is marked optional. Paths must be"
+            " relative and may not contain the '..' path or start with '..'."
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Name of the referent. More info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description=(
+            "optional specify whether the ConfigMap or its keys must be defined"
+        ),
+    )
+
+
+class EmptyDirVolumeSource(BaseModel):
+    medium: Optional[str] = Field(
+        default=None,
+        description=(
+            "medium represents what type of storage medium should back this directory."
+            ' The default is "" which means to use the node\'s default medium. Must be'
+            " an empty string (default) or Memory. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#emptydir"
+        ),
+    )
+    sizeLimit: Optional[Union[str, float]] = Field(
+        default=None,
+        description=(
+            "sizeLimit is the total amount of local storage required for this EmptyDir"
+            " volume. The size limit is also applicable for memory medium. The maximum"
+            " usage on memory medium EmptyDir would be the minimum value between the"
+            " SizeLimit specified here and the sum of memory limits of all containers"
+            " in a pod. The default is nil which means that the limit is undefined."
+            " More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir"
+        ),
+    )
+
+
+class FlexVolumeSource(BaseModel):
+    driver: str = Field(
+        ..., description="driver is the name of the driver to use for this volume."
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The'
+            " default filesystem depends on FlexVolume script."
+        ),
+    )
+    options: Optional[Dict[str, str]] = Field(
+        default=None,
+        description=(
+            "options is Optional: this field holds extra command options if any."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts."
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef is Optional: secretRef is reference to the secret object"
+            " containing sensitive information to pass to the plugin scripts. This may"
+            " be empty if no secret object is specified. If the secret object contains"
+            " more than one secret, all secrets are passed to the plugin scripts."
+        ),
+    )
+
+
+class ISCSIVolumeSource(BaseModel):
+    chapAuthDiscovery: Optional[bool] = Field(
+        default=None,
+        description=(
+            "chapAuthDiscovery defines whether support iSCSI Discovery CHAP"
+            " authentication"
+        ),
+    )
+    chapAuthSession: Optional[bool] = Field(
+        default=None,
+        description=(
+            "chapAuthSession defines whether support iSCSI Session CHAP authentication"
+        ),
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#iscsi"
+        ),
+    )
+    initiatorName: Optional[str] = Field(
+        default=None,
+        description=(
+            "initiatorName is the custom iSCSI Initiator Name. If initiatorName is"
+            " specified with iscsiInterface simultaneously, new iSCSI interface <target"
+            " portal>:<volume name> will be created for the connection."
+        ),
+    )
+    iqn: str = Field(..., description="iqn is the target iSCSI Qualified Name.")
+    iscsiInterface: Optional[str] = Field(
+        default=None,
+        description=(
+            "iscsiInterface is the interface Name that uses an iSCSI transport."
+            " Defaults to 'default' (tcp)."
+        ),
+    )
+    lun: int = Field(..., description="lun represents iSCSI Target Lun number.")
+    portals: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "portals is the iSCSI Target Portal List. The portal is either an IP or"
+            " ip_addr:port if the port is other than default (typically TCP ports 860"
+            " and 3260)."
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to"
+            " false."
+        ),
+    )
+    secretRef: Optional[LocalObjectReference] = Field(
+        default=None,
+        description=(
+            "secretRef is the CHAP Secret for iSCSI target and initiator authentication"
+        ),
+    )
+    targetPortal: str = Field(
+        ...,
+        description=(
+            "targetPortal is iSCSI Target Portal. The Portal is either an IP or"
+            " ip_addr:port if the port is other than default (typically TCP ports 860"
+            " and 3260)."
+        ),
+    )
+
+
+class ClusterTrustBundleProjection(BaseModel):
+    labelSelector: Optional[v1.LabelSelector] = Field(
+        default=None,
+        description=(
+            "Select all ClusterTrustBundles that match this label selector.  Only has"
+            " effect if signerName is set.  Mutually-exclusive with name.  If unset,"
+            ' interpreted as "match nothing".  If set but empty, interpreted as "match'
+            ' everything".'
+        ),
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Select a single ClusterTrustBundle by object name.  Mutually-exclusive"
+            " with signerName and labelSelector."
+        ),
+    )
+    optional: Optional[bool] = Field(
+        default=None,
+        description=(
+            "If true, don't block pod startup if the referenced ClusterTrustBundle(s)"
+            " aren't available.  If using name, then the named ClusterTrustBundle is"
+            " allowed not to exist.  If using signerName, then the combination of"
+            " signerName and labelSelector is allowed to match zero"
+            " ClusterTrustBundles."
+        ),
+    )
+    path: str = Field(
+        ..., description="Relative path from the volume root to write the bundle."
+    )
+    signerName: Optional[str] = Field(
+        default=None,
+        description=(
+            "Select all ClusterTrustBundles that match this signer name."
+            " Mutually-exclusive with name.  The contents of all selected"
+            " ClusterTrustBundles will be unified and deduplicated."
+        ),
+    )
+
+
+class DownwardAPIVolumeFile(BaseModel):
+    fieldRef: Optional[ObjectFieldSelector] = Field(
+        default=None,
+        description=(
+            "Required: Selects a field of the pod: only annotations, labels, name,"
+            " namespace and uid are supported."
+        ),
+    )
+    mode: Optional[int] = Field(
+        default=None,
+        description=(
+            "Optional: mode bits used to set permissions on this file, must be an octal"
+            " value between 0000 and 0777 or a decimal value between 0 and 511. YAML"
+            " accepts both octal and decimal values, JSON requires decimal values for"
+            " mode bits. If not specified, the volume defaultMode will be used. This"
+            " might be in conflict with other options that affect the file mode, like"
+            " fsGroup, and the result can be other mode bits set."
+        ),
+    )
+    path: str = Field(
+        ...,
+        description=(
+            "Required: Path is  the relative path name of the file to be created. Must"
+            " not be absolute or contain the '..' path. Must be utf-8 encoded. The"
+            " first item of the relative path must not start with '..'"
+        ),
+    )
+    resourceFieldRef: Optional[ResourceFieldSelector] = Field(
+        default=None,
+        description=(
+            "Selects a resource of the container: only resources limits and requests"
+            " (limits.cpu, limits.memory, requests.cpu and requests.memory) are"
+            " currently supported."
+        ),
+    )
+
+
+class DownwardAPIVolumeSource(BaseModel):
+    defaultMode: Optional[int] = Field(
+        default=None,
+        description=(
+            "Optional: mode bits to use on created files by default. Must be a"
+            " Optional: mode bits used to set permissions on created files by default."
+            " Must be an octal value between 0000 and 0777 or a decimal value between 0"
+            " and 511. YAML accepts both octal and decimal values, JSON requires"
+            " decimal values for mode bits. Defaults to 0644. Directories within the"
+            " path are not affected by this setting. This might be in conflict with"
+            " other options that affect the file mode, like fsGroup, and the result can"
+            " be other mode bits set."
+        ),
+    )
+    items: Optional[List[DownwardAPIVolumeFile]] = Field(
+        default=None, description="Items is a list of downward API volume file"
+    )
+
+
+class PersistentVolumeClaimTemplate(BaseModel):
+    metadata: Optional[v1.ObjectMeta] = Field(
+        default=None,
+        description=(
+            "May contain labels and annotations that will be copied into the PVC when"
+            " creating it. No other fields are allowed and will be rejected during"
+            " validation."
+        ),
+    )
+    spec: PersistentVolumeClaimSpec = Field(
+        ...,
+        description=(
+            "The specification for the PersistentVolumeClaim. The entire content is"
+            " copied unchanged into the PVC that gets created from this template. The"
+            " same fields as in a PersistentVolumeClaim are also valid here."
+        ),
+    )
+
+
+class DownwardAPIProjection(BaseModel):
+    items: Optional[List[DownwardAPIVolumeFile]] = Field(
+        default=None, description="Items is a list of DownwardAPIVolume file"
+    )
+
+
+class EphemeralVolumeSource(BaseModel):
+    volumeClaimTemplate: Optional[PersistentVolumeClaimTemplate] = Field(
+        default=None,
+        description=(
+            "Will be used to create a stand-alone PVC to provision the volume. The pod"
+            " in which this EphemeralVolumeSource is embedded will be the owner of the"
+            " PVC, i.e. the PVC will be deleted together with the pod.  The name of the"
+            " PVC will be `<pod name>-<volume name>` where `<volume name>` is the name"
+            " from the `PodSpec.Volumes` array entry. Pod validation will reject the"
+            " pod if the concatenated name is not valid for a PVC (for example, too"
+            " long).\n\nAn existing PVC with that name that is not owned by the pod"
+            " will *not* be used for the pod to avoid using an unrelated volume by"
+            " mistake. Starting the pod is then blocked until the unrelated PVC is"
+            " removed. If such a pre-created PVC is meant to be used by the pod, the"
+            " PVC has to updated with an owner reference to the pod once the pod"
+            " exists. Normally this should not be necessary, but it may be useful when"
+            " manually reconstructing a broken cluster.\n\nThis field is read-only and"
+            " no changes will be made by Kubernetes to the PVC after it has been"
+            " created.\n\nRequired, must not be nil."
+        ),
+    )
+
+
+class VolumeProjection(BaseModel):
+    clusterTrustBundle: Optional[ClusterTrustBundleProjection] = Field(
+        default=None,
+        description=(
+            "ClusterTrustBundle allows a pod to access the `.spec.trustBundle` field of"
+            " ClusterTrustBundle objects in an auto-updating file.\n\nAlpha, gated by"
+            " the ClusterTrustBundleProjection feature gate.\n\nClusterTrustBundle"
+            " objects can either be selected by name, or by the combination of signer"
+            " name and a label selector.\n\nKubelet performs aggressive normalization"
+            " of the PEM contents written into the pod filesystem.  Esoteric PEM"
+            " features such as inter-block comments and block headers are stripped. "
+            " Certificates are deduplicated. The ordering of certificates within the"
+            " file is arbitrary, and Kubelet may change the order over time."
+        ),
+    )
+    configMap: Optional[ConfigMapProjection] = Field(
+        default=None,
+        description="configMap information about the configMap data to project",
+    )
+    downwardAPI: Optional[DownwardAPIProjection] = Field(
+        default=None,
+        description="downwardAPI information about the downwardAPI data to project",
+    )
+    secret: Optional[SecretProjection] = Field(
+        default=None, description="secret information about the secret data to project"
+    )
+    serviceAccountToken: Optional[ServiceAccountTokenProjection] = Field(
+        default=None,
+        description=(
+            "serviceAccountToken is information about the serviceAccountToken data to"
+            " project"
+        ),
+    )
+
+
+class ProjectedVolumeSource(BaseModel):
+    defaultMode: Optional[int] = Field(
+        default=None,
+        description=(
+            "defaultMode are the mode bits used to set permissions on created files by"
+            " default. Must be an octal value between 0000 and 0777 or a decimal value"
+            " between 0 and 511. YAML accepts both octal and decimal values, JSON"
+            " requires decimal values for mode bits. Directories within the path are"
+            " not affected by this setting. This might be in conflict with other"
+            " options that affect the file mode, like fsGroup, and the result can be"
+            " other mode bits set."
+        ),
+    )
+    sources: Optional[List[VolumeProjection]] = Field(
+        default=None, description="sources is the list of volume projections"
+    )
+
+
+class Volume(BaseModel):
+    awsElasticBlockStore: Optional[AWSElasticBlockStoreVolumeSource] = Field(
+        default=None,
+        description=(
+            "awsElasticBlockStore represents an AWS Disk resource that is attached to a"
+            " kubelet's host machine and then exposed to the pod. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore"
+        ),
+    )
+    azureDisk: Optional[AzureDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "azureDisk represents an Azure Data Disk mount on the host and bind mount"
+            " to the pod."
+        ),
+    )
+    azureFile: Optional[AzureFileVolumeSource] = Field(
+        default=None,
+        description=(
+            "azureFile represents an Azure File Service mount on the host and bind"
+            " mount to the pod."
+        ),
+    )
+    cephfs: Optional[CephFSVolumeSource] = Field(
+        default=None,
+        description=(
+            "cephFS represents a Ceph FS mount on the host that shares a pod's lifetime"
+        ),
+    )
+    cinder: Optional[CinderVolumeSource] = Field(
+        default=None,
+        description=(
+            "cinder represents a cinder volume attached and mounted on kubelets host"
+            " machine. More info: https://examples.k8s.io/mysql-cinder-pd/README.md"
+        ),
+    )
+    configMap: Optional[ConfigMapVolumeSource] = Field(
+        default=None,
+        description="configMap represents a configMap that should populate this volume",
+    )
+    csi: Optional[CSIVolumeSource] = Field(
+        default=None,
+        description=(
+            "csi (Container Storage Interface) represents ephemeral storage that is"
+            " handled by certain external CSI drivers (Beta feature)."
+        ),
+    )
+    downwardAPI: Optional[DownwardAPIVolumeSource] = Field(
+        default=None,
+        description=(
+            "downwardAPI represents downward API about the pod that should populate"
+            " this volume"
+        ),
+    )
+    emptyDir: Optional[EmptyDirVolumeSource] = Field(
+        default=None,
+        description=(
+            "emptyDir represents a temporary directory that shares a pod's lifetime."
+            " More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir"
+        ),
+    )
+    ephemeral: Optional[EphemeralVolumeSource] = Field(
+        default=None,
+        description=(
+            "ephemeral represents a volume that is handled by a cluster storage driver."
+            " The volume's lifecycle is tied to the pod that defines it - it will be"
+            " created before the pod starts, and deleted when the pod is"
+            " removed.\n\nUse this if: a) the volume is only needed while the pod runs,"
+            " b) features of normal volumes like restoring from snapshot or capacity\n "
+            "  tracking are needed,\nc) the storage driver is specified through a"
+            " storage class, and d) the storage driver supports dynamic volume"
+            " provisioning through\n   a PersistentVolumeClaim (see"
+            " EphemeralVolumeSource for more\n   information on the connection between"
+            " this volume type\n   and PersistentVolumeClaim).\n\nUse"
+            " PersistentVolumeClaim or one of the vendor-specific APIs for volumes that"
+            " persist for longer than the lifecycle of an individual pod.\n\nUse CSI"
+            " for light-weight local ephemeral volumes if the CSI driver is meant to be"
+            " used that way - see the documentation of the driver for more"
+            " information.\n\nA pod can use both types of ephemeral volumes and"
+            " persistent volumes at the same time."
+        ),
+    )
+    fc: Optional[FCVolumeSource] = Field(
+        default=None,
+        description=(
+            "fc represents a Fibre Channel resource that is attached to a kubelet's"
+            " host machine and then exposed to the pod."
+        ),
+    )
+    flexVolume: Optional[FlexVolumeSource] = Field(
+        default=None,
+        description=(
+            "flexVolume represents a generic volume resource that is"
+            " provisioned/attached using an exec based plugin."
+        ),
+    )
+    flocker: Optional[FlockerVolumeSource] = Field(
+        default=None,
+        description=(
+            "flocker represents a Flocker volume attached to a kubelet's host machine."
+            " This depends on the Flocker control service being running"
+        ),
+    )
+    gcePersistentDisk: Optional[GCEPersistentDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "gcePersistentDisk represents a GCE Disk resource that is attached to a"
+            " kubelet's host machine and then exposed to the pod. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+    gitRepo: Optional[GitRepoVolumeSource] = Field(
+        default=None,
+        description=(
+            "gitRepo represents a git repository at a particular revision. DEPRECATED:"
+            " GitRepo is deprecated. To provision a container with a git repo, mount an"
+            " EmptyDir into an InitContainer that clones the repo using git, then mount"
+            " the EmptyDir into the Pod's container."
+        ),
+    )
+    glusterfs: Optional[GlusterfsVolumeSource] = Field(
+        default=None,
+        description=(
+            "glusterfs represents a Glusterfs mount on the host that shares a pod's"
+            " lifetime. More info: https://examples.k8s.io/volumes/glusterfs/README.md"
+        ),
+    )
+    hostPath: Optional[HostPathVolumeSource] = Field(
+        default=None,
+        description=(
+            "hostPath represents a pre-existing file or directory on the host machine"
+            " that is directly exposed to the container. This is generally used for"
+            " system agents or other privileged things that are allowed to see the host"
+            " machine. Most containers will NOT need this. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#hostpath"
+        ),
+    )
+    iscsi: Optional[ISCSIVolumeSource] = Field(
+        default=None,
+        description=(
+            "iscsi represents an ISCSI Disk resource that is attached to a kubelet's"
+            " host machine and then exposed to the pod. More info:"
+            " https://examples.k8s.io/volumes/iscsi/README.md"
+        ),
+    )
+    name: str = Field(
+        ...,
+        description=(
+            "name of the volume. Must be a DNS_LABEL and unique within the pod. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names"
+        ),
+    )
+    nfs: Optional[NFSVolumeSource] = Field(
+        default=None,
+        description=(
+            "nfs represents an NFS mount on the host that shares a pod's lifetime More"
+            " info: https://kubernetes.io/docs/concepts/storage/volumes#nfs"
+        ),
+    )
+    persistentVolumeClaim: Optional[PersistentVolumeClaimVolumeSource] = Field(
+        default=None,
+        description=(
+            "persistentVolumeClaimVolumeSource represents a reference to a"
+            " PersistentVolumeClaim in the same namespace. More info:"
+            " https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims"
+        ),
+    )
+    photonPersistentDisk: Optional[PhotonPersistentDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "photonPersistentDisk represents a PhotonController persistent disk"
+            " attached and mounted on kubelets host machine"
+        ),
+    )
+    portworxVolume: Optional[PortworxVolumeSource] = Field(
+        default=None,
+        description=(
+            "portworxVolume represents a portworx volume attached and mounted on"
+            " kubelets host machine"
+        ),
+    )
+    projected: Optional[ProjectedVolumeSource] = Field(
+        default=None,
+        description=(
+            "projected items for all in one resources secrets, configmaps, and"
+            " downward API"
+        ),
+    )
+    quobyte: Optional[QuobyteVolumeSource] = Field(
+        default=None,
+        description=(
+            "quobyte represents a Quobyte mount on the host that shares a pod's"
+            " lifetime"
+        ),
+    )
+    rbd: Optional[RBDVolumeSource] = Field(
+        default=None,
+        description=(
+            "rbd represents a Rados Block Device mount on the host that shares a pod's"
+            " lifetime. More info: https://examples.k8s.io/volumes/rbd/README.md"
+        ),
+    )
+    scaleIO: Optional[ScaleIOVolumeSource] = Field(
+        default=None,
+        description=(
+            "scaleIO represents a ScaleIO persistent volume attached and mounted on"
+            " Kubernetes nodes."
+        ),
+    )
+    secret: Optional[SecretVolumeSource] = Field(
+        default=None,
+        description=(
+            "secret represents a secret that should populate this volume. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#secret"
+        ),
+    )
+    storageos: Optional[StorageOSVolumeSource] = Field(
+        default=None,
+        description=(
+            "storageOS represents a StorageOS volume attached and mounted on Kubernetes"
+            " nodes."
+        ),
+    )
+    vsphereVolume: Optional[VsphereVirtualDiskVolumeSource] = Field(
+        default=None,
+        description=(
+            "vsphereVolume represents a vSphere volume attached and mounted on kubelets"
+            " host machine"
+        ),
+    )
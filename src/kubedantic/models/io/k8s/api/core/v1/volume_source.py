@@ -0,0 +1,359 @@
+# generated by datamodel-codegen:
+#   timestamp: 2024-04-28T19:06:26+00:00
+#   k8s version: v1.30.0
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class AWSElasticBlockStoreVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore"
+        ),
+    )
+    partition: Optional[int] = Field(
+        default=None,
+        description=(
+            "partition is the partition in the volume that you want to mount. If"
+            " omitted, the default is to mount by volume name. Examples: For volume"
+            ' /dev/sda1, you specify the partition as "1". Similarly, the volume'
+            ' partition for /dev/sda is "0" (or you can leave the property empty).'
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly value true will force the readOnly setting in VolumeMounts. More"
+            " info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore"
+        ),
+    )
+    volumeID: str = Field(
+        ...,
+        description=(
+            "volumeID is unique ID of the persistent disk resource in AWS (Amazon EBS"
+            " volume). More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore"
+        ),
+    )
+
+
+class AzureDiskVolumeSource(BaseModel):
+    cachingMode: Optional[str] = Field(
+        default=None,
+        description=(
+            "cachingMode is the Host Caching mode: None, Read Only, Read Write."
+        ),
+    )
+    diskName: str = Field(
+        ..., description="diskName is the Name of the data disk in the blob storage"
+    )
+    diskURI: str = Field(
+        ..., description="diskURI is the URI of data disk in the blob storage"
+    )
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is Filesystem type to mount. Must be a filesystem type supported by"
+            ' the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred'
+            ' to be "ext4" if unspecified.'
+        ),
+    )
+    kind: Optional[str] = Field(
+        default=None,
+        description=(
+            "kind expected values are Shared: multiple blob disks per storage account "
+            " Dedicated: single blob disk per storage account  Managed: azure managed"
+            " data disk (only in managed availability set). defaults to shared"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly Defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+
+
+class FCVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Implicitly inferred to be "ext4" if unspecified.'
+        ),
+    )
+    lun: Optional[int] = Field(
+        default=None, description="lun is Optional: FC target lun number"
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly is Optional: Defaults to false (read/write). ReadOnly here will"
+            " force the ReadOnly setting in VolumeMounts."
+        ),
+    )
+    targetWWNs: Optional[List[str]] = Field(
+        default=None,
+        description="targetWWNs is Optional: FC target worldwide names (WWNs)",
+    )
+    wwids: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "wwids Optional: FC volume world wide identifiers (wwids) Either wwids or"
+            " combination of targetWWNs and lun must be set, but not both"
+            " simultaneously."
+        ),
+    )
+
+
+class FlockerVolumeSource(BaseModel):
+    datasetName: Optional[str] = Field(
+        default=None,
+        description=(
+            "datasetName is Name of the dataset stored as metadata -> name on the"
+            " dataset for Flocker should be considered as deprecated"
+        ),
+    )
+    datasetUUID: Optional[str] = Field(
+        default=None,
+        description=(
+            "datasetUUID is the UUID of the dataset. This is unique identifier of a"
+            " Flocker dataset"
+        ),
+    )
+
+
+class GCEPersistentDiskVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is filesystem type of the volume that you want to mount. Tip:"
+            " Ensure that the filesystem type is supported by the host operating"
+            ' system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4"'
+            " if unspecified. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+    partition: Optional[int] = Field(
+        default=None,
+        description=(
+            "partition is the partition in the volume that you want to mount. If"
+            " omitted, the default is to mount by volume name. Examples: For volume"
+            ' /dev/sda1, you specify the partition as "1". Similarly, the volume'
+            ' partition for /dev/sda is "0" (or you can leave the property empty). More'
+            " info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+    pdName: str = Field(
+        ...,
+        description=(
+            "pdName is unique name of the PD resource in GCE. Used to identify the disk"
+            " in GCE. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to"
+            " false. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk"
+        ),
+    )
+
+
+class HostPathVolumeSource(BaseModel):
+    path: str = Field(
+        ...,
+        description=(
+            "path of the directory on the host. If the path is a symlink, it will"
+            " follow the link to the real path. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#hostpath"
+        ),
+    )
+    type: Optional[str] = Field(
+        default=None,
+        description=(
+            'type for HostPath Volume Defaults to "" More info:'
+            " https://kubernetes.io/docs/concepts/storage/volumes#hostpath"
+        ),
+    )
+
+
+class NFSVolumeSource(BaseModel):
+    path: str = Field(
+        ...,
+        description=(
+            "path that is exported by the NFS server. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#nfs"
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the NFS export to be mounted with read-only"
+            " permissions. Defaults to false. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#nfs"
+        ),
+    )
+    server: str = Field(
+        ...,
+        description=(
+            "server is the hostname or IP address of the NFS server. More info:"
+            " https://kubernetes.io/docs/concepts/storage/volumes#nfs"
+        ),
+    )
+
+
+class NodeSelectorRequirement(BaseModel):
+    key: str = Field(..., description="The label key that the selector applies to.")
+    operator: str = Field(
+        ...,
+        description=(
+            "Represents a key's relationship to a set of values. Valid operators are"
+            " In, NotIn, Exists, DoesNotExist. Gt, and Lt."
+        ),
+    )
+    values: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "An array of string values. If the operator is In or NotIn, the values"
+            " array must be non-empty. If the operator is Exists or DoesNotExist, the"
+            " values array must be empty. If the operator is Gt or Lt, the values array"
+            " must have a single element, which will be interpreted as an integer. This"
+            " array is replaced during a strategic merge patch."
+        ),
+    )
+
+
+class NodeSelectorTerm(BaseModel):
+    matchExpressions: Optional[List[NodeSelectorRequirement]] = Field(
+        default=None,
+        description="A list of node selector requirements by node's labels.",
+    )
+    matchFields: Optional[List[NodeSelectorRequirement]] = Field(
+        default=None,
+        description="A list of node selector requirements by node's fields.",
+    )
+
+
+class PhotonPersistentDiskVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is the filesystem type to mount. Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs", "ntfs".'
+            ' Implicitly inferred to be "ext4" if unspecified.'
+        ),
+    )
+    pdID: str = Field(
+        ...,
+        description="pdID is the ID that identifies Photon Controller persistent disk",
+    )
+
+
+class PortworxVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fSType represents the filesystem type to mount Must be a filesystem type"
+            ' supported by the host operating system. Ex. "ext4", "xfs". Implicitly'
+            ' inferred to be "ext4" if unspecified.'
+        ),
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly defaults to false (read/write). ReadOnly here will force the"
+            " ReadOnly setting in VolumeMounts."
+        ),
+    )
+    volumeID: str = Field(
+        ..., description="volumeID uniquely identifies a Portworx volume"
+    )
+
+
+class QuobyteVolumeSource(BaseModel):
+    group: Optional[str] = Field(
+        default=None, description="group to map volume access to Default is no group"
+    )
+    readOnly: Optional[bool] = Field(
+        default=None,
+        description=(
+            "readOnly here will force the Quobyte volume to be mounted with read-only"
+            " permissions. Defaults to false."
+        ),
+    )
+    registry: str = Field(
+        ...,
+        description=(
+            "registry represents a single or multiple Quobyte Registry services"
+            " specified as a string as host:port pair (multiple entries are separated"
+            " with commas) which acts as the central registry for volumes"
+        ),
+    )
+    tenant: Optional[str] = Field(
+        default=None,
+        description=(
+            "tenant owning the given Quobyte volume in the Backend Used with"
+            " dynamically provisioned Quobyte volumes, value is set by the plugin"
+        ),
+    )
+    user: Optional[str] = Field(
+        default=None,
+        description="user to map volume access to Defaults to serivceaccount user",
+    )
+    volume: str = Field(
+        ...,
+        description=(
+            "volume is a string that references an already created Quobyte volume by"
+            " name."
+        ),
+    )
+
+
+class VsphereVirtualDiskVolumeSource(BaseModel):
+    fsType: Optional[str] = Field(
+        default=None,
+        description=(
+            "fsType is filesystem type to mount. Must be a filesystem type supported by"
+            ' the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred'
+            ' to be "ext4" if unspecified.'
+        ),
+    )
+    storagePolicyID: Optional[str] = Field(
+        default=None,
+        description=(
+            "storagePolicyID is the storage Policy Based Management (SPBM) profile ID"
+            " associated with the StoragePolicyName."
+        ),
+    )
+    storagePolicyName: Optional[str] = Field(
+        default=None,
+        description=(
+            "storagePolicyName is the storage Policy Based Management (SPBM) profile"
+            " name."
+        ),
+    )
+    volumePath: str = Field(
+        ..., description="volumePath is the path that identifies vSphere volume vmdk"
+    )
+
+
+class NodeSelector(BaseModel):
+    nodeSelectorTerms: List[NodeSelectorTerm] = Field(
+        ..., description="Required. A list of node selector terms. The terms are ORed."
+    )
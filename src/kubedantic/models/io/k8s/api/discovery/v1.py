@@ -8,7 +8,8 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1 as v1_1
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ..core import v1
 
 
@@ -174,7 +175,7 @@ class Endpoint(BaseModel):
     )
 
 
-class EndpointSlice(BaseModel):
+class EndpointSlice(NamespacedObject):
     addressType: str = Field(
         ...,
         description=(
@@ -185,15 +186,7 @@ class EndpointSlice(BaseModel):
             " Address. * FQDN: Represents a Fully Qualified Domain Name."
         ),
     )
-    apiVersion: Optional[str] = Field(
-        default="discovery.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+    apiVersion: Optional[str] = "discovery.k8s.io/v1"
     endpoints: List[Endpoint] = Field(
         ...,
         description=(
@@ -201,18 +194,7 @@ class EndpointSlice(BaseModel):
             " include a maximum of 1000 endpoints."
         ),
     )
-    kind: Optional[str] = Field(
-        default="EndpointSlice",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1_1.ObjectMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+    kind: Optional[str] = "EndpointSlice"
     ports: Optional[List[EndpointPort]] = Field(
         default=None,
         description=(
@@ -225,28 +207,6 @@ class EndpointSlice(BaseModel):
     )
 
 
-class EndpointSliceList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="discovery.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[EndpointSlice] = Field(
-        ..., description="items is the list of endpoint slices"
-    )
-    kind: Optional[str] = Field(
-        default="EndpointSliceList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1_1.ListMeta] = Field(
-        default=None, description="Standard list metadata."
-    )
+class EndpointSliceList(ObjectList[EndpointSlice]):
+    apiVersion: Optional[str] = "discovery.k8s.io/v1"
+    kind: Optional[str] = "EndpointSliceList"
@@ -5,11 +5,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ..core import v1 as v1_1
 
 
@@ -30,7 +31,7 @@ class EventSeries(BaseModel):
     )
 
 
-class Event(BaseModel):
+class Event(NamespacedObject):
     action: Optional[str] = Field(
         default=None,
         description=(
@@ -39,15 +40,7 @@ class Event(BaseModel):
             " can have at most 128 characters."
         ),
     )
-    apiVersion: Optional[str] = Field(
-        default="events.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+    apiVersion: Optional[str] = "events.k8s.io/v1"
     deprecatedCount: Optional[int] = Field(
         default=None,
         description=(
@@ -82,22 +75,7 @@ class Event(BaseModel):
             "eventTime is the time when this Event was first observed. It is required."
         ),
     )
-    kind: Optional[str] = Field(
-        default="Event",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+    kind: Optional[str] = "Event"
     note: Optional[str] = Field(
         default=None,
         description=(
@@ -161,30 +139,6 @@ class Event(BaseModel):
     )
 
 
-class EventList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="events.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Event] = Field(..., description="items is a list of schema objects.")
-    kind: Optional[str] = Field(
-        default="EventList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class EventList(ObjectList[Event]):
+    apiVersion: Optional[str] = "events.k8s.io/v1"
+    kind: Optional[str] = "EventList"
@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
 
 
 class ExemptPriorityLevelConfiguration(BaseModel):
@@ -437,32 +437,9 @@ class PolicyRulesWithSubjects(BaseModel):
     )
 
 
-class PriorityLevelConfiguration(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="flowcontrol.apiserver.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="PriorityLevelConfiguration",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "`metadata` is the standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PriorityLevelConfiguration(ClusterScopedObject):
+    apiVersion: Optional[str] = "flowcontrol.apiserver.k8s.io/v1"
+    kind: Optional[str] = "PriorityLevelConfiguration"
     spec: Optional[PriorityLevelConfigurationSpec] = Field(
         default=None,
         description=(
@@ -480,35 +457,9 @@ class PriorityLevelConfiguration(BaseModel):
     )
 
 
-class PriorityLevelConfigurationList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="flowcontrol.apiserver.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[PriorityLevelConfiguration] = Field(
-        ..., description="`items` is a list of request-priorities."
-    )
-    kind: Optional[str] = Field(
-        default="PriorityLevelConfigurationList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "`metadata` is the standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PriorityLevelConfigurationList(ObjectList[PriorityLevelConfiguration]):
+    apiVersion: Optional[str] = "flowcontrol.apiserver.k8s.io/v1"
+    kind: Optional[str] = "PriorityLevelConfigurationList"
 
 
 class FlowSchemaSpec(BaseModel):
@@ -549,32 +500,9 @@ class FlowSchemaSpec(BaseModel):
     )
 
 
-class FlowSchema(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="flowcontrol.apiserver.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="FlowSchema",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "`metadata` is the standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class FlowSchema(ClusterScopedObject):
+    apiVersion: Optional[str] = "flowcontrol.apiserver.k8s.io/v1"
+    kind: Optional[str] = "FlowSchema"
     spec: Optional[FlowSchemaSpec] = Field(
         default=None,
         description=(
@@ -592,32 +520,6 @@ class FlowSchema(BaseModel):
     )
 
 
-class FlowSchemaList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="flowcontrol.apiserver.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[FlowSchema] = Field(
-        ..., description="`items` is a list of FlowSchemas."
-    )
-    kind: Optional[str] = Field(
-        default="FlowSchemaList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "`metadata` is the standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class FlowSchemaList(ObjectList[FlowSchema]):
+    apiVersion: Optional[str] = "flowcontrol.apiserver.k8s.io/v1"
+    kind: Optional[str] = "FlowSchemaList"
@@ -8,6 +8,8 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject, NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 from ..core import v1 as v1_1
 
@@ -169,32 +171,9 @@ class ServiceBackendPort(BaseModel):
     )
 
 
-class IngressClass(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="IngressClass",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class IngressClass(ClusterScopedObject):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "IngressClass"
     spec: Optional[IngressClassSpec] = Field(
         default=None,
         description=(
@@ -204,31 +183,9 @@ class IngressClass(BaseModel):
     )
 
 
-class IngressClassList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[IngressClass] = Field(
-        ..., description="items is the list of IngressClasses."
-    )
-    kind: Optional[str] = Field(
-        default="IngressClassList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard list metadata."
-    )
+class IngressClassList(ObjectList[IngressClass]):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "IngressClassList"
 
 
 class IngressLoadBalancerIngress(BaseModel):
@@ -558,32 +515,9 @@ class IngressSpec(BaseModel):
     )
 
 
-class NetworkPolicy(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="NetworkPolicy",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class NetworkPolicy(NamespacedObject):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "NetworkPolicy"
     spec: Optional[NetworkPolicySpec] = Field(
         default=None,
         description=(
@@ -593,63 +527,14 @@ class NetworkPolicy(BaseModel):
     )
 
 
-class NetworkPolicyList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[NetworkPolicy] = Field(
-        ..., description="items is a list of schema objects."
-    )
-    kind: Optional[str] = Field(
-        default="NetworkPolicyList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class NetworkPolicyList(ObjectList[NetworkPolicy]):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "NetworkPolicyList"
 
 
-class Ingress(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Ingress",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class Ingress(NamespacedObject):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "Ingress"
     spec: Optional[IngressSpec] = Field(
         default=None,
         description=(
@@ -666,30 +551,6 @@ class Ingress(BaseModel):
     )
 
 
-class IngressList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Ingress] = Field(..., description="items is the list of Ingress.")
-    kind: Optional[str] = Field(
-        default="IngressList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class IngressList(ObjectList[Ingress]):
+    apiVersion: Optional[str] = "networking.k8s.io/v1"
+    kind: Optional[str] = "IngressList"
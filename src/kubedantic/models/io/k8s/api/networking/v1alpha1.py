@@ -8,6 +8,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -58,32 +60,9 @@ class ServiceCIDRStatus(BaseModel):
     )
 
 
-class IPAddress(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="IPAddress",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class IPAddress(ClusterScopedObject):
+    apiVersion: Optional[str] = "networking.k8s.io/v1alpha1"
+    kind: Optional[str] = "IPAddress"
     spec: Optional[IPAddressSpec] = Field(
         default=None,
         description=(
@@ -93,61 +72,14 @@ class IPAddress(BaseModel):
     )
 
 
-class IPAddressList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[IPAddress] = Field(..., description="items is the list of IPAddresses.")
-    kind: Optional[str] = Field(
-        default="IPAddressList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class IPAddressList(ObjectList[IPAddress]):
+    apiVersion: Optional[str] = "networking.k8s.io/v1alpha1"
+    kind: Optional[str] = "IPAddressList"
 
 
-class ServiceCIDR(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ServiceCIDR",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class ServiceCIDR(ClusterScopedObject):
+    apiVersion: Optional[str] = "networking.k8s.io/v1alpha1"
+    kind: Optional[str] = "ServiceCIDR"
     spec: Optional[ServiceCIDRSpec] = Field(
         default=None,
         description=(
@@ -164,32 +96,6 @@ class ServiceCIDR(BaseModel):
     )
 
 
-class ServiceCIDRList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="networking.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ServiceCIDR] = Field(
-        ..., description="items is the list of ServiceCIDRs."
-    )
-    kind: Optional[str] = Field(
-        default="ServiceCIDRList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class ServiceCIDRList(ObjectList[ServiceCIDR]):
+    apiVersion: Optional[str] = "networking.k8s.io/v1alpha1"
+    kind: Optional[str] = "ServiceCIDRList"
@@ -8,7 +8,8 @@ from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
-from ...apimachinery.pkg.apis.meta import v1 as v1_1
+from kubedantic.base import ClusterScopedObject, ObjectList
+
 from ..core import v1
 
 
@@ -43,16 +44,8 @@ class Scheduling(BaseModel):
     )
 
 
-class RuntimeClass(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="node.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+class RuntimeClass(ClusterScopedObject):
+    apiVersion: Optional[str] = "node.k8s.io/v1"
     handler: str = Field(
         ...,
         description=(
@@ -66,22 +59,7 @@ class RuntimeClass(BaseModel):
             " conform to the DNS Label (RFC 1123) requirements, and is immutable."
         ),
     )
-    kind: Optional[str] = Field(
-        default="RuntimeClass",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1_1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+    kind: Optional[str] = "RuntimeClass"
     overhead: Optional[Overhead] = Field(
         default=None,
         description=(
@@ -101,32 +79,6 @@ class RuntimeClass(BaseModel):
     )
 
 
-class RuntimeClassList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="node.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[RuntimeClass] = Field(
-        ..., description="items is a list of schema objects."
-    )
-    kind: Optional[str] = Field(
-        default="RuntimeClassList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1_1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class RuntimeClassList(ObjectList[RuntimeClass]):
+    apiVersion: Optional[str] = "node.k8s.io/v1"
+    kind: Optional[str] = "RuntimeClassList"
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -122,59 +124,17 @@ class PodDisruptionBudgetStatus(BaseModel):
     )
 
 
-class Eviction(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="policy/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+class Eviction(NamespacedObject):
+    apiVersion: Optional[str] = "policy/v1"
     deleteOptions: Optional[v1.DeleteOptions] = Field(
         default=None, description="DeleteOptions may be provided"
     )
-    kind: Optional[str] = Field(
-        default="Eviction",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="ObjectMeta describes the pod that is being evicted."
-    )
+    kind: Optional[str] = "Eviction"
 
 
-class PodDisruptionBudget(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="policy/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="PodDisruptionBudget",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PodDisruptionBudget(NamespacedObject):
+    apiVersion: Optional[str] = "policy/v1"
+    kind: Optional[str] = "PodDisruptionBudget"
     spec: Optional[PodDisruptionBudgetSpec] = Field(
         default=None,
         description="Specification of the desired behavior of the PodDisruptionBudget.",
@@ -185,32 +145,6 @@ class PodDisruptionBudget(BaseModel):
     )
 
 
-class PodDisruptionBudgetList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="policy/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[PodDisruptionBudget] = Field(
-        ..., description="Items is a list of PodDisruptionBudgets"
-    )
-    kind: Optional[str] = Field(
-        default="PodDisruptionBudgetList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PodDisruptionBudgetList(ObjectList[PodDisruptionBudget]):
+    apiVersion: Optional[str] = "policy/v1"
+    kind: Optional[str] = "PodDisruptionBudgetList"
@@ -8,6 +8,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject, NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 
 
@@ -102,7 +104,7 @@ class AggregationRule(BaseModel):
     )
 
 
-class ClusterRole(BaseModel):
+class ClusterRole(ClusterScopedObject):
     aggregationRule: Optional[AggregationRule] = Field(
         default=None,
         description=(
@@ -112,54 +114,16 @@ class ClusterRole(BaseModel):
             " controller."
         ),
     )
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ClusterRole",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "ClusterRole"
     rules: Optional[List[PolicyRule]] = Field(
         default=None, description="Rules holds all the PolicyRules for this ClusterRole"
     )
 
 
-class ClusterRoleBinding(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="ClusterRoleBinding",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class ClusterRoleBinding(ClusterScopedObject):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "ClusterRoleBinding"
     roleRef: RoleRef = Field(
         ...,
         description=(
@@ -174,107 +138,27 @@ class ClusterRoleBinding(BaseModel):
     )
 
 
-class ClusterRoleBindingList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ClusterRoleBinding] = Field(
-        ..., description="Items is a list of ClusterRoleBindings"
-    )
-    kind: Optional[str] = Field(
-        default="ClusterRoleBindingList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class ClusterRoleBindingList(ObjectList[ClusterRoleBinding]):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "ClusterRoleBindingList"
 
 
-class ClusterRoleList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[ClusterRole] = Field(..., description="Items is a list of ClusterRoles")
-    kind: Optional[str] = Field(
-        default="ClusterRoleList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class ClusterRoleList(ObjectList[ClusterRole]):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "ClusterRoleList"
 
 
-class Role(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="Role",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class Role(NamespacedObject):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "Role"
     rules: Optional[List[PolicyRule]] = Field(
         default=None, description="Rules holds all the PolicyRules for this Role"
     )
 
 
-class RoleBinding(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="RoleBinding",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class RoleBinding(NamespacedObject):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "RoleBinding"
     roleRef: RoleRef = Field(
         ...,
         description=(
@@ -289,51 +173,11 @@ class RoleBinding(BaseModel):
     )
 
 
-class RoleBindingList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[RoleBinding] = Field(..., description="Items is a list of RoleBindings")
-    kind: Optional[str] = Field(
-        default="RoleBindingList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class RoleBindingList(ObjectList[RoleBinding]):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "RoleBindingList"
 
 
-class RoleList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="rbac.authorization.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[Role] = Field(..., description="Items is a list of Roles")
-    kind: Optional[str] = Field(
-        default="RoleList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None, description="Standard object's metadata."
-    )
+class RoleList(ObjectList[Role]):
+    apiVersion: Optional[str] = "rbac.authorization.k8s.io/v1"
+    kind: Optional[str] = "RoleList"
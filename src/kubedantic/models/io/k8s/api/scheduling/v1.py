@@ -4,23 +4,15 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
 
 
-class PriorityClass(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="scheduling.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+class PriorityClass(ClusterScopedObject):
+    apiVersion: Optional[str] = "scheduling.k8s.io/v1"
     description: Optional[str] = Field(
         default=None,
         description=(
@@ -39,22 +31,7 @@ class PriorityClass(BaseModel):
             " the default priority."
         ),
     )
-    kind: Optional[str] = Field(
-        default="PriorityClass",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+    kind: Optional[str] = "PriorityClass"
     preemptionPolicy: Optional[str] = Field(
         default=None,
         description=(
@@ -73,32 +50,6 @@ class PriorityClass(BaseModel):
     )
 
 
-class PriorityClassList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="scheduling.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[PriorityClass] = Field(
-        ..., description="items is the list of PriorityClasses"
-    )
-    kind: Optional[str] = Field(
-        default="PriorityClassList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class PriorityClassList(ObjectList[PriorityClass]):
+    apiVersion: Optional[str] = "scheduling.k8s.io/v1"
+    kind: Optional[str] = "PriorityClassList"
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from kubedantic.base import ClusterScopedObject, NamespacedObject, ObjectList
+
 from ...apimachinery.pkg.apis.meta import v1
 from ..core import v1 as v1_1
 
@@ -249,16 +251,8 @@ class CSINodeSpec(BaseModel):
     )
 
 
-class CSIStorageCapacity(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+class CSIStorageCapacity(NamespacedObject):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
     capacity: Optional[Union[str, float]] = Field(
         default=None,
         description=(
@@ -270,15 +264,7 @@ class CSIStorageCapacity(BaseModel):
             " currently unavailable."
         ),
     )
-    kind: Optional[str] = Field(
-        default="CSIStorageCapacity",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
+    kind: Optional[str] = "CSIStorageCapacity"
     maximumVolumeSize: Optional[Union[str, float]] = Field(
         default=None,
         description=(
@@ -292,18 +278,6 @@ class CSIStorageCapacity(BaseModel):
             " ResourceRequirements.Requests in a volume claim."
         ),
     )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. The name has no particular meaning. It must be"
-            " a DNS subdomain (dots allowed, 253 characters). To ensure that there are"
-            " no conflicts with other CSI drivers on the cluster, the recommendation is"
-            " to use csisc-<uuid>, a generated name, or a reverse-domain name which"
-            " ends with the unique CSI driver name.\n\nObjects are namespaced.\n\nMore"
-            " info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
     nodeTopology: Optional[v1.LabelSelector] = Field(
         default=None,
         description=(
@@ -325,38 +299,12 @@ class CSIStorageCapacity(BaseModel):
     )
 
 
-class CSIStorageCapacityList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CSIStorageCapacity] = Field(
-        ..., description="items is the list of CSIStorageCapacity objects."
-    )
-    kind: Optional[str] = Field(
-        default="CSIStorageCapacityList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CSIStorageCapacityList(ObjectList[CSIStorageCapacity]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "CSIStorageCapacityList"
 
 
-class StorageClass(BaseModel):
+class StorageClass(ClusterScopedObject):
     allowVolumeExpansion: Optional[bool] = Field(
         default=None,
         description=(
@@ -373,31 +321,8 @@ class StorageClass(BaseModel):
             " enable the VolumeScheduling feature."
         ),
     )
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="StorageClass",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "StorageClass"
     mountOptions: Optional[List[str]] = Field(
         default=None,
         description=(
@@ -434,35 +359,9 @@ class StorageClass(BaseModel):
     )
 
 
-class StorageClassList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[StorageClass] = Field(
-        ..., description="items is the list of StorageClasses"
-    )
-    kind: Optional[str] = Field(
-        default="StorageClassList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class StorageClassList(ObjectList[StorageClass]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "StorageClassList"
 
 
 class VolumeAttachmentStatus(BaseModel):
@@ -501,127 +400,28 @@ class VolumeAttachmentStatus(BaseModel):
     )
 
 
-class CSIDriver(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="CSIDriver",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata. metadata.Name indicates the name of the CSI"
-            " driver that this object refers to; it MUST be the same name returned by"
-            " the CSI GetPluginName() call for that driver. The driver name must be 63"
-            " characters or less, beginning and ending with an alphanumeric character"
-            " ([a-z0-9A-Z]) with dashes (-), dots (.), and alphanumerics between. More"
-            " info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CSIDriver(ClusterScopedObject):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "CSIDriver"
     spec: CSIDriverSpec = Field(
         ..., description="spec represents the specification of the CSI Driver."
     )
 
 
-class CSIDriverList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CSIDriver] = Field(..., description="items is the list of CSIDriver")
-    kind: Optional[str] = Field(
-        default="CSIDriverList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CSIDriverList(ObjectList[CSIDriver]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "CSIDriverList"
 
 
-class CSINode(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="CSINode",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. metadata.name must be the Kubernetes node"
-            " name."
-        ),
-    )
+class CSINode(ClusterScopedObject):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "CSINode"
     spec: CSINodeSpec = Field(..., description="spec is the specification of CSINode")
 
 
-class CSINodeList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CSINode] = Field(..., description="items is the list of CSINode")
-    kind: Optional[str] = Field(
-        default="CSINodeList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CSINodeList(ObjectList[CSINode]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "CSINodeList"
 
 
 class VolumeAttachmentSource(BaseModel):
@@ -664,32 +464,9 @@ class VolumeAttachmentSpec(BaseModel):
     )
 
 
-class VolumeAttachment(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="VolumeAttachment",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class VolumeAttachment(ClusterScopedObject):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "VolumeAttachment"
     spec: VolumeAttachmentSpec = Field(
         ...,
         description=(
@@ -707,32 +484,6 @@ class VolumeAttachment(BaseModel):
     )
 
 
-class VolumeAttachmentList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[VolumeAttachment] = Field(
-        ..., description="items is the list of VolumeAttachments"
-    )
-    kind: Optional[str] = Field(
-        default="VolumeAttachmentList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class VolumeAttachmentList(ObjectList[VolumeAttachment]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1"
+    kind: Optional[str] = "VolumeAttachmentList"
@@ -4,42 +4,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from ...apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
 
 
-class VolumeAttributesClass(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
+class VolumeAttributesClass(ClusterScopedObject):
+    apiVersion: Optional[str] = "storage.k8s.io/v1alpha1"
     driverName: str = Field(
         ..., description="Name of the CSI driver This field is immutable."
     )
-    kind: Optional[str] = Field(
-        default="VolumeAttributesClass",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+    kind: Optional[str] = "VolumeAttributesClass"
     parameters: Optional[Dict[str, str]] = Field(
         default=None,
         description=(
@@ -59,32 +36,6 @@ class VolumeAttributesClass(BaseModel):
     )
 
 
-class VolumeAttributesClassList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="storage.k8s.io/v1alpha1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[VolumeAttributesClass] = Field(
-        ..., description="items is the list of VolumeAttributesClass objects."
-    )
-    kind: Optional[str] = Field(
-        default="VolumeAttributesClassList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class VolumeAttributesClassList(ObjectList[VolumeAttributesClass]):
+    apiVersion: Optional[str] = "storage.k8s.io/v1alpha1"
+    kind: Optional[str] = "VolumeAttributesClassList"
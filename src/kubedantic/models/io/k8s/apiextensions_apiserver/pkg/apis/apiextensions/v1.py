@@ -7,9 +7,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .....apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
+from kubedantic.types import Base64Bytes
 
 
 class CustomResourceColumnDefinition(BaseModel):
@@ -210,7 +211,9 @@ class CustomResourceSubresourceScale(BaseModel):
 
 
 class CustomResourceSubresourceStatus(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
 
 
 class CustomResourceSubresources(BaseModel):
@@ -424,7 +427,7 @@ class ValidationRule(BaseModel):
 
 
 class WebhookClientConfig(BaseModel):
-    caBundle: Optional[str] = Field(
+    caBundle: Optional[Base64Bytes] = Field(
         default=None,
         description=(
             "caBundle is a PEM encoded CA bundle which will be used to validate the"
@@ -507,6 +510,7 @@ class CustomResourceConversion(BaseModel):
     )
 
 
+# JSONSchemaProps references itself, which pydantic resolves on creation
 class JSONSchemaProps(BaseModel):
     field_ref: Optional[str] = Field(default=None, alias="$ref")
     field_schema: Optional[str] = Field(default=None, alias="$schema")
@@ -848,32 +852,9 @@ class CustomResourceDefinitionSpec(BaseModel):
     )
 
 
-class CustomResourceDefinition(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apiextensions.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="CustomResourceDefinition",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CustomResourceDefinition(ClusterScopedObject):
+    apiVersion: Optional[str] = "apiextensions.k8s.io/v1"
+    kind: Optional[str] = "CustomResourceDefinition"
     spec: CustomResourceDefinitionSpec = Field(
         ..., description="spec describes how the user wants the resources to appear"
     )
@@ -883,32 +864,6 @@ class CustomResourceDefinition(BaseModel):
     )
 
 
-class CustomResourceDefinitionList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apiextensions.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[CustomResourceDefinition] = Field(
-        ..., description="items list individual CustomResourceDefinition objects"
-    )
-    kind: Optional[str] = Field(
-        default="CustomResourceDefinitionList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class CustomResourceDefinitionList(ObjectList[CustomResourceDefinition]):
+    apiVersion: Optional[str] = "apiextensions.k8s.io/v1"
+    kind: Optional[str] = "CustomResourceDefinitionList"
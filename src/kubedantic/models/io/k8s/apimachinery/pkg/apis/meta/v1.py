@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ... import runtime
 
@@ -83,7 +83,7 @@ class APIResource(BaseModel):
 
 class APIResourceList(BaseModel):
     apiVersion: Optional[str] = Field(
-        default=None,
+        default="v1",
         description=(
             "APIVersion defines the versioned schema of this representation of an"
             " object. Servers should convert recognized schemas to the latest internal"
@@ -115,7 +115,9 @@ class APIResourceList(BaseModel):
 
 
 class FieldsV1(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
 
 
 class LabelSelectorRequirement(BaseModel):
@@ -233,7 +235,9 @@ class OwnerReference(BaseModel):
 
 
 class Patch(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
 
 
 class Preconditions(BaseModel):
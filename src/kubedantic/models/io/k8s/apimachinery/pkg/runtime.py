@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RawExtension(BaseModel):
-    pass
+    model_config = ConfigDict(
+        extra="allow",
+    )
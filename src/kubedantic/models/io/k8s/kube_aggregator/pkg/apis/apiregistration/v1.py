@@ -9,7 +9,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
-from .....apimachinery.pkg.apis.meta import v1
+from kubedantic.base import ClusterScopedObject, ObjectList
+from kubedantic.types import Base64Bytes
 
 
 class APIServiceCondition(BaseModel):
@@ -60,7 +61,7 @@ class ServiceReference(BaseModel):
 
 
 class APIServiceSpec(BaseModel):
-    caBundle: Optional[str] = Field(
+    caBundle: Optional[Base64Bytes] = Field(
         default=None,
         description=(
             "CABundle is a PEM encoded CA bundle which will be used to validate an API"
@@ -128,32 +129,9 @@ class APIServiceSpec(BaseModel):
     )
 
 
-class APIService(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apiregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    kind: Optional[str] = Field(
-        default="APIService",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ObjectMeta] = Field(
-        default=None,
-        description=(
-            "Standard object's metadata. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class APIService(ClusterScopedObject):
+    apiVersion: Optional[str] = "apiregistration.k8s.io/v1"
+    kind: Optional[str] = "APIService"
     spec: Optional[APIServiceSpec] = Field(
         default=None,
         description=(
@@ -166,30 +144,6 @@ class APIService(BaseModel):
     )
 
 
-class APIServiceList(BaseModel):
-    apiVersion: Optional[str] = Field(
-        default="apiregistration.k8s.io/v1",
-        description=(
-            "APIVersion defines the versioned schema of this representation of an"
-            " object. Servers should convert recognized schemas to the latest internal"
-            " value, and may reject unrecognized values. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources"
-        ),
-    )
-    items: List[APIService] = Field(..., description="Items is the list of APIService")
-    kind: Optional[str] = Field(
-        default="APIServiceList",
-        description=(
-            "Kind is a string value representing the REST resource this object"
-            " represents. Servers may infer this from the endpoint the client submits"
-            " requests to. Cannot be updated. In CamelCase. More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
-        ),
-    )
-    metadata: Optional[v1.ListMeta] = Field(
-        default=None,
-        description=(
-            "Standard list metadata More info:"
-            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata"
-        ),
-    )
+class APIServiceList(ObjectList[APIService]):
+    apiVersion: Optional[str] = "apiregistration.k8s.io/v1"
+    kind: Optional[str] = "APIServiceList"
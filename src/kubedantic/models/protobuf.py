@@ -0,0 +1,1936 @@
+# generated by generator/main.py:
+#   timestamp: 2026-10-19T15:59:21+00:00
+#   k8s version: v1.30.0
+
+"""
+Protobuf messages of the kinds, from the ``generated.proto`` files of
+Kubernetes, by full name.
+
+Only the kinds of the packages of the files given to the generator have
+messages:
+
+* ``k8s.io.api.core.v1``
+* ``k8s.io.api.networking.v1``
+* ``k8s.io.apimachinery.pkg.apis.meta.v1``
+
+The fields of each message are given by number, as their JSON name, their
+label (``"optional"``, ``"repeated"``, ``"map"``, or ``"inline"`` for the
+messages whose fields are inlined in JSON) and their type, a scalar type or
+the full name of a message (of the values, for maps).
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+MESSAGES: Dict[str, Dict[int, Tuple[str, str, str]]] = {
+    "k8s.io.api.core.v1.AWSElasticBlockStoreVolumeSource": {
+        1: ("volumeID", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("partition", "optional", "int32"),
+        4: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.Affinity": {
+        1: ("nodeAffinity", "optional", "k8s.io.api.core.v1.NodeAffinity"),
+        2: ("podAffinity", "optional", "k8s.io.api.core.v1.PodAffinity"),
+        3: ("podAntiAffinity", "optional", "k8s.io.api.core.v1.PodAntiAffinity"),
+    },
+    "k8s.io.api.core.v1.AppArmorProfile": {
+        1: ("type", "optional", "string"),
+        2: ("localhostProfile", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.AttachedVolume": {
+        1: ("name", "optional", "string"),
+        2: ("devicePath", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.AzureDiskVolumeSource": {
+        1: ("diskName", "optional", "string"),
+        2: ("diskURI", "optional", "string"),
+        3: ("cachingMode", "optional", "string"),
+        4: ("fsType", "optional", "string"),
+        5: ("readOnly", "optional", "bool"),
+        6: ("kind", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.AzureFilePersistentVolumeSource": {
+        1: ("secretName", "optional", "string"),
+        2: ("shareName", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("secretNamespace", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.AzureFileVolumeSource": {
+        1: ("secretName", "optional", "string"),
+        2: ("shareName", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.Binding": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("target", "optional", "k8s.io.api.core.v1.ObjectReference"),
+    },
+    "k8s.io.api.core.v1.CSIPersistentVolumeSource": {
+        1: ("driver", "optional", "string"),
+        2: ("volumeHandle", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("fsType", "optional", "string"),
+        5: ("volumeAttributes", "map", "string"),
+        6: (
+            "controllerPublishSecretRef",
+            "optional",
+            "k8s.io.api.core.v1.SecretReference",
+        ),
+        7: ("nodeStageSecretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        8: ("nodePublishSecretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        9: (
+            "controllerExpandSecretRef",
+            "optional",
+            "k8s.io.api.core.v1.SecretReference",
+        ),
+        10: ("nodeExpandSecretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+    },
+    "k8s.io.api.core.v1.CSIVolumeSource": {
+        1: ("driver", "optional", "string"),
+        2: ("readOnly", "optional", "bool"),
+        3: ("fsType", "optional", "string"),
+        4: ("volumeAttributes", "map", "string"),
+        5: (
+            "nodePublishSecretRef",
+            "optional",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+    },
+    "k8s.io.api.core.v1.Capabilities": {
+        1: ("add", "repeated", "string"),
+        2: ("drop", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.CephFSPersistentVolumeSource": {
+        1: ("monitors", "repeated", "string"),
+        2: ("path", "optional", "string"),
+        3: ("user", "optional", "string"),
+        4: ("secretFile", "optional", "string"),
+        5: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        6: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.CephFSVolumeSource": {
+        1: ("monitors", "repeated", "string"),
+        2: ("path", "optional", "string"),
+        3: ("user", "optional", "string"),
+        4: ("secretFile", "optional", "string"),
+        5: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+        6: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.CinderPersistentVolumeSource": {
+        1: ("volumeID", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+    },
+    "k8s.io.api.core.v1.CinderVolumeSource": {
+        1: ("volumeID", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+    },
+    "k8s.io.api.core.v1.ClientIPConfig": {
+        1: ("timeoutSeconds", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.ClusterTrustBundleProjection": {
+        1: ("name", "optional", "string"),
+        2: ("signerName", "optional", "string"),
+        3: (
+            "labelSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        4: ("path", "optional", "string"),
+        5: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ComponentCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: ("message", "optional", "string"),
+        4: ("error", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ComponentStatus": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("conditions", "repeated", "k8s.io.api.core.v1.ComponentCondition"),
+    },
+    "k8s.io.api.core.v1.ComponentStatusList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.ComponentStatus"),
+    },
+    "k8s.io.api.core.v1.ConfigMap": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("data", "map", "string"),
+        3: ("binaryData", "map", "bytes"),
+        4: ("immutable", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ConfigMapEnvSource": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ConfigMapKeySelector": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("key", "optional", "string"),
+        3: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ConfigMapList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.ConfigMap"),
+    },
+    "k8s.io.api.core.v1.ConfigMapNodeConfigSource": {
+        1: ("namespace", "optional", "string"),
+        2: ("name", "optional", "string"),
+        3: ("uid", "optional", "string"),
+        4: ("resourceVersion", "optional", "string"),
+        5: ("kubeletConfigKey", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ConfigMapProjection": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("items", "repeated", "k8s.io.api.core.v1.KeyToPath"),
+        4: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ConfigMapVolumeSource": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("items", "repeated", "k8s.io.api.core.v1.KeyToPath"),
+        3: ("defaultMode", "optional", "int32"),
+        4: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.Container": {
+        1: ("name", "optional", "string"),
+        2: ("image", "optional", "string"),
+        3: ("command", "repeated", "string"),
+        4: ("args", "repeated", "string"),
+        5: ("workingDir", "optional", "string"),
+        6: ("ports", "repeated", "k8s.io.api.core.v1.ContainerPort"),
+        7: ("env", "repeated", "k8s.io.api.core.v1.EnvVar"),
+        8: ("resources", "optional", "k8s.io.api.core.v1.ResourceRequirements"),
+        9: ("volumeMounts", "repeated", "k8s.io.api.core.v1.VolumeMount"),
+        10: ("livenessProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        11: ("readinessProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        12: ("lifecycle", "optional", "k8s.io.api.core.v1.Lifecycle"),
+        13: ("terminationMessagePath", "optional", "string"),
+        14: ("imagePullPolicy", "optional", "string"),
+        15: ("securityContext", "optional", "k8s.io.api.core.v1.SecurityContext"),
+        16: ("stdin", "optional", "bool"),
+        17: ("stdinOnce", "optional", "bool"),
+        18: ("tty", "optional", "bool"),
+        19: ("envFrom", "repeated", "k8s.io.api.core.v1.EnvFromSource"),
+        20: ("terminationMessagePolicy", "optional", "string"),
+        21: ("volumeDevices", "repeated", "k8s.io.api.core.v1.VolumeDevice"),
+        22: ("startupProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        23: ("resizePolicy", "repeated", "k8s.io.api.core.v1.ContainerResizePolicy"),
+        24: ("restartPolicy", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ContainerImage": {
+        1: ("names", "repeated", "string"),
+        2: ("sizeBytes", "optional", "int64"),
+    },
+    "k8s.io.api.core.v1.ContainerPort": {
+        1: ("name", "optional", "string"),
+        2: ("hostPort", "optional", "int32"),
+        3: ("containerPort", "optional", "int32"),
+        4: ("protocol", "optional", "string"),
+        5: ("hostIP", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ContainerResizePolicy": {
+        1: ("resourceName", "optional", "string"),
+        2: ("restartPolicy", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ContainerState": {
+        1: ("waiting", "optional", "k8s.io.api.core.v1.ContainerStateWaiting"),
+        2: ("running", "optional", "k8s.io.api.core.v1.ContainerStateRunning"),
+        3: ("terminated", "optional", "k8s.io.api.core.v1.ContainerStateTerminated"),
+    },
+    "k8s.io.api.core.v1.ContainerStateRunning": {
+        1: ("startedAt", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+    },
+    "k8s.io.api.core.v1.ContainerStateTerminated": {
+        1: ("exitCode", "optional", "int32"),
+        2: ("signal", "optional", "int32"),
+        3: ("reason", "optional", "string"),
+        4: ("message", "optional", "string"),
+        5: ("startedAt", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        6: ("finishedAt", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        7: ("containerID", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ContainerStateWaiting": {
+        1: ("reason", "optional", "string"),
+        2: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ContainerStatus": {
+        1: ("name", "optional", "string"),
+        2: ("state", "optional", "k8s.io.api.core.v1.ContainerState"),
+        3: ("lastState", "optional", "k8s.io.api.core.v1.ContainerState"),
+        4: ("ready", "optional", "bool"),
+        5: ("restartCount", "optional", "int32"),
+        6: ("image", "optional", "string"),
+        7: ("imageID", "optional", "string"),
+        8: ("containerID", "optional", "string"),
+        9: ("started", "optional", "bool"),
+        10: (
+            "allocatedResources",
+            "map",
+            "k8s.io.apimachinery.pkg.api.resource.Quantity",
+        ),
+        11: ("resources", "optional", "k8s.io.api.core.v1.ResourceRequirements"),
+        12: ("volumeMounts", "repeated", "k8s.io.api.core.v1.VolumeMountStatus"),
+    },
+    "k8s.io.api.core.v1.DaemonEndpoint": {
+        1: ("Port", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.DownwardAPIProjection": {
+        1: ("items", "repeated", "k8s.io.api.core.v1.DownwardAPIVolumeFile"),
+    },
+    "k8s.io.api.core.v1.DownwardAPIVolumeFile": {
+        1: ("path", "optional", "string"),
+        2: ("fieldRef", "optional", "k8s.io.api.core.v1.ObjectFieldSelector"),
+        3: ("resourceFieldRef", "optional", "k8s.io.api.core.v1.ResourceFieldSelector"),
+        4: ("mode", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.DownwardAPIVolumeSource": {
+        1: ("items", "repeated", "k8s.io.api.core.v1.DownwardAPIVolumeFile"),
+        2: ("defaultMode", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.EmptyDirVolumeSource": {
+        1: ("medium", "optional", "string"),
+        2: ("sizeLimit", "optional", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+    },
+    "k8s.io.api.core.v1.EndpointAddress": {
+        1: ("ip", "optional", "string"),
+        2: ("targetRef", "optional", "k8s.io.api.core.v1.ObjectReference"),
+        3: ("hostname", "optional", "string"),
+        4: ("nodeName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.EndpointPort": {
+        1: ("name", "optional", "string"),
+        2: ("port", "optional", "int32"),
+        3: ("protocol", "optional", "string"),
+        4: ("appProtocol", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.EndpointSubset": {
+        1: ("addresses", "repeated", "k8s.io.api.core.v1.EndpointAddress"),
+        2: ("notReadyAddresses", "repeated", "k8s.io.api.core.v1.EndpointAddress"),
+        3: ("ports", "repeated", "k8s.io.api.core.v1.EndpointPort"),
+    },
+    "k8s.io.api.core.v1.Endpoints": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("subsets", "repeated", "k8s.io.api.core.v1.EndpointSubset"),
+    },
+    "k8s.io.api.core.v1.EndpointsList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Endpoints"),
+    },
+    "k8s.io.api.core.v1.EnvFromSource": {
+        1: ("prefix", "optional", "string"),
+        2: ("configMapRef", "optional", "k8s.io.api.core.v1.ConfigMapEnvSource"),
+        3: ("secretRef", "optional", "k8s.io.api.core.v1.SecretEnvSource"),
+    },
+    "k8s.io.api.core.v1.EnvVar": {
+        1: ("name", "optional", "string"),
+        2: ("value", "optional", "string"),
+        3: ("valueFrom", "optional", "k8s.io.api.core.v1.EnvVarSource"),
+    },
+    "k8s.io.api.core.v1.EnvVarSource": {
+        1: ("fieldRef", "optional", "k8s.io.api.core.v1.ObjectFieldSelector"),
+        2: ("resourceFieldRef", "optional", "k8s.io.api.core.v1.ResourceFieldSelector"),
+        3: ("configMapKeyRef", "optional", "k8s.io.api.core.v1.ConfigMapKeySelector"),
+        4: ("secretKeyRef", "optional", "k8s.io.api.core.v1.SecretKeySelector"),
+    },
+    "k8s.io.api.core.v1.EphemeralContainer": {
+        1: (
+            "ephemeralContainerCommon",
+            "inline",
+            "k8s.io.api.core.v1.EphemeralContainerCommon",
+        ),
+        2: ("targetContainerName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.EphemeralContainerCommon": {
+        1: ("name", "optional", "string"),
+        2: ("image", "optional", "string"),
+        3: ("command", "repeated", "string"),
+        4: ("args", "repeated", "string"),
+        5: ("workingDir", "optional", "string"),
+        6: ("ports", "repeated", "k8s.io.api.core.v1.ContainerPort"),
+        7: ("env", "repeated", "k8s.io.api.core.v1.EnvVar"),
+        8: ("resources", "optional", "k8s.io.api.core.v1.ResourceRequirements"),
+        9: ("volumeMounts", "repeated", "k8s.io.api.core.v1.VolumeMount"),
+        10: ("livenessProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        11: ("readinessProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        12: ("lifecycle", "optional", "k8s.io.api.core.v1.Lifecycle"),
+        13: ("terminationMessagePath", "optional", "string"),
+        14: ("imagePullPolicy", "optional", "string"),
+        15: ("securityContext", "optional", "k8s.io.api.core.v1.SecurityContext"),
+        16: ("stdin", "optional", "bool"),
+        17: ("stdinOnce", "optional", "bool"),
+        18: ("tty", "optional", "bool"),
+        19: ("envFrom", "repeated", "k8s.io.api.core.v1.EnvFromSource"),
+        20: ("terminationMessagePolicy", "optional", "string"),
+        21: ("volumeDevices", "repeated", "k8s.io.api.core.v1.VolumeDevice"),
+        22: ("startupProbe", "optional", "k8s.io.api.core.v1.Probe"),
+        23: ("resizePolicy", "repeated", "k8s.io.api.core.v1.ContainerResizePolicy"),
+        24: ("restartPolicy", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.EphemeralVolumeSource": {
+        1: (
+            "volumeClaimTemplate",
+            "optional",
+            "k8s.io.api.core.v1.PersistentVolumeClaimTemplate",
+        ),
+    },
+    "k8s.io.api.core.v1.Event": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("involvedObject", "optional", "k8s.io.api.core.v1.ObjectReference"),
+        3: ("reason", "optional", "string"),
+        4: ("message", "optional", "string"),
+        5: ("source", "optional", "k8s.io.api.core.v1.EventSource"),
+        6: ("firstTimestamp", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        7: ("lastTimestamp", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        8: ("count", "optional", "int32"),
+        9: ("type", "optional", "string"),
+        10: ("eventTime", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.MicroTime"),
+        11: ("series", "optional", "k8s.io.api.core.v1.EventSeries"),
+        12: ("action", "optional", "string"),
+        13: ("related", "optional", "k8s.io.api.core.v1.ObjectReference"),
+        14: ("reportingComponent", "optional", "string"),
+        15: ("reportingInstance", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.EventList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Event"),
+    },
+    "k8s.io.api.core.v1.EventSeries": {
+        1: ("count", "optional", "int32"),
+        2: (
+            "lastObservedTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.MicroTime",
+        ),
+    },
+    "k8s.io.api.core.v1.EventSource": {
+        1: ("component", "optional", "string"),
+        2: ("host", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ExecAction": {
+        1: ("command", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.FCVolumeSource": {
+        1: ("targetWWNs", "repeated", "string"),
+        2: ("lun", "optional", "int32"),
+        3: ("fsType", "optional", "string"),
+        4: ("readOnly", "optional", "bool"),
+        5: ("wwids", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.FlexPersistentVolumeSource": {
+        1: ("driver", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        4: ("readOnly", "optional", "bool"),
+        5: ("options", "map", "string"),
+    },
+    "k8s.io.api.core.v1.FlexVolumeSource": {
+        1: ("driver", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+        4: ("readOnly", "optional", "bool"),
+        5: ("options", "map", "string"),
+    },
+    "k8s.io.api.core.v1.FlockerVolumeSource": {
+        1: ("datasetName", "optional", "string"),
+        2: ("datasetUUID", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.GCEPersistentDiskVolumeSource": {
+        1: ("pdName", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("partition", "optional", "int32"),
+        4: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.GRPCAction": {
+        1: ("port", "optional", "int32"),
+        2: ("service", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.GitRepoVolumeSource": {
+        1: ("repository", "optional", "string"),
+        2: ("revision", "optional", "string"),
+        3: ("directory", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.GlusterfsPersistentVolumeSource": {
+        1: ("endpoints", "optional", "string"),
+        2: ("path", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("endpointsNamespace", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.GlusterfsVolumeSource": {
+        1: ("endpoints", "optional", "string"),
+        2: ("path", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.HTTPGetAction": {
+        1: ("path", "optional", "string"),
+        2: ("port", "optional", "k8s.io.apimachinery.pkg.util.intstr.IntOrString"),
+        3: ("host", "optional", "string"),
+        4: ("scheme", "optional", "string"),
+        5: ("httpHeaders", "repeated", "k8s.io.api.core.v1.HTTPHeader"),
+    },
+    "k8s.io.api.core.v1.HTTPHeader": {
+        1: ("name", "optional", "string"),
+        2: ("value", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.HostAlias": {
+        1: ("ip", "optional", "string"),
+        2: ("hostnames", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.HostIP": {
+        1: ("ip", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.HostPathVolumeSource": {
+        1: ("path", "optional", "string"),
+        2: ("type", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ISCSIPersistentVolumeSource": {
+        1: ("targetPortal", "optional", "string"),
+        2: ("iqn", "optional", "string"),
+        3: ("lun", "optional", "int32"),
+        4: ("iscsiInterface", "optional", "string"),
+        5: ("fsType", "optional", "string"),
+        6: ("readOnly", "optional", "bool"),
+        7: ("portals", "repeated", "string"),
+        8: ("chapAuthDiscovery", "optional", "bool"),
+        10: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        11: ("chapAuthSession", "optional", "bool"),
+        12: ("initiatorName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ISCSIVolumeSource": {
+        1: ("targetPortal", "optional", "string"),
+        2: ("iqn", "optional", "string"),
+        3: ("lun", "optional", "int32"),
+        4: ("iscsiInterface", "optional", "string"),
+        5: ("fsType", "optional", "string"),
+        6: ("readOnly", "optional", "bool"),
+        7: ("portals", "repeated", "string"),
+        8: ("chapAuthDiscovery", "optional", "bool"),
+        10: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+        11: ("chapAuthSession", "optional", "bool"),
+        12: ("initiatorName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ImageVolumeSource": {
+        1: ("reference", "optional", "string"),
+        2: ("pullPolicy", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.KeyToPath": {
+        1: ("key", "optional", "string"),
+        2: ("path", "optional", "string"),
+        3: ("mode", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.Lifecycle": {
+        1: ("postStart", "optional", "k8s.io.api.core.v1.LifecycleHandler"),
+        2: ("preStop", "optional", "k8s.io.api.core.v1.LifecycleHandler"),
+    },
+    "k8s.io.api.core.v1.LifecycleHandler": {
+        1: ("exec", "optional", "k8s.io.api.core.v1.ExecAction"),
+        2: ("httpGet", "optional", "k8s.io.api.core.v1.HTTPGetAction"),
+        3: ("tcpSocket", "optional", "k8s.io.api.core.v1.TCPSocketAction"),
+        4: ("sleep", "optional", "k8s.io.api.core.v1.SleepAction"),
+    },
+    "k8s.io.api.core.v1.LimitRange": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.LimitRangeSpec"),
+    },
+    "k8s.io.api.core.v1.LimitRangeItem": {
+        1: ("type", "optional", "string"),
+        2: ("max", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        3: ("min", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        4: ("default", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        5: ("defaultRequest", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        6: (
+            "maxLimitRequestRatio",
+            "map",
+            "k8s.io.apimachinery.pkg.api.resource.Quantity",
+        ),
+    },
+    "k8s.io.api.core.v1.LimitRangeList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.LimitRange"),
+    },
+    "k8s.io.api.core.v1.LimitRangeSpec": {
+        1: ("limits", "repeated", "k8s.io.api.core.v1.LimitRangeItem"),
+    },
+    "k8s.io.api.core.v1.LoadBalancerIngress": {
+        1: ("ip", "optional", "string"),
+        2: ("hostname", "optional", "string"),
+        3: ("ipMode", "optional", "string"),
+        4: ("ports", "repeated", "k8s.io.api.core.v1.PortStatus"),
+    },
+    "k8s.io.api.core.v1.LoadBalancerStatus": {
+        1: ("ingress", "repeated", "k8s.io.api.core.v1.LoadBalancerIngress"),
+    },
+    "k8s.io.api.core.v1.LocalObjectReference": {
+        1: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.LocalVolumeSource": {
+        1: ("path", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ModifyVolumeStatus": {
+        1: ("targetVolumeAttributesClassName", "optional", "string"),
+        2: ("status", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.NFSVolumeSource": {
+        1: ("server", "optional", "string"),
+        2: ("path", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.Namespace": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.NamespaceSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.NamespaceStatus"),
+    },
+    "k8s.io.api.core.v1.NamespaceCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        4: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        5: ("reason", "optional", "string"),
+        6: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.NamespaceList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Namespace"),
+    },
+    "k8s.io.api.core.v1.NamespaceSpec": {
+        1: ("finalizers", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.NamespaceStatus": {
+        1: ("phase", "optional", "string"),
+        2: ("conditions", "repeated", "k8s.io.api.core.v1.NamespaceCondition"),
+    },
+    "k8s.io.api.core.v1.Node": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.NodeSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.NodeStatus"),
+    },
+    "k8s.io.api.core.v1.NodeAddress": {
+        1: ("type", "optional", "string"),
+        2: ("address", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.NodeAffinity": {
+        1: (
+            "requiredDuringSchedulingIgnoredDuringExecution",
+            "optional",
+            "k8s.io.api.core.v1.NodeSelector",
+        ),
+        2: (
+            "preferredDuringSchedulingIgnoredDuringExecution",
+            "repeated",
+            "k8s.io.api.core.v1.PreferredSchedulingTerm",
+        ),
+    },
+    "k8s.io.api.core.v1.NodeCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: (
+            "lastHeartbeatTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        4: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        5: ("reason", "optional", "string"),
+        6: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.NodeConfigSource": {
+        2: ("configMap", "optional", "k8s.io.api.core.v1.ConfigMapNodeConfigSource"),
+    },
+    "k8s.io.api.core.v1.NodeConfigStatus": {
+        1: ("assigned", "optional", "k8s.io.api.core.v1.NodeConfigSource"),
+        2: ("active", "optional", "k8s.io.api.core.v1.NodeConfigSource"),
+        3: ("lastKnownGood", "optional", "k8s.io.api.core.v1.NodeConfigSource"),
+        4: ("error", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.NodeDaemonEndpoints": {
+        1: ("kubeletEndpoint", "optional", "k8s.io.api.core.v1.DaemonEndpoint"),
+    },
+    "k8s.io.api.core.v1.NodeList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Node"),
+    },
+    "k8s.io.api.core.v1.NodeRuntimeHandler": {
+        1: ("name", "optional", "string"),
+        2: ("features", "optional", "k8s.io.api.core.v1.NodeRuntimeHandlerFeatures"),
+    },
+    "k8s.io.api.core.v1.NodeRuntimeHandlerFeatures": {
+        1: ("recursiveReadOnlyMounts", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.NodeSelector": {
+        1: ("nodeSelectorTerms", "repeated", "k8s.io.api.core.v1.NodeSelectorTerm"),
+    },
+    "k8s.io.api.core.v1.NodeSelectorRequirement": {
+        1: ("key", "optional", "string"),
+        2: ("operator", "optional", "string"),
+        3: ("values", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.NodeSelectorTerm": {
+        1: (
+            "matchExpressions",
+            "repeated",
+            "k8s.io.api.core.v1.NodeSelectorRequirement",
+        ),
+        2: ("matchFields", "repeated", "k8s.io.api.core.v1.NodeSelectorRequirement"),
+    },
+    "k8s.io.api.core.v1.NodeSpec": {
+        1: ("podCIDR", "optional", "string"),
+        2: ("externalID", "optional", "string"),
+        3: ("providerID", "optional", "string"),
+        4: ("unschedulable", "optional", "bool"),
+        5: ("taints", "repeated", "k8s.io.api.core.v1.Taint"),
+        6: ("configSource", "optional", "k8s.io.api.core.v1.NodeConfigSource"),
+        7: ("podCIDRs", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.NodeStatus": {
+        1: ("capacity", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: ("allocatable", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        3: ("phase", "optional", "string"),
+        4: ("conditions", "repeated", "k8s.io.api.core.v1.NodeCondition"),
+        5: ("addresses", "repeated", "k8s.io.api.core.v1.NodeAddress"),
+        6: ("daemonEndpoints", "optional", "k8s.io.api.core.v1.NodeDaemonEndpoints"),
+        7: ("nodeInfo", "optional", "k8s.io.api.core.v1.NodeSystemInfo"),
+        8: ("images", "repeated", "k8s.io.api.core.v1.ContainerImage"),
+        9: ("volumesInUse", "repeated", "string"),
+        10: ("volumesAttached", "repeated", "k8s.io.api.core.v1.AttachedVolume"),
+        11: ("config", "optional", "k8s.io.api.core.v1.NodeConfigStatus"),
+        12: ("runtimeHandlers", "repeated", "k8s.io.api.core.v1.NodeRuntimeHandler"),
+    },
+    "k8s.io.api.core.v1.NodeSystemInfo": {
+        1: ("machineID", "optional", "string"),
+        2: ("systemUUID", "optional", "string"),
+        3: ("bootID", "optional", "string"),
+        4: ("kernelVersion", "optional", "string"),
+        5: ("osImage", "optional", "string"),
+        6: ("containerRuntimeVersion", "optional", "string"),
+        7: ("kubeletVersion", "optional", "string"),
+        8: ("kubeProxyVersion", "optional", "string"),
+        9: ("operatingSystem", "optional", "string"),
+        10: ("architecture", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ObjectFieldSelector": {
+        1: ("apiVersion", "optional", "string"),
+        2: ("fieldPath", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ObjectReference": {
+        1: ("kind", "optional", "string"),
+        2: ("namespace", "optional", "string"),
+        3: ("name", "optional", "string"),
+        4: ("uid", "optional", "string"),
+        5: ("apiVersion", "optional", "string"),
+        6: ("resourceVersion", "optional", "string"),
+        7: ("fieldPath", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PersistentVolume": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.PersistentVolumeSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.PersistentVolumeStatus"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaim": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.PersistentVolumeClaimSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.PersistentVolumeClaimStatus"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: ("lastProbeTime", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        4: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        5: ("reason", "optional", "string"),
+        6: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.PersistentVolumeClaim"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimSpec": {
+        1: ("accessModes", "repeated", "string"),
+        2: ("resources", "optional", "k8s.io.api.core.v1.VolumeResourceRequirements"),
+        3: ("volumeName", "optional", "string"),
+        4: (
+            "selector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        5: ("storageClassName", "optional", "string"),
+        6: ("volumeMode", "optional", "string"),
+        7: ("dataSource", "optional", "k8s.io.api.core.v1.TypedLocalObjectReference"),
+        8: ("dataSourceRef", "optional", "k8s.io.api.core.v1.TypedObjectReference"),
+        9: ("volumeAttributesClassName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimStatus": {
+        1: ("phase", "optional", "string"),
+        2: ("accessModes", "repeated", "string"),
+        3: ("capacity", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        4: (
+            "conditions",
+            "repeated",
+            "k8s.io.api.core.v1.PersistentVolumeClaimCondition",
+        ),
+        5: (
+            "allocatedResources",
+            "map",
+            "k8s.io.apimachinery.pkg.api.resource.Quantity",
+        ),
+        7: ("allocatedResourceStatuses", "map", "string"),
+        8: ("currentVolumeAttributesClassName", "optional", "string"),
+        9: ("modifyVolumeStatus", "optional", "k8s.io.api.core.v1.ModifyVolumeStatus"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimTemplate": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.PersistentVolumeClaimSpec"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeClaimVolumeSource": {
+        1: ("claimName", "optional", "string"),
+        2: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.PersistentVolume"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeSource": {
+        1: (
+            "gcePersistentDisk",
+            "optional",
+            "k8s.io.api.core.v1.GCEPersistentDiskVolumeSource",
+        ),
+        2: (
+            "awsElasticBlockStore",
+            "optional",
+            "k8s.io.api.core.v1.AWSElasticBlockStoreVolumeSource",
+        ),
+        3: ("hostPath", "optional", "k8s.io.api.core.v1.HostPathVolumeSource"),
+        4: (
+            "glusterfs",
+            "optional",
+            "k8s.io.api.core.v1.GlusterfsPersistentVolumeSource",
+        ),
+        5: ("nfs", "optional", "k8s.io.api.core.v1.NFSVolumeSource"),
+        6: ("rbd", "optional", "k8s.io.api.core.v1.RBDPersistentVolumeSource"),
+        7: ("iscsi", "optional", "k8s.io.api.core.v1.ISCSIPersistentVolumeSource"),
+        8: ("cinder", "optional", "k8s.io.api.core.v1.CinderPersistentVolumeSource"),
+        9: ("cephfs", "optional", "k8s.io.api.core.v1.CephFSPersistentVolumeSource"),
+        10: ("fc", "optional", "k8s.io.api.core.v1.FCVolumeSource"),
+        11: ("flocker", "optional", "k8s.io.api.core.v1.FlockerVolumeSource"),
+        12: ("flexVolume", "optional", "k8s.io.api.core.v1.FlexPersistentVolumeSource"),
+        13: (
+            "azureFile",
+            "optional",
+            "k8s.io.api.core.v1.AzureFilePersistentVolumeSource",
+        ),
+        14: (
+            "vsphereVolume",
+            "optional",
+            "k8s.io.api.core.v1.VsphereVirtualDiskVolumeSource",
+        ),
+        15: ("quobyte", "optional", "k8s.io.api.core.v1.QuobyteVolumeSource"),
+        16: ("azureDisk", "optional", "k8s.io.api.core.v1.AzureDiskVolumeSource"),
+        17: (
+            "photonPersistentDisk",
+            "optional",
+            "k8s.io.api.core.v1.PhotonPersistentDiskVolumeSource",
+        ),
+        18: ("portworxVolume", "optional", "k8s.io.api.core.v1.PortworxVolumeSource"),
+        19: ("scaleIO", "optional", "k8s.io.api.core.v1.ScaleIOPersistentVolumeSource"),
+        20: ("local", "optional", "k8s.io.api.core.v1.LocalVolumeSource"),
+        21: (
+            "storageos",
+            "optional",
+            "k8s.io.api.core.v1.StorageOSPersistentVolumeSource",
+        ),
+        22: ("csi", "optional", "k8s.io.api.core.v1.CSIPersistentVolumeSource"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeSpec": {
+        1: ("capacity", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: (
+            "persistentVolumeSource",
+            "inline",
+            "k8s.io.api.core.v1.PersistentVolumeSource",
+        ),
+        3: ("accessModes", "repeated", "string"),
+        4: ("claimRef", "optional", "k8s.io.api.core.v1.ObjectReference"),
+        5: ("persistentVolumeReclaimPolicy", "optional", "string"),
+        6: ("storageClassName", "optional", "string"),
+        7: ("mountOptions", "repeated", "string"),
+        8: ("volumeMode", "optional", "string"),
+        9: ("nodeAffinity", "optional", "k8s.io.api.core.v1.VolumeNodeAffinity"),
+        10: ("volumeAttributesClassName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PersistentVolumeStatus": {
+        1: ("phase", "optional", "string"),
+        2: ("message", "optional", "string"),
+        3: ("reason", "optional", "string"),
+        4: (
+            "lastPhaseTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+    },
+    "k8s.io.api.core.v1.PhotonPersistentDiskVolumeSource": {
+        1: ("pdID", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.Pod": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.PodSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.PodStatus"),
+    },
+    "k8s.io.api.core.v1.PodAffinity": {
+        1: (
+            "requiredDuringSchedulingIgnoredDuringExecution",
+            "repeated",
+            "k8s.io.api.core.v1.PodAffinityTerm",
+        ),
+        2: (
+            "preferredDuringSchedulingIgnoredDuringExecution",
+            "repeated",
+            "k8s.io.api.core.v1.WeightedPodAffinityTerm",
+        ),
+    },
+    "k8s.io.api.core.v1.PodAffinityTerm": {
+        1: (
+            "labelSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        2: ("namespaces", "repeated", "string"),
+        3: ("topologyKey", "optional", "string"),
+        4: (
+            "namespaceSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        5: ("matchLabelKeys", "repeated", "string"),
+        6: ("mismatchLabelKeys", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.PodAntiAffinity": {
+        1: (
+            "requiredDuringSchedulingIgnoredDuringExecution",
+            "repeated",
+            "k8s.io.api.core.v1.PodAffinityTerm",
+        ),
+        2: (
+            "preferredDuringSchedulingIgnoredDuringExecution",
+            "repeated",
+            "k8s.io.api.core.v1.WeightedPodAffinityTerm",
+        ),
+    },
+    "k8s.io.api.core.v1.PodCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: ("lastProbeTime", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        4: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        5: ("reason", "optional", "string"),
+        6: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodDNSConfig": {
+        1: ("nameservers", "repeated", "string"),
+        2: ("searches", "repeated", "string"),
+        3: ("options", "repeated", "k8s.io.api.core.v1.PodDNSConfigOption"),
+    },
+    "k8s.io.api.core.v1.PodDNSConfigOption": {
+        1: ("name", "optional", "string"),
+        2: ("value", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodIP": {
+        1: ("ip", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Pod"),
+    },
+    "k8s.io.api.core.v1.PodOS": {
+        1: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodReadinessGate": {
+        1: ("conditionType", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodResourceClaim": {
+        1: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodResourceClaimStatus": {
+        1: ("name", "optional", "string"),
+        2: ("resourceClaimName", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodSchedulingGate": {
+        1: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PodSecurityContext": {
+        1: ("seLinuxOptions", "optional", "k8s.io.api.core.v1.SELinuxOptions"),
+        2: ("runAsUser", "optional", "int64"),
+        3: ("runAsNonRoot", "optional", "bool"),
+        4: ("supplementalGroups", "repeated", "int64"),
+        5: ("fsGroup", "optional", "int64"),
+        6: ("runAsGroup", "optional", "int64"),
+        7: ("sysctls", "repeated", "k8s.io.api.core.v1.Sysctl"),
+        8: (
+            "windowsOptions",
+            "optional",
+            "k8s.io.api.core.v1.WindowsSecurityContextOptions",
+        ),
+        9: ("fsGroupChangePolicy", "optional", "string"),
+        10: ("seccompProfile", "optional", "k8s.io.api.core.v1.SeccompProfile"),
+        11: ("appArmorProfile", "optional", "k8s.io.api.core.v1.AppArmorProfile"),
+    },
+    "k8s.io.api.core.v1.PodSpec": {
+        1: ("volumes", "repeated", "k8s.io.api.core.v1.Volume"),
+        2: ("containers", "repeated", "k8s.io.api.core.v1.Container"),
+        3: ("restartPolicy", "optional", "string"),
+        4: ("terminationGracePeriodSeconds", "optional", "int64"),
+        5: ("activeDeadlineSeconds", "optional", "int64"),
+        6: ("dnsPolicy", "optional", "string"),
+        7: ("nodeSelector", "map", "string"),
+        8: ("serviceAccountName", "optional", "string"),
+        9: ("serviceAccount", "optional", "string"),
+        10: ("nodeName", "optional", "string"),
+        11: ("hostNetwork", "optional", "bool"),
+        12: ("hostPID", "optional", "bool"),
+        13: ("hostIPC", "optional", "bool"),
+        14: ("securityContext", "optional", "k8s.io.api.core.v1.PodSecurityContext"),
+        15: ("imagePullSecrets", "repeated", "k8s.io.api.core.v1.LocalObjectReference"),
+        16: ("hostname", "optional", "string"),
+        17: ("subdomain", "optional", "string"),
+        18: ("affinity", "optional", "k8s.io.api.core.v1.Affinity"),
+        19: ("schedulerName", "optional", "string"),
+        20: ("initContainers", "repeated", "k8s.io.api.core.v1.Container"),
+        21: ("automountServiceAccountToken", "optional", "bool"),
+        22: ("tolerations", "repeated", "k8s.io.api.core.v1.Toleration"),
+        23: ("hostAliases", "repeated", "k8s.io.api.core.v1.HostAlias"),
+        24: ("priorityClassName", "optional", "string"),
+        25: ("priority", "optional", "int32"),
+        26: ("dnsConfig", "optional", "k8s.io.api.core.v1.PodDNSConfig"),
+        27: ("shareProcessNamespace", "optional", "bool"),
+        28: ("readinessGates", "repeated", "k8s.io.api.core.v1.PodReadinessGate"),
+        29: ("runtimeClassName", "optional", "string"),
+        30: ("enableServiceLinks", "optional", "bool"),
+        31: ("preemptionPolicy", "optional", "string"),
+        32: ("overhead", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        33: (
+            "topologySpreadConstraints",
+            "repeated",
+            "k8s.io.api.core.v1.TopologySpreadConstraint",
+        ),
+        34: (
+            "ephemeralContainers",
+            "repeated",
+            "k8s.io.api.core.v1.EphemeralContainer",
+        ),
+        35: ("setHostnameAsFQDN", "optional", "bool"),
+        36: ("os", "optional", "k8s.io.api.core.v1.PodOS"),
+        37: ("hostUsers", "optional", "bool"),
+        38: ("schedulingGates", "repeated", "k8s.io.api.core.v1.PodSchedulingGate"),
+        39: ("resourceClaims", "repeated", "k8s.io.api.core.v1.PodResourceClaim"),
+    },
+    "k8s.io.api.core.v1.PodStatus": {
+        1: ("phase", "optional", "string"),
+        2: ("conditions", "repeated", "k8s.io.api.core.v1.PodCondition"),
+        3: ("message", "optional", "string"),
+        4: ("reason", "optional", "string"),
+        5: ("hostIP", "optional", "string"),
+        6: ("podIP", "optional", "string"),
+        7: ("startTime", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        8: ("containerStatuses", "repeated", "k8s.io.api.core.v1.ContainerStatus"),
+        9: ("qosClass", "optional", "string"),
+        10: ("initContainerStatuses", "repeated", "k8s.io.api.core.v1.ContainerStatus"),
+        11: ("nominatedNodeName", "optional", "string"),
+        12: ("podIPs", "repeated", "k8s.io.api.core.v1.PodIP"),
+        13: (
+            "ephemeralContainerStatuses",
+            "repeated",
+            "k8s.io.api.core.v1.ContainerStatus",
+        ),
+        14: ("resize", "optional", "string"),
+        15: (
+            "resourceClaimStatuses",
+            "repeated",
+            "k8s.io.api.core.v1.PodResourceClaimStatus",
+        ),
+        16: ("hostIPs", "repeated", "k8s.io.api.core.v1.HostIP"),
+    },
+    "k8s.io.api.core.v1.PodTemplate": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("template", "optional", "k8s.io.api.core.v1.PodTemplateSpec"),
+    },
+    "k8s.io.api.core.v1.PodTemplateList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.PodTemplate"),
+    },
+    "k8s.io.api.core.v1.PodTemplateSpec": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.PodSpec"),
+    },
+    "k8s.io.api.core.v1.PortStatus": {
+        1: ("port", "optional", "int32"),
+        2: ("protocol", "optional", "string"),
+        3: ("error", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.PortworxVolumeSource": {
+        1: ("volumeID", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.PreferredSchedulingTerm": {
+        1: ("weight", "optional", "int32"),
+        2: ("preference", "optional", "k8s.io.api.core.v1.NodeSelectorTerm"),
+    },
+    "k8s.io.api.core.v1.Probe": {
+        1: ("handler", "inline", "k8s.io.api.core.v1.ProbeHandler"),
+        2: ("initialDelaySeconds", "optional", "int32"),
+        3: ("timeoutSeconds", "optional", "int32"),
+        4: ("periodSeconds", "optional", "int32"),
+        5: ("successThreshold", "optional", "int32"),
+        6: ("failureThreshold", "optional", "int32"),
+        7: ("terminationGracePeriodSeconds", "optional", "int64"),
+    },
+    "k8s.io.api.core.v1.ProbeHandler": {
+        1: ("exec", "optional", "k8s.io.api.core.v1.ExecAction"),
+        2: ("httpGet", "optional", "k8s.io.api.core.v1.HTTPGetAction"),
+        3: ("tcpSocket", "optional", "k8s.io.api.core.v1.TCPSocketAction"),
+        4: ("grpc", "optional", "k8s.io.api.core.v1.GRPCAction"),
+    },
+    "k8s.io.api.core.v1.ProjectedVolumeSource": {
+        1: ("sources", "repeated", "k8s.io.api.core.v1.VolumeProjection"),
+        2: ("defaultMode", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.QuobyteVolumeSource": {
+        1: ("registry", "optional", "string"),
+        2: ("volume", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("user", "optional", "string"),
+        5: ("group", "optional", "string"),
+        6: ("tenant", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.RBDPersistentVolumeSource": {
+        1: ("monitors", "repeated", "string"),
+        2: ("image", "optional", "string"),
+        3: ("fsType", "optional", "string"),
+        4: ("pool", "optional", "string"),
+        5: ("user", "optional", "string"),
+        6: ("keyring", "optional", "string"),
+        7: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        8: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.RBDVolumeSource": {
+        1: ("monitors", "repeated", "string"),
+        2: ("image", "optional", "string"),
+        3: ("fsType", "optional", "string"),
+        4: ("pool", "optional", "string"),
+        5: ("user", "optional", "string"),
+        6: ("keyring", "optional", "string"),
+        7: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+        8: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ReplicationController": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.ReplicationControllerSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.ReplicationControllerStatus"),
+    },
+    "k8s.io.api.core.v1.ReplicationControllerCondition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        4: ("reason", "optional", "string"),
+        5: ("message", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ReplicationControllerList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.ReplicationController"),
+    },
+    "k8s.io.api.core.v1.ReplicationControllerSpec": {
+        1: ("replicas", "optional", "int32"),
+        2: ("selector", "map", "string"),
+        3: ("template", "optional", "k8s.io.api.core.v1.PodTemplateSpec"),
+        4: ("minReadySeconds", "optional", "int32"),
+    },
+    "k8s.io.api.core.v1.ReplicationControllerStatus": {
+        1: ("replicas", "optional", "int32"),
+        2: ("fullyLabeledReplicas", "optional", "int32"),
+        3: ("observedGeneration", "optional", "int64"),
+        4: ("readyReplicas", "optional", "int32"),
+        5: ("availableReplicas", "optional", "int32"),
+        6: (
+            "conditions",
+            "repeated",
+            "k8s.io.api.core.v1.ReplicationControllerCondition",
+        ),
+    },
+    "k8s.io.api.core.v1.ResourceClaim": {
+        1: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ResourceFieldSelector": {
+        1: ("containerName", "optional", "string"),
+        2: ("resource", "optional", "string"),
+        3: ("divisor", "optional", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+    },
+    "k8s.io.api.core.v1.ResourceQuota": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.ResourceQuotaSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.ResourceQuotaStatus"),
+    },
+    "k8s.io.api.core.v1.ResourceQuotaList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.ResourceQuota"),
+    },
+    "k8s.io.api.core.v1.ResourceQuotaSpec": {
+        1: ("hard", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: ("scopes", "repeated", "string"),
+        3: ("scopeSelector", "optional", "k8s.io.api.core.v1.ScopeSelector"),
+    },
+    "k8s.io.api.core.v1.ResourceQuotaStatus": {
+        1: ("hard", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: ("used", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+    },
+    "k8s.io.api.core.v1.ResourceRequirements": {
+        1: ("limits", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: ("requests", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        3: ("claims", "repeated", "k8s.io.api.core.v1.ResourceClaim"),
+    },
+    "k8s.io.api.core.v1.SELinuxOptions": {
+        1: ("user", "optional", "string"),
+        2: ("role", "optional", "string"),
+        3: ("type", "optional", "string"),
+        4: ("level", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ScaleIOPersistentVolumeSource": {
+        1: ("gateway", "optional", "string"),
+        2: ("system", "optional", "string"),
+        3: ("secretRef", "optional", "k8s.io.api.core.v1.SecretReference"),
+        4: ("sslEnabled", "optional", "bool"),
+        5: ("protectionDomain", "optional", "string"),
+        6: ("storagePool", "optional", "string"),
+        7: ("storageMode", "optional", "string"),
+        8: ("volumeName", "optional", "string"),
+        9: ("fsType", "optional", "string"),
+        10: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ScaleIOVolumeSource": {
+        1: ("gateway", "optional", "string"),
+        2: ("system", "optional", "string"),
+        3: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+        4: ("sslEnabled", "optional", "bool"),
+        5: ("protectionDomain", "optional", "string"),
+        6: ("storagePool", "optional", "string"),
+        7: ("storageMode", "optional", "string"),
+        8: ("volumeName", "optional", "string"),
+        9: ("fsType", "optional", "string"),
+        10: ("readOnly", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ScopeSelector": {
+        1: (
+            "matchExpressions",
+            "repeated",
+            "k8s.io.api.core.v1.ScopedResourceSelectorRequirement",
+        ),
+    },
+    "k8s.io.api.core.v1.ScopedResourceSelectorRequirement": {
+        1: ("scopeName", "optional", "string"),
+        2: ("operator", "optional", "string"),
+        3: ("values", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.SeccompProfile": {
+        1: ("type", "optional", "string"),
+        2: ("localhostProfile", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.Secret": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("data", "map", "bytes"),
+        3: ("type", "optional", "string"),
+        4: ("stringData", "map", "string"),
+        5: ("immutable", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.SecretEnvSource": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.SecretKeySelector": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("key", "optional", "string"),
+        3: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.SecretList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Secret"),
+    },
+    "k8s.io.api.core.v1.SecretProjection": {
+        1: (
+            "localObjectReference",
+            "inline",
+            "k8s.io.api.core.v1.LocalObjectReference",
+        ),
+        2: ("items", "repeated", "k8s.io.api.core.v1.KeyToPath"),
+        4: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.SecretReference": {
+        1: ("name", "optional", "string"),
+        2: ("namespace", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.SecretVolumeSource": {
+        1: ("secretName", "optional", "string"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.KeyToPath"),
+        3: ("defaultMode", "optional", "int32"),
+        4: ("optional", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.SecurityContext": {
+        1: ("capabilities", "optional", "k8s.io.api.core.v1.Capabilities"),
+        2: ("privileged", "optional", "bool"),
+        3: ("seLinuxOptions", "optional", "k8s.io.api.core.v1.SELinuxOptions"),
+        4: ("runAsUser", "optional", "int64"),
+        5: ("runAsNonRoot", "optional", "bool"),
+        6: ("readOnlyRootFilesystem", "optional", "bool"),
+        7: ("allowPrivilegeEscalation", "optional", "bool"),
+        8: ("runAsGroup", "optional", "int64"),
+        9: ("procMount", "optional", "string"),
+        10: (
+            "windowsOptions",
+            "optional",
+            "k8s.io.api.core.v1.WindowsSecurityContextOptions",
+        ),
+        11: ("seccompProfile", "optional", "k8s.io.api.core.v1.SeccompProfile"),
+        12: ("appArmorProfile", "optional", "k8s.io.api.core.v1.AppArmorProfile"),
+    },
+    "k8s.io.api.core.v1.Service": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.core.v1.ServiceSpec"),
+        3: ("status", "optional", "k8s.io.api.core.v1.ServiceStatus"),
+    },
+    "k8s.io.api.core.v1.ServiceAccount": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("secrets", "repeated", "k8s.io.api.core.v1.ObjectReference"),
+        3: ("imagePullSecrets", "repeated", "k8s.io.api.core.v1.LocalObjectReference"),
+        4: ("automountServiceAccountToken", "optional", "bool"),
+    },
+    "k8s.io.api.core.v1.ServiceAccountList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.ServiceAccount"),
+    },
+    "k8s.io.api.core.v1.ServiceAccountTokenProjection": {
+        1: ("audience", "optional", "string"),
+        2: ("expirationSeconds", "optional", "int64"),
+        3: ("path", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ServiceList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.core.v1.Service"),
+    },
+    "k8s.io.api.core.v1.ServicePort": {
+        1: ("name", "optional", "string"),
+        2: ("protocol", "optional", "string"),
+        3: ("port", "optional", "int32"),
+        4: (
+            "targetPort",
+            "optional",
+            "k8s.io.apimachinery.pkg.util.intstr.IntOrString",
+        ),
+        5: ("nodePort", "optional", "int32"),
+        6: ("appProtocol", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ServiceSpec": {
+        1: ("ports", "repeated", "k8s.io.api.core.v1.ServicePort"),
+        2: ("selector", "map", "string"),
+        3: ("clusterIP", "optional", "string"),
+        4: ("type", "optional", "string"),
+        5: ("externalIPs", "repeated", "string"),
+        7: ("sessionAffinity", "optional", "string"),
+        8: ("loadBalancerIP", "optional", "string"),
+        9: ("loadBalancerSourceRanges", "repeated", "string"),
+        10: ("externalName", "optional", "string"),
+        11: ("externalTrafficPolicy", "optional", "string"),
+        12: ("healthCheckNodePort", "optional", "int32"),
+        13: ("publishNotReadyAddresses", "optional", "bool"),
+        14: (
+            "sessionAffinityConfig",
+            "optional",
+            "k8s.io.api.core.v1.SessionAffinityConfig",
+        ),
+        17: ("ipFamilyPolicy", "optional", "string"),
+        18: ("clusterIPs", "repeated", "string"),
+        19: ("ipFamilies", "repeated", "string"),
+        20: ("allocateLoadBalancerNodePorts", "optional", "bool"),
+        21: ("loadBalancerClass", "optional", "string"),
+        22: ("internalTrafficPolicy", "optional", "string"),
+        23: ("trafficDistribution", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.ServiceStatus": {
+        1: ("loadBalancer", "optional", "k8s.io.api.core.v1.LoadBalancerStatus"),
+        2: ("conditions", "repeated", "k8s.io.apimachinery.pkg.apis.meta.v1.Condition"),
+    },
+    "k8s.io.api.core.v1.SessionAffinityConfig": {
+        1: ("clientIP", "optional", "k8s.io.api.core.v1.ClientIPConfig"),
+    },
+    "k8s.io.api.core.v1.SleepAction": {
+        1: ("seconds", "optional", "int64"),
+    },
+    "k8s.io.api.core.v1.StorageOSPersistentVolumeSource": {
+        1: ("volumeName", "optional", "string"),
+        2: ("volumeNamespace", "optional", "string"),
+        3: ("fsType", "optional", "string"),
+        4: ("readOnly", "optional", "bool"),
+        5: ("secretRef", "optional", "k8s.io.api.core.v1.ObjectReference"),
+    },
+    "k8s.io.api.core.v1.StorageOSVolumeSource": {
+        1: ("volumeName", "optional", "string"),
+        2: ("volumeNamespace", "optional", "string"),
+        3: ("fsType", "optional", "string"),
+        4: ("readOnly", "optional", "bool"),
+        5: ("secretRef", "optional", "k8s.io.api.core.v1.LocalObjectReference"),
+    },
+    "k8s.io.api.core.v1.Sysctl": {
+        1: ("name", "optional", "string"),
+        2: ("value", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.TCPSocketAction": {
+        1: ("port", "optional", "k8s.io.apimachinery.pkg.util.intstr.IntOrString"),
+        2: ("host", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.Taint": {
+        1: ("key", "optional", "string"),
+        2: ("value", "optional", "string"),
+        3: ("effect", "optional", "string"),
+        4: ("timeAdded", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+    },
+    "k8s.io.api.core.v1.Toleration": {
+        1: ("key", "optional", "string"),
+        2: ("operator", "optional", "string"),
+        3: ("value", "optional", "string"),
+        4: ("effect", "optional", "string"),
+        5: ("tolerationSeconds", "optional", "int64"),
+    },
+    "k8s.io.api.core.v1.TopologySpreadConstraint": {
+        1: ("maxSkew", "optional", "int32"),
+        2: ("topologyKey", "optional", "string"),
+        3: ("whenUnsatisfiable", "optional", "string"),
+        4: (
+            "labelSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        5: ("minDomains", "optional", "int32"),
+        6: ("nodeAffinityPolicy", "optional", "string"),
+        7: ("nodeTaintsPolicy", "optional", "string"),
+        8: ("matchLabelKeys", "repeated", "string"),
+    },
+    "k8s.io.api.core.v1.TypedLocalObjectReference": {
+        1: ("apiGroup", "optional", "string"),
+        2: ("kind", "optional", "string"),
+        3: ("name", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.TypedObjectReference": {
+        1: ("apiGroup", "optional", "string"),
+        2: ("kind", "optional", "string"),
+        3: ("name", "optional", "string"),
+        4: ("namespace", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.Volume": {
+        1: ("name", "optional", "string"),
+        2: ("volumeSource", "inline", "k8s.io.api.core.v1.VolumeSource"),
+    },
+    "k8s.io.api.core.v1.VolumeDevice": {
+        1: ("name", "optional", "string"),
+        2: ("devicePath", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.VolumeMount": {
+        1: ("name", "optional", "string"),
+        2: ("readOnly", "optional", "bool"),
+        3: ("mountPath", "optional", "string"),
+        4: ("subPath", "optional", "string"),
+        5: ("mountPropagation", "optional", "string"),
+        6: ("subPathExpr", "optional", "string"),
+        7: ("recursiveReadOnly", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.VolumeMountStatus": {
+        1: ("name", "optional", "string"),
+        2: ("mountPath", "optional", "string"),
+        3: ("readOnly", "optional", "bool"),
+        4: ("recursiveReadOnly", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.VolumeNodeAffinity": {
+        1: ("required", "optional", "k8s.io.api.core.v1.NodeSelector"),
+    },
+    "k8s.io.api.core.v1.VolumeProjection": {
+        1: ("secret", "optional", "k8s.io.api.core.v1.SecretProjection"),
+        2: ("downwardAPI", "optional", "k8s.io.api.core.v1.DownwardAPIProjection"),
+        3: ("configMap", "optional", "k8s.io.api.core.v1.ConfigMapProjection"),
+        4: (
+            "serviceAccountToken",
+            "optional",
+            "k8s.io.api.core.v1.ServiceAccountTokenProjection",
+        ),
+        5: (
+            "clusterTrustBundle",
+            "optional",
+            "k8s.io.api.core.v1.ClusterTrustBundleProjection",
+        ),
+    },
+    "k8s.io.api.core.v1.VolumeResourceRequirements": {
+        1: ("limits", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+        2: ("requests", "map", "k8s.io.apimachinery.pkg.api.resource.Quantity"),
+    },
+    "k8s.io.api.core.v1.VolumeSource": {
+        1: ("hostPath", "optional", "k8s.io.api.core.v1.HostPathVolumeSource"),
+        2: ("emptyDir", "optional", "k8s.io.api.core.v1.EmptyDirVolumeSource"),
+        3: (
+            "gcePersistentDisk",
+            "optional",
+            "k8s.io.api.core.v1.GCEPersistentDiskVolumeSource",
+        ),
+        4: (
+            "awsElasticBlockStore",
+            "optional",
+            "k8s.io.api.core.v1.AWSElasticBlockStoreVolumeSource",
+        ),
+        5: ("gitRepo", "optional", "k8s.io.api.core.v1.GitRepoVolumeSource"),
+        6: ("secret", "optional", "k8s.io.api.core.v1.SecretVolumeSource"),
+        7: ("nfs", "optional", "k8s.io.api.core.v1.NFSVolumeSource"),
+        8: ("iscsi", "optional", "k8s.io.api.core.v1.ISCSIVolumeSource"),
+        9: ("glusterfs", "optional", "k8s.io.api.core.v1.GlusterfsVolumeSource"),
+        10: (
+            "persistentVolumeClaim",
+            "optional",
+            "k8s.io.api.core.v1.PersistentVolumeClaimVolumeSource",
+        ),
+        11: ("rbd", "optional", "k8s.io.api.core.v1.RBDVolumeSource"),
+        12: ("flexVolume", "optional", "k8s.io.api.core.v1.FlexVolumeSource"),
+        13: ("cinder", "optional", "k8s.io.api.core.v1.CinderVolumeSource"),
+        14: ("cephfs", "optional", "k8s.io.api.core.v1.CephFSVolumeSource"),
+        15: ("flocker", "optional", "k8s.io.api.core.v1.FlockerVolumeSource"),
+        16: ("downwardAPI", "optional", "k8s.io.api.core.v1.DownwardAPIVolumeSource"),
+        17: ("fc", "optional", "k8s.io.api.core.v1.FCVolumeSource"),
+        18: ("azureFile", "optional", "k8s.io.api.core.v1.AzureFileVolumeSource"),
+        19: ("configMap", "optional", "k8s.io.api.core.v1.ConfigMapVolumeSource"),
+        20: (
+            "vsphereVolume",
+            "optional",
+            "k8s.io.api.core.v1.VsphereVirtualDiskVolumeSource",
+        ),
+        21: ("quobyte", "optional", "k8s.io.api.core.v1.QuobyteVolumeSource"),
+        22: ("azureDisk", "optional", "k8s.io.api.core.v1.AzureDiskVolumeSource"),
+        23: (
+            "photonPersistentDisk",
+            "optional",
+            "k8s.io.api.core.v1.PhotonPersistentDiskVolumeSource",
+        ),
+        24: ("portworxVolume", "optional", "k8s.io.api.core.v1.PortworxVolumeSource"),
+        25: ("scaleIO", "optional", "k8s.io.api.core.v1.ScaleIOVolumeSource"),
+        26: ("projected", "optional", "k8s.io.api.core.v1.ProjectedVolumeSource"),
+        27: ("storageos", "optional", "k8s.io.api.core.v1.StorageOSVolumeSource"),
+        28: ("csi", "optional", "k8s.io.api.core.v1.CSIVolumeSource"),
+        29: ("ephemeral", "optional", "k8s.io.api.core.v1.EphemeralVolumeSource"),
+        30: ("image", "optional", "k8s.io.api.core.v1.ImageVolumeSource"),
+    },
+    "k8s.io.api.core.v1.VsphereVirtualDiskVolumeSource": {
+        1: ("volumePath", "optional", "string"),
+        2: ("fsType", "optional", "string"),
+        3: ("storagePolicyName", "optional", "string"),
+        4: ("storagePolicyID", "optional", "string"),
+    },
+    "k8s.io.api.core.v1.WeightedPodAffinityTerm": {
+        1: ("weight", "optional", "int32"),
+        2: ("podAffinityTerm", "optional", "k8s.io.api.core.v1.PodAffinityTerm"),
+    },
+    "k8s.io.api.core.v1.WindowsSecurityContextOptions": {
+        1: ("gmsaCredentialSpecName", "optional", "string"),
+        2: ("gmsaCredentialSpec", "optional", "string"),
+        3: ("runAsUserName", "optional", "string"),
+        4: ("hostProcess", "optional", "bool"),
+    },
+    "k8s.io.api.networking.v1.HTTPIngressPath": {
+        1: ("path", "optional", "string"),
+        2: ("backend", "optional", "k8s.io.api.networking.v1.IngressBackend"),
+        3: ("pathType", "optional", "string"),
+    },
+    "k8s.io.api.networking.v1.HTTPIngressRuleValue": {
+        1: ("paths", "repeated", "k8s.io.api.networking.v1.HTTPIngressPath"),
+    },
+    "k8s.io.api.networking.v1.IPBlock": {
+        1: ("cidr", "optional", "string"),
+        2: ("except", "repeated", "string"),
+    },
+    "k8s.io.api.networking.v1.Ingress": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.networking.v1.IngressSpec"),
+        3: ("status", "optional", "k8s.io.api.networking.v1.IngressStatus"),
+    },
+    "k8s.io.api.networking.v1.IngressBackend": {
+        3: ("resource", "optional", "k8s.io.api.core.v1.TypedLocalObjectReference"),
+        4: ("service", "optional", "k8s.io.api.networking.v1.IngressServiceBackend"),
+    },
+    "k8s.io.api.networking.v1.IngressClass": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.networking.v1.IngressClassSpec"),
+    },
+    "k8s.io.api.networking.v1.IngressClassList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.networking.v1.IngressClass"),
+    },
+    "k8s.io.api.networking.v1.IngressClassParametersReference": {
+        1: ("apiGroup", "optional", "string"),
+        2: ("kind", "optional", "string"),
+        3: ("name", "optional", "string"),
+        4: ("scope", "optional", "string"),
+        5: ("namespace", "optional", "string"),
+    },
+    "k8s.io.api.networking.v1.IngressClassSpec": {
+        1: ("controller", "optional", "string"),
+        2: (
+            "parameters",
+            "optional",
+            "k8s.io.api.networking.v1.IngressClassParametersReference",
+        ),
+    },
+    "k8s.io.api.networking.v1.IngressList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.networking.v1.Ingress"),
+    },
+    "k8s.io.api.networking.v1.IngressLoadBalancerIngress": {
+        1: ("ip", "optional", "string"),
+        2: ("hostname", "optional", "string"),
+        4: ("ports", "repeated", "k8s.io.api.networking.v1.IngressPortStatus"),
+    },
+    "k8s.io.api.networking.v1.IngressLoadBalancerStatus": {
+        1: (
+            "ingress",
+            "repeated",
+            "k8s.io.api.networking.v1.IngressLoadBalancerIngress",
+        ),
+    },
+    "k8s.io.api.networking.v1.IngressPortStatus": {
+        1: ("port", "optional", "int32"),
+        2: ("protocol", "optional", "string"),
+        3: ("error", "optional", "string"),
+    },
+    "k8s.io.api.networking.v1.IngressRule": {
+        1: ("host", "optional", "string"),
+        2: ("ingressRuleValue", "inline", "k8s.io.api.networking.v1.IngressRuleValue"),
+    },
+    "k8s.io.api.networking.v1.IngressRuleValue": {
+        1: ("http", "optional", "k8s.io.api.networking.v1.HTTPIngressRuleValue"),
+    },
+    "k8s.io.api.networking.v1.IngressServiceBackend": {
+        1: ("name", "optional", "string"),
+        2: ("port", "optional", "k8s.io.api.networking.v1.ServiceBackendPort"),
+    },
+    "k8s.io.api.networking.v1.IngressSpec": {
+        1: ("defaultBackend", "optional", "k8s.io.api.networking.v1.IngressBackend"),
+        2: ("tls", "repeated", "k8s.io.api.networking.v1.IngressTLS"),
+        3: ("rules", "repeated", "k8s.io.api.networking.v1.IngressRule"),
+        4: ("ingressClassName", "optional", "string"),
+    },
+    "k8s.io.api.networking.v1.IngressStatus": {
+        1: (
+            "loadBalancer",
+            "optional",
+            "k8s.io.api.networking.v1.IngressLoadBalancerStatus",
+        ),
+    },
+    "k8s.io.api.networking.v1.IngressTLS": {
+        1: ("hosts", "repeated", "string"),
+        2: ("secretName", "optional", "string"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicy": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta"),
+        2: ("spec", "optional", "k8s.io.api.networking.v1.NetworkPolicySpec"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicyEgressRule": {
+        1: ("ports", "repeated", "k8s.io.api.networking.v1.NetworkPolicyPort"),
+        2: ("to", "repeated", "k8s.io.api.networking.v1.NetworkPolicyPeer"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicyIngressRule": {
+        1: ("ports", "repeated", "k8s.io.api.networking.v1.NetworkPolicyPort"),
+        2: ("from", "repeated", "k8s.io.api.networking.v1.NetworkPolicyPeer"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicyList": {
+        1: ("metadata", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta"),
+        2: ("items", "repeated", "k8s.io.api.networking.v1.NetworkPolicy"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicyPeer": {
+        1: (
+            "podSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        2: (
+            "namespaceSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        3: ("ipBlock", "optional", "k8s.io.api.networking.v1.IPBlock"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicyPort": {
+        1: ("protocol", "optional", "string"),
+        2: ("port", "optional", "k8s.io.apimachinery.pkg.util.intstr.IntOrString"),
+        3: ("endPort", "optional", "int32"),
+    },
+    "k8s.io.api.networking.v1.NetworkPolicySpec": {
+        1: (
+            "podSelector",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector",
+        ),
+        2: ("ingress", "repeated", "k8s.io.api.networking.v1.NetworkPolicyIngressRule"),
+        3: ("egress", "repeated", "k8s.io.api.networking.v1.NetworkPolicyEgressRule"),
+        4: ("policyTypes", "repeated", "string"),
+    },
+    "k8s.io.api.networking.v1.ServiceBackendPort": {
+        1: ("name", "optional", "string"),
+        2: ("number", "optional", "int32"),
+    },
+    "k8s.io.apimachinery.pkg.api.resource.Quantity": {
+        1: ("string", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.APIGroup": {
+        1: ("name", "optional", "string"),
+        2: (
+            "versions",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.GroupVersionForDiscovery",
+        ),
+        3: (
+            "preferredVersion",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.GroupVersionForDiscovery",
+        ),
+        4: (
+            "serverAddressByClientCIDRs",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.ServerAddressByClientCIDR",
+        ),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.APIGroupList": {
+        1: ("groups", "repeated", "k8s.io.apimachinery.pkg.apis.meta.v1.APIGroup"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.APIResource": {
+        1: ("name", "optional", "string"),
+        2: ("namespaced", "optional", "bool"),
+        3: ("kind", "optional", "string"),
+        4: ("verbs", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Verbs"),
+        5: ("shortNames", "repeated", "string"),
+        6: ("singularName", "optional", "string"),
+        7: ("categories", "repeated", "string"),
+        8: ("group", "optional", "string"),
+        9: ("version", "optional", "string"),
+        10: ("storageVersionHash", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.APIResourceList": {
+        1: ("groupVersion", "optional", "string"),
+        2: (
+            "resources",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.APIResource",
+        ),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.APIVersions": {
+        1: ("versions", "repeated", "string"),
+        2: (
+            "serverAddressByClientCIDRs",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.ServerAddressByClientCIDR",
+        ),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.Condition": {
+        1: ("type", "optional", "string"),
+        2: ("status", "optional", "string"),
+        3: ("observedGeneration", "optional", "int64"),
+        4: (
+            "lastTransitionTime",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        5: ("reason", "optional", "string"),
+        6: ("message", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.FieldsV1": {
+        1: ("Raw", "optional", "bytes"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.GroupVersionForDiscovery": {
+        1: ("groupVersion", "optional", "string"),
+        2: ("version", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelector": {
+        1: ("matchLabels", "map", "string"),
+        2: (
+            "matchExpressions",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelectorRequirement",
+        ),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.LabelSelectorRequirement": {
+        1: ("key", "optional", "string"),
+        2: ("operator", "optional", "string"),
+        3: ("values", "repeated", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.ListMeta": {
+        1: ("selfLink", "optional", "string"),
+        2: ("resourceVersion", "optional", "string"),
+        3: ("continue", "optional", "string"),
+        4: ("remainingItemCount", "optional", "int64"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry": {
+        1: ("manager", "optional", "string"),
+        2: ("operation", "optional", "string"),
+        3: ("apiVersion", "optional", "string"),
+        4: ("time", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.Time"),
+        6: ("fieldsType", "optional", "string"),
+        7: ("fieldsV1", "optional", "k8s.io.apimachinery.pkg.apis.meta.v1.FieldsV1"),
+        8: ("subresource", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.MicroTime": {
+        1: ("seconds", "optional", "int64"),
+        2: ("nanos", "optional", "int32"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.ObjectMeta": {
+        1: ("name", "optional", "string"),
+        2: ("generateName", "optional", "string"),
+        3: ("namespace", "optional", "string"),
+        4: ("selfLink", "optional", "string"),
+        5: ("uid", "optional", "string"),
+        6: ("resourceVersion", "optional", "string"),
+        7: ("generation", "optional", "int64"),
+        8: (
+            "creationTimestamp",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        9: (
+            "deletionTimestamp",
+            "optional",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.Time",
+        ),
+        10: ("deletionGracePeriodSeconds", "optional", "int64"),
+        11: ("labels", "map", "string"),
+        12: ("annotations", "map", "string"),
+        13: (
+            "ownerReferences",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.OwnerReference",
+        ),
+        14: ("finalizers", "repeated", "string"),
+        17: (
+            "managedFields",
+            "repeated",
+            "k8s.io.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry",
+        ),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.OwnerReference": {
+        1: ("kind", "optional", "string"),
+        3: ("name", "optional", "string"),
+        4: ("uid", "optional", "string"),
+        5: ("apiVersion", "optional", "string"),
+        6: ("controller", "optional", "bool"),
+        7: ("blockOwnerDeletion", "optional", "bool"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.ServerAddressByClientCIDR": {
+        1: ("clientCIDR", "optional", "string"),
+        2: ("serverAddress", "optional", "string"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.Time": {
+        1: ("seconds", "optional", "int64"),
+        2: ("nanos", "optional", "int32"),
+    },
+    "k8s.io.apimachinery.pkg.apis.meta.v1.Verbs": {
+        1: ("items", "repeated", "string"),
+    },
+    "k8s.io.apimachinery.pkg.util.intstr.IntOrString": {
+        1: ("type", "optional", "int64"),
+        2: ("intVal", "optional", "int32"),
+        3: ("strVal", "optional", "string"),
+    },
+}
+
+# Messages encoded as the list of their items in JSON
+LIST_MESSAGES: FrozenSet[str] = frozenset(
+    ["k8s.io.apimachinery.pkg.apis.meta.v1.Verbs"]
+)
+
+KINDS: Dict[Tuple[str, str], str] = {
+    ("networking.k8s.io/v1", "Ingress"): "k8s.io.api.networking.v1.Ingress",
+    ("networking.k8s.io/v1", "IngressClass"): "k8s.io.api.networking.v1.IngressClass",
+    (
+        "networking.k8s.io/v1",
+        "IngressClassList",
+    ): "k8s.io.api.networking.v1.IngressClassList",
+    ("networking.k8s.io/v1", "IngressList"): "k8s.io.api.networking.v1.IngressList",
+    ("networking.k8s.io/v1", "NetworkPolicy"): "k8s.io.api.networking.v1.NetworkPolicy",
+    (
+        "networking.k8s.io/v1",
+        "NetworkPolicyList",
+    ): "k8s.io.api.networking.v1.NetworkPolicyList",
+    ("v1", "APIGroup"): "k8s.io.apimachinery.pkg.apis.meta.v1.APIGroup",
+    ("v1", "APIGroupList"): "k8s.io.apimachinery.pkg.apis.meta.v1.APIGroupList",
+    ("v1", "APIResourceList"): "k8s.io.apimachinery.pkg.apis.meta.v1.APIResourceList",
+    ("v1", "APIVersions"): "k8s.io.apimachinery.pkg.apis.meta.v1.APIVersions",
+    ("v1", "Binding"): "k8s.io.api.core.v1.Binding",
+    ("v1", "ComponentStatus"): "k8s.io.api.core.v1.ComponentStatus",
+    ("v1", "ComponentStatusList"): "k8s.io.api.core.v1.ComponentStatusList",
+    ("v1", "ConfigMap"): "k8s.io.api.core.v1.ConfigMap",
+    ("v1", "ConfigMapList"): "k8s.io.api.core.v1.ConfigMapList",
+    ("v1", "Endpoints"): "k8s.io.api.core.v1.Endpoints",
+    ("v1", "EndpointsList"): "k8s.io.api.core.v1.EndpointsList",
+    ("v1", "Event"): "k8s.io.api.core.v1.Event",
+    ("v1", "EventList"): "k8s.io.api.core.v1.EventList",
+    ("v1", "LimitRange"): "k8s.io.api.core.v1.LimitRange",
+    ("v1", "LimitRangeList"): "k8s.io.api.core.v1.LimitRangeList",
+    ("v1", "Namespace"): "k8s.io.api.core.v1.Namespace",
+    ("v1", "NamespaceList"): "k8s.io.api.core.v1.NamespaceList",
+    ("v1", "Node"): "k8s.io.api.core.v1.Node",
+    ("v1", "NodeList"): "k8s.io.api.core.v1.NodeList",
+    ("v1", "PersistentVolume"): "k8s.io.api.core.v1.PersistentVolume",
+    ("v1", "PersistentVolumeClaim"): "k8s.io.api.core.v1.PersistentVolumeClaim",
+    ("v1", "PersistentVolumeClaimList"): "k8s.io.api.core.v1.PersistentVolumeClaimList",
+    ("v1", "PersistentVolumeList"): "k8s.io.api.core.v1.PersistentVolumeList",
+    ("v1", "Pod"): "k8s.io.api.core.v1.Pod",
+    ("v1", "PodList"): "k8s.io.api.core.v1.PodList",
+    ("v1", "PodTemplate"): "k8s.io.api.core.v1.PodTemplate",
+    ("v1", "PodTemplateList"): "k8s.io.api.core.v1.PodTemplateList",
+    ("v1", "ReplicationController"): "k8s.io.api.core.v1.ReplicationController",
+    ("v1", "ReplicationControllerList"): "k8s.io.api.core.v1.ReplicationControllerList",
+    ("v1", "ResourceQuota"): "k8s.io.api.core.v1.ResourceQuota",
+    ("v1", "ResourceQuotaList"): "k8s.io.api.core.v1.ResourceQuotaList",
+    ("v1", "Secret"): "k8s.io.api.core.v1.Secret",
+    ("v1", "SecretList"): "k8s.io.api.core.v1.SecretList",
+    ("v1", "Service"): "k8s.io.api.core.v1.Service",
+    ("v1", "ServiceAccount"): "k8s.io.api.core.v1.ServiceAccount",
+    ("v1", "ServiceAccountList"): "k8s.io.api.core.v1.ServiceAccountList",
+    ("v1", "ServiceList"): "k8s.io.api.core.v1.ServiceList",
+}
@@ -0,0 +1,497 @@
+# generated by generator/main.py:
+#   timestamp: 2026-10-19T15:26:05+00:00
+#   k8s version: v1.30.0
+
+"""
+Fields populated by the server, which are left out when exporting objects
+to apply them again, by ``apiVersion`` and ``kind``.
+
+The values are nested dicts of the excluded fields, as ``exclude`` takes
+them in ``model_dump``, with ``"__all__"`` standing for every list item.
+"""
+
+from typing import Any, Dict, Tuple
+
+_OBJECT_META = {
+    "creationTimestamp": True,
+    "deletionGracePeriodSeconds": True,
+    "deletionTimestamp": True,
+    "generation": True,
+    "managedFields": True,
+    "resourceVersion": True,
+    "selfLink": True,
+    "uid": True,
+}
+_MUTATING_WEBHOOK_CONFIGURATION = {"metadata": _OBJECT_META}
+_LIST_META = {"resourceVersion": True, "selfLink": True}
+_MUTATING_WEBHOOK_CONFIGURATION_LIST = {
+    "items": {"__all__": _MUTATING_WEBHOOK_CONFIGURATION},
+    "metadata": _LIST_META,
+}
+_VALIDATING_ADMISSION_POLICY = {"metadata": _OBJECT_META, "status": True}
+_VALIDATING_ADMISSION_POLICY_BINDING = {"metadata": _OBJECT_META}
+_VALIDATING_ADMISSION_POLICY_BINDING_LIST = {
+    "items": {"__all__": _VALIDATING_ADMISSION_POLICY_BINDING},
+    "metadata": _LIST_META,
+}
+_VALIDATING_ADMISSION_POLICY_LIST = {
+    "items": {"__all__": _VALIDATING_ADMISSION_POLICY},
+    "metadata": _LIST_META,
+}
+_VALIDATING_WEBHOOK_CONFIGURATION = {"metadata": _OBJECT_META}
+_VALIDATING_WEBHOOK_CONFIGURATION_LIST = {
+    "items": {"__all__": _VALIDATING_WEBHOOK_CONFIGURATION},
+    "metadata": _LIST_META,
+}
+_V1ALPHA1_VALIDATING_ADMISSION_POLICY = {"metadata": _OBJECT_META, "status": True}
+_V1ALPHA1_VALIDATING_ADMISSION_POLICY_BINDING = {"metadata": _OBJECT_META}
+_V1ALPHA1_VALIDATING_ADMISSION_POLICY_BINDING_LIST = {
+    "items": {"__all__": _V1ALPHA1_VALIDATING_ADMISSION_POLICY_BINDING},
+    "metadata": _LIST_META,
+}
+_V1ALPHA1_VALIDATING_ADMISSION_POLICY_LIST = {
+    "items": {"__all__": _V1ALPHA1_VALIDATING_ADMISSION_POLICY},
+    "metadata": _LIST_META,
+}
+_V1BETA1_VALIDATING_ADMISSION_POLICY = {"metadata": _OBJECT_META, "status": True}
+_V1BETA1_VALIDATING_ADMISSION_POLICY_BINDING = {"metadata": _OBJECT_META}
+_V1BETA1_VALIDATING_ADMISSION_POLICY_BINDING_LIST = {
+    "items": {"__all__": _V1BETA1_VALIDATING_ADMISSION_POLICY_BINDING},
+    "metadata": _LIST_META,
+}
+_V1BETA1_VALIDATING_ADMISSION_POLICY_LIST = {
+    "items": {"__all__": _V1BETA1_VALIDATING_ADMISSION_POLICY},
+    "metadata": _LIST_META,
+}
+_CONTROLLER_REVISION = {"metadata": _OBJECT_META}
+_CONTROLLER_REVISION_LIST = {
+    "items": {"__all__": _CONTROLLER_REVISION},
+    "metadata": _LIST_META,
+}
+_PERSISTENT_VOLUME_CLAIM_TEMPLATE = {"metadata": _OBJECT_META}
+_EPHEMERAL_VOLUME_SOURCE = {"volumeClaimTemplate": _PERSISTENT_VOLUME_CLAIM_TEMPLATE}
+_VOLUME = {"ephemeral": _EPHEMERAL_VOLUME_SOURCE}
+_POD_SPEC = {"volumes": {"__all__": _VOLUME}}
+_POD_TEMPLATE_SPEC = {"metadata": _OBJECT_META, "spec": _POD_SPEC}
+_DAEMON_SET_SPEC = {"template": _POD_TEMPLATE_SPEC}
+_DAEMON_SET = {"metadata": _OBJECT_META, "spec": _DAEMON_SET_SPEC, "status": True}
+_DAEMON_SET_LIST = {"items": {"__all__": _DAEMON_SET}, "metadata": _LIST_META}
+_DEPLOYMENT_SPEC = {"template": _POD_TEMPLATE_SPEC}
+_DEPLOYMENT = {"metadata": _OBJECT_META, "spec": _DEPLOYMENT_SPEC, "status": True}
+_DEPLOYMENT_LIST = {"items": {"__all__": _DEPLOYMENT}, "metadata": _LIST_META}
+_REPLICA_SET_SPEC = {"template": _POD_TEMPLATE_SPEC}
+_REPLICA_SET = {"metadata": _OBJECT_META, "spec": _REPLICA_SET_SPEC, "status": True}
+_REPLICA_SET_LIST = {"items": {"__all__": _REPLICA_SET}, "metadata": _LIST_META}
+_PERSISTENT_VOLUME_CLAIM = {"metadata": _OBJECT_META, "status": True}
+_STATEFUL_SET_SPEC = {
+    "template": _POD_TEMPLATE_SPEC,
+    "volumeClaimTemplates": {"__all__": _PERSISTENT_VOLUME_CLAIM},
+}
+_STATEFUL_SET = {"metadata": _OBJECT_META, "spec": _STATEFUL_SET_SPEC, "status": True}
+_STATEFUL_SET_LIST = {"items": {"__all__": _STATEFUL_SET}, "metadata": _LIST_META}
+_SELF_SUBJECT_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_TOKEN_REQUEST = {"metadata": _OBJECT_META, "status": True}
+_TOKEN_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_V1ALPHA1_SELF_SUBJECT_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_V1BETA1_SELF_SUBJECT_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_LOCAL_SUBJECT_ACCESS_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_SELF_SUBJECT_ACCESS_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_SELF_SUBJECT_RULES_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_SUBJECT_ACCESS_REVIEW = {"metadata": _OBJECT_META, "status": True}
+_HORIZONTAL_POD_AUTOSCALER = {"metadata": _OBJECT_META, "status": True}
+_HORIZONTAL_POD_AUTOSCALER_LIST = {
+    "items": {"__all__": _HORIZONTAL_POD_AUTOSCALER},
+    "metadata": _LIST_META,
+}
+_SCALE = {"metadata": _OBJECT_META, "status": True}
+_V2_HORIZONTAL_POD_AUTOSCALER = {"metadata": _OBJECT_META, "status": True}
+_V2_HORIZONTAL_POD_AUTOSCALER_LIST = {
+    "items": {"__all__": _V2_HORIZONTAL_POD_AUTOSCALER},
+    "metadata": _LIST_META,
+}
+_JOB_SPEC = {"template": _POD_TEMPLATE_SPEC}
+_JOB_TEMPLATE_SPEC = {"metadata": _OBJECT_META, "spec": _JOB_SPEC}
+_CRON_JOB_SPEC = {"jobTemplate": _JOB_TEMPLATE_SPEC}
+_CRON_JOB = {"metadata": _OBJECT_META, "spec": _CRON_JOB_SPEC, "status": True}
+_CRON_JOB_LIST = {"items": {"__all__": _CRON_JOB}, "metadata": _LIST_META}
+_JOB = {"metadata": _OBJECT_META, "spec": _JOB_SPEC, "status": True}
+_JOB_LIST = {"items": {"__all__": _JOB}, "metadata": _LIST_META}
+_CERTIFICATE_SIGNING_REQUEST = {"metadata": _OBJECT_META, "status": True}
+_CERTIFICATE_SIGNING_REQUEST_LIST = {
+    "items": {"__all__": _CERTIFICATE_SIGNING_REQUEST},
+    "metadata": _LIST_META,
+}
+_CLUSTER_TRUST_BUNDLE = {"metadata": _OBJECT_META}
+_CLUSTER_TRUST_BUNDLE_LIST = {
+    "items": {"__all__": _CLUSTER_TRUST_BUNDLE},
+    "metadata": _LIST_META,
+}
+_LEASE = {"metadata": _OBJECT_META}
+_LEASE_LIST = {"items": {"__all__": _LEASE}, "metadata": _LIST_META}
+_BINDING = {"metadata": _OBJECT_META}
+_COMPONENT_STATUS = {"metadata": _OBJECT_META}
+_COMPONENT_STATUS_LIST = {
+    "items": {"__all__": _COMPONENT_STATUS},
+    "metadata": _LIST_META,
+}
+_CONFIG_MAP = {"metadata": _OBJECT_META}
+_CONFIG_MAP_LIST = {"items": {"__all__": _CONFIG_MAP}, "metadata": _LIST_META}
+_ENDPOINTS = {"metadata": _OBJECT_META}
+_ENDPOINTS_LIST = {"items": {"__all__": _ENDPOINTS}, "metadata": _LIST_META}
+_EVENT = {"metadata": _OBJECT_META}
+_EVENT_LIST = {"items": {"__all__": _EVENT}, "metadata": _LIST_META}
+_LIMIT_RANGE = {"metadata": _OBJECT_META}
+_LIMIT_RANGE_LIST = {"items": {"__all__": _LIMIT_RANGE}, "metadata": _LIST_META}
+_NAMESPACE = {"metadata": _OBJECT_META, "status": True}
+_NAMESPACE_LIST = {"items": {"__all__": _NAMESPACE}, "metadata": _LIST_META}
+_NODE = {"metadata": _OBJECT_META, "status": True}
+_NODE_LIST = {"items": {"__all__": _NODE}, "metadata": _LIST_META}
+_PERSISTENT_VOLUME = {"metadata": _OBJECT_META, "status": True}
+_PERSISTENT_VOLUME_CLAIM_LIST = {
+    "items": {"__all__": _PERSISTENT_VOLUME_CLAIM},
+    "metadata": _LIST_META,
+}
+_PERSISTENT_VOLUME_LIST = {
+    "items": {"__all__": _PERSISTENT_VOLUME},
+    "metadata": _LIST_META,
+}
+_POD = {"metadata": _OBJECT_META, "spec": _POD_SPEC, "status": True}
+_POD_LIST = {"items": {"__all__": _POD}, "metadata": _LIST_META}
+_POD_TEMPLATE = {"metadata": _OBJECT_META, "template": _POD_TEMPLATE_SPEC}
+_POD_TEMPLATE_LIST = {"items": {"__all__": _POD_TEMPLATE}, "metadata": _LIST_META}
+_REPLICATION_CONTROLLER_SPEC = {"template": _POD_TEMPLATE_SPEC}
+_REPLICATION_CONTROLLER = {
+    "metadata": _OBJECT_META,
+    "spec": _REPLICATION_CONTROLLER_SPEC,
+    "status": True,
+}
+_REPLICATION_CONTROLLER_LIST = {
+    "items": {"__all__": _REPLICATION_CONTROLLER},
+    "metadata": _LIST_META,
+}
+_RESOURCE_QUOTA = {"metadata": _OBJECT_META, "status": True}
+_RESOURCE_QUOTA_LIST = {"items": {"__all__": _RESOURCE_QUOTA}, "metadata": _LIST_META}
+_SECRET = {"metadata": _OBJECT_META}
+_SECRET_LIST = {"items": {"__all__": _SECRET}, "metadata": _LIST_META}
+_SERVICE = {"metadata": _OBJECT_META, "status": True}
+_SERVICE_ACCOUNT = {"metadata": _OBJECT_META}
+_SERVICE_ACCOUNT_LIST = {"items": {"__all__": _SERVICE_ACCOUNT}, "metadata": _LIST_META}
+_SERVICE_LIST = {"items": {"__all__": _SERVICE}, "metadata": _LIST_META}
+_ENDPOINT_SLICE = {"metadata": _OBJECT_META}
+_ENDPOINT_SLICE_LIST = {"items": {"__all__": _ENDPOINT_SLICE}, "metadata": _LIST_META}
+_V1_EVENT = {"metadata": _OBJECT_META}
+_V1_EVENT_LIST = {"items": {"__all__": _V1_EVENT}, "metadata": _LIST_META}
+_FLOW_SCHEMA = {"metadata": _OBJECT_META, "status": True}
+_FLOW_SCHEMA_LIST = {"items": {"__all__": _FLOW_SCHEMA}, "metadata": _LIST_META}
+_PRIORITY_LEVEL_CONFIGURATION = {"metadata": _OBJECT_META, "status": True}
+_PRIORITY_LEVEL_CONFIGURATION_LIST = {
+    "items": {"__all__": _PRIORITY_LEVEL_CONFIGURATION},
+    "metadata": _LIST_META,
+}
+_V1BETA3_FLOW_SCHEMA = {"metadata": _OBJECT_META, "status": True}
+_V1BETA3_FLOW_SCHEMA_LIST = {
+    "items": {"__all__": _V1BETA3_FLOW_SCHEMA},
+    "metadata": _LIST_META,
+}
+_V1BETA3_PRIORITY_LEVEL_CONFIGURATION = {"metadata": _OBJECT_META, "status": True}
+_V1BETA3_PRIORITY_LEVEL_CONFIGURATION_LIST = {
+    "items": {"__all__": _V1BETA3_PRIORITY_LEVEL_CONFIGURATION},
+    "metadata": _LIST_META,
+}
+_INGRESS = {"metadata": _OBJECT_META, "status": True}
+_INGRESS_CLASS = {"metadata": _OBJECT_META}
+_INGRESS_CLASS_LIST = {"items": {"__all__": _INGRESS_CLASS}, "metadata": _LIST_META}
+_INGRESS_LIST = {"items": {"__all__": _INGRESS}, "metadata": _LIST_META}
+_NETWORK_POLICY = {"metadata": _OBJECT_META}
+_NETWORK_POLICY_LIST = {"items": {"__all__": _NETWORK_POLICY}, "metadata": _LIST_META}
+_IPADDRESS = {"metadata": _OBJECT_META}
+_IPADDRESS_LIST = {"items": {"__all__": _IPADDRESS}, "metadata": _LIST_META}
+_SERVICE_CIDR = {"metadata": _OBJECT_META, "status": True}
+_SERVICE_CIDRLIST = {"items": {"__all__": _SERVICE_CIDR}, "metadata": _LIST_META}
+_RUNTIME_CLASS = {"metadata": _OBJECT_META}
+_RUNTIME_CLASS_LIST = {"items": {"__all__": _RUNTIME_CLASS}, "metadata": _LIST_META}
+_EVICTION = {"metadata": _OBJECT_META}
+_POD_DISRUPTION_BUDGET = {"metadata": _OBJECT_META, "status": True}
+_POD_DISRUPTION_BUDGET_LIST = {
+    "items": {"__all__": _POD_DISRUPTION_BUDGET},
+    "metadata": _LIST_META,
+}
+_CLUSTER_ROLE = {"metadata": _OBJECT_META}
+_CLUSTER_ROLE_BINDING = {"metadata": _OBJECT_META}
+_CLUSTER_ROLE_BINDING_LIST = {
+    "items": {"__all__": _CLUSTER_ROLE_BINDING},
+    "metadata": _LIST_META,
+}
+_CLUSTER_ROLE_LIST = {"items": {"__all__": _CLUSTER_ROLE}, "metadata": _LIST_META}
+_ROLE = {"metadata": _OBJECT_META}
+_ROLE_BINDING = {"metadata": _OBJECT_META}
+_ROLE_BINDING_LIST = {"items": {"__all__": _ROLE_BINDING}, "metadata": _LIST_META}
+_ROLE_LIST = {"items": {"__all__": _ROLE}, "metadata": _LIST_META}
+_PRIORITY_CLASS = {"metadata": _OBJECT_META}
+_PRIORITY_CLASS_LIST = {"items": {"__all__": _PRIORITY_CLASS}, "metadata": _LIST_META}
+_CSIDRIVER = {"metadata": _OBJECT_META}
+_CSIDRIVER_LIST = {"items": {"__all__": _CSIDRIVER}, "metadata": _LIST_META}
+_CSINODE = {"metadata": _OBJECT_META}
+_CSINODE_LIST = {"items": {"__all__": _CSINODE}, "metadata": _LIST_META}
+_CSISTORAGE_CAPACITY = {"metadata": _OBJECT_META}
+_CSISTORAGE_CAPACITY_LIST = {
+    "items": {"__all__": _CSISTORAGE_CAPACITY},
+    "metadata": _LIST_META,
+}
+_STORAGE_CLASS = {"metadata": _OBJECT_META}
+_STORAGE_CLASS_LIST = {"items": {"__all__": _STORAGE_CLASS}, "metadata": _LIST_META}
+_VOLUME_ATTACHMENT = {"metadata": _OBJECT_META, "status": True}
+_VOLUME_ATTACHMENT_LIST = {
+    "items": {"__all__": _VOLUME_ATTACHMENT},
+    "metadata": _LIST_META,
+}
+_VOLUME_ATTRIBUTES_CLASS = {"metadata": _OBJECT_META}
+_VOLUME_ATTRIBUTES_CLASS_LIST = {
+    "items": {"__all__": _VOLUME_ATTRIBUTES_CLASS},
+    "metadata": _LIST_META,
+}
+_CUSTOM_RESOURCE_DEFINITION = {"metadata": _OBJECT_META, "status": True}
+_CUSTOM_RESOURCE_DEFINITION_LIST = {
+    "items": {"__all__": _CUSTOM_RESOURCE_DEFINITION},
+    "metadata": _LIST_META,
+}
+_APISERVICE = {"metadata": _OBJECT_META, "status": True}
+_APISERVICE_LIST = {"items": {"__all__": _APISERVICE}, "metadata": _LIST_META}
+
+READ_ONLY_FIELDS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    (
+        "admissionregistration.k8s.io/v1",
+        "MutatingWebhookConfiguration",
+    ): _MUTATING_WEBHOOK_CONFIGURATION,
+    (
+        "admissionregistration.k8s.io/v1",
+        "MutatingWebhookConfigurationList",
+    ): _MUTATING_WEBHOOK_CONFIGURATION_LIST,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingAdmissionPolicy",
+    ): _VALIDATING_ADMISSION_POLICY,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingAdmissionPolicyBinding",
+    ): _VALIDATING_ADMISSION_POLICY_BINDING,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingAdmissionPolicyBindingList",
+    ): _VALIDATING_ADMISSION_POLICY_BINDING_LIST,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingAdmissionPolicyList",
+    ): _VALIDATING_ADMISSION_POLICY_LIST,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingWebhookConfiguration",
+    ): _VALIDATING_WEBHOOK_CONFIGURATION,
+    (
+        "admissionregistration.k8s.io/v1",
+        "ValidatingWebhookConfigurationList",
+    ): _VALIDATING_WEBHOOK_CONFIGURATION_LIST,
+    (
+        "admissionregistration.k8s.io/v1alpha1",
+        "ValidatingAdmissionPolicy",
+    ): _V1ALPHA1_VALIDATING_ADMISSION_POLICY,
+    (
+        "admissionregistration.k8s.io/v1alpha1",
+        "ValidatingAdmissionPolicyBinding",
+    ): _V1ALPHA1_VALIDATING_ADMISSION_POLICY_BINDING,
+    (
+        "admissionregistration.k8s.io/v1alpha1",
+        "ValidatingAdmissionPolicyBindingList",
+    ): _V1ALPHA1_VALIDATING_ADMISSION_POLICY_BINDING_LIST,
+    (
+        "admissionregistration.k8s.io/v1alpha1",
+        "ValidatingAdmissionPolicyList",
+    ): _V1ALPHA1_VALIDATING_ADMISSION_POLICY_LIST,
+    (
+        "admissionregistration.k8s.io/v1beta1",
+        "ValidatingAdmissionPolicy",
+    ): _V1BETA1_VALIDATING_ADMISSION_POLICY,
+    (
+        "admissionregistration.k8s.io/v1beta1",
+        "ValidatingAdmissionPolicyBinding",
+    ): _V1BETA1_VALIDATING_ADMISSION_POLICY_BINDING,
+    (
+        "admissionregistration.k8s.io/v1beta1",
+        "ValidatingAdmissionPolicyBindingList",
+    ): _V1BETA1_VALIDATING_ADMISSION_POLICY_BINDING_LIST,
+    (
+        "admissionregistration.k8s.io/v1beta1",
+        "ValidatingAdmissionPolicyList",
+    ): _V1BETA1_VALIDATING_ADMISSION_POLICY_LIST,
+    (
+        "apiextensions.k8s.io/v1",
+        "CustomResourceDefinition",
+    ): _CUSTOM_RESOURCE_DEFINITION,
+    (
+        "apiextensions.k8s.io/v1",
+        "CustomResourceDefinitionList",
+    ): _CUSTOM_RESOURCE_DEFINITION_LIST,
+    ("apiregistration.k8s.io/v1", "APIService"): _APISERVICE,
+    ("apiregistration.k8s.io/v1", "APIServiceList"): _APISERVICE_LIST,
+    ("apps/v1", "ControllerRevision"): _CONTROLLER_REVISION,
+    ("apps/v1", "ControllerRevisionList"): _CONTROLLER_REVISION_LIST,
+    ("apps/v1", "DaemonSet"): _DAEMON_SET,
+    ("apps/v1", "DaemonSetList"): _DAEMON_SET_LIST,
+    ("apps/v1", "Deployment"): _DEPLOYMENT,
+    ("apps/v1", "DeploymentList"): _DEPLOYMENT_LIST,
+    ("apps/v1", "ReplicaSet"): _REPLICA_SET,
+    ("apps/v1", "ReplicaSetList"): _REPLICA_SET_LIST,
+    ("apps/v1", "StatefulSet"): _STATEFUL_SET,
+    ("apps/v1", "StatefulSetList"): _STATEFUL_SET_LIST,
+    ("authentication.k8s.io/v1", "SelfSubjectReview"): _SELF_SUBJECT_REVIEW,
+    ("authentication.k8s.io/v1", "TokenRequest"): _TOKEN_REQUEST,
+    ("authentication.k8s.io/v1", "TokenReview"): _TOKEN_REVIEW,
+    (
+        "authentication.k8s.io/v1alpha1",
+        "SelfSubjectReview",
+    ): _V1ALPHA1_SELF_SUBJECT_REVIEW,
+    (
+        "authentication.k8s.io/v1beta1",
+        "SelfSubjectReview",
+    ): _V1BETA1_SELF_SUBJECT_REVIEW,
+    (
+        "authorization.k8s.io/v1",
+        "LocalSubjectAccessReview",
+    ): _LOCAL_SUBJECT_ACCESS_REVIEW,
+    ("authorization.k8s.io/v1", "SelfSubjectAccessReview"): _SELF_SUBJECT_ACCESS_REVIEW,
+    ("authorization.k8s.io/v1", "SelfSubjectRulesReview"): _SELF_SUBJECT_RULES_REVIEW,
+    ("authorization.k8s.io/v1", "SubjectAccessReview"): _SUBJECT_ACCESS_REVIEW,
+    ("autoscaling/v1", "HorizontalPodAutoscaler"): _HORIZONTAL_POD_AUTOSCALER,
+    ("autoscaling/v1", "HorizontalPodAutoscalerList"): _HORIZONTAL_POD_AUTOSCALER_LIST,
+    ("autoscaling/v1", "Scale"): _SCALE,
+    ("autoscaling/v2", "HorizontalPodAutoscaler"): _V2_HORIZONTAL_POD_AUTOSCALER,
+    (
+        "autoscaling/v2",
+        "HorizontalPodAutoscalerList",
+    ): _V2_HORIZONTAL_POD_AUTOSCALER_LIST,
+    ("batch/v1", "CronJob"): _CRON_JOB,
+    ("batch/v1", "CronJobList"): _CRON_JOB_LIST,
+    ("batch/v1", "Job"): _JOB,
+    ("batch/v1", "JobList"): _JOB_LIST,
+    (
+        "certificates.k8s.io/v1",
+        "CertificateSigningRequest",
+    ): _CERTIFICATE_SIGNING_REQUEST,
+    (
+        "certificates.k8s.io/v1",
+        "CertificateSigningRequestList",
+    ): _CERTIFICATE_SIGNING_REQUEST_LIST,
+    ("certificates.k8s.io/v1alpha1", "ClusterTrustBundle"): _CLUSTER_TRUST_BUNDLE,
+    (
+        "certificates.k8s.io/v1alpha1",
+        "ClusterTrustBundleList",
+    ): _CLUSTER_TRUST_BUNDLE_LIST,
+    ("coordination.k8s.io/v1", "Lease"): _LEASE,
+    ("coordination.k8s.io/v1", "LeaseList"): _LEASE_LIST,
+    ("discovery.k8s.io/v1", "EndpointSlice"): _ENDPOINT_SLICE,
+    ("discovery.k8s.io/v1", "EndpointSliceList"): _ENDPOINT_SLICE_LIST,
+    ("events.k8s.io/v1", "Event"): _V1_EVENT,
+    ("events.k8s.io/v1", "EventList"): _V1_EVENT_LIST,
+    ("flowcontrol.apiserver.k8s.io/v1", "FlowSchema"): _FLOW_SCHEMA,
+    ("flowcontrol.apiserver.k8s.io/v1", "FlowSchemaList"): _FLOW_SCHEMA_LIST,
+    (
+        "flowcontrol.apiserver.k8s.io/v1",
+        "PriorityLevelConfiguration",
+    ): _PRIORITY_LEVEL_CONFIGURATION,
+    (
+        "flowcontrol.apiserver.k8s.io/v1",
+        "PriorityLevelConfigurationList",
+    ): _PRIORITY_LEVEL_CONFIGURATION_LIST,
+    ("flowcontrol.apiserver.k8s.io/v1beta3", "FlowSchema"): _V1BETA3_FLOW_SCHEMA,
+    (
+        "flowcontrol.apiserver.k8s.io/v1beta3",
+        "FlowSchemaList",
+    ): _V1BETA3_FLOW_SCHEMA_LIST,
+    (
+        "flowcontrol.apiserver.k8s.io/v1beta3",
+        "PriorityLevelConfiguration",
+    ): _V1BETA3_PRIORITY_LEVEL_CONFIGURATION,
+    (
+        "flowcontrol.apiserver.k8s.io/v1beta3",
+        "PriorityLevelConfigurationList",
+    ): _V1BETA3_PRIORITY_LEVEL_CONFIGURATION_LIST,
+    ("networking.k8s.io/v1", "Ingress"): _INGRESS,
+    ("networking.k8s.io/v1", "IngressClass"): _INGRESS_CLASS,
+    ("networking.k8s.io/v1", "IngressClassList"): _INGRESS_CLASS_LIST,
+    ("networking.k8s.io/v1", "IngressList"): _INGRESS_LIST,
+    ("networking.k8s.io/v1", "NetworkPolicy"): _NETWORK_POLICY,
+    ("networking.k8s.io/v1", "NetworkPolicyList"): _NETWORK_POLICY_LIST,
+    ("networking.k8s.io/v1alpha1", "IPAddress"): _IPADDRESS,
+    ("networking.k8s.io/v1alpha1", "IPAddressList"): _IPADDRESS_LIST,
+    ("networking.k8s.io/v1alpha1", "ServiceCIDR"): _SERVICE_CIDR,
+    ("networking.k8s.io/v1alpha1", "ServiceCIDRList"): _SERVICE_CIDRLIST,
+    ("node.k8s.io/v1", "RuntimeClass"): _RUNTIME_CLASS,
+    ("node.k8s.io/v1", "RuntimeClassList"): _RUNTIME_CLASS_LIST,
+    ("policy/v1", "Eviction"): _EVICTION,
+    ("policy/v1", "PodDisruptionBudget"): _POD_DISRUPTION_BUDGET,
+    ("policy/v1", "PodDisruptionBudgetList"): _POD_DISRUPTION_BUDGET_LIST,
+    ("rbac.authorization.k8s.io/v1", "ClusterRole"): _CLUSTER_ROLE,
+    ("rbac.authorization.k8s.io/v1", "ClusterRoleBinding"): _CLUSTER_ROLE_BINDING,
+    (
+        "rbac.authorization.k8s.io/v1",
+        "ClusterRoleBindingList",
+    ): _CLUSTER_ROLE_BINDING_LIST,
+    ("rbac.authorization.k8s.io/v1", "ClusterRoleList"): _CLUSTER_ROLE_LIST,
+    ("rbac.authorization.k8s.io/v1", "Role"): _ROLE,
+    ("rbac.authorization.k8s.io/v1", "RoleBinding"): _ROLE_BINDING,
+    ("rbac.authorization.k8s.io/v1", "RoleBindingList"): _ROLE_BINDING_LIST,
+    ("rbac.authorization.k8s.io/v1", "RoleList"): _ROLE_LIST,
+    ("scheduling.k8s.io/v1", "PriorityClass"): _PRIORITY_CLASS,
+    ("scheduling.k8s.io/v1", "PriorityClassList"): _PRIORITY_CLASS_LIST,
+    ("storage.k8s.io/v1", "CSIDriver"): _CSIDRIVER,
+    ("storage.k8s.io/v1", "CSIDriverList"): _CSIDRIVER_LIST,
+    ("storage.k8s.io/v1", "CSINode"): _CSINODE,
+    ("storage.k8s.io/v1", "CSINodeList"): _CSINODE_LIST,
+    ("storage.k8s.io/v1", "CSIStorageCapacity"): _CSISTORAGE_CAPACITY,
+    ("storage.k8s.io/v1", "CSIStorageCapacityList"): _CSISTORAGE_CAPACITY_LIST,
+    ("storage.k8s.io/v1", "StorageClass"): _STORAGE_CLASS,
+    ("storage.k8s.io/v1", "StorageClassList"): _STORAGE_CLASS_LIST,
+    ("storage.k8s.io/v1", "VolumeAttachment"): _VOLUME_ATTACHMENT,
+    ("storage.k8s.io/v1", "VolumeAttachmentList"): _VOLUME_ATTACHMENT_LIST,
+    ("storage.k8s.io/v1alpha1", "VolumeAttributesClass"): _VOLUME_ATTRIBUTES_CLASS,
+    (
+        "storage.k8s.io/v1alpha1",
+        "VolumeAttributesClassList",
+    ): _VOLUME_ATTRIBUTES_CLASS_LIST,
+    ("v1", "Binding"): _BINDING,
+    ("v1", "ComponentStatus"): _COMPONENT_STATUS,
+    ("v1", "ComponentStatusList"): _COMPONENT_STATUS_LIST,
+    ("v1", "ConfigMap"): _CONFIG_MAP,
+    ("v1", "ConfigMapList"): _CONFIG_MAP_LIST,
+    ("v1", "Endpoints"): _ENDPOINTS,
+    ("v1", "EndpointsList"): _ENDPOINTS_LIST,
+    ("v1", "Event"): _EVENT,
+    ("v1", "EventList"): _EVENT_LIST,
+    ("v1", "LimitRange"): _LIMIT_RANGE,
+    ("v1", "LimitRangeList"): _LIMIT_RANGE_LIST,
+    ("v1", "Namespace"): _NAMESPACE,
+    ("v1", "NamespaceList"): _NAMESPACE_LIST,
+    ("v1", "Node"): _NODE,
+    ("v1", "NodeList"): _NODE_LIST,
+    ("v1", "PersistentVolume"): _PERSISTENT_VOLUME,
+    ("v1", "PersistentVolumeClaim"): _PERSISTENT_VOLUME_CLAIM,
+    ("v1", "PersistentVolumeClaimList"): _PERSISTENT_VOLUME_CLAIM_LIST,
+    ("v1", "PersistentVolumeList"): _PERSISTENT_VOLUME_LIST,
+    ("v1", "Pod"): _POD,
+    ("v1", "PodList"): _POD_LIST,
+    ("v1", "PodTemplate"): _POD_TEMPLATE,
+    ("v1", "PodTemplateList"): _POD_TEMPLATE_LIST,
+    ("v1", "ReplicationController"): _REPLICATION_CONTROLLER,
+    ("v1", "ReplicationControllerList"): _REPLICATION_CONTROLLER_LIST,
+    ("v1", "ResourceQuota"): _RESOURCE_QUOTA,
+    ("v1", "ResourceQuotaList"): _RESOURCE_QUOTA_LIST,
+    ("v1", "Secret"): _SECRET,
+    ("v1", "SecretList"): _SECRET_LIST,
+    ("v1", "Service"): _SERVICE,
+    ("v1", "ServiceAccount"): _SERVICE_ACCOUNT,
+    ("v1", "ServiceAccountList"): _SERVICE_ACCOUNT_LIST,
+    ("v1", "ServiceList"): _SERVICE_LIST,
+}
+
+# Fields of the kinds missing above, e.g. custom resources
+DEFAULT_READ_ONLY_FIELDS: Dict[str, Any] = {"metadata": _OBJECT_META, "status": True}
@@ -0,0 +1,193 @@
+"""
+Field paths into models, e.g. ``spec.template.spec.containers[0].image`` or
+``metadata.labels["app.kubernetes.io/name"]``.
+"""
+
+import re
+from typing import Any, Dict, List, Mapping, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .sharing import _get_model_type
+
+M = TypeVar("M", bound=BaseModel)
+
+Segment = Union[str, int]
+
+_SEGMENT = re.compile(
+    r"""
+    \.?(?P<name>[^.\[\]]+)          # attribute or key, e.g. .spec
+    | \[(?P<index>-?\d+)\]          # list index, e.g. [0]
+    | \[(?P<quote>["'])(?P<key>.*?)(?P=quote)\]  # quoted key, e.g. ["a.b/c"]
+    """,
+    re.VERBOSE,
+)
+
+
+class InvalidPathError(ValueError):
+    pass
+
+
+def parse_path(path: str) -> Tuple[Segment, ...]:
+    """
+    Splits a path into its segments: names (or keys) and list indexes.
+
+    :raises InvalidPathError: If the path is malformed.
+    """
+    segments: List[Segment] = []
+    position = 0
+
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        if match is None or (position == 0 and path.startswith(".")):
+            raise InvalidPathError(f"Invalid path {path!r} at position {position}")
+
+        if match.group("index") is not None:
+            segments.append(int(match.group("index")))
+        else:
+            segments.append(match.group("name") or match.group("key"))
+        position = match.end()
+
+    if not segments:
+        raise InvalidPathError("Empty path")
+
+    return tuple(segments)
+
+
+def _get_child(node: Any, segment: Segment) -> Any:
+    if isinstance(node, BaseModel):
+        if not isinstance(segment, str) or segment not in type(node).model_fields:
+            raise InvalidPathError(f"{type(node).__name__} has no field {segment!r}")
+        return getattr(node, segment)
+
+    if isinstance(node, Mapping):
+        return node.get(segment)
+
+    if isinstance(node, (list, tuple)):
+        if not isinstance(segment, int):
+            raise InvalidPathError(f"Expected a list index, got {segment!r}")
+        return node[segment]
+
+    raise InvalidPathError(f"Cannot look up {segment!r} in {type(node).__name__}")
+
+
+def get_path(
+    obj: Any, path: Union[str, Tuple[Segment, ...]], default: Any = None
+) -> Any:
+    """
+    Returns the value at ``path``, or ``default`` if a field along the way
+    is unset.
+    """
+    segments = parse_path(path) if isinstance(path, str) else path
+    node = obj
+
+    for segment in segments:
+        if node is None:
+            return default
+        try:
+            node = _get_child(node, segment)
+        except (IndexError, KeyError):
+            return default
+
+    return default if node is None else node
+
+
+def _new_child(node: Any, segment: Segment) -> Any:
+    """
+    Returns an empty value for a missing intermediate field along a path.
+
+    :raises InvalidPathError: If the field is a model with required fields,
+        which must then be given whole.
+    """
+    if isinstance(node, BaseModel) and isinstance(segment, str):
+        field = type(node).model_fields[segment]
+        model = _get_model_type(field.annotation)
+        if model is not None:
+            required = [
+                name for name, info in model.model_fields.items() if info.is_required()
+            ]
+            if required:
+                raise InvalidPathError(
+                    f"{type(node).__name__}.{segment} is unset and {model.__name__}"
+                    f" requires {', '.join(required)}; set it whole instead"
+                )
+            return model.model_construct()
+
+    return {}
+
+
+def _evolve(node: Any, changes: Dict[Segment, Any]) -> Any:
+    """
+    Returns a shallow copy of ``node`` with the given children replaced,
+    evolving the children with nested changes recursively.
+    """
+    values: Dict[Any, Any] = {}
+    for segment, change in changes.items():
+        try:
+            child = _get_child(node, segment)
+        except IndexError:
+            raise InvalidPathError(f"List index {segment} out of range") from None
+
+        if isinstance(change, _Nested):
+            if child is None:
+                child = _new_child(node, segment)
+            values[segment] = _evolve(child, change.changes)
+        else:
+            values[segment] = change.value
+
+    if isinstance(node, BaseModel):
+        return node.model_copy(update=values)
+
+    if isinstance(node, (list, tuple)):
+        items = list(node)
+        for index, value in values.items():
+            items[index] = value
+        return type(node)(items)
+
+    return type(node)({**node, **values})
+
+
+class _Nested:
+    __slots__ = ("changes",)
+
+    def __init__(self) -> None:
+        self.changes: Dict[Segment, Any] = {}
+
+
+class _Leaf:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def evolve(obj: M, changes: Mapping[str, Any]) -> M:
+    """
+    Returns a copy of ``obj`` with the values at the given paths replaced.
+
+    Only the models, lists and dicts along the paths are copied; everything
+    else is shared with ``obj``, which is left untouched. As with
+    ``model_copy(update=...)``, the new values are not validated::
+
+        evolve(deployment, {
+            "spec.replicas": 3,
+            "spec.template.spec.containers[0].image": "nginx:1.27",
+        })
+
+    :raises InvalidPathError: If a path does not exist in the model.
+    """
+    root = _Nested()
+
+    for path, value in changes.items():
+        *parents, leaf = parse_path(path)
+        node = root
+        for segment in parents:
+            child = node.changes.setdefault(segment, _Nested())
+            if not isinstance(child, _Nested):
+                raise InvalidPathError(f"Conflicting changes for {path!r}")
+            node = child
+        if leaf in node.changes:
+            raise InvalidPathError(f"Conflicting changes for {path!r}")
+        node.changes[leaf] = _Leaf(value)
+
+    return _evolve(obj, root.changes)
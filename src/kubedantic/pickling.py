@@ -0,0 +1,90 @@
+"""
+Compact pickling of the Kubernetes kinds and lists, e.g. to send large lists
+to the workers of a ``ProcessPoolExecutor``.
+
+Objects are pickled as the JSON of the fields that are set, encoded by
+pydantic, and validated again when unpickled. With protocol 5 the JSON is an
+out-of-band buffer if the pickler is given a ``buffer_callback``::
+
+    buffers = []
+    data = pickle.dumps(pods, protocol=5, buffer_callback=buffers.append)
+    pods = pickle.loads(data, buffers=buffers)
+
+Building many models at once triggers collections of the younger generations
+again and again, none of which would find any garbage. :func:`restore` can
+pause the garbage collector while it validates, which callers that own the
+process may opt into; as the collector is global, it is never paused when
+unpickling.
+"""
+
+import contextlib
+import gc
+import operator
+import pickle
+import threading
+from typing import Any, Callable, Iterator, Optional, SupportsIndex, Tuple, Type
+
+from pydantic import BaseModel
+
+Buffer = Any
+
+# Restores in progress, by any thread, and whether the collector was enabled
+# before the first one
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_enabled = False
+
+
+@contextlib.contextmanager
+def _paused_gc() -> Iterator[None]:
+    global _gc_pauses, _gc_enabled
+
+    with _gc_lock:
+        if not _gc_pauses:
+            _gc_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if not _gc_pauses and _gc_enabled:
+                gc.enable()
+
+
+def restore(model: Type[BaseModel], data: Buffer, pause_gc: bool = False) -> BaseModel:
+    """
+    Validates an object of ``model`` from the JSON of :func:`reduce_model`.
+
+    With ``pause_gc``, the garbage collector is disabled while validating,
+    for every thread of the process.
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+
+    if not pause_gc:
+        return model.model_validate_json(data)
+
+    with _paused_gc():
+        return model.model_validate_json(data)
+
+
+def reduce_model(
+    obj: BaseModel,
+    protocol: SupportsIndex,
+    restore: Callable[[Type[BaseModel], Buffer], BaseModel] = restore,
+    model: Optional[Type[BaseModel]] = None,
+) -> Tuple[Any, ...]:
+    """
+    Returns the ``__reduce_ex__`` value of ``obj``: the JSON of the fields
+    that are set, restored by ``restore`` as ``model`` (its class by default).
+    """
+    data: Buffer = type(obj).__pydantic_serializer__.to_json(
+        obj, by_alias=True, exclude_unset=True
+    )
+
+    if operator.index(protocol) >= 5:
+        data = pickle.PickleBuffer(data)
+
+    return restore, (model or type(obj), data)
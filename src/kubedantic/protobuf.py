@@ -0,0 +1,373 @@
+"""
+Decoding of the objects sent by the API server as protobuf, when requested
+with the :data:`CONTENT_TYPE` media type::
+
+    response = session.get(url, headers={"Accept": CONTENT_TYPE})
+    pods = from_protobuf(response.content)
+
+The data is the ``k8s\\x00`` magic number followed by a ``runtime.Unknown``
+envelope, whose ``apiVersion`` and ``kind`` pick the message of the object
+and its model (see :func:`kubedantic.base.get_model`). The messages come
+from the ``generated.proto`` files of Kubernetes, see
+:mod:`kubedantic.models.protobuf`: only those of ``core/v1``,
+``networking/v1`` and ``meta/v1`` (e.g. ``APIResourceList``) are included, the other
+kinds raising :class:`~kubedantic.base.UnknownKindError`.
+
+Fields unknown to the messages, e.g. added by a newer version of Kubernetes,
+are skipped like protobuf does, or are errors with ``strict=True``. The
+messages come from the files of Kubernetes 1.32 (the only ones at hand when
+they were generated), matched with the 1.30 schemas of the models, so that
+the fields removed since 1.30, e.g. ``PodResourceClaim.source``, are
+unknown to them.
+
+Protobuf has no null, and the fields of Go structs that are not pointers
+are always encoded: empty strings and zero timestamps are left unset, as
+they are in JSON, but numbers and booleans are set even when zero.
+"""
+
+import base64
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .base import UnknownKindError, get_model, validate_python
+from .models.protobuf import KINDS, LIST_MESSAGES, MESSAGES
+
+MAGIC = b"k8s\x00"
+CONTENT_TYPE = "application/vnd.kubernetes.protobuf"
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH = 2
+_FIXED32 = 5
+
+_FIXED_TYPES = {
+    "double": (_FIXED64, struct.Struct("<d")),
+    "fixed64": (_FIXED64, struct.Struct("<Q")),
+    "sfixed64": (_FIXED64, struct.Struct("<q")),
+    "float": (_FIXED32, struct.Struct("<f")),
+    "fixed32": (_FIXED32, struct.Struct("<I")),
+    "sfixed32": (_FIXED32, struct.Struct("<i")),
+}
+_VARINT_TYPES = {"bool", "int32", "int64", "sint32", "sint64", "uint32", "uint64"}
+# Types of the repeated fields that may be packed
+_PACKED_TYPES = _VARINT_TYPES.union(_FIXED_TYPES)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Seconds of the zero time.Time of Go, encoded for timestamps that are unset
+_ZERO_TIME = -62135596800
+
+_META = "k8s.io.apimachinery.pkg.apis.meta.v1."
+_APIEXTENSIONS = "k8s.io.apiextensions_apiserver.pkg.apis.apiextensions.v1."
+
+
+def _read_varint(data: memoryview, position: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Invalid protobuf varint")
+
+
+def _iter_fields(data: memoryview) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Yields the number, wire type and value of the fields of a message, the
+    values being integers for varints and views of the bytes otherwise.
+    """
+    position, end = 0, len(data)
+    value: Any
+    while position < end:
+        key, position = _read_varint(data, position)
+        number, wire_type = key >> 3, key & 7
+
+        if wire_type == _VARINT:
+            value, position = _read_varint(data, position)
+        else:
+            if wire_type == _LENGTH:
+                size, position = _read_varint(data, position)
+            elif wire_type == _FIXED64:
+                size = 8
+            elif wire_type == _FIXED32:
+                size = 4
+            else:
+                raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+            value = data[position : position + size]
+            position += size
+            if position > end:
+                raise ValueError("Truncated protobuf message")
+
+        yield number, wire_type, value
+
+
+def _to_signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _decode_varint(type: str, value: int) -> Any:
+    if type == "bool":
+        return bool(value)
+    if type in ("int32", "int64"):
+        return _to_signed(value)
+    if type in ("sint32", "sint64"):
+        return (value >> 1) ^ -(value & 1)
+    return value
+
+
+def _iter_packed(type: str, data: memoryview) -> Iterator[Any]:
+    if type in _FIXED_TYPES:
+        _, format = _FIXED_TYPES[type]
+        for (value,) in format.iter_unpack(data):
+            yield value
+        return
+
+    position = 0
+    while position < len(data):
+        value, position = _read_varint(data, position)
+        yield _decode_varint(type, value)
+
+
+def _decode_value(type: str, wire_type: int, value: Any, strict: bool) -> Any:
+    if type in _VARINT_TYPES:
+        expected = _VARINT
+    elif type in _FIXED_TYPES:
+        expected = _FIXED_TYPES[type][0]
+    else:
+        expected = _LENGTH
+    if wire_type != expected:
+        raise ValueError(f"Invalid protobuf wire type {wire_type} for {type}")
+
+    if type == "string":
+        return str(value, "utf-8")
+    if type == "bytes":
+        return base64.b64encode(value).decode()
+    if type in _VARINT_TYPES:
+        return _decode_varint(type, value)
+    if type in _FIXED_TYPES:
+        return _FIXED_TYPES[type][1].unpack(value)[0]
+    return _decode_message(value, type, strict)
+
+
+def _decode_entry(data: memoryview, type: str, strict: bool) -> Tuple[str, Any]:
+    key: Any = ""
+    value = None
+    for number, wire_type, item in _iter_fields(data):
+        if number == 1:
+            key = str(item, "utf-8") if wire_type == _LENGTH else _to_signed(item)
+        elif number == 2:
+            value = _decode_value(type, wire_type, item, strict)
+
+    if value is None:
+        # Entries leave out the values that are empty
+        empty = memoryview(b"")
+        value = _decode_message(empty, type, strict) if type in MESSAGES else ""
+    # JSON has strings for the keys of numbers too
+    return str(key), value
+
+
+def _format_time(fields: Dict[str, Any], format: str) -> Optional[str]:
+    seconds = fields.get("seconds", 0)
+    if seconds == _ZERO_TIME:
+        return None
+    time = _EPOCH + timedelta(
+        seconds=seconds, microseconds=fields.get("nanos", 0) // 1000
+    )
+    return time.strftime(format)
+
+
+def _format_duration(fields: Dict[str, Any]) -> str:
+    # As time.Duration.String() of Go, e.g. "1h2m3.5s" or "250ms"
+    nanoseconds = fields.get("duration", 0)
+    sign = "-" if nanoseconds < 0 else ""
+    nanoseconds = abs(nanoseconds)
+
+    def decimal(value: int, unit: int) -> str:
+        whole, fraction = divmod(value, unit)
+        digits = str(fraction).rjust(len(str(unit)) - 1, "0").rstrip("0")
+        return f"{whole}.{digits}" if digits else str(whole)
+
+    if nanoseconds < 1000:
+        return f"{sign}{nanoseconds}ns" if nanoseconds else "0s"
+    if nanoseconds < 1000_000:
+        return f"{sign}{decimal(nanoseconds, 1000)}µs"
+    if nanoseconds < 1000_000_000:
+        return f"{sign}{decimal(nanoseconds, 1000_000)}ms"
+
+    minutes, seconds = divmod(nanoseconds, 60 * 1000_000_000)
+    hours, minutes = divmod(minutes, 60)
+    text = f"{decimal(seconds, 1000_000_000)}s"
+    if hours:
+        return f"{sign}{hours}h{minutes}m{text}"
+    return f"{sign}{minutes}m{text}" if minutes else f"{sign}{text}"
+
+
+def _load_json(fields: Dict[str, Any], name: str) -> Any:
+    raw = fields.get(name)
+    return json.loads(base64.b64decode(raw)) if raw else None
+
+
+def _schema_or(default: Callable[[Dict[str, Any]], Any]) -> Callable[..., Any]:
+    return lambda fields: fields["schema"] if "schema" in fields else default(fields)
+
+
+# Messages of types with their own JSON encoding, from their decoded fields
+_CONVERTERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    f"{_META}Time": lambda fields: _format_time(fields, "%Y-%m-%dT%H:%M:%SZ"),
+    f"{_META}MicroTime": lambda fields: _format_time(fields, "%Y-%m-%dT%H:%M:%S.%fZ"),
+    f"{_META}Duration": _format_duration,
+    f"{_META}Fields": lambda fields: fields.get("map", {}),
+    f"{_META}FieldsV1": lambda fields: _load_json(fields, "Raw"),
+    "k8s.io.apimachinery.pkg.api.resource.Quantity": (
+        lambda fields: fields.get("string", "")
+    ),
+    "k8s.io.apimachinery.pkg.util.intstr.IntOrString": (
+        lambda fields: (
+            fields.get("strVal", "") if fields.get("type") else fields.get("intVal", 0)
+        )
+    ),
+    "k8s.io.apimachinery.pkg.runtime.RawExtension": (
+        lambda fields: _load_json(fields, "raw")
+    ),
+    f"{_APIEXTENSIONS}JSON": lambda fields: _load_json(fields, "raw"),
+    f"{_APIEXTENSIONS}JSONSchemaPropsOrArray": _schema_or(
+        lambda fields: fields.get("jSONSchemas", [])
+    ),
+    f"{_APIEXTENSIONS}JSONSchemaPropsOrBool": _schema_or(
+        lambda fields: fields.get("allows", False)
+    ),
+    f"{_APIEXTENSIONS}JSONSchemaPropsOrStringArray": _schema_or(
+        lambda fields: fields.get("property", [])
+    ),
+}
+
+
+def _decode_field(
+    result: Dict[str, Any],
+    field: Tuple[str, str, str],
+    wire_type: int,
+    value: Any,
+    strict: bool,
+):
+    """
+    Adds the JSON value of a ``field`` of a message to ``result``.
+    """
+    json_name, label, type = field
+    if label == "map":
+        key, item = _decode_entry(value, type, strict)
+        result.setdefault(json_name, {})[key] = item
+    elif label == "repeated":
+        items = result.setdefault(json_name, [])
+        if wire_type == _LENGTH and type in _PACKED_TYPES:
+            items.extend(_iter_packed(type, value))
+        else:
+            items.append(_decode_value(type, wire_type, value, strict))
+    elif label == "inline":
+        result.update(_decode_message(value, type, strict))
+    else:
+        item = _decode_value(type, wire_type, value, strict)
+        if item is not None and item != "":
+            result[json_name] = item
+
+
+def _decode_message(data: memoryview, name: str, strict: bool) -> Any:
+    """
+    Returns the JSON value of the message ``name`` encoded in ``data``,
+    skipping the fields unknown to it unless ``strict``.
+    """
+    fields = MESSAGES.get(name, {})
+    result: Dict[str, Any] = {}
+
+    for number, wire_type, value in _iter_fields(data):
+        field = fields.get(number)
+        if field is not None:
+            _decode_field(result, field, wire_type, value, strict)
+        elif strict:
+            raise ValueError(f"Unknown field {number} of protobuf message {name}")
+
+    if name in _CONVERTERS:
+        return _CONVERTERS[name](result)
+    if name in LIST_MESSAGES:
+        return result.get("items", [])
+    return result
+
+
+def _read_type_meta(data: memoryview) -> Tuple[str, str]:
+    api_version = kind = ""
+    for number, wire_type, value in _iter_fields(data):
+        if number == 1 and wire_type == _LENGTH:
+            api_version = str(value, "utf-8")
+        elif number == 2 and wire_type == _LENGTH:
+            kind = str(value, "utf-8")
+    return api_version, kind
+
+
+def _read_envelope(data: memoryview) -> Tuple[str, str, memoryview]:
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not protobuf data of Kubernetes, no magic number")
+
+    api_version = kind = encoding = ""
+    raw = memoryview(b"")
+    for number, wire_type, value in _iter_fields(data[len(MAGIC) :]):
+        if wire_type != _LENGTH:
+            continue
+        if number == 1:
+            api_version, kind = _read_type_meta(value)
+        elif number == 2:
+            raw = value
+        elif number == 3:
+            encoding = str(value, "utf-8")
+
+    if encoding:
+        raise ValueError(f"Unsupported content encoding {encoding!r}")
+    return api_version, kind, raw
+
+
+def loads(data: Buffer, strict: bool = False) -> Dict[str, Any]:
+    """
+    Returns the JSON object of the object encoded in protobuf ``data``, with
+    its ``apiVersion`` and ``kind``, skipping the fields unknown to the
+    messages unless ``strict``.
+
+    :raises UnknownKindError: If no message is known for its kind.
+    :raises ValueError: If ``data`` is not protobuf data of Kubernetes, or
+        has fields unknown to the messages and ``strict``.
+    """
+    view = memoryview(data).cast("B")
+    try:
+        api_version, kind, raw = _read_envelope(view)
+        message = KINDS.get((api_version, kind))
+        if message is None:
+            raise UnknownKindError(
+                f"No protobuf message found for {api_version}, Kind={kind}"
+            )
+        obj = _decode_message(raw, message, strict)
+    except (IndexError, struct.error):
+        raise ValueError("Truncated protobuf data") from None
+
+    return {"apiVersion": api_version, "kind": kind, **obj}
+
+
+def from_protobuf(
+    data: Buffer, context: Optional[Mapping[str, Any]] = None, strict: bool = False
+) -> BaseModel:
+    """
+    Returns the object encoded in protobuf ``data``, validated by the model
+    registered for its ``apiVersion`` and ``kind``, see :func:`loads`.
+
+    :raises UnknownKindError: If no message or model is known for its kind.
+    :raises ValueError: If ``data`` is not protobuf data of Kubernetes, or
+        has fields unknown to the messages and ``strict``.
+    :raises pydantic.ValidationError: If it is not a valid object.
+    """
+    obj = loads(data, strict)
+    return validate_python(get_model(obj["apiVersion"], obj["kind"]), obj, context)
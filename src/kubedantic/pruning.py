@@ -0,0 +1,130 @@
+"""
+Export of objects without the fields populated by the server, for backups
+or to apply them again::
+
+    manifests = [prune_for_apply(deployment) for deployment in deployments]
+
+:func:`to_apply_configuration` builds the body of a server-side apply, which
+only has the fields that were set explicitly, so that the field manager does
+not claim the ones it does not care about.
+
+The read-only fields of each kind (``status``, ``metadata.uid``,
+``metadata.managedFields``...) are generated from the OpenAPI specs, see
+:mod:`kubedantic.models.read_only`.
+"""
+
+import functools
+import json
+from typing import Any, Dict, Iterable, Iterator, Type, Union
+
+from pydantic import BaseModel
+
+from .base import ObjectList
+from .models.read_only import DEFAULT_READ_ONLY_FIELDS, READ_ONLY_FIELDS
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    fields = model.model_fields
+    return {
+        name: fields[name].default for name in ("apiVersion", "kind") if name in fields
+    }
+
+
+def _get_type_fields(obj: BaseModel) -> Dict[str, Any]:
+    """
+    Returns the ``apiVersion`` and ``kind`` of an object, which list items
+    usually leave unset, falling back to the defaults of its model.
+    """
+    return {
+        name: getattr(obj, name) or default
+        for name, default in _get_type_defaults(type(obj)).items()
+    }
+
+
+def get_read_only_fields(obj: BaseModel) -> Dict[str, Any]:
+    """
+    Returns the read-only fields of an object, as nested dicts that
+    ``model_dump`` takes as ``exclude``.
+    """
+    type_fields = _get_type_fields(obj)
+    key = (type_fields.get("apiVersion"), type_fields.get("kind"))
+    return READ_ONLY_FIELDS.get(key, DEFAULT_READ_ONLY_FIELDS)  # type: ignore[arg-type]
+
+
+def prune_for_apply(obj: BaseModel) -> Dict[str, Any]:
+    """
+    Returns the JSON data of ``obj`` to apply it again: the fields that are
+    set, without the fields populated by the server, in a single pass.
+    """
+    data = obj.model_dump(
+        mode="json",
+        by_alias=True,
+        exclude_unset=True,
+        exclude_none=True,
+        exclude=get_read_only_fields(obj),
+    )
+    return {**_get_type_fields(obj), **data}
+
+
+def iter_prune_for_apply(
+    objects: Union[ObjectList[Any], Iterable[BaseModel]],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the JSON data of every object (e.g. the items of a large list)
+    pruned with :func:`prune_for_apply`, one at a time.
+    """
+    items = objects.items if isinstance(objects, ObjectList) else objects
+
+    for obj in items:
+        yield prune_for_apply(obj)
+
+
+def _check_name(obj: BaseModel):
+    metadata = getattr(obj, "metadata", None)
+
+    if not getattr(metadata, "name", None):
+        raise ValueError(f"{type(obj).__name__} has no metadata.name to apply")
+
+
+def to_apply_configuration(obj: BaseModel) -> Dict[str, Any]:
+    """
+    Returns the body of a server-side apply of ``obj``: its ``apiVersion``,
+    ``kind`` and ``metadata`` followed by the other fields set explicitly
+    (at any depth), without the fields populated by the server.
+
+    :raises ValueError: If the object has no ``metadata.name``, which apply
+        requires.
+    """
+    _check_name(obj)
+    return prune_for_apply(obj)
+
+
+def dump_apply_configuration(obj: BaseModel) -> str:
+    """
+    Returns :func:`to_apply_configuration` encoded as JSON, serialized by
+    pydantic without building the intermediate dicts.
+
+    :raises ValueError: If the object has no ``metadata.name``, which apply
+        requires.
+    """
+    _check_name(obj)
+    data = obj.model_dump_json(
+        by_alias=True,
+        exclude_unset=True,
+        exclude_none=True,
+        exclude=get_read_only_fields(obj),
+    )
+    # Left out by exclude_unset when they come from the defaults of the model
+    missing = {
+        name: value
+        for name, value in _get_type_fields(obj).items()
+        if name not in obj.model_fields_set or getattr(obj, name) is None
+    }
+
+    if not missing:
+        return data
+
+    # Spliced in front, where the fields would be if they were set
+    head = json.dumps(missing, separators=(",", ":"))[:-1]
+    return f"{head},{data[1:]}" if data != "{}" else f"{head}}}"
@@ -0,0 +1,196 @@
+"""
+Opt-in sharing of identical subtrees (hash-consing) across decoded objects.
+
+Pods created from the same template carry identical specs, so decoding them
+with a shared :class:`SubtreeCache` keeps a single instance of each distinct
+spec::
+
+    cache = SubtreeCache()
+    pods = [validate_json(Pod, data, cache.context) for data in documents]
+
+The cache is used by the helpers validating objects, e.g.
+:func:`kubedantic.base.validate_json` or
+:func:`kubedantic.bulk.validate_objects`, given its context.
+
+A cache can be used by several threads at once, still keeping each subtree
+once. Shared subtrees are referenced by many objects at once, so they are
+instances of the :func:`kubedantic.frozen.read_only` variants of their
+models, which raise on assignment and have immutable lists: update the
+objects with :func:`kubedantic.paths.evolve`, which leaves them untouched.
+They compare equal to the subtrees decoded without a cache.
+
+Subtrees are shared by a digest of their JSON data; the ones holding other
+Python values (e.g. ``datetime`` or model instances) are validated without
+being shared.
+"""
+
+import hashlib
+import json
+import threading
+import typing
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .frozen import read_only
+
+CONTEXT_KEY = "subtree_cache"
+
+# Paths to the subtrees that are usually identical across objects of a kind
+_POD_TEMPLATE = ("spec", "template")
+SHARED_PATHS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "Pod": (("spec",),),
+    "PodTemplate": (("template",),),
+    "ReplicationController": (_POD_TEMPLATE,),
+    "ReplicaSet": (_POD_TEMPLATE,),
+    "Deployment": (_POD_TEMPLATE,),
+    "StatefulSet": (_POD_TEMPLATE,),
+    "DaemonSet": (_POD_TEMPLATE,),
+    "Job": (_POD_TEMPLATE,),
+    "CronJob": (("spec", "jobTemplate", "spec", "template"),),
+}
+
+
+def _get_model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    # Optional[Model]
+    return next(
+        (arg for arg in typing.get_args(annotation) if _get_model_type(arg)),
+        None,
+    )
+
+
+def _get_digest(data: Any) -> Optional[bytes]:
+    """
+    Returns the digest of JSON data, or None if it holds other values.
+    """
+    try:
+        raw = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+class SubtreeCache:
+    """
+    Cache of the subtrees shared by the objects validated with its context.
+    """
+
+    def __init__(self):
+        self._subtrees: Dict[Tuple[Type[BaseModel], bytes], BaseModel] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._subtrees)
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """
+        Returns the validation context enabling sharing through this cache.
+        """
+        return {CONTEXT_KEY: self}
+
+    def clear(self):
+        with self._lock:
+            self._subtrees.clear()
+            self.hits = self.misses = 0
+
+    def get(
+        self, model: Type[BaseModel], data: Any, context: Optional[Mapping[str, Any]]
+    ) -> BaseModel:
+        """
+        Returns the shared, read-only instance of ``model`` for ``data``,
+        validating it on the first lookup. Data that is not plain JSON is
+        validated by ``model`` without being shared.
+        """
+        digest = _get_digest(data)
+        if digest is None:
+            return model.model_validate(data, context=context)
+
+        model = read_only(model)
+        key = (model, digest)
+
+        with self._lock:
+            subtree = self._subtrees.get(key)
+            if subtree is not None:
+                self.hits += 1
+                return subtree
+
+        # Validated outside of the lock, keeping the first instance stored if
+        # another thread validated the same subtree meanwhile
+        validated = model.model_validate(data, context=context)
+
+        with self._lock:
+            subtree = self._subtrees.setdefault(key, validated)
+            if subtree is validated:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return subtree
+
+    def _replace(
+        self,
+        model: Type[BaseModel],
+        data: Dict[str, Any],
+        path: Tuple[str, ...],
+        context: Optional[Mapping[str, Any]],
+    ) -> Dict[str, Any]:
+        name, rest = path[0], path[1:]
+        value = data.get(name)
+        field = model.model_fields.get(name)
+        field_type = _get_model_type(field.annotation) if field else None
+
+        if not isinstance(value, dict) or field_type is None:
+            return data
+
+        if rest:
+            value = self._replace(field_type, value, rest, context)
+        else:
+            value = self.get(field_type, value, context)
+
+        return {**data, name: value}
+
+    def share(
+        self,
+        model: Type[BaseModel],
+        data: Any,
+        context: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        """
+        Returns the data of an object (or of a list of objects) to validate
+        with ``model``, with its shareable subtrees replaced by their shared
+        instances.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        paths = SHARED_PATHS.get(model.__name__)
+        if paths is not None:
+            for path in paths:
+                data = self._replace(model, data, path, context)
+            return data
+
+        # Lists of objects, e.g. PodList
+        items = data.get("items")
+        field = model.model_fields.get("items")
+        item_type = _get_model_type(field.annotation) if field else None
+
+        if not isinstance(items, list) or item_type is None:
+            return data
+        if item_type.__name__ not in SHARED_PATHS:
+            return data
+
+        items = [self.share(item_type, item, context) for item in items]
+        return {**data, "items": items}
+
+
+def get_cache(context: Optional[Mapping[str, Any]]) -> Optional[SubtreeCache]:
+    """
+    Returns the cache set in a validation context, if any.
+    """
+    return context.get(CONTEXT_KEY) if context else None
@@ -0,0 +1,222 @@
+"""
+Snapshots of the objects of a cache, e.g. of an informer, saved while a
+controller runs and loaded on start to serve from until it has listed the
+objects again::
+
+    write_snapshot("pods.snapshot", store.values(), resource_version="12345")
+
+    with Snapshot("pods.snapshot") as snapshot:
+        store = {pod.key: pod for pod in snapshot.load()}
+
+A snapshot holds the compact JSON of the fields set of every object, as in
+:mod:`kubedantic.pickling`, after an index of their types, keys and offsets,
+so that single objects can be read from the memory-mapped file. The objects
+were valid when saved, yet validating their JSON in pydantic-core is still
+the fastest way to build nested models; loading them all at once can do so
+with the garbage collector paused.
+"""
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from . import pickling
+from .base import get_model
+
+_MAGIC = b"KDSNAP01"
+_SIZE = struct.Struct("<Q")
+
+
+def _get_type(obj: BaseModel) -> Tuple[str, str]:
+    fields = type(obj).model_fields
+    api_version = getattr(obj, "apiVersion", None) or fields["apiVersion"].default
+    kind = getattr(obj, "kind", None) or fields["kind"].default
+    if not (api_version and kind):
+        raise ValueError(f"{type(obj).__name__} object has no apiVersion and kind")
+    return api_version, kind
+
+
+def write_snapshot(
+    path: Union[str, "os.PathLike[str]"],
+    objects: Iterable[BaseModel],
+    resource_version: Optional[str] = None,
+):
+    """
+    Saves a snapshot of the Kubernetes ``objects`` at ``path``, replacing
+    the previous one at once, with the ``resource_version`` to resume
+    watching from.
+
+    :raises ValueError: If an object has no ``apiVersion`` and ``kind``.
+    """
+    types: Dict[Tuple[str, str], int] = {}
+    type_ids = array.array("I")
+    ends = array.array("Q")
+    keys: List[str] = []
+    records: List[bytes] = []
+    size = 0
+
+    for obj in objects:
+        type_ids.append(types.setdefault(_get_type(obj), len(types)))
+        record = type(obj).__pydantic_serializer__.to_json(
+            obj, by_alias=True, exclude_unset=True
+        )
+        records.append(record)
+        size += len(record)
+        ends.append(size)
+        keys.append(getattr(obj, "key", ""))
+
+    header = json.dumps(
+        {
+            "resource_version": resource_version,
+            "byteorder": sys.byteorder,
+            "count": len(records),
+            "types": list(types),
+        },
+        separators=(",", ":"),
+    ).encode()
+    # Keys never contain NUL characters
+    raw_keys = "\0".join(keys).encode()
+
+    # Written aside first, so that a failure never leaves a partial snapshot
+    path = os.fspath(path)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_MAGIC + _SIZE.pack(len(header)) + header)
+            type_ids.tofile(file)
+            ends.tofile(file)
+            file.write(_SIZE.pack(len(raw_keys)) + raw_keys)
+            file.writelines(records)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+class Snapshot:
+    """
+    Objects of the snapshot saved at ``path``, validated on access.
+
+    The file is memory-mapped, or read at once if ``use_mmap`` is false.
+
+    :raises ValueError: If the file is not a snapshot.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], use_mmap: bool = True):
+        self.path = os.fspath(path)
+
+        with open(self.path, "rb") as file:
+            if use_mmap:
+                self._data: Any = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = file.read()
+
+        try:
+            self._read_index()
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_index(self):
+        if self._data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{self.path} is not a snapshot")
+
+        offset = len(_MAGIC)
+        (size,) = _SIZE.unpack_from(self._data, offset)
+        offset += _SIZE.size
+        header = json.loads(self._data[offset : offset + size])
+        offset += size
+
+        self.resource_version: Optional[str] = header["resource_version"]
+        self._types = [tuple(item_type) for item_type in header["types"]]
+
+        count = header["count"]
+        self._type_ids = array.array("I")
+        self._ends = array.array("Q")
+        for values in (self._type_ids, self._ends):
+            end = offset + count * values.itemsize
+            values.frombytes(self._data[offset:end])
+            if len(values) != count:
+                raise ValueError(f"{self.path} is truncated")
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            offset = end
+
+        (size,) = _SIZE.unpack_from(self._data, offset)
+        offset += _SIZE.size
+        raw_keys = self._data[offset : offset + size]
+        self._keys = raw_keys.decode().split("\0") if count else []
+        self._start = offset + size
+        self._positions: Optional[Dict[str, List[int]]] = None
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, position: int) -> BaseModel:
+        api_version, kind = self._types[self._type_ids[position]]
+        start = self._start + (self._ends[position - 1] if position else 0)
+        data = self._data[start : self._start + self._ends[position]]
+        return get_model(api_version, kind).model_validate_json(data)
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        return (self[position] for position in range(len(self)))
+
+    def keys(self) -> List[str]:
+        """
+        Returns the ``namespace/name`` keys of the objects, in order.
+        """
+        return list(self._keys)
+
+    def get(self, key: str, kind: Optional[str] = None) -> Optional[BaseModel]:
+        """
+        Returns the first object with the ``namespace/name`` ``key`` (of
+        ``kind`` if given), or ``None``.
+        """
+        if self._positions is None:
+            self._positions = {}
+            for position, item_key in enumerate(self._keys):
+                self._positions.setdefault(item_key, []).append(position)
+
+        for position in self._positions.get(key, ()):
+            if kind is None or self._types[self._type_ids[position]][1] == kind:
+                return self[position]
+        return None
+
+    def load(self, pause_gc: bool = False) -> List[BaseModel]:
+        """
+        Returns all the objects.
+
+        With ``pause_gc``, the garbage collector is disabled while validating
+        them, for every thread of the process.
+        """
+        if not pause_gc:
+            return list(self)
+
+        with pickling._paused_gc():
+            return list(self)
@@ -0,0 +1,247 @@
+"""
+Models of the ``meta.k8s.io/v1`` kinds returned instead of full objects, when
+requested with the :data:`CONTENT_TYPE` or
+:data:`PARTIAL_OBJECT_METADATA_CONTENT_TYPE` media types::
+
+    response = session.get(url, headers={"Accept": CONTENT_TYPE})
+    columns = get_columns(response.content, ["Name", "Status"])
+
+These kinds are served by every API group but left out of the OpenAPI specs,
+so they are declared here rather than generated;
+:func:`kubedantic.base.get_model` finds them all the same.
+
+A table has a list of cells per row, in the order of its column definitions.
+:func:`get_columns` projects the columns out of the JSON of a table without
+validating it, and :meth:`Table.columns` out of a validated one, without
+building an object per cell in either case.
+"""
+
+from __future__ import annotations
+
+import json
+from operator import itemgetter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+from .base import (
+    KubernetesObject,
+    ObjectList,
+    UnknownKindError,
+    get_model,
+    validate_python,
+)
+from .models.io.k8s.apimachinery.pkg.apis.meta import v1
+
+API_VERSION = "meta.k8s.io/v1"
+CONTENT_TYPE = "application/json;as=Table;v=v1;g=meta.k8s.io"
+PARTIAL_OBJECT_METADATA_CONTENT_TYPE = (
+    "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io"
+)
+
+
+class PartialObjectMetadata(KubernetesObject):
+    """
+    Metadata of an object of any kind.
+    """
+
+    apiVersion: Optional[str] = API_VERSION
+    kind: Optional[str] = "PartialObjectMetadata"
+
+
+class PartialObjectMetadataList(ObjectList[PartialObjectMetadata]):
+    apiVersion: Optional[str] = API_VERSION
+    kind: Optional[str] = "PartialObjectMetadataList"
+
+
+class TableColumnDefinition(BaseModel):
+    description: Optional[str] = Field(
+        default=None,
+        description="description is a human readable description of this column.",
+    )
+    format: Optional[str] = Field(
+        default=None,
+        description=(
+            "format is an optional OpenAPI type modifier for this column. A format"
+            " modifies the type and imposes additional rules, like date or time"
+            " formatting for a string. The 'name' format is applied to the primary"
+            " identifier column which has type 'string' to assist in clients"
+            " identifying column is the resource name."
+        ),
+    )
+    name: str = Field(..., description="name is a human readable name for the column.")
+    priority: Optional[int] = Field(
+        default=None,
+        description=(
+            "priority is an integer defining the relative importance of this column"
+            " compared to others. Lower numbers are considered higher priority."
+            " Columns that may be omitted in limited space scenarios should be given"
+            " a higher priority."
+        ),
+    )
+    type: str = Field(
+        ...,
+        description=(
+            "type is an OpenAPI type definition for this column, such as number,"
+            " integer, string, or array."
+        ),
+    )
+
+
+class TableRowCondition(BaseModel):
+    message: Optional[str] = Field(
+        default=None,
+        description="Human readable message indicating details about last transition.",
+    )
+    reason: Optional[str] = Field(
+        default=None,
+        description="(brief) machine readable reason for the condition's last transition.",
+    )
+    status: str = Field(
+        ..., description="Status of the condition, one of True, False, Unknown."
+    )
+    type: str = Field(
+        ...,
+        description=(
+            "Type of row condition. The only defined value is 'Completed' indicating"
+            " that the object this row represents has reached a completed state and"
+            " may be given less visual priority than other rows."
+        ),
+    )
+
+
+class TableRow(BaseModel):
+    cells: List[Any] = Field(
+        ...,
+        description=(
+            "cells will be as wide as the column definitions array and may contain"
+            " strings, numbers (float64 or int64), booleans, simple maps, lists, or"
+            " null. See the type field of the column definition for a more detailed"
+            " description."
+        ),
+    )
+    conditions: Optional[List[TableRowCondition]] = Field(
+        default=None,
+        description=(
+            "conditions describe additional status of a row that are relevant for a"
+            " human user. These conditions apply to the row, not to the object, and"
+            " will be specific to table output."
+        ),
+    )
+    object: Any = Field(
+        default=None,
+        description=(
+            "This field contains the requested additional information about each"
+            " object based on the includeObject policy when requesting the Table. If"
+            ' "None", this field is empty, if "Object" this will be the default'
+            ' serialization of the object for the current API version, and if'
+            ' "Metadata" (the default) will contain the object metadata.'
+        ),
+    )
+
+    @field_validator("object")
+    @classmethod
+    def _validate_object(cls, value: Any, info: ValidationInfo) -> Any:
+        """
+        Validates the object with the model of its kind, e.g.
+        :class:`PartialObjectMetadata`, keeping objects of unknown kinds as
+        they are.
+        """
+        if not isinstance(value, dict):
+            return value
+
+        try:
+            model = get_model(value.get("apiVersion") or "", value.get("kind") or "")
+        except UnknownKindError:
+            return value
+        return validate_python(model, value, info.context)
+
+
+class Table(BaseModel):
+    """
+    Tabular representation of a list of objects, with the columns picked by
+    the server.
+    """
+
+    apiVersion: Optional[str] = API_VERSION
+    columnDefinitions: List[TableColumnDefinition] = Field(
+        ...,
+        description=(
+            "columnDefinitions describes each column in the returned items array. The"
+            " number of cells per row will always match the number of column"
+            " definitions."
+        ),
+    )
+    kind: Optional[str] = "Table"
+    metadata: Optional[v1.ListMeta] = Field(
+        default=None,
+        description=(
+            "Standard list metadata. More info:"
+            " https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+        ),
+    )
+    rows: List[TableRow] = Field(
+        ..., description="rows is the list of items in the table."
+    )
+
+    def columns(self, names: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+        """
+        Returns the cells of the ``names`` columns (all of them by default),
+        by column name.
+
+        :raises KeyError: If the table has no column of one of the names.
+        """
+        return _project(
+            [column.name for column in self.columnDefinitions],
+            [row.cells for row in self.rows],
+            names,
+        )
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Returns the cells of the ``name`` column.
+
+        :raises KeyError: If the table has no such column.
+        """
+        return self.columns([name])[name]
+
+
+def _project(
+    column_names: List[str], cells: List[List[Any]], names: Optional[Sequence[str]]
+) -> Dict[str, List[Any]]:
+    indexes = {name: index for index, name in enumerate(column_names)}
+    columns = {}
+
+    for name in column_names if names is None else names:
+        try:
+            index = indexes[name]
+        except KeyError:
+            raise KeyError(f"No column named {name!r} in the table") from None
+        columns[name] = list(map(itemgetter(index), cells))
+
+    return columns
+
+
+def get_columns(
+    data: Union[str, bytes, Mapping[str, Any]], names: Optional[Sequence[str]] = None
+) -> Dict[str, List[Any]]:
+    """
+    Returns the cells of the ``names`` columns (all of them by default) of a
+    table, by column name, from its JSON or the data loaded from it.
+
+    Neither the table nor its rows are validated, which makes it much
+    cheaper than validating a :class:`Table` when only the cells are needed.
+
+    :raises KeyError: If the table has no column of one of the names.
+    :raises ValueError: If ``data`` is not a table.
+    """
+    table = json.loads(data) if isinstance(data, (str, bytes)) else data
+
+    if table.get("kind", "Table") != "Table" or "columnDefinitions" not in table:
+        raise ValueError(f"Expected a Table, got a {table.get('kind')}")
+
+    return _project(
+        [column["name"] for column in table["columnDefinitions"]],
+        [row["cells"] for row in table.get("rows") or ()],
+        names,
+    )
@@ -0,0 +1,125 @@
+"""
+Field types of the generated models.
+
+:class:`Base64Bytes` types the fields holding bytes, e.g. ``Secret.data`` or
+``ConfigMap.binaryData``, which are base64 strings in JSON and YAML. The
+string is checked when validated, but kept as is and only decoded on access::
+
+    secret = Secret.model_validate(data)
+    certificate = bytes(secret.data["tls.crt"])
+    size = secret.data["tls.key"].nbytes
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, Union
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import PydanticCustomError, core_schema
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _decode_base64(value: str) -> bytes:
+    """
+    Returns the bytes of the padded base64 ``value``.
+
+    :raises ValueError: If it is not valid base64.
+    """
+    # Only checked by b64decode from Python 3.11
+    if len(value) % 4:
+        raise binascii.Error("Incorrect padding")
+    return base64.b64decode(value, validate=True)
+
+
+class Base64Bytes(str):
+    """
+    Base64 string of a field holding bytes, decoded on first access.
+
+    As a ``str``, it is dumped, compared and hashed like the string it was
+    validated from, so dumping it again costs no encoding. The string is
+    checked by decoding it when created, but only the bytes decoded by
+    ``bytes()``, :meth:`view` and :meth:`from_bytes` are cached, and they
+    are not pickled.
+
+    :raises ValueError: If the string is not valid base64.
+    """
+
+    _decoded: bytes
+
+    def __new__(cls, value: str = "") -> "Base64Bytes":
+        _decode_base64(value)
+        return super().__new__(cls, value)
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Base64Bytes":
+        """
+        Encodes raw bytes, e.g. to set the value of a field.
+        """
+        value = str.__new__(cls, base64.b64encode(data).decode("ascii"))
+        value._decoded = bytes(data)
+        return value
+
+    def __bytes__(self) -> bytes:
+        try:
+            return self._decoded
+        except AttributeError:
+            self._decoded = _decode_base64(self)
+            return self._decoded
+
+    def view(self) -> memoryview:
+        """
+        Returns a read-only view of the decoded bytes, without copying them.
+        """
+        return memoryview(bytes(self))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the decoded bytes, computed without decoding them.
+        """
+        padding = 2 if self.endswith("==") else 1 if self.endswith("=") else 0
+        return len(self) // 4 * 3 - padding
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({super().__repr__()})"
+
+    def __reduce__(self):
+        return type(self), (str(self),)
+
+    @classmethod
+    def _validate(cls, value: Any) -> "Base64Bytes":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return cls(value)
+            except ValueError as error:
+                raise PydanticCustomError(
+                    "base64_bytes_decoding",
+                    "Input should be valid base64: {error}",
+                    {"error": str(error)},
+                ) from None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return cls.from_bytes(value)
+        raise PydanticCustomError(
+            "base64_bytes_type", "Input should be a base64 string or bytes"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                cls._validate, core_schema.str_schema()
+            ),
+            python_schema=core_schema.no_info_plain_validator_function(cls._validate),
+            serialization=core_schema.to_string_ser_schema(when_used="json"),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> Dict[str, Any]:
+        return {"type": "string", "format": "byte"}
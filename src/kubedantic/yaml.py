@@ -0,0 +1,215 @@
+"""
+Loading of the Kubernetes objects of multi-document YAML files, such as the
+manifests of GitOps repositories::
+
+    for obj in iter_load("manifests/web.yaml"):
+        print(obj.kind, obj.key)
+
+Every document is validated by the model registered for its ``apiVersion``
+and ``kind`` (see :func:`kubedantic.base.get_model`), and the items of
+``List`` documents (as written by ``kubectl get -o yaml``) one by one. The
+documents are loaded one at a time, with the LibYAML parser when PyYAML was
+built with it.
+
+Objects are written back as manifests with :func:`to_yaml`, in the order of
+``kubectl`` and with multi-line strings as literal blocks::
+
+    with open("manifests/web.yaml", "w") as file:
+        to_yaml([deployment, service], file)
+
+Requires PyYAML, e.g. with ``pip install kubedantic[yaml]``.
+"""
+
+import functools
+import os
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+from .base import UnknownKindError, get_model, validate_python
+from .pruning import _get_type_fields
+
+try:
+    from yaml import CSafeDumper as _BaseDumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _BaseDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+Source = Union[str, "os.PathLike[str]", IO[str], IO[bytes]]
+
+# Top-level fields in the order of kubectl, before and after the others
+_FIRST_FIELDS = ("apiVersion", "kind", "metadata", "spec")
+_LAST_FIELDS = ("status",)
+
+
+class DocumentError(ValueError):
+    """
+    Error in a document of a YAML file, at a ``line`` starting at 1.
+    """
+
+    def __init__(self, name: str, line: int, message: str):
+        super().__init__(f"{name}:{line}: {message}")
+        self.name = name
+        self.line = line
+
+
+def _get_node(node: yaml.Node, loc: Sequence[Union[str, int]]) -> yaml.Node:
+    """
+    Returns the deepest node found at ``loc`` under ``node``.
+    """
+    for element in loc:
+        if isinstance(node, yaml.MappingNode):
+            child = next(
+                (value for key, value in node.value if key.value == element), None
+            )
+        elif isinstance(node, yaml.SequenceNode) and isinstance(element, int):
+            child = node.value[element] if element < len(node.value) else None
+        else:
+            child = None
+        if child is None:
+            break
+        node = child
+
+    return node
+
+
+def _get_line(node: yaml.Node, loc: Sequence[Union[str, int]]) -> int:
+    return _get_node(node, loc).start_mark.line + 1
+
+
+def _validate(
+    name: str,
+    data: Any,
+    node: yaml.Node,
+    context: Optional[Mapping[str, Any]],
+) -> BaseModel:
+    fields = data if isinstance(data, dict) else {}
+    api_version = fields.get("apiVersion") or ""
+    kind = fields.get("kind") or ""
+
+    try:
+        return validate_python(get_model(api_version, kind), data, context)
+    except UnknownKindError as error:
+        raise DocumentError(name, _get_line(node, ()), str(error)) from error
+    except ValidationError as error:
+        (first, *_) = error.errors()
+        raise DocumentError(name, _get_line(node, first["loc"]), str(error)) from error
+
+
+def _iter_objects(
+    name: str, data: Any, node: yaml.Node, context: Optional[Mapping[str, Any]]
+) -> Iterator[BaseModel]:
+    if not (isinstance(data, dict) and data.get("kind") == "List"):
+        yield _validate(name, data, node, context)
+        return
+
+    items = data.get("items") or []
+    for index, item in enumerate(items):
+        yield _validate(name, item, _get_node(node, ("items", index)), context)
+
+
+def _load(
+    name: str, stream: Union[IO[str], IO[bytes]], context: Optional[Mapping[str, Any]]
+) -> Iterator[BaseModel]:
+    loader = _Loader(stream)
+
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            data = loader.construct_document(node)
+            if data is not None:
+                yield from _iter_objects(name, data, node, context)
+    finally:
+        loader.dispose()
+
+
+def iter_load(
+    source: Source, context: Optional[Mapping[str, Any]] = None
+) -> Iterator[BaseModel]:
+    """
+    Yields the objects of the documents of the YAML file at ``source`` (or
+    of a text or binary stream), skipping empty documents.
+
+    :raises DocumentError: If a document is not a valid object of a known
+        kind, with the line of the first field in error.
+    :raises yaml.YAMLError: If the file is not valid YAML.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, "rb") as file:
+            yield from _load(path, file, context)
+    else:
+        name = getattr(source, "name", "<stream>")
+        yield from _load(str(name), source, context)
+
+
+def _represent_str(dumper: yaml.representer.SafeRepresenter, value: str) -> yaml.Node:
+    # The emitter falls back to quoting the strings that cannot be blocks
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+class _Dumper(_BaseDumper):
+    pass
+
+
+_Dumper.add_representer(str, _represent_str)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_order(model: Type[BaseModel]) -> Tuple[str, ...]:
+    names = [field.alias or name for name, field in model.model_fields.items()]
+    first = [name for name in _FIRST_FIELDS if name in names]
+    last = [name for name in _LAST_FIELDS if name in names]
+    others = [name for name in names if name not in first and name not in last]
+    return (*first, *others, *last)
+
+
+def _to_data(obj: BaseModel) -> Dict[str, Any]:
+    data = obj.model_dump(
+        mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+    )
+    # Manifests need the apiVersion and kind that list items leave unset
+    for name, value in _get_type_fields(obj).items():
+        if value is not None:
+            data.setdefault(name, value)
+
+    ordered = {name: data[name] for name in _get_field_order(type(obj)) if name in data}
+    # Extra fields, e.g. of custom resources
+    ordered.update(data)
+    return ordered
+
+
+def to_yaml(
+    objects: Union[BaseModel, Iterable[BaseModel]], stream: Optional[IO[str]] = None
+) -> Optional[str]:
+    """
+    Writes the fields set of an object, or of every object of an iterable as
+    separate documents, to ``stream`` as they come, or returns the YAML if
+    no stream is given.
+    """
+    if isinstance(objects, BaseModel):
+        objects = [objects]
+
+    return yaml.dump_all(
+        (_to_data(obj) for obj in objects),
+        stream,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
@@ -0,0 +1,17 @@
+from typing import Dict, Tuple, Type
+
+import pytest
+from pydantic import BaseModel
+
+from kubedantic import base
+
+
+@pytest.fixture
+def registry(monkeypatch) -> Dict[Tuple[str, str], Type[BaseModel]]:
+    """
+    Registry of the models by kind, restored after the test, for tests
+    declaring custom resources.
+    """
+    registry = dict(base._registry)
+    monkeypatch.setattr(base, "_registry", registry)
+    return registry
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from pydantic import ValidationError
+
+import kubedantic
+from kubedantic.aio import aiter_items, avalidate_list
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList
+
+ITEMS: List[Dict[str, Any]] = [
+    {"metadata": {"name": f"web-{index}"}, "spec": {"containers": [{"name": "web"}]}}
+    for index in range(10)
+]
+
+DATA = {
+    "apiVersion": "v1",
+    "items": ITEMS,
+    "kind": "PodList",
+    "metadata": {"resourceVersion": "42"},
+}
+
+RAW = json.dumps(DATA, indent=2)
+
+
+async def _stream(data: bytes, size: int = 100) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [RAW, RAW.encode(), DATA, "stream"],
+    ids=["str", "bytes", "dict", "stream"],
+)
+def test_avalidate_list(source: Any):
+    if source == "stream":
+        source = _stream(RAW.encode())
+
+    pods = asyncio.run(avalidate_list(PodList, source, chunk_size=100))
+
+    assert pods == PodList.model_validate(DATA)
+    assert pods.model_fields_set == {"apiVersion", "items", "kind", "metadata"}
+    assert kubedantic.avalidate_list is avalidate_list
+
+
+def test_avalidate_list_executor():
+    async def validate() -> PodList:
+        with ThreadPoolExecutor(2) as executor:
+            stream = _stream(RAW.encode())
+            return await avalidate_list(PodList, stream, executor=executor)
+
+    assert asyncio.run(validate()) == PodList.model_validate(DATA)
+
+
+def test_yields_to_event_loop():
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def validate() -> PodList:
+        task = asyncio.ensure_future(tick())
+        try:
+            return await avalidate_list(PodList, RAW, chunk_size=100)
+        finally:
+            task.cancel()
+
+    asyncio.run(validate())
+
+    assert len(ticks) >= len(ITEMS)
+
+
+def test_aiter_items_backpressure():
+    async def consume() -> List[Pod]:
+        pods = []
+        async for pod in aiter_items(PodList, RAW, chunk_size=100):
+            pods.append(pod)
+            if len(pods) == 3:
+                break
+        return pods
+
+    pods = asyncio.run(consume())
+
+    assert [pod.name for pod in pods] == ["web-0", "web-1", "web-2"]
+
+
+def test_aiter_items_streams():
+    raw = RAW.encode()
+    consumed = asyncio.Event()
+
+    async def stream() -> AsyncIterator[bytes]:
+        # The rest only comes once the first items were validated
+        yield raw[: len(raw) // 2]
+        await consumed.wait()
+        yield raw[len(raw) // 2 :]
+
+    async def consume() -> List[Pod]:
+        pods = []
+        async for pod in aiter_items(PodList, stream(), chunk_size=100):
+            pods.append(pod)
+            if len(pods) == 3:
+                consumed.set()
+        return pods
+
+    pods = asyncio.run(consume())
+
+    assert [pod.name for pod in pods] == [f"web-{index}" for index in range(10)]
+
+
+@pytest.mark.parametrize("source", [DATA, RAW], ids=["dict", "str"])
+def test_validation_errors(source: Any):
+    items = [*ITEMS, {"spec": {"containers": [{"image": "nginx"}]}}]
+    if isinstance(source, dict):
+        source = {**source, "items": items}
+    else:
+        source = json.dumps({**DATA, "items": items})
+
+    with pytest.raises(ValidationError) as info:
+        asyncio.run(avalidate_list(PodList, source, chunk_size=100))
+
+    error = info.value
+    assert error.title == "PodList"
+    assert [item["loc"] for item in error.errors()] == [
+        ("items", 10, "spec", "containers", 0, "name")
+    ]
@@ -0,0 +1,117 @@
+import pytest
+
+from kubedantic.base import (
+    ClusterScopedObject,
+    GroupVersionKind,
+    KubernetesObject,
+    NamespacedObject,
+    UnknownKindError,
+    get_model,
+)
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment, ReplicaSet
+from kubedantic.models.io.k8s.api.core.v1 import Namespace, Pod, PodList
+from kubedantic.models.io.k8s.api.rbac.v1 import ClusterRole
+
+
+def test_scopes():
+    assert issubclass(Pod, NamespacedObject)
+    assert issubclass(Deployment, NamespacedObject)
+    assert issubclass(Namespace, ClusterScopedObject)
+    assert issubclass(ClusterRole, ClusterScopedObject)
+    assert not issubclass(PodList, KubernetesObject)
+
+
+def test_gvk():
+    assert Pod().gvk == GroupVersionKind("", "v1", "Pod")
+    assert Deployment().gvk == GroupVersionKind("apps", "v1", "Deployment")
+    assert Deployment().gvk.api_version == "apps/v1"
+    assert ClusterRole().gvk == GroupVersionKind(
+        "rbac.authorization.k8s.io", "v1", "ClusterRole"
+    )
+
+
+def test_key():
+    pod = Pod.model_validate({"metadata": {"name": "web", "namespace": "prod"}})
+    namespace = Namespace.model_validate({"metadata": {"name": "prod"}})
+
+    assert pod.key == "prod/web"
+    assert namespace.key == "prod"
+    assert Pod().key == ""
+
+
+def test_metadata_helpers():
+    pod = Pod.model_validate({
+        "metadata": {"name": "web", "uid": "1", "resourceVersion": "42"}
+    })
+
+    assert pod.name == "web"
+    assert pod.namespace is None
+    assert pod.uid == "1"
+    assert pod.resource_version == "42"
+    assert Pod().resource_version is None
+
+
+def test_owners():
+    replica_set = ReplicaSet.model_validate({"metadata": {"name": "rs", "uid": "rs"}})
+    pod = Pod.model_validate({
+        "metadata": {
+            "name": "web",
+            "ownerReferences": [
+                {"apiVersion": "v1", "kind": "Node", "name": "n", "uid": "node"},
+                {
+                    "apiVersion": "apps/v1",
+                    "kind": "ReplicaSet",
+                    "name": "rs",
+                    "uid": "rs",
+                    "controller": True,
+                },
+            ],
+        }
+    })
+
+    assert len(pod.owner_references) == 2
+    assert Pod().owner_references == []
+    controller = pod.controller_owner()
+    assert controller is not None
+    assert controller.kind == "ReplicaSet"
+    assert pod.is_owned_by(replica_set)
+    assert pod.is_owned_by("node")
+    assert not pod.is_owned_by("other")
+    assert not pod.is_owned_by(Pod())
+
+
+def test_get_model():
+    assert get_model("v1", "Pod") is Pod
+    assert get_model("v1", "PodList") is PodList
+    assert get_model("apps/v1", "Deployment") is Deployment
+    assert get_model("rbac.authorization.k8s.io/v1", "ClusterRole") is ClusterRole
+
+
+def test_get_model_lazy_import():
+    model = get_model("apiextensions.k8s.io/v1", "CustomResourceDefinition")
+
+    assert model.__name__ == "CustomResourceDefinition"
+    assert issubclass(model, ClusterScopedObject)
+
+
+def test_get_model_custom_resource(registry):
+    class Widget(NamespacedObject):
+        apiVersion: str = "example.com/v1"
+        kind: str = "Widget"
+
+    assert get_model("example.com/v1", "Widget") is Widget
+    assert registry[("example.com/v1", "Widget")] is Widget
+
+
+@pytest.mark.parametrize(
+    "api_version, kind",
+    [
+        ("v1", "Unknown"),
+        ("unknown.k8s.io/v1", "Pod"),
+        ("v1", "ObjectMeta"),
+        ("v1", "PodSpec"),
+    ],
+)
+def test_get_model_unknown(api_version, kind):
+    with pytest.raises(UnknownKindError):
+        get_model(api_version, kind)
@@ -0,0 +1,182 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from kubedantic import bulk
+from kubedantic.bulk import ItemError, validate_file, validate_objects
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import Pod
+from kubedantic.sharing import SubtreeCache
+
+
+def _pod(index: int) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": f"web-{index}", "labels": {"app": "wéb"}},
+        "spec": {"containers": [{"name": "web", "image": "nginx:1.25"}]},
+    }
+
+
+DEPLOYMENT = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {"name": "web"},
+    "spec": {"selector": {}, "template": {}, "replicas": 3},
+}
+
+ITEMS: List[Dict[str, Any]] = [
+    _pod(0),
+    DEPLOYMENT,
+    {**_pod(1), "spec": {"containers": [{"image": "nginx"}]}},
+    {"apiVersion": "example.com/v1", "kind": "Gadget", "metadata": {"name": "g"}},
+    *(_pod(index) for index in range(2, 10)),
+]
+
+
+def _get_name(obj: Any) -> str:
+    return obj.metadata.name
+
+
+@pytest.fixture
+def dump(tmp_path: Path) -> Path:
+    path = tmp_path / "dump.json"
+    data = {"apiVersion": "v1", "items": ITEMS, "kind": "List", "metadata": {}}
+    path.write_text(json.dumps(data, indent=4, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _check_results(results: List[Any]):
+    assert len(results) == len(ITEMS)
+    assert results[0] == Pod.model_validate(ITEMS[0])
+    assert results[1] == Deployment.model_validate(DEPLOYMENT)
+    assert results[4:] == [Pod.model_validate(item) for item in ITEMS[4:]]
+
+    invalid, unknown = results[2], results[3]
+    assert invalid == ItemError(
+        position=2,
+        api_version="v1",
+        kind="Pod",
+        name="web-1",
+        errors=[
+            {
+                "type": "missing",
+                "loc": ("spec", "containers", 0, "name"),
+                "msg": "Field required",
+            }
+        ],
+    )
+    assert isinstance(unknown, ItemError)
+    assert (unknown.position, unknown.kind) == (3, "Gadget")
+    assert unknown.errors[0]["type"] == "unknown_kind"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 400, bulk.CHUNK_SIZE])
+def test_validate_file(dump: Path, chunk_size: int):
+    _check_results(list(validate_file(dump, workers=1, chunk_size=chunk_size)))
+
+
+def test_validate_file_small_blocks(dump: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bulk, "BLOCK_SIZE", 7)
+
+    _check_results(list(validate_file(dump, workers=1, chunk_size=400)))
+
+
+def test_validate_file_workers(dump: Path):
+    results = list(validate_file(dump, workers=2, chunk_size=400))
+
+    _check_results(results)
+
+
+def test_validate_file_transform(dump: Path):
+    results = list(validate_file(dump, workers=2, transform=_get_name, chunk_size=1))
+
+    assert results[:2] == ["web-0", "web"]
+    assert isinstance(results[2], ItemError)
+    assert results[4:] == [f"web-{index}" for index in range(2, 10)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_typed_list(tmp_path: Path, workers: int):
+    path = tmp_path / "pods.json"
+    items = [{"metadata": {"name": "web"}}, {"metadata": {"name": "db"}}]
+    path.write_text(json.dumps({"apiVersion": "v1", "items": items, "kind": "PodList"}))
+
+    results = list(validate_file(path, workers=workers, chunk_size=20))
+
+    assert results == [Pod.model_validate(item) for item in items]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_validate_file_wrong_guesses(tmp_path: Path, indent: Optional[int]):
+    path = tmp_path / "dump.json"
+    # Objects in lists and strings inside of the items look like items too
+    items = [
+        {
+            **_pod(index),
+            "metadata": {"name": f"web-{index}", "annotations": {"note": "a, {} ]"}},
+            "spec": {"containers": [{"name": "web"}, {"name": "proxy"}]},
+        }
+        for index in range(20)
+    ]
+    path.write_text(json.dumps({"items": items, "kind": "List"}, indent=indent))
+
+    expected = list(validate_file(path, workers=1))
+    for chunk_size in [1, 50, 300]:
+        assert list(validate_file(path, workers=2, chunk_size=chunk_size)) == expected
+    assert [pod.name for pod in expected] == [f"web-{index}" for index in range(20)]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("[]", []),
+        ('{"items": [], "kind": "List"}', []),
+        ('{"kind": "List", "items": null}', []),
+        ("[" + json.dumps(DEPLOYMENT) + "]", [Deployment.model_validate(DEPLOYMENT)]),
+    ],
+)
+def test_shapes(tmp_path: Path, data: str, expected: List[Any]):
+    path = tmp_path / "dump.json"
+    path.write_text(data)
+
+    assert list(validate_file(path, workers=1)) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    ["", "{", '{"items": [{"kind": "Pod"}', '{"items" 1}', '{"items": [{},]}', "[] []"],
+)
+def test_invalid_json(tmp_path: Path, data: str):
+    path = tmp_path / "dump.json"
+    path.write_text(data)
+
+    with pytest.raises(ValueError):
+        list(validate_file(path, workers=1))
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_validate_objects(workers: Optional[int]):
+    results = list(validate_objects(iter(ITEMS), workers=workers, batch_size=2))
+
+    _check_results(results)
+
+
+def test_validate_objects_context():
+    cache = SubtreeCache()
+    pods = [_pod(index) for index in range(20)]
+
+    results = list(
+        validate_objects(pods, workers=4, context=cache.context, batch_size=3)
+    )
+
+    assert [pod.name for pod in results] == [f"web-{index}" for index in range(20)]
+    assert all(pod.spec is results[0].spec for pod in results)
+
+
+def test_validate_objects_transform():
+    results = validate_objects(ITEMS[:2], workers=2, transform=_get_name)
+
+    assert list(results) == ["web-0", "web"]
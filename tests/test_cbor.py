@@ -0,0 +1,164 @@
+import pytest
+
+from kubedantic import cbor
+from kubedantic.cbor import from_cbor, loads, to_cbor
+from kubedantic.models.io.k8s.api.core.v1 import (
+    ConfigMap,
+    Pod,
+    PodList,
+    Secret,
+    SecretList,
+)
+from kubedantic.models.io.k8s.apiextensions_apiserver.pkg.apis.apiextensions.v1 import (
+    JSONSchemaProps,
+)
+
+POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "wéb",
+        "labels": {"tier": "frontend", "app": "web"},
+        "creationTimestamp": "2024-04-28T19:06:26Z",
+    },
+    "spec": {
+        "containers": [
+            {
+                "name": "web",
+                "image": "nginx",
+                "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+            }
+        ],
+        "priority": -5,
+        "terminationGracePeriodSeconds": 2**40,
+    },
+}
+
+
+@pytest.fixture(autouse=True, params=["cbor2", "python"])
+def codec(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(cbor, "cbor2", None)
+    elif cbor.cbor2 is None:
+        pytest.skip("cbor2 is not installed")
+    return request.param
+
+
+def test_round_trip():
+    pod = Pod.model_validate(POD)
+
+    assert from_cbor(to_cbor(pod)) == pod
+    assert from_cbor(to_cbor(pod), Pod) == pod
+
+
+def test_encoding():
+    config_map = ConfigMap.model_validate({
+        "metadata": {"name": "a", "labels": {"zz": "1", "b": "2"}},
+    })
+
+    assert to_cbor(config_map) == bytes.fromhex(
+        "d9d9f7"  # Self-described CBOR
+        "a3"  # Map of 3 fields, by encoded key
+        "446b696e64" "49436f6e6669674d6170"  # kind: ConfigMap
+        "486d65746164617461" "a2"  # metadata
+        "446e616d65" "4161"  # name: a
+        "466c6162656c73" "a2" "4162" "4132" "427a7a" "4131"  # labels
+        "4a61706956657273696f6e" "427631"  # apiVersion: v1
+    )  # fmt: skip
+
+
+def test_encoding_non_ascii_keys():
+    # By length, then bytes: "é" is 2 bytes long, like "zz", and sorts after
+    config_map = ConfigMap.model_validate({"data": {"zz": "", "é": "", "b": ""}})
+
+    assert to_cbor(config_map).startswith(
+        bytes.fromhex(
+            "d9d9f7" "a3"
+            "4464617461" "a3" "4162" "40" "427a7a" "40" "42c3a9" "40"  # data
+        )
+    )  # fmt: skip
+
+
+def test_bytes():
+    secret = Secret.model_validate({"data": {"key": "aGVsbG8="}})
+    data = to_cbor(secret)
+
+    # Tag 22 and the 5 raw bytes
+    assert bytes.fromhex("d6" "45" "68656c6c6f") in data  # fmt: skip
+    assert from_cbor(data) == secret
+
+
+def test_bytes_in_lists():
+    secrets = SecretList.model_validate({
+        "items": [{"data": {"key": "aGVsbG8="}}, {"data": {"empty": ""}}]
+    })
+    data = to_cbor(secrets)
+
+    assert data.count(b"\xd6") == 2
+    assert from_cbor(data, SecretList) == secrets
+
+
+def test_invalid_base64():
+    # Refused when validated, so set without validation
+    secret = Secret.model_construct(data={"key": "hello!"})
+
+    with pytest.raises(ValueError, match="Invalid base64"):
+        to_cbor(secret)
+
+
+def test_floats():
+    schema = JSONSchemaProps(minimum=1.5, maximum=0.1)
+
+    assert to_cbor(schema) == bytes.fromhex(
+        "d9d9f7" "a2"
+        "476d6178696d756d" "fb3fb999999999999a"  # maximum: 0.1, as a float64
+        "476d696e696d756d" "f93e00"  # minimum: 1.5, as a float16
+    )  # fmt: skip
+    assert from_cbor(to_cbor(schema), JSONSchemaProps) == schema
+
+
+def test_nan():
+    with pytest.raises(ValueError, match="Cannot encode nan"):
+        to_cbor(JSONSchemaProps(minimum=float("nan")))
+
+
+def test_loads_text_strings():
+    # {"kind": "Pod", "apiVersion": "v1"}, with text strings
+    data = bytes.fromhex("a2" "646b696e64" "63506f64" "6a61706956657273696f6e" "627631")  # fmt: skip
+
+    assert from_cbor(data) == Pod()
+    # Byte strings tagged to be read as base64url (21) and base16 (23)
+    assert loads(bytes.fromhex("d5" "43" "fbff00")) == "-_8A"  # fmt: skip
+    assert loads(bytes.fromhex("d7" "42" "beef")) == "beef"  # fmt: skip
+
+
+def test_lists():
+    pods = PodList.model_validate({"items": [POD, {"metadata": {"name": "api"}}]})
+
+    assert from_cbor(to_cbor(pods)) == pods
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ("a1", "Truncated|premature end"),
+        ("616100", "Extra data"),
+        ("9fff", "[Ii]ndefinite"),
+        ("a2416100616101", "Duplicate"),
+        ("a10102", "keys must be strings"),
+        ("c100", "Unsupported CBOR tag 1"),
+        ("c24101", "Unsupported CBOR tag 2"),
+        ("d6616100", "expects a byte string"),
+        ("f97e00", "Unsupported CBOR float"),
+        ("f7", "Unsupported CBOR simple value"),
+        ("41ff", "Invalid UTF-8"),
+    ],
+)
+def test_loads_errors(data: str, message: str):
+    with pytest.raises(ValueError, match=message):
+        loads(bytes.fromhex(data))
+
+
+def test_nested_too_deeply():
+    with pytest.raises(ValueError, match="nested too deeply|nesting depth"):
+        loads(b"\x81" * 100_000 + b"\x00")
@@ -0,0 +1,160 @@
+import numpy
+import pytest
+
+from kubedantic.columnar import (
+    BOOL,
+    CATEGORY,
+    FLOAT,
+    INT,
+    QUANTITY,
+    STR,
+    TIMESTAMP,
+    parse_quantity,
+    to_columns,
+)
+from kubedantic.models.io.k8s.api.core.v1 import Pod
+from kubedantic.paths import InvalidPathError
+
+
+def _pod(index: int) -> dict:
+    return {
+        "metadata": {
+            "name": f"web-{index}",
+            "namespace": ["default", "kube-system"][index % 2],
+            "creationTimestamp": f"2024-01-0{index + 1}T00:00:00Z",
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "web",
+                    "resources": {"requests": {"cpu": "250m", "memory": "64Mi"}},
+                }
+            ],
+            "nodeName": f"node-{index % 2}",
+        },
+        "status": {
+            "containerStatuses": [
+                {
+                    "name": "web",
+                    "image": "nginx",
+                    "imageID": "",
+                    "ready": True,
+                    "restartCount": index,
+                }
+            ]
+        },
+    }
+
+
+PODS = [_pod(0), _pod(1), _pod(2)]
+# The third pod is not scheduled, and has no requests nor status yet
+del PODS[2]["spec"]["nodeName"], PODS[2]["spec"]["containers"][0]["resources"]
+del PODS[2]["status"]
+
+
+@pytest.fixture(params=["models", "dicts"])
+def objects(request):
+    if request.param == "models":
+        return [Pod.model_validate(pod) for pod in PODS]
+    return PODS
+
+
+def test_to_columns(objects):
+    columns = to_columns(
+        objects,
+        {
+            "metadata.namespace": CATEGORY,
+            "spec.nodeName": CATEGORY,
+            "spec.containers[0].resources.requests.cpu": QUANTITY,
+            "spec.containers[0].resources.requests.memory": QUANTITY,
+            "status.containerStatuses[0].restartCount": INT,
+            "status.containerStatuses[0].ready": BOOL,
+            "metadata.creationTimestamp": TIMESTAMP,
+            "metadata.name": STR,
+        },
+    )
+
+    assert columns["metadata.namespace"].tolist() == [0, 1, 0]
+    assert columns.categories["metadata.namespace"].tolist() == [
+        "default",
+        "kube-system",
+    ]
+    assert columns["spec.nodeName"].dtype == numpy.int32
+    assert columns.decode("spec.nodeName").tolist() == ["node-0", "node-1", None]
+    numpy.testing.assert_array_equal(
+        columns["spec.containers[0].resources.requests.cpu"], [0.25, 0.25, numpy.nan]
+    )
+    assert columns["spec.containers[0].resources.requests.memory"][0] == 64 * 2**20
+    assert columns["status.containerStatuses[0].restartCount"].tolist() == [0, 1, 0]
+    assert columns["status.containerStatuses[0].ready"].tolist() == [
+        True,
+        True,
+        False,
+    ]
+    assert columns["metadata.creationTimestamp"][2] == numpy.datetime64(
+        "2024-01-03T00:00:00", "us"
+    )
+    assert columns["metadata.name"].tolist() == ["web-0", "web-1", "web-2"]
+
+
+def test_to_columns_inferred():
+    objects = [Pod.model_validate(pod) for pod in PODS]
+
+    columns = to_columns(
+        objects,
+        [
+            "spec.nodeName",
+            "status.containerStatuses[0].restartCount",
+            "status.containerStatuses[0].ready",
+            "metadata.creationTimestamp",
+        ],
+    )
+
+    assert columns["spec.nodeName"].tolist() == [0, 1, -1]
+    assert columns["status.containerStatuses[0].restartCount"].dtype == numpy.int64
+    assert columns["status.containerStatuses[0].ready"].dtype == numpy.bool_
+    assert columns["metadata.creationTimestamp"].dtype == numpy.dtype("datetime64[us]")
+
+
+def test_to_records():
+    columns = to_columns(PODS, {"metadata.name": STR, "spec.nodeName": CATEGORY})
+
+    records = columns.to_records()
+
+    assert records.dtype.names == ("metadata.name", "spec.nodeName")
+    assert records[1]["spec.nodeName"] == 1
+
+
+def test_to_columns_empty():
+    columns = to_columns([], {"spec.nodeName": CATEGORY, "metadata.uid": FLOAT})
+
+    assert columns["spec.nodeName"].shape == (0,)
+    assert columns.categories["spec.nodeName"].shape == (0,)
+    assert columns["metadata.uid"].dtype == numpy.float64
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("100m", 0.1),
+        ("1Gi", 2**30),
+        ("1.5", 1.5),
+        ("2k", 2000),
+        ("12e3", 12000),
+        ("500u", 0.0005),
+        (3, 3.0),
+    ],
+)
+def test_parse_quantity(value, expected):
+    assert parse_quantity(value) == pytest.approx(expected)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Invalid quantity '1 cpu'"):
+        parse_quantity("1 cpu")
+    with pytest.raises(ValueError, match="Invalid quantity 'web'"):
+        to_columns(PODS, {"spec.containers[0].name": QUANTITY})
+    with pytest.raises(ValueError, match="Unknown column type 'date'"):
+        to_columns(PODS, {"metadata.name": "date"})
+    with pytest.raises(InvalidPathError):
+        to_columns([Pod.model_validate(PODS[0])], ["spec.nodeNames"])
@@ -0,0 +1,158 @@
+import pytest
+
+from kubedantic.frozen import freeze
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodSpec
+from kubedantic.paths import InvalidPathError, evolve, get_path, parse_path
+
+DEPLOYMENT = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {"name": "web", "labels": {"app.kubernetes.io/name": "web"}},
+    "spec": {
+        "replicas": 1,
+        "selector": {"matchLabels": {"app": "web"}},
+        "template": {
+            "metadata": {"labels": {"app": "web"}},
+            "spec": {
+                "containers": [
+                    {"name": "web", "image": "nginx:1.25"},
+                    {"name": "sidecar", "image": "envoy:1.30"},
+                ],
+                "volumes": [{"name": "data", "emptyDir": {}}],
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def deployment() -> Deployment:
+    return Deployment.model_validate(DEPLOYMENT)
+
+
+@pytest.mark.parametrize(
+    ("path", "segments"),
+    [
+        ("spec", ("spec",)),
+        ("spec.replicas", ("spec", "replicas")),
+        ("spec.containers[0].image", ("spec", "containers", 0, "image")),
+        ("items[-1]", ("items", -1)),
+        (
+            'metadata.labels["app.kubernetes.io/name"]',
+            ("metadata", "labels", "app.kubernetes.io/name"),
+        ),
+        ("metadata.labels['a.b'].c", ("metadata", "labels", "a.b", "c")),
+    ],
+)
+def test_parse_path(path, segments):
+    assert parse_path(path) == segments
+
+
+@pytest.mark.parametrize("path", ["", ".spec", "spec..replicas", "spec[x]", "spec[0"])
+def test_parse_invalid_path(path):
+    with pytest.raises(InvalidPathError):
+        parse_path(path)
+
+
+def test_get_path(deployment):
+    assert get_path(deployment, "spec.template.spec.containers[1].name") == "sidecar"
+    assert get_path(deployment, 'metadata.labels["app.kubernetes.io/name"]') == "web"
+    assert get_path(deployment, "status.replicas") is None
+    assert get_path(deployment, "spec.template.spec.containers[5]", "none") == "none"
+
+
+def test_evolve(deployment):
+    image = "spec.template.spec.containers[0].image"
+    evolved = evolve(deployment, {"spec.replicas": 3, image: "nginx:1.27"})
+
+    assert get_path(evolved, "spec.replicas") == 3
+    assert get_path(evolved, image) == "nginx:1.27"
+    # The original is untouched
+    assert get_path(deployment, "spec.replicas") == 1
+    assert get_path(deployment, image) == "nginx:1.25"
+
+
+def test_evolve_copies_only_the_spine(deployment):
+    image = "spec.template.spec.containers[0].image"
+    evolved = evolve(deployment, {image: "nginx:1.27"})
+
+    assert evolved.spec is not deployment.spec
+    assert evolved.spec.template.spec is not deployment.spec.template.spec
+    assert (
+        evolved.spec.template.spec.containers
+        is not deployment.spec.template.spec.containers
+    )
+    # Everything off the path is shared
+    assert evolved.metadata is deployment.metadata
+    assert evolved.spec.selector is deployment.spec.selector
+    assert evolved.spec.template.metadata is deployment.spec.template.metadata
+    assert evolved.spec.template.spec.volumes is deployment.spec.template.spec.volumes
+    assert (
+        evolved.spec.template.spec.containers[1]
+        is deployment.spec.template.spec.containers[1]
+    )
+
+
+def test_evolve_dict_key(deployment):
+    evolved = evolve(deployment, {'metadata.labels["app.kubernetes.io/version"]': "2"})
+
+    assert evolved.metadata.labels == {
+        "app.kubernetes.io/name": "web",
+        "app.kubernetes.io/version": "2",
+    }
+    assert deployment.metadata.labels == {"app.kubernetes.io/name": "web"}
+
+
+def test_evolve_sets_fields(deployment):
+    evolved = evolve(deployment, {"spec.paused": True})
+
+    assert "paused" in evolved.spec.model_fields_set
+    assert "paused" not in deployment.spec.model_fields_set
+    assert evolved.model_dump(exclude_unset=True)["spec"]["paused"] is True
+
+
+def test_evolve_missing_parents(deployment):
+    evolved = evolve(deployment, {"spec.strategy.rollingUpdate.maxSurge": "50%"})
+
+    assert get_path(evolved, "spec.strategy.rollingUpdate.maxSurge") == "50%"
+    assert evolved.model_dump(exclude_unset=True)["spec"]["strategy"] == {
+        "rollingUpdate": {"maxSurge": "50%"}
+    }
+
+
+def test_evolve_missing_required_parents():
+    with pytest.raises(InvalidPathError, match="containers"):
+        evolve(Pod(), {"spec.nodeName": "node-1"})
+
+    evolved = evolve(Pod(), {"spec": PodSpec(containers=[], nodeName="node-1")})
+    assert get_path(evolved, "spec.nodeName") == "node-1"
+
+
+def test_evolve_frozen(deployment):
+    frozen_deployment = freeze(deployment)
+    image = "spec.template.spec.containers[0].image"
+    evolved = evolve(frozen_deployment, {image: "nginx:1.27"})
+
+    assert type(evolved) is type(frozen_deployment)
+    assert isinstance(evolved.spec.template.spec.containers, tuple)
+    assert get_path(evolved, image) == "nginx:1.27"
+    assert evolved != frozen_deployment
+    assert hash(evolved) != hash(frozen_deployment)
+    assert evolve(frozen_deployment, {image: "nginx:1.25"}) == frozen_deployment
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"spec.unknown": 1},
+        {"spec.template.spec.containers.image": "nginx"},
+        {"spec.replicas": 3, "spec.replicas.value": 3},
+        {"spec.template": None, "spec.template.spec": None},
+        {"spec.template.spec.containers[3].image": "nginx"},
+        {"spec.template.spec.containers[-4]": None},
+    ],
+)
+def test_evolve_invalid_paths(deployment, changes):
+    with pytest.raises(InvalidPathError):
+        evolve(deployment, changes)
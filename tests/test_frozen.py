@@ -0,0 +1,203 @@
+import pickle
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from kubedantic.base import validate_python
+from kubedantic.frozen import (
+    FrozenDict,
+    FrozenList,
+    FrozenModel,
+    freeze,
+    frozen,
+    read_only,
+    thaw,
+)
+from kubedantic.interning import intern_strings
+from kubedantic.models.io.k8s.api.apps.v1 import ControllerRevision
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList
+from kubedantic.models.io.k8s.apiextensions_apiserver.pkg.apis.apiextensions.v1 import (  # noqa: E501
+    CustomResourceDefinition,
+)
+from kubedantic.sharing import SubtreeCache
+
+POD = {
+    "metadata": {"name": "web", "namespace": "prod", "labels": {"app": "web"}},
+    "spec": {"containers": [{"name": "web", "image": "nginx", "args": ["-v"]}]},
+}
+
+
+def test_frozen_model():
+    model = frozen(Pod)
+
+    assert issubclass(model, FrozenModel)
+    assert issubclass(model, Pod)
+    assert frozen(Pod) is model
+    assert frozen(model) is model
+
+
+def test_freeze():
+    pod = freeze(Pod.model_validate(POD))
+
+    assert pod.key == "prod/web"
+    assert pod.spec is not None
+    assert isinstance(pod.spec.containers, tuple)
+    assert pod.spec.containers[0].args == ("-v",)
+    assert pod.metadata is not None
+    assert isinstance(pod.metadata.labels, FrozenDict)
+    assert freeze(pod) is pod
+
+
+def test_immutable():
+    pod = freeze(Pod.model_validate(POD))
+    assert pod.metadata is not None and pod.metadata.labels is not None
+
+    with pytest.raises(ValidationError):
+        pod.metadata.name = "other"
+    with pytest.raises(TypeError):
+        pod.metadata.labels["app"] = "other"
+    with pytest.raises(TypeError):
+        pod.metadata.labels.update(app="other")
+
+
+def test_hash_and_equality():
+    first = frozen(Pod).model_validate(POD)
+    second = freeze(Pod.model_validate(POD))
+    other = freeze(Pod.model_validate({**POD, "metadata": {"name": "other"}}))
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != other
+    assert len({first, second, other}) == 2
+    assert {first: 1}[second] == 1
+
+
+def test_hash_is_cached():
+    pod = freeze(Pod.model_validate(POD))
+
+    assert pod.__pydantic_private__["_hash"] is None
+    value = hash(pod)
+    assert pod.__pydantic_private__["_hash"] == value
+    assert hash(pod) == value
+
+
+def test_copy_resets_hash():
+    pod = freeze(Pod.model_validate(POD))
+    value = hash(pod)
+
+    assert hash(pod.model_copy()) == value
+    renamed = pod.model_copy(update={"kind": "Other"})
+    assert renamed.__pydantic_private__["_hash"] is None
+    assert hash(renamed) != value
+
+
+def test_thaw():
+    pod = Pod.model_validate(POD)
+    thawed = thaw(freeze(pod))
+
+    assert type(thawed) is Pod
+    assert thawed == pod
+    assert thawed.model_fields_set == pod.model_fields_set
+    assert thaw(pod) is pod
+
+
+def test_serialization():
+    pod = freeze(Pod.model_validate(POD))
+
+    assert pod.model_dump(mode="json", exclude_unset=True) == POD
+    assert Pod.model_validate_json(pod.model_dump_json()) == Pod.model_validate(POD)
+    assert pickle.loads(pickle.dumps(pod)) == pod
+
+
+def test_pickle_read_only():
+    pod = read_only(Pod).model_validate(POD)
+    restored = pickle.loads(pickle.dumps(pod))
+
+    assert type(restored) is read_only(Pod)
+    assert isinstance(restored.spec.containers, FrozenList)  # type: ignore[union-attr]
+    assert restored == pod
+
+
+def test_extra_fields():
+    model = frozen(ControllerRevision)
+    first = model.model_validate({"revision": 1, "data": {"spec": {"replicas": 1}}})
+    second = model.model_validate({"revision": 1, "data": {"spec": {"replicas": 2}}})
+    again = model.model_validate({"revision": 1, "data": {"spec": {"replicas": 1}}})
+
+    assert first != second
+    assert len({first, second, again}) == 2
+    assert first.data.spec == FrozenDict(replicas=1)  # type: ignore[union-attr]
+    assert (
+        first.data
+        == ControllerRevision.model_validate(  # type: ignore[comparison-overlap]
+            {"revision": 1, "data": {"spec": {"replicas": 1}}}
+        ).data
+    )
+
+
+def test_frozen_list():
+    pods = frozen(PodList).model_validate({"items": [POD, POD]})
+
+    assert isinstance(pods.items, tuple)
+    assert pods.items[0] == pods.items[1]
+    assert hash(pods)
+
+
+def test_recursive_and_free_form_fields():
+    crd = frozen(CustomResourceDefinition).model_validate({
+        "spec": {
+            "group": "example.com",
+            "names": {"kind": "Widget", "plural": "widgets"},
+            "scope": "Namespaced",
+            "versions": [
+                {
+                    "name": "v1",
+                    "served": True,
+                    "storage": True,
+                    "schema": {
+                        "openAPIV3Schema": {
+                            "type": "object",
+                            "properties": {
+                                "size": {"type": "array", "default": [1, {"a": 2}]}
+                            },
+                        }
+                    },
+                }
+            ],
+        }
+    })
+    assert crd.spec.versions[0].schema_ is not None
+    schema = crd.spec.versions[0].schema_.openAPIV3Schema
+    assert schema is not None and schema.properties is not None
+
+    assert schema.properties["size"].default == (1, FrozenDict(a=2))
+    assert hash(crd)
+
+
+def test_interning_and_sharing():
+    cache = SubtreeCache()
+    model = frozen(Pod)
+
+    first = validate_python(model, POD, cache.context)
+    second = intern_strings(validate_python(model, POD, cache.context))
+
+    assert first.spec is second.spec
+    assert isinstance(second.metadata.labels, FrozenDict)  # type: ignore[union-attr]
+
+
+def test_read_only():
+    model = read_only(Pod)
+    pod = Pod.model_validate({"spec": model.model_validate(POD).spec})
+
+    assert issubclass(model, FrozenModel)
+    assert model is not frozen(Pod)
+    assert read_only(frozen(Pod)) is frozen(Pod)
+    assert isinstance(pod.spec.containers, FrozenList)  # type: ignore[union-attr]
+    assert hash(pod.spec) == hash(model.model_validate(POD).spec)
+    with pytest.raises(TypeError, match="FrozenList is immutable"):
+        pod.spec.containers.append(pod.spec.containers[0])  # type: ignore[union-attr]
+    # Nested in a mutable model, its lists are serialized without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert pod.model_dump(exclude_unset=True)["spec"] == POD["spec"]
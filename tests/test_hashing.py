@@ -0,0 +1,145 @@
+import copy
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import pytest
+
+import kubedantic
+from kubedantic.frozen import freeze
+from kubedantic.hashing import content_hash
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.apiextensions_apiserver.pkg.apis.apiextensions.v1 import (
+    JSONSchemaProps,
+)
+from kubedantic.paths import evolve
+
+DEPLOYMENT: Dict[str, Any] = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {
+        "name": "web",
+        "labels": {"app": "web", "tier": "frontend"},
+        "annotations": {"deployment.kubernetes.io/revision": "3"},
+    },
+    "spec": {
+        "replicas": 2,
+        "selector": {"matchLabels": {"app": "web"}},
+        "template": {
+            "metadata": {"labels": {"app": "web"}},
+            "spec": {"containers": [{"name": "web", "image": "nginx:1.25"}]},
+        },
+    },
+}
+
+LIVE = {
+    **DEPLOYMENT,
+    "metadata": {
+        **DEPLOYMENT["metadata"],
+        "uid": "5a1b",
+        "resourceVersion": "1234",
+        "generation": 7,
+        "managedFields": [{"manager": "kubectl", "operation": "Apply"}],
+    },
+    "status": {"replicas": 2, "readyReplicas": 2},
+}
+
+
+def _deployment(data=DEPLOYMENT) -> Deployment:
+    return Deployment.model_validate(copy.deepcopy(data))
+
+
+def test_content_hash_is_stable():
+    value = content_hash(_deployment())
+
+    assert value == content_hash(_deployment())
+    assert len(value) == 32
+    assert kubedantic.content_hash is content_hash
+
+
+def test_order_does_not_matter():
+    reordered = dict(reversed(list(DEPLOYMENT.items())))
+    reordered["metadata"] = {
+        **DEPLOYMENT["metadata"],
+        "labels": {"tier": "frontend", "app": "web"},
+    }
+
+    assert content_hash(_deployment(reordered)) == content_hash(_deployment())
+
+
+def test_server_fields_are_ignored():
+    assert content_hash(_deployment(LIVE)) == content_hash(_deployment())
+
+
+def test_none_fields_are_ignored():
+    deployment = _deployment()
+    explicit = evolve(deployment, {"spec.paused": None})
+
+    assert content_hash(explicit) == content_hash(deployment)
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"spec.replicas": 3},
+        {"spec.paused": False},
+        {"spec.template.spec.containers[0].image": "nginx:1.27"},
+        {'metadata.labels["tier"]': "backend"},
+        {'metadata.labels["version"]': "1"},
+        {"metadata.creationTimestamp": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+    ],
+)
+def test_changes_are_detected(changes):
+    deployment = _deployment()
+
+    assert content_hash(evolve(deployment, changes)) != content_hash(deployment)
+
+
+def test_ignore():
+    deployment = _deployment()
+    revision = 'metadata.annotations["deployment.kubernetes.io/revision"]'
+    changed = evolve(deployment, {revision: "4"})
+
+    assert content_hash(changed) != content_hash(deployment)
+    assert content_hash(changed, [revision]) == content_hash(deployment, [revision])
+    assert content_hash(changed, ["metadata.annotations"]) == content_hash(
+        deployment, ["metadata.annotations"]
+    )
+    containers = ["spec.template.spec.containers[0]"]
+    image = evolve(deployment, {"spec.template.spec.containers[0].image": "nginx"})
+    assert content_hash(image, containers) == content_hash(deployment, containers)
+
+
+def test_aliases():
+    schema = JSONSchemaProps.model_validate({"not": {"type": "string"}})
+    other = JSONSchemaProps.model_validate({"not": {"type": "integer"}})
+
+    assert content_hash(schema) != content_hash(other)
+    assert content_hash(schema, ["not_"]) == content_hash(other, ["not_"])
+
+
+def test_frozen_hash_matches():
+    deployment = _deployment(LIVE)
+
+    assert content_hash(freeze(deployment)) == content_hash(deployment)
+
+
+def test_frozen_hash_is_cached():
+    deployment = freeze(_deployment())
+    value = content_hash(deployment)
+
+    assert deployment.__pydantic_private__["_digests"]
+    assert content_hash(deployment) == value
+    assert content_hash(deployment, ["spec.replicas"]) != value
+    assert len(deployment.__pydantic_private__["_digests"]) == 2
+
+    evolved = evolve(deployment, {"spec.replicas": 3})
+    assert evolved.__pydantic_private__["_digests"] is None
+    assert content_hash(evolved) != value
+    assert content_hash(evolve(evolved, {"spec.replicas": 2})) == value
+
+
+def test_unhashable_value():
+    schema = JSONSchemaProps.model_validate({"default": object()})
+
+    with pytest.raises(TypeError):
+        content_hash(schema)
@@ -0,0 +1,163 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+from pydantic import ValidationError
+
+import kubedantic
+from kubedantic import indexed
+from kubedantic.indexed import IndexedList, ItemInfo
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import Namespace, Pod, Service
+
+
+def _pod(index: int) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": f"web-{index}", "namespace": "shop"},
+        "spec": {"containers": [{"name": "wéb", "image": "nginx:1.25"}]},
+    }
+
+
+ITEMS: List[Dict[str, Any]] = [
+    {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "shop"}},
+    {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "namespace": "shop"},
+        "spec": {"selector": {}, "template": {}},
+    },
+    {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "web", "namespace": "shop"},
+    },
+    {**_pod(0), "spec": {"containers": [{"image": "nginx"}]}},
+    *(_pod(index) for index in range(1, 5)),
+]
+
+
+@pytest.fixture
+def dump(tmp_path: Path) -> Path:
+    path = tmp_path / "dump.json"
+    data = {
+        "apiVersion": "v1",
+        "items": ITEMS,
+        "kind": "List",
+        "metadata": {"resourceVersion": "42"},
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_indexed_list(dump: Path):
+    with IndexedList(dump) as snapshot:
+        assert len(snapshot) == len(ITEMS)
+        assert snapshot.fields["metadata"] == {"resourceVersion": "42"}
+        assert snapshot[0] == Namespace.model_validate(ITEMS[0])
+        assert snapshot.get("web", "shop", kind="Service") == Service.model_validate(
+            ITEMS[2]
+        )
+        assert snapshot.get("web", "shop", "Deployment") == Deployment.model_validate(
+            ITEMS[1]
+        )
+        assert snapshot.positions("web", "shop") == [1, 2]
+        assert snapshot.positions("shop") == [0]
+        assert snapshot.get("web") is None
+        assert snapshot.get("web-4", "shop") == Pod.model_validate(ITEMS[-1])
+        assert json.loads(snapshot.raw(4)) == ITEMS[4]
+
+        with pytest.raises(ValidationError):
+            snapshot.validate(3)
+
+    assert kubedantic.IndexedList is IndexedList
+
+
+def test_info(dump: Path):
+    with IndexedList(dump) as snapshot:
+        info = snapshot.info(4)
+        namespace = snapshot.info(0)
+
+    assert info == ItemInfo("v1", "Pod", "shop", "web-1", info.start, info.end)
+    assert json.loads(dump.read_bytes()[info.start : info.end]) == ITEMS[4]
+    assert namespace[:4] == ("v1", "Namespace", None, "shop")
+
+
+def test_typed_list(tmp_path: Path):
+    path = tmp_path / "pods.json"
+    items = [{"metadata": {"name": "web"}, "spec": {"containers": []}}]
+    path.write_text(json.dumps({"apiVersion": "v1", "kind": "PodList", "items": items}))
+
+    with IndexedList(path, save_index=False) as snapshot:
+        assert list(snapshot) == [Pod.model_validate(items[0])]
+        assert snapshot.info(0).kind == "Pod"
+
+    assert not (tmp_path / "pods.json.index").exists()
+
+
+def test_reopen(dump: Path, monkeypatch: pytest.MonkeyPatch):
+    with IndexedList(dump) as snapshot:
+        infos = [snapshot.info(position) for position in range(len(snapshot))]
+    index_path = Path(f"{dump}{indexed.INDEX_SUFFIX}")
+    assert index_path.exists()
+
+    def _build_index(*args: Any):
+        raise AssertionError("Not reused")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(indexed, "_build_index", _build_index)
+        with IndexedList(dump) as snapshot:
+            assert [snapshot.info(n) for n in range(len(snapshot))] == infos
+            assert snapshot.fields["metadata"] == {"resourceVersion": "42"}
+            assert snapshot.get("web-2", "shop") == Pod.model_validate(ITEMS[5])
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: data[:-10],
+        lambda data: data[: len(data) // 2],
+        lambda data: data[:12],
+        lambda data: data[:12] + b"{" + data[13:],
+        lambda data: data + b"\0web",
+    ],
+    ids=["names", "arrays", "header", "json", "extra"],
+)
+def test_damaged_index(dump: Path, damage: Callable[[bytes], bytes]):
+    with IndexedList(dump) as snapshot:
+        infos = [snapshot.info(position) for position in range(len(snapshot))]
+    index_path = Path(f"{dump}{indexed.INDEX_SUFFIX}")
+    data = index_path.read_bytes()
+    index_path.write_bytes(damage(data))
+
+    with IndexedList(dump) as snapshot:
+        assert [snapshot.info(n) for n in range(len(snapshot))] == infos
+
+    assert index_path.read_bytes() == data
+
+
+def test_stale_index(dump: Path):
+    with IndexedList(dump):
+        pass
+
+    dump.write_text(json.dumps({"items": ITEMS[:2]}))
+    stat = dump.stat()
+    os.utime(dump, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    with IndexedList(dump) as snapshot:
+        assert len(snapshot) == 2
+        assert snapshot.fields == {}
+
+
+def test_empty(tmp_path: Path):
+    path = tmp_path / "empty.json"
+    path.write_text('{"kind": "List", "items": []}')
+
+    with IndexedList(path):
+        pass
+    with IndexedList(path) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.get("web") is None
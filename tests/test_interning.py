@@ -0,0 +1,87 @@
+import json
+
+from kubedantic.base import validate_json, validate_python
+from kubedantic.interning import intern_strings
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList
+
+POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "web-1",
+        "namespace": "production",
+        "labels": {"app.kubernetes.io/name": "web"},
+        "annotations": {"kubectl.kubernetes.io/restartedAt": "2024-01-01"},
+        "ownerReferences": [
+            {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "rs", "uid": "1"}
+        ],
+    },
+    "spec": {
+        "nodeName": "node-1",
+        "containers": [{"name": "web", "image": "registry.example.com/web:1.0"}],
+    },
+}
+
+
+def _load() -> dict:
+    # A fresh copy, as if decoded from a separate API response
+    return json.loads(json.dumps(POD))
+
+
+def _strings(pod: Pod) -> list:
+    assert pod.metadata is not None
+    assert pod.metadata.labels is not None
+    assert pod.metadata.annotations is not None
+    assert pod.spec is not None
+    return [
+        pod.kind,
+        pod.metadata.namespace,
+        next(iter(pod.metadata.labels)),
+        pod.metadata.labels["app.kubernetes.io/name"],
+        next(iter(pod.metadata.annotations)),
+        pod.owner_references[0].kind,
+        pod.spec.nodeName,
+        pod.spec.containers[0].image,
+    ]
+
+
+def test_intern_on_validation():
+    context = {"intern_strings": True}
+    first = validate_python(Pod, _load(), context)
+    second = validate_python(Pod, _load(), context)
+
+    for a, b in zip(_strings(first), _strings(second)):
+        assert a == b
+        assert a is b
+
+
+def test_no_interning_by_default():
+    first = Pod.model_validate(_load())
+    second = Pod.model_validate(_load())
+
+    assert first.spec is not None and second.spec is not None
+    assert first.spec.nodeName is not second.spec.nodeName
+
+
+def test_intern_list_items():
+    data = json.dumps({"items": [POD, POD]})
+    pods = validate_json(PodList, data, context={"intern_strings": True})
+    single = validate_python(Pod, _load(), context={"intern_strings": True})
+
+    for pod in pods.items:
+        assert pod.spec is not None and single.spec is not None
+        assert pod.spec.nodeName is single.spec.nodeName
+
+
+def test_intern_strings():
+    first = intern_strings(Pod.model_validate(_load()))
+    second = intern_strings(Pod.model_validate(_load()))
+
+    assert _strings(first) == _strings(second)
+    assert all(a is b for a, b in zip(_strings(first), _strings(second)))
+    # Annotation values are mostly unique, so only their keys are interned
+    assert first.metadata is not None and second.metadata is not None
+    key = "kubectl.kubernetes.io/restartedAt"
+    assert first.metadata.annotations is not None
+    assert second.metadata.annotations is not None
+    assert first.metadata.annotations[key] is not second.metadata.annotations[key]
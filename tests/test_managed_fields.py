@@ -0,0 +1,187 @@
+from typing import Any, Dict
+
+import pytest
+
+import kubedantic
+from kubedantic.managed_fields import (
+    FieldSet,
+    ManagedFields,
+    key_element,
+    to_elements,
+    value_element,
+)
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+
+GITOPS: Dict[str, Any] = {
+    "f:metadata": {
+        "f:finalizers": {'v:"example.io/cleanup"': {}},
+        "f:labels": {".": {}, "f:app": {}},
+    },
+    "f:spec": {
+        "f:replicas": {},
+        "f:template": {
+            "f:spec": {
+                "f:containers": {
+                    'k:{"name":"web"}': {".": {}, "f:image": {}, "f:name": {}},
+                },
+            },
+        },
+    },
+}
+
+HPA: Dict[str, Any] = {"f:spec": {"f:replicas": {}}}
+
+CONTROLLER: Dict[str, Any] = {
+    "f:metadata": {"f:annotations": {"f:deployment.kubernetes.io/revision": {}}},
+    "f:status": {"f:replicas": {}},
+}
+
+DEPLOYMENT = {
+    "metadata": {
+        "name": "web",
+        "managedFields": [
+            {"manager": "argocd", "operation": "Apply", "fieldsV1": GITOPS},
+            {"manager": "hpa", "operation": "Update", "fieldsV1": HPA},
+            {
+                "manager": "kube-controller-manager",
+                "operation": "Update",
+                "fieldsV1": {"f:spec": {"f:replicas": {}}},
+            },
+            {
+                "manager": "kube-controller-manager",
+                "operation": "Update",
+                "subresource": "status",
+                "fieldsV1": CONTROLLER,
+            },
+        ],
+    },
+}
+
+
+def test_fields_v1_is_kept():
+    deployment = Deployment.model_validate(DEPLOYMENT)
+
+    data = deployment.model_dump(exclude_none=True)
+
+    assert data["metadata"]["managedFields"][0]["fieldsV1"] == GITOPS
+
+
+def test_to_elements():
+    assert to_elements("spec.replicas") == ("f:spec", "f:replicas")
+    assert to_elements('metadata.labels["app.kubernetes.io/name"]') == (
+        "f:metadata",
+        "f:labels",
+        "f:app.kubernetes.io/name",
+    )
+    assert to_elements(("spec", "ports", 0)) == ("f:spec", "f:ports", "i:0")
+    assert to_elements(("containers", key_element(name="web", port=80))) == (
+        "f:containers",
+        'k:{"name":"web","port":80}',
+    )
+
+
+def test_contains():
+    fields = FieldSet(GITOPS)
+    web = ("spec", "template", "spec", "containers", key_element(name="web"))
+
+    assert "spec.replicas" in fields
+    assert "metadata.labels" in fields
+    assert "metadata.labels.app" in fields
+    assert ("metadata", "finalizers", value_element("example.io/cleanup")) in fields
+    assert web in fields
+    assert (*web, "image") in fields
+    assert "spec" not in fields
+    assert "spec.template" not in fields
+    assert "metadata.finalizers" not in fields
+    assert "spec.paused" not in fields
+    assert "spec.replicas.value" not in fields
+
+
+def test_iter():
+    assert set(FieldSet(HPA)) == {("f:spec", "f:replicas")}
+    assert len(FieldSet(GITOPS)) == 7
+    assert not FieldSet()
+    assert not FieldSet({".": {}})
+
+
+def test_union():
+    labels = FieldSet({"f:metadata": {"f:labels": {}}})
+    label = FieldSet({"f:metadata": {"f:labels": {"f:app": {}}}})
+
+    union = labels | label
+
+    assert union.fields == {"f:metadata": {"f:labels": {".": {}, "f:app": {}}}}
+    assert union == label | labels
+    assert set(union) == set(labels) | set(label)
+
+
+def test_intersection():
+    fields = FieldSet(GITOPS)
+
+    assert fields & FieldSet(HPA) == FieldSet(HPA)
+    assert not fields & FieldSet(CONTROLLER)
+    assert (fields & fields).fields == GITOPS
+    assert (fields & FieldSet({"f:metadata": {"f:labels": {"f:app": {}}}})).fields == {
+        "f:metadata": {"f:labels": {"f:app": {}}}
+    }
+
+
+def test_difference():
+    fields = FieldSet(GITOPS)
+
+    difference = fields - FieldSet(HPA)
+
+    assert set(difference) == set(fields) - set(FieldSet(HPA))
+    assert "spec.replicas" not in difference
+    assert difference.fields["f:metadata"] is GITOPS["f:metadata"]
+    assert (fields - FieldSet({"f:metadata": {"f:labels": {}}})).fields["f:metadata"][
+        "f:labels"
+    ] == {"f:app": {}}
+
+
+def test_set_operations_do_not_modify():
+    left = FieldSet({"f:spec": {"f:replicas": {}}})
+    right = FieldSet({"f:spec": {"f:replicas": {"f:value": {}}}})
+
+    _ = left | right, left & right, left - right
+
+    assert left.fields == {"f:spec": {"f:replicas": {}}}
+    assert right.fields == {"f:spec": {"f:replicas": {"f:value": {}}}}
+
+
+def test_managed_fields():
+    managed = ManagedFields.from_object(Deployment.model_validate(DEPLOYMENT))
+
+    assert managed.managers == ["argocd", "hpa", "kube-controller-manager"]
+    assert managed.owners("spec.replicas") == [
+        "argocd",
+        "hpa",
+        "kube-controller-manager",
+    ]
+    assert managed.owners("status.replicas") == ["kube-controller-manager"]
+    assert managed.owners("spec.paused") == []
+    assert managed.get("kube-controller-manager") == FieldSet(HPA) | FieldSet(
+        CONTROLLER
+    )
+    assert not managed.get("kubectl")
+    assert kubedantic.ManagedFields is ManagedFields
+
+
+def test_conflicts():
+    managed = ManagedFields.from_object(Deployment.model_validate(DEPLOYMENT))
+
+    assert managed.conflicts("argocd") == {
+        "hpa": FieldSet(HPA),
+        "kube-controller-manager": FieldSet(HPA),
+    }
+    assert managed.conflicts("kubectl") == {}
+
+
+@pytest.mark.parametrize("metadata", [None, {"name": "web"}])
+def test_unmanaged(metadata):
+    managed = ManagedFields.from_object(
+        Deployment.model_validate({"metadata": metadata})
+    )
+
+    assert managed.managers == []
+    assert managed.owners("spec.replicas") == []
@@ -1,5 +1,15 @@
-from kubedantic.models.io.k8s.api.apps.v1 import Deployment, DeploymentSpec
-from kubedantic.models.io.k8s.api.core.v1 import PodTemplateSpec
+import subprocess
+import sys
+
+import pytest
+
+from kubedantic.base import ObjectList
+from kubedantic.models.io.k8s.api.apps.v1 import (
+    Deployment,
+    DeploymentList,
+    DeploymentSpec,
+)
+from kubedantic.models.io.k8s.api.core.v1 import PodList, PodTemplateSpec
 from kubedantic.models.io.k8s.apimachinery.pkg.apis.meta.v1 import (
     LabelSelector,
     ObjectMeta,
@@ -27,3 +37,74 @@ def test_deployment():
     assert deployment.spec.selector.matchLabels == {"app": "test"}
     assert deployment.spec.template.metadata is not None
     assert deployment.spec.template.metadata.labels == {"app": "test"}
+
+
+def test_deployment_list():
+    deployment_list = DeploymentList.model_validate({
+        "items": [{"metadata": {"name": "test"}}],
+        "metadata": {"resourceVersion": "1"},
+    })
+
+    assert isinstance(deployment_list, ObjectList)
+    assert deployment_list.apiVersion == "apps/v1"
+    assert deployment_list.kind == "DeploymentList"
+    assert deployment_list.metadata is not None
+    assert deployment_list.metadata.resourceVersion == "1"
+    assert isinstance(deployment_list.items[0], Deployment)
+    assert deployment_list.items[0].kind == "Deployment"
+
+
+def test_core_list():
+    pod_list = PodList(items=[])
+
+    assert pod_list.apiVersion == "v1"
+    assert pod_list.kind == "PodList"
+
+
+def test_core_chunks_are_lazy():
+    code = (
+        "import sys\n"
+        "from kubedantic.models.io.k8s.api.core.v1 import ConfigMap\n"
+        "print('kubedantic.models.io.k8s.api.core.v1.pod_spec' in sys.modules)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.strip() == "False"
+
+
+def test_core_reexports():
+    from kubedantic.models.io.k8s.api.core import v1
+    from kubedantic.models.io.k8s.api.core.v1.pod_spec import PodSpec
+
+    assert v1.PodSpec is PodSpec
+    assert "PodSpec" in dir(v1)
+
+    with pytest.raises(AttributeError):
+        v1.Missing  # noqa: B018
+
+
+def test_models_are_complete_after_import():
+    # Every model must be fully built when its module is imported, without
+    # forward references left for a deferred ``model_rebuild`` at first use
+    code = (
+        "import importlib, pathlib, sys\n"
+        "from pydantic import BaseModel\n"
+        "import kubedantic.models\n"
+        "root = pathlib.Path(kubedantic.models.__path__[0])\n"
+        "for path in sorted(root.rglob('*.py')):\n"
+        "    if path.stem == '__init__':\n"
+        "        continue\n"
+        "    parts = path.relative_to(root).with_suffix('').parts\n"
+        "    module = importlib.import_module('.'.join(('kubedantic.models', *parts)))\n"
+        "    for name, value in vars(module).items():\n"
+        "        if (\n"
+        "            isinstance(value, type)\n"
+        "            and issubclass(value, BaseModel)\n"
+        "            and value.__module__ == module.__name__\n"
+        "            and not value.__pydantic_complete__\n"
+        "        ):\n"
+        "            print(f'{module.__name__}.{name}')\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.split() == []
@@ -0,0 +1,100 @@
+import gc
+import pickle
+from typing import List
+
+import pytest
+from pydantic import model_validator
+
+from kubedantic import pickling
+from kubedantic.frozen import freeze
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList
+
+POD = {
+    "metadata": {
+        "name": "web",
+        "creationTimestamp": "2024-01-01T00:00:00Z",
+        "managedFields": [{"manager": "kubectl", "fieldsV1": {"f:spec": {}}}],
+    },
+    "spec": {"containers": [{"name": "web", "image": "nginx:1.25"}]},
+}
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    pods = PodList.model_validate({"items": [POD, POD]})
+
+    unpickled = pickle.loads(pickle.dumps(pods, protocol=protocol))
+
+    assert unpickled == pods
+    assert unpickled.items[0].model_fields_set == {"metadata", "spec"}
+
+
+def test_pickle_out_of_band():
+    pod = Pod.model_validate(POD)
+    buffers: List[pickle.PickleBuffer] = []
+
+    data = pickle.dumps(pod, protocol=5, buffer_callback=buffers.append)
+
+    assert len(buffers) == 1
+    assert len(data) < len(bytes(buffers[0]))
+    assert pickle.loads(data, buffers=buffers) == pod
+
+
+def test_pickle_fields_set():
+    deployment = Deployment(spec=None)
+
+    unpickled = pickle.loads(pickle.dumps(deployment))
+
+    assert unpickled.model_fields_set == {"spec"}
+
+
+def test_pickle_frozen():
+    pod = freeze(Pod.model_validate(POD))
+
+    unpickled = pickle.loads(pickle.dumps(pod, protocol=5))
+
+    assert type(unpickled) is type(pod)
+    assert unpickled == pod
+
+
+GC_STATES: List[bool] = []
+
+
+class GCPod(Pod):
+    @model_validator(mode="after")
+    def _record_gc(self):
+        GC_STATES.append(gc.isenabled())
+        return self
+
+
+def test_unpickle_keeps_gc():
+    data = pickle.dumps(GCPod.model_validate(POD))
+    GC_STATES.clear()
+
+    pickle.loads(data)
+
+    assert GC_STATES == [True]
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_restore_pauses_gc(enabled):
+    data = GCPod.model_validate(POD).model_dump_json(exclude_unset=True)
+    GC_STATES.clear()
+    (gc.enable if enabled else gc.disable)()
+
+    try:
+        assert pickling.restore(GCPod, data.encode(), pause_gc=True) is not None
+        assert GC_STATES == [False]
+        assert gc.isenabled() is enabled
+    finally:
+        gc.enable()
+
+
+def test_nested_gc_pauses():
+    with pickling._paused_gc():
+        with pickling._paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+
+    assert gc.isenabled()
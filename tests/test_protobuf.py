@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from kubedantic.base import UnknownKindError
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList, Secret
+from kubedantic.models.io.k8s.api.networking.v1 import IngressClass
+from kubedantic.protobuf import MAGIC, from_protobuf, loads
+
+# Responses of the API server next to their JSON, not recorded from an API
+# server but encoded with the official protobuf runtime, from the
+# descriptors of the generated.proto files of Kubernetes 1.32 vendored by
+# the armada-client wheel, the messages of kubedantic.models.protobuf being
+# generated from the same files
+DATA_PATH = Path(__file__).parent / "data" / "protobuf"
+
+
+def _read(name: str) -> bytes:
+    return (DATA_PATH / f"{name}.pb").read_bytes()
+
+
+def _read_json(name: str) -> dict:
+    return json.loads((DATA_PATH / f"{name}.json").read_text())
+
+
+@pytest.mark.parametrize(
+    "name", ["pod", "pod_list", "pod_sidecar", "secret", "ingress_class"]
+)
+def test_loads(name: str):
+    assert loads(_read(name)) == _read_json(name)
+
+
+def test_from_protobuf():
+    pod = from_protobuf(_read("pod"))
+
+    assert pod == Pod.model_validate(_read_json("pod"))
+    assert isinstance(pod, Pod)
+    # Embedded structs and types with their own JSON encoding
+    assert pod.spec.volumes[0].configMap.name == "web-config"  # type: ignore[index,union-attr]
+    container = pod.spec.containers[0]  # type: ignore[union-attr]
+    assert container.livenessProbe.httpGet.port == "http"  # type: ignore[union-attr]
+    assert container.readinessProbe.tcpSocket.port == 8080  # type: ignore[union-attr]
+    assert container.resources.requests == {"cpu": "100m", "memory": "128Mi"}  # type: ignore[union-attr]
+    # Zero timestamps and empty strings are left unset
+    assert "lastProbeTime" not in pod.status.conditions[0].model_fields_set  # type: ignore[index,union-attr]
+    assert container.env[1].model_fields_set == {"name"}  # type: ignore[index]
+
+
+def test_from_protobuf_fields():
+    pod = from_protobuf(_read("pod_sidecar"))
+
+    assert pod == Pod.model_validate(_read_json("pod_sidecar"))
+    spec = pod.spec  # type: ignore[union-attr]
+    assert spec.initContainers[0].restartPolicy == "Always"  # type: ignore[index,union-attr]
+    assert spec.containers[0].startupProbe.grpc.port == 8080  # type: ignore[union-attr]
+    assert spec.ephemeralContainers[0].targetContainerName == "web"  # type: ignore[index,union-attr]
+    assert spec.schedulingGates[0].name == "example.com/quota"  # type: ignore[index,union-attr]
+    assert spec.hostUsers is False
+    assert spec.overhead == {"cpu": "250m"}
+    entry = pod.metadata.managedFields[0]  # type: ignore[index,union-attr]
+    assert entry.fieldsV1.model_dump() == {  # type: ignore[union-attr]
+        "f:spec": {"f:containers": {'k:{"name":"web"}': {".": {}, "f:image": {}}}}
+    }
+
+    # Fields named differently in protobuf
+    ingress_class = from_protobuf(_read("ingress_class"))
+    assert isinstance(ingress_class, IngressClass)
+    assert ingress_class.spec.parameters.apiGroup == "k8s.example.com"  # type: ignore[union-attr]
+
+
+def test_from_protobuf_list():
+    pods = from_protobuf(bytearray(_read("pod_list")))
+
+    assert isinstance(pods, PodList)
+    assert [pod.metadata.name for pod in pods.items] == ["web-0", "web-1"]  # type: ignore[union-attr]
+
+
+def test_bytes():
+    secret = from_protobuf(memoryview(_read("secret")))
+
+    assert isinstance(secret, Secret)
+    assert secret.data == {"empty": "", "tls.key": "AP9rZXk="}
+    assert secret.metadata.creationTimestamp is None  # type: ignore[union-attr]
+
+
+def test_unknown_fields():
+    # Fields 15 to 18 of a Pod, unknown to its message, of every wire type,
+    # at the end of the raw object, the last field of the envelope, 422
+    # bytes long so far
+    unknown = (
+        b"\x78\x01"  # Varint
+        b"\x81\x01" + bytes(8)  # 64 bits
+        + b"\x8a\x01\x02hi"  # Length-delimited
+        + b"\x95\x01" + bytes(4)  # 32 bits
+    )  # fmt: skip
+    data = _read("pod").replace(b"\x12\xa6\x03", b"\x12\xbd\x03", 1) + unknown
+
+    assert loads(data) == _read_json("pod")
+    with pytest.raises(ValueError, match="Unknown field 15 of .*core.v1.Pod$"):
+        loads(data, strict=True)
+    with pytest.raises(ValueError, match="Unknown field 15"):
+        from_protobuf(data, strict=True)
+
+
+def test_unknown_kind():
+    # Unknown{typeMeta: {apiVersion: "v1", kind: "Gizmo"}}
+    data = MAGIC + b"\x0a\x0b\x0a\x02v1\x12\x05Gizmo"
+
+    with pytest.raises(UnknownKindError, match="v1, Kind=Gizmo"):
+        from_protobuf(data)
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b'{"kind": "Pod"}', "no magic number"),
+        (MAGIC + b"\x0a\x0b\x0a\x02v1", "Truncated"),
+        (MAGIC + b"\x1a\x04gzip", "Unsupported content encoding"),
+        (MAGIC + b"\x0f", "Unsupported protobuf wire type 7"),
+    ],
+)
+def test_errors(data: bytes, message: str):
+    with pytest.raises(ValueError, match=message):
+        loads(data)
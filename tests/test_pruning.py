@@ -0,0 +1,221 @@
+import json
+from typing import Any, Dict, Optional
+
+import pytest
+
+import kubedantic
+from kubedantic.base import NamespacedObject
+from kubedantic.models.io.k8s.api.apps.v1 import (
+    Deployment,
+    DeploymentSpec,
+    DeploymentStatus,
+    StatefulSet,
+)
+from kubedantic.models.io.k8s.api.core.v1 import Pod, PodList, PodTemplateSpec
+from kubedantic.models.io.k8s.apimachinery.pkg.apis.meta.v1 import (
+    LabelSelector,
+    ObjectMeta,
+)
+from kubedantic.pruning import (
+    dump_apply_configuration,
+    get_read_only_fields,
+    iter_prune_for_apply,
+    prune_for_apply,
+    to_apply_configuration,
+)
+
+METADATA = {
+    "name": "web",
+    "namespace": "default",
+    "labels": {"app": "web"},
+    "uid": "5a1b",
+    "resourceVersion": "1234",
+    "generation": 3,
+    "creationTimestamp": "2024-01-01T00:00:00Z",
+    "selfLink": "/api/v1/namespaces/default/pods/web",
+    "managedFields": [{"manager": "kubectl", "operation": "Apply"}],
+}
+
+POD: Dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": METADATA,
+    "spec": {
+        "containers": [{"name": "web", "image": "nginx:1.25"}],
+        "volumes": [
+            {
+                "name": "scratch",
+                "ephemeral": {
+                    "volumeClaimTemplate": {
+                        "metadata": {"labels": {"type": "scratch"}, "uid": "9c"},
+                        "spec": {"accessModes": ["ReadWriteOnce"]},
+                    }
+                },
+            }
+        ],
+    },
+    "status": {"phase": "Running", "podIP": "10.0.0.1"},
+}
+
+PRUNED_POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {"name": "web", "namespace": "default", "labels": {"app": "web"}},
+    "spec": {
+        "containers": [{"name": "web", "image": "nginx:1.25"}],
+        "volumes": [
+            {
+                "name": "scratch",
+                "ephemeral": {
+                    "volumeClaimTemplate": {
+                        "metadata": {"labels": {"type": "scratch"}},
+                        "spec": {"accessModes": ["ReadWriteOnce"]},
+                    }
+                },
+            }
+        ],
+    },
+}
+
+
+def test_prune_for_apply():
+    assert prune_for_apply(Pod.model_validate(POD)) == PRUNED_POD
+    assert kubedantic.prune_for_apply is prune_for_apply
+
+
+def test_prune_nested_kinds():
+    statefulset = StatefulSet.model_validate({
+        "metadata": METADATA,
+        "spec": {
+            "selector": {"matchLabels": {"app": "web"}},
+            "serviceName": "web",
+            "template": {"metadata": {"labels": {"app": "web"}, "uid": "7f"}},
+            "volumeClaimTemplates": [
+                {
+                    "metadata": {"name": "data", "uid": "8e"},
+                    "status": {"phase": "Bound"},
+                }
+            ],
+        },
+        "status": {"replicas": 1},
+    })
+
+    assert prune_for_apply(statefulset) == {
+        "apiVersion": "apps/v1",
+        "kind": "StatefulSet",
+        "metadata": {"name": "web", "namespace": "default", "labels": {"app": "web"}},
+        "spec": {
+            "selector": {"matchLabels": {"app": "web"}},
+            "serviceName": "web",
+            "template": {"metadata": {"labels": {"app": "web"}}},
+            "volumeClaimTemplates": [{"metadata": {"name": "data"}}],
+        },
+    }
+
+
+def test_defaults_are_kept():
+    pod = Pod.model_validate({"metadata": {"name": "web"}})
+
+    assert prune_for_apply(pod) == {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": "web"},
+    }
+
+
+def test_iter_prune_for_apply():
+    items = [{**POD, "apiVersion": None, "kind": None}] * 3
+    pods = PodList.model_validate({
+        "items": items,
+        "metadata": {"resourceVersion": "1"},
+    })
+
+    pruned = iter_prune_for_apply(pods)
+
+    assert next(pruned) == PRUNED_POD
+    assert list(pruned) == [PRUNED_POD] * 2
+    assert list(iter_prune_for_apply(pods.items)) == [PRUNED_POD] * 3
+
+
+def test_custom_resources(registry):
+    class Widget(NamespacedObject):
+        apiVersion: Optional[str] = "example.io/v1"
+        kind: Optional[str] = "Widget"
+        spec: Optional[Dict[str, Any]] = None
+        status: Optional[Dict[str, Any]] = None
+
+    widget = Widget.model_validate({
+        "metadata": METADATA,
+        "spec": {"size": 3},
+        "status": {"ready": True},
+    })
+
+    assert get_read_only_fields(widget)["status"] is True
+    assert prune_for_apply(widget) == {
+        "apiVersion": "example.io/v1",
+        "kind": "Widget",
+        "metadata": {"name": "web", "namespace": "default", "labels": {"app": "web"}},
+        "spec": {"size": 3},
+    }
+
+
+def test_to_apply_configuration():
+    deployment = Deployment(
+        metadata=ObjectMeta(name="web", namespace="default"),
+        spec=DeploymentSpec(
+            replicas=1,
+            selector=LabelSelector(matchLabels={"app": "web"}),
+            template=PodTemplateSpec(),
+        ),
+        status=DeploymentStatus(replicas=1),
+    )
+    deployment.metadata.uid = "5a1b"  # type: ignore[union-attr]
+
+    configuration = to_apply_configuration(deployment)
+
+    assert configuration == {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "namespace": "default"},
+        "spec": {
+            "replicas": 1,
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {},
+        },
+    }
+    assert list(configuration)[:3] == ["apiVersion", "kind", "metadata"]
+    assert kubedantic.to_apply_configuration is to_apply_configuration
+
+
+def test_to_apply_configuration_without_name():
+    with pytest.raises(ValueError, match="Pod has no metadata.name"):
+        to_apply_configuration(Pod(metadata=ObjectMeta(generateName="web-")))
+
+    with pytest.raises(ValueError):
+        to_apply_configuration(Pod())
+
+
+@pytest.mark.parametrize("type_fields", [{}, {"apiVersion": "v1", "kind": "Pod"}])
+def test_dump_apply_configuration(type_fields):
+    pod = Pod.model_validate({**POD, "apiVersion": None, "kind": None, **type_fields})
+
+    dumped = dump_apply_configuration(pod)
+
+    assert dumped.startswith('{"apiVersion":"v1","kind":"Pod","metadata":')
+    assert json.loads(dumped) == to_apply_configuration(pod) == PRUNED_POD
+    assert kubedantic.dump_apply_configuration is dump_apply_configuration
+
+    with pytest.raises(ValueError):
+        dump_apply_configuration(Pod())
+
+
+def test_dump_apply_configuration_defaults():
+    data = {
+        key: value for key, value in POD.items() if key not in ("apiVersion", "kind")
+    }
+    pod = Pod.model_validate(data)
+
+    dumped = dump_apply_configuration(pod)
+
+    assert dumped.startswith('{"apiVersion":"v1","kind":"Pod","metadata":')
+    assert json.loads(dumped) == to_apply_configuration(pod) == PRUNED_POD
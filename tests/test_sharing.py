@@ -0,0 +1,201 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from kubedantic.base import validate_json, validate_python
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.batch.v1 import CronJob
+from kubedantic.models.io.k8s.api.core.v1 import Container, Pod, PodList, PodSpec
+from kubedantic.sharing import SubtreeCache
+
+SPEC = {
+    "containers": [
+        {
+            "name": "web",
+            "image": "nginx:1.25",
+            "env": [{"name": "MODE", "value": "production"}],
+            "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+        }
+    ],
+    "volumes": [{"name": "data", "emptyDir": {}}],
+}
+
+
+def _pod(name: str, spec: dict = SPEC) -> dict:
+    return {"metadata": {"name": name}, "spec": json.loads(json.dumps(spec))}
+
+
+def test_share_pod_specs():
+    cache = SubtreeCache()
+
+    first = validate_python(Pod, _pod("web-1"), cache.context)
+    second = validate_python(Pod, _pod("web-2"), cache.context)
+
+    assert first.spec is second.spec
+    assert first.name == "web-1"
+    assert second.name == "web-2"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_key_order_does_not_matter():
+    cache = SubtreeCache()
+    reordered = dict(reversed(list(SPEC.items())))
+
+    first = validate_python(Pod, _pod("web-1"), cache.context)
+    second = validate_python(Pod, _pod("web-2", reordered), cache.context)
+
+    assert first.spec is second.spec
+
+
+def test_different_specs_are_not_shared():
+    cache = SubtreeCache()
+    other = {**SPEC, "nodeName": "node-1"}
+
+    first = validate_python(Pod, _pod("web-1"), cache.context)
+    second = validate_python(Pod, _pod("web-2", other), cache.context)
+
+    assert first.spec is not second.spec
+    assert second.spec is not None
+    assert second.spec.nodeName == "node-1"
+    assert len(cache) == 2
+
+
+def test_share_list_items():
+    cache = SubtreeCache()
+    data = json.dumps({"items": [_pod("web-1"), _pod("web-2")]})
+
+    pods = validate_json(PodList, data, cache.context)
+
+    assert pods.items[0].spec is pods.items[1].spec
+
+
+def test_share_pod_templates():
+    cache = SubtreeCache()
+    workload = {"selector": {}, "template": {"spec": SPEC}}
+
+    first = validate_python(Deployment, {"spec": workload}, cache.context)
+    second = validate_python(
+        Deployment, {"spec": {**workload, "replicas": 3}}, cache.context
+    )
+    cron_jobs = [
+        validate_python(
+            CronJob,
+            {
+                "spec": {
+                    "schedule": "@daily",
+                    "jobTemplate": {"spec": {"template": {"spec": SPEC}}},
+                }
+            },
+            cache.context,
+        )
+        for _ in range(2)
+    ]
+
+    assert first.spec is not None and second.spec is not None
+    assert first.spec.template is second.spec.template
+    assert second.spec.replicas == 3
+    templates = [
+        cron_job.spec.jobTemplate.spec.template
+        for cron_job in cron_jobs
+        if cron_job.spec and cron_job.spec.jobTemplate.spec
+    ]
+    assert templates[0] is templates[1]
+
+
+def test_no_sharing_by_default():
+    assert Pod.model_validate(_pod("a")).spec is not Pod.model_validate(_pod("b")).spec
+
+
+def test_shared_objects_equal_plain_ones():
+    cache = SubtreeCache()
+    data = json.dumps(_pod("web-1"))
+
+    shared = validate_json(Pod, data, cache.context)
+    plain = Pod.model_validate_json(data)
+
+    assert type(shared.spec) is not PodSpec
+    assert shared == plain
+    assert plain == shared
+    assert shared.spec == plain.spec
+    assert plain.spec == shared.spec
+    assert shared != Pod.model_validate(_pod("web-1", {**SPEC, "nodeName": "node-1"}))
+
+
+def test_models_have_no_validators():
+    # Sharing and interning are applied around the validation, keeping the
+    # validation without them free of Python validators
+    assert not Pod.__pydantic_decorators__.model_validators
+    assert not PodList.__pydantic_decorators__.model_validators
+
+
+def test_clear():
+    cache = SubtreeCache()
+    validate_python(Pod, _pod("web-1"), cache.context)
+
+    cache.clear()
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_threads():
+    cache = SubtreeCache()
+    barrier = threading.Barrier(8)
+
+    def validate(index: int) -> Pod:
+        barrier.wait()
+        return validate_python(Pod, _pod(f"web-{index}"), cache.context)
+
+    with ThreadPoolExecutor(8) as executor:
+        pods = list(executor.map(validate, range(8)))
+
+    assert all(pod.spec is pods[0].spec for pod in pods)
+    assert (cache.hits + cache.misses, cache.misses, len(cache)) == (8, 1, 1)
+
+
+def test_shared_subtrees_are_frozen():
+    cache = SubtreeCache()
+    first = validate_python(Pod, _pod("web-1"), cache.context)
+    second = validate_python(Pod, _pod("web-2"), cache.context)
+
+    with pytest.raises(ValidationError, match="frozen"):
+        second.spec.nodeName = "node-1"  # type: ignore[union-attr]
+    with pytest.raises(TypeError, match="immutable"):
+        second.spec.containers.append(Container(name="sidecar"))  # type: ignore[union-attr]
+
+    assert first.spec.nodeName is None  # type: ignore[union-attr]
+    assert isinstance(first.spec, PodSpec)
+    assert first.model_dump(exclude_unset=True) == _pod("web-1")
+
+
+def test_python_values_are_not_shared():
+    cache = SubtreeCache()
+    template = {
+        "metadata": {"creationTimestamp": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+        "spec": SPEC,
+    }
+    deployments = [
+        validate_python(
+            Deployment,
+            {"spec": {"selector": {}, "template": template}},
+            cache.context,
+        )
+        for _ in range(2)
+    ]
+    pods = [
+        validate_python(
+            Pod, {"spec": {"containers": [Container(name="web")]}}, cache.context
+        )
+        for _ in range(2)
+    ]
+
+    assert deployments[0].spec.template.metadata.creationTimestamp == datetime(  # type: ignore[union-attr]
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+    assert deployments[0].spec.template is not deployments[1].spec.template  # type: ignore[union-attr]
+    assert pods[0].spec.containers[0].name == "web"  # type: ignore[union-attr]
+    assert pods[0].spec is not pods[1].spec
+    assert len(cache) == 0
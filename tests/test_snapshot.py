@@ -0,0 +1,126 @@
+import gc
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+import kubedantic
+from kubedantic.base import KubernetesObject
+from kubedantic.frozen import frozen
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import Namespace, Pod
+from kubedantic.snapshot import Snapshot, write_snapshot
+
+OBJECTS: List[KubernetesObject] = [
+    Namespace.model_validate({"metadata": {"name": "shop"}}),
+    Deployment.model_validate({
+        "metadata": {"name": "web", "namespace": "shop"},
+        "spec": {"selector": {}, "template": {}},
+    }),
+    *(
+        Pod.model_validate({
+            "metadata": {"name": f"web-{index}", "namespace": "shop"},
+            "spec": {"containers": [{"name": "wéb", "image": "nginx"}]},
+        })
+        for index in range(3)
+    ),
+    Pod.model_validate({"metadata": {"name": "web", "namespace": "shop"}}),
+]
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_snapshot(tmp_path: Path, use_mmap: bool):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, OBJECTS, resource_version="42")
+
+    with Snapshot(path, use_mmap=use_mmap) as snapshot:
+        assert snapshot.resource_version == "42"
+        assert len(snapshot) == len(OBJECTS)
+        assert snapshot.load() == OBJECTS
+        assert snapshot.load(pause_gc=True) == OBJECTS
+        assert gc.isenabled()
+        assert list(snapshot) == OBJECTS
+        assert snapshot[2] == OBJECTS[2]
+        assert snapshot.keys() == [obj.key for obj in OBJECTS]
+        assert snapshot.get("shop/web") == OBJECTS[1]
+        assert snapshot.get("shop/web", kind="Pod") == OBJECTS[-1]
+        assert snapshot.get("shop/web", kind="Service") is None
+        assert snapshot.get("shop") == OBJECTS[0]
+
+    assert kubedantic.Snapshot is Snapshot
+    assert kubedantic.write_snapshot is write_snapshot
+
+
+def test_fields_set(tmp_path: Path):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, OBJECTS[2:3])
+
+    with Snapshot(path) as snapshot:
+        (pod,) = snapshot.load()
+
+    assert snapshot.resource_version is None
+    assert isinstance(pod, Pod) and pod.metadata
+    assert pod.model_fields_set == OBJECTS[2].model_fields_set
+    assert pod.metadata.model_fields_set == {"name", "namespace"}
+
+
+def test_frozen(tmp_path: Path):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, [frozen(Pod).model_validate(OBJECTS[2].model_dump())])
+
+    with Snapshot(path) as snapshot:
+        assert snapshot.load() == [OBJECTS[2]]
+
+
+def test_empty(tmp_path: Path):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, [])
+
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.load() == []
+        assert snapshot.get("web") is None
+
+
+def test_replace(tmp_path: Path):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, OBJECTS)
+
+    with pytest.raises(ValueError, match="KubernetesObject object has no"):
+        write_snapshot(path, [*OBJECTS, KubernetesObject()])
+
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == len(OBJECTS)
+    assert [child.name for child in tmp_path.iterdir()] == ["objects.snapshot"]
+
+
+def test_not_a_snapshot(tmp_path: Path):
+    path = tmp_path / "objects.json"
+    path.write_text("{}")
+
+    with pytest.raises(ValueError, match="is not a snapshot"):
+        Snapshot(path)
+
+
+@pytest.mark.parametrize("size", [12, 40, -60])
+def test_damaged_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, size: int):
+    path = tmp_path / "objects.snapshot"
+    write_snapshot(path, OBJECTS)
+    data = path.read_bytes()
+    # Cut in the size of the header, in the header, and in the offsets
+    header_end = data.index(b"}") + 1
+    path.write_bytes(data[: size if size > 0 else header_end - size])
+    maps: List[mmap.mmap] = []
+
+    class _Map(mmap.mmap):
+        def __init__(self, *args: Any, **kwargs: Any):
+            maps.append(self)
+
+    monkeypatch.setattr(mmap, "mmap", _Map)
+
+    with pytest.raises((ValueError, struct.error)):
+        Snapshot(path)
+
+    assert maps and all(mapped.closed for mapped in maps)
@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from kubedantic.base import get_model
+from kubedantic.table import (
+    PartialObjectMetadata,
+    PartialObjectMetadataList,
+    Table,
+    get_columns,
+)
+
+TABLE = {
+    "kind": "Table",
+    "apiVersion": "meta.k8s.io/v1",
+    "metadata": {"resourceVersion": "42"},
+    "columnDefinitions": [
+        {
+            "name": "Name",
+            "type": "string",
+            "format": "name",
+            "description": "Name must be unique within a namespace.",
+            "priority": 0,
+        },
+        {
+            "name": "Ready",
+            "type": "string",
+            "format": "",
+            "description": "The aggregate readiness state of this pod.",
+            "priority": 0,
+        },
+        {
+            "name": "Restarts",
+            "type": "integer",
+            "format": "",
+            "description": "The number of times the containers have restarted.",
+            "priority": 0,
+        },
+    ],
+    "rows": [
+        {
+            "cells": ["web-0", "1/1", 0],
+            "object": {
+                "kind": "PartialObjectMetadata",
+                "apiVersion": "meta.k8s.io/v1",
+                "metadata": {"name": "web-0", "namespace": "default"},
+            },
+        },
+        {
+            "cells": ["job-0", "0/1", 2],
+            "conditions": [{"type": "Completed", "status": "True"}],
+            "object": {"kind": "Gizmo", "apiVersion": "example.io/v1"},
+        },
+    ],
+}
+
+
+def test_validate():
+    table = Table.model_validate(TABLE)
+
+    assert table.columnDefinitions[0].format == "name"
+    assert table.rows[1].conditions[0].type == "Completed"  # type: ignore[index]
+    row_object = table.rows[0].object
+    assert isinstance(row_object, PartialObjectMetadata)
+    assert row_object.key == "default/web-0"
+    # Objects of unknown kinds are kept as they are
+    assert table.rows[1].object == {"kind": "Gizmo", "apiVersion": "example.io/v1"}
+
+
+def test_columns():
+    table = Table.model_validate(TABLE)
+
+    assert table.columns(["Restarts", "Name"]) == {
+        "Restarts": [0, 2],
+        "Name": ["web-0", "job-0"],
+    }
+    assert list(table.columns()) == ["Name", "Ready", "Restarts"]
+    assert table.column("Ready") == ["1/1", "0/1"]
+
+
+@pytest.mark.parametrize("data", [TABLE, json.dumps(TABLE), json.dumps(TABLE).encode()])
+def test_get_columns(data):
+    assert get_columns(data, ["Name", "Restarts"]) == {
+        "Name": ["web-0", "job-0"],
+        "Restarts": [0, 2],
+    }
+    assert get_columns(data) == Table.model_validate(TABLE).columns()
+
+
+def test_get_columns_empty():
+    assert get_columns({**TABLE, "rows": None}, ["Name"]) == {"Name": []}
+
+
+def test_get_columns_errors():
+    with pytest.raises(KeyError, match="No column named 'Age'"):
+        get_columns(TABLE, ["Age"])
+    with pytest.raises(ValueError, match="Expected a Table, got a PodList"):
+        get_columns({"kind": "PodList", "items": []})
+
+
+def test_get_model():
+    assert get_model("meta.k8s.io/v1", "Table") is Table
+    assert (
+        get_model("meta.k8s.io/v1", "PartialObjectMetadataList")
+        is PartialObjectMetadataList
+    )
+
+
+def test_partial_object_metadata_list():
+    data = {
+        "kind": "PartialObjectMetadataList",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": {"resourceVersion": "42"},
+        "items": [{"metadata": {"name": "web-0", "namespace": "default"}}],
+    }
+
+    objects = PartialObjectMetadataList.model_validate(data)
+
+    assert objects.items[0].name == "web-0"
+    assert objects.items[0].kind == "PartialObjectMetadata"
@@ -0,0 +1,99 @@
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from kubedantic.frozen import freeze
+from kubedantic.models.io.k8s.api.core.v1 import ConfigMap, Secret
+from kubedantic.types import Base64Bytes
+
+SECRET = {"metadata": {"name": "tls"}, "data": {"tls.key": "AP9rZXk=", "empty": ""}}
+
+
+def test_validate():
+    secret = Secret.model_validate(SECRET)
+    value = secret.data["tls.key"]  # type: ignore[index]
+
+    assert isinstance(value, Base64Bytes)
+    assert value == "AP9rZXk="
+    # Decoded on first access only
+    assert "_decoded" not in vars(value)
+    assert bytes(value) == b"\x00\xffkey"
+    assert bytes(value) is bytes(value)
+
+
+def test_validate_bytes():
+    config_map = ConfigMap(binaryData={"raw": b"\x00\xff"})  # type: ignore[dict-item]
+
+    assert config_map.binaryData == {"raw": "AP8="}
+    assert config_map.model_dump_json(exclude_unset=True) == (
+        '{"binaryData":{"raw":"AP8="}}'
+    )
+
+
+@pytest.mark.parametrize("value", ["AP9rZXk=", "AP9rZQ==", "AP9r", ""])
+def test_nbytes(value: str):
+    assert Base64Bytes(value).nbytes == len(bytes(Base64Bytes(value)))
+
+
+def test_view():
+    value = Base64Bytes.from_bytes(b"\x00\xffkey")
+
+    view = value.view()
+
+    assert view.readonly
+    assert view.obj is bytes(value)
+    assert view[1] == 0xFF
+
+
+def test_dump_unchanged():
+    raw_json = Secret.model_validate(SECRET).model_dump_json(exclude_unset=True)
+    secret = Secret.model_validate_json(raw_json)
+
+    assert secret.model_dump(exclude_unset=True) == SECRET
+    assert type(secret.model_dump(mode="json")["data"]["tls.key"]) is str
+    assert secret == Secret.model_validate(SECRET)
+
+
+@pytest.mark.parametrize("value", ["?", "AP8", "AP8==", "AP8=AP8=", "A===", "AP8=\n"])
+def test_invalid(value: str):
+    with pytest.raises(ValidationError, match="valid base64"):
+        Secret.model_validate({"data": {"tls.key": value}})
+    with pytest.raises(ValidationError, match="valid base64"):
+        Secret.model_validate_json(json.dumps({"data": {"tls.key": value}}))
+    with pytest.raises(ValueError):
+        Base64Bytes(value)
+
+
+def test_invalid_type():
+    with pytest.raises(ValidationError, match="base64 string or bytes"):
+        Secret.model_validate({"data": {"tls.key": 1}})
+
+
+def test_pickle():
+    value = Base64Bytes("AP9rZXk=")
+    bytes(value)
+
+    unpickled = pickle.loads(pickle.dumps(value))
+
+    assert unpickled == value
+    assert isinstance(unpickled, Base64Bytes)
+    # The decoded bytes are not pickled
+    assert "_decoded" not in vars(unpickled)
+
+
+def test_freeze():
+    secret = freeze(Secret.model_validate(SECRET))
+
+    assert isinstance(secret.data["tls.key"], Base64Bytes)  # type: ignore[index]
+    assert hash(secret) == hash(freeze(Secret.model_validate(SECRET)))
+
+
+def test_json_schema():
+    schema = Secret.model_json_schema()
+
+    assert schema["properties"]["data"]["anyOf"][0]["additionalProperties"] == {
+        "format": "byte",
+        "type": "string",
+    }
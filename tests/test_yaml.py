@@ -0,0 +1,168 @@
+import io
+from pathlib import Path
+
+import pytest
+import yaml
+
+from kubedantic.models.io.k8s.api.apps.v1 import Deployment
+from kubedantic.models.io.k8s.api.core.v1 import ConfigMap, Pod, Service
+from kubedantic.yaml import DocumentError, iter_load, to_yaml
+
+MANIFESTS = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  selector: {}
+  template:
+    spec:
+      containers:
+        - name: wéb
+          image: nginx
+---
+# Empty documents are skipped
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: web
+"""
+
+INVALID = """\
+apiVersion: v1
+kind: Pod
+metadata:
+  name: web
+spec:
+  containers:
+    - name: web
+    - image: nginx
+"""
+
+
+def test_iter_load(tmp_path: Path):
+    path = tmp_path / "web.yaml"
+    path.write_text(MANIFESTS, encoding="utf-8")
+
+    deployment, service = iter_load(path)
+
+    assert isinstance(deployment, Deployment)
+    assert deployment.spec.template.spec.containers[0].name == "wéb"  # type: ignore[union-attr]
+    assert service == Service(metadata={"name": "web"})  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_stream(binary: bool):
+    stream = io.BytesIO(MANIFESTS.encode()) if binary else io.StringIO(MANIFESTS)
+
+    assert [obj.kind for obj in iter_load(stream)] == ["Deployment", "Service"]  # type: ignore[attr-defined]
+
+
+def test_lazy():
+    objects = iter_load(io.StringIO(MANIFESTS + "---\n" + INVALID))
+
+    assert next(objects).kind == "Deployment"  # type: ignore[attr-defined]
+    assert next(objects).kind == "Service"  # type: ignore[attr-defined]
+    with pytest.raises(DocumentError):
+        next(objects)
+
+
+def test_list():
+    data = {
+        "apiVersion": "v1",
+        "kind": "List",
+        "items": [
+            {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "web"}},
+            {"apiVersion": "v1", "kind": "Pod", "spec": {"containers": [{}]}},
+        ],
+    }
+    stream = io.StringIO(yaml.safe_dump(data, sort_keys=False))
+    objects = iter_load(stream)
+
+    assert next(objects) == Pod.model_validate(data["items"][0])  # type: ignore[index]
+    with pytest.raises(DocumentError) as info:
+        next(objects)
+    assert info.value.line == 12
+
+
+def test_errors(tmp_path: Path):
+    path = tmp_path / "pod.yaml"
+    path.write_text(MANIFESTS + "---\n" + INVALID)
+
+    with pytest.raises(DocumentError) as info:
+        list(iter_load(path))
+
+    error = info.value
+    assert (error.name, error.line) == (str(path), 27)
+    assert str(error).startswith(f"{path}:27: 1 validation error for Pod")
+    assert "spec.containers.1.name" in str(error)
+
+
+def test_unknown_kind():
+    stream = io.StringIO(MANIFESTS + "---\napiVersion: example.com/v1\nkind: Gizmo\n")
+
+    with pytest.raises(DocumentError, match=r"^<stream>:20: No model found"):
+        list(iter_load(stream))
+
+
+def test_invalid_yaml():
+    with pytest.raises(yaml.YAMLError):
+        list(iter_load(io.StringIO("kind: [Pod")))
+
+
+def test_to_yaml():
+    config_map = ConfigMap.model_validate({
+        "data": {"nginx.conf": "worker_processes 1;\nevents {}\n", "motd": "wéb"},
+        "metadata": {"name": "web", "labels": {"app": "web"}},
+    })
+
+    assert (
+        to_yaml(config_map)
+        == """\
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  labels:
+    app: web
+  name: web
+data:
+  nginx.conf: |
+    worker_processes 1;
+    events {}
+  motd: wéb
+"""
+    )
+
+
+def test_to_yaml_status_last():
+    pod = Pod.model_validate({
+        "status": {"phase": "Running"},
+        "spec": {"containers": []},
+        "kind": "Pod",
+        "metadata": {"name": "web"},
+    })
+
+    assert list(yaml.safe_load(to_yaml(pod))) == [
+        "apiVersion",
+        "kind",
+        "metadata",
+        "spec",
+        "status",
+    ]
+
+
+def test_to_yaml_stream():
+    objects = list(iter_load(io.StringIO(MANIFESTS)))
+    stream = io.StringIO()
+
+    assert to_yaml(iter(objects), stream) is None
+
+    assert stream.getvalue().count("---\n") == 1
+    assert list(iter_load(io.StringIO(stream.getvalue()))) == objects
+
+
+def test_to_yaml_not_block():
+    pod = Pod.model_validate({"metadata": {"annotations": {"note": "a \nb"}}})
+
+    assert list(iter_load(io.StringIO(to_yaml(pod)))) == [pod]  # type: ignore[arg-type]